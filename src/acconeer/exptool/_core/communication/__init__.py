@@ -13,4 +13,9 @@ from .links import (
     SocketLink,
     USBLink,
 )
-from .message_stream import MessageStream
+from .message_stream import (
+    MessageStream,
+    MessageStreamError,
+    MessageStreamOverflowError,
+    OverflowPolicy,
+)
@@ -3,6 +3,7 @@
 
 from .buffered_link import BufferedLink, LinkError
 from .null_link import NullLink, NullLinkError
+from .receive_buffer import ReceiveBuffer
 from .serial_link import ExploreSerialLink, SerialLink, SerialProcessLink
 from .socket_link import SocketLink
 from .usb_link import USBLink
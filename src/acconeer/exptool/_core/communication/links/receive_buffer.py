@@ -0,0 +1,121 @@
+# Copyright (c) Acconeer AB, 2024
+# All rights reserved
+from __future__ import annotations
+
+from typing import Callable, Optional
+
+
+class ReceiveBuffer:
+    """Preallocated receive buffer shared by :class:`BufferedLink` implementations
+
+    Received bytes are written directly into a preallocated ``bytearray``, either by a
+    ``recv_into``-like callable (:meth:`fill_from`) or by copying (:meth:`extend`).
+
+    Consumed bytes are not sliced off the front of the buffer. Instead, a read index is moved
+    forward and the (usually few) unconsumed bytes are moved to the front only when there is
+    not enough room left at the end. The buffer only grows if the unconsumed bytes wouldn't
+    fit anyway.
+
+    Bytes returned by :meth:`read` are copied into a new ``bytearray`` of the exact size, so
+    they stay valid (and unchanged) after the buffer is reused. This matters, since parsed
+    messages may keep views into their payload.
+    """
+
+    def __init__(self, chunk_size: int = 4096, capacity: Optional[int] = None) -> None:
+        if chunk_size < 1:
+            raise ValueError("'chunk_size' needs to be at least 1")
+
+        self._chunk_size = chunk_size
+        self._buf = bytearray(16 * chunk_size if capacity is None else capacity)
+        self._view = memoryview(self._buf)
+        self._start = 0
+        self._end = 0
+
+    @property
+    def chunk_size(self) -> int:
+        """The maximum number of bytes received by each call to :meth:`fill_from`"""
+        return self._chunk_size
+
+    @property
+    def capacity(self) -> int:
+        """The current size of the underlying buffer"""
+        return len(self._buf)
+
+    def __len__(self) -> int:
+        return self._end - self._start
+
+    def clear(self) -> None:
+        """Discards all buffered bytes"""
+        self._start = 0
+        self._end = 0
+
+    def _reserve(self, num_bytes: int) -> None:
+        """Makes room for at least ``num_bytes`` bytes after the buffered ones"""
+        if self._end + num_bytes <= len(self._buf):
+            return
+
+        size = len(self)
+
+        if size + num_bytes <= len(self._buf):
+            # memoryview assignment handles the overlapping ranges
+            self._view[:size] = self._view[self._start : self._end]
+        else:
+            new_buf = bytearray(max(2 * len(self._buf), size + num_bytes))
+            new_buf[:size] = self._view[self._start : self._end]
+            self._buf = new_buf
+            self._view = memoryview(new_buf)
+
+        self._start = 0
+        self._end = size
+
+    def fill_from(self, recv_into: Callable[[memoryview], int]) -> int:
+        """Lets ``recv_into`` write at most :attr:`chunk_size` bytes into the buffer
+
+        :param recv_into:
+            A callable with the same semantics as ``socket.recv_into``; writes into the given
+            memoryview and returns the number of bytes written.
+        :returns: The number of bytes received
+        """
+        self._reserve(self._chunk_size)
+        num_received = recv_into(self._view[self._end : self._end + self._chunk_size])
+        self._end += num_received
+        return num_received
+
+    def extend(self, data: bytes) -> None:
+        """Appends ``data`` to the buffer"""
+        num_bytes = len(data)
+        self._reserve(num_bytes)
+        self._view[self._end : self._end + num_bytes] = data
+        self._end += num_bytes
+
+    def find(self, byte_sequence: bytes, start: int = 0) -> int:
+        """Returns the position of ``byte_sequence`` among the buffered bytes, or -1
+
+        :param start: The position at which to start searching
+        """
+        index = self._buf.find(byte_sequence, self._start + start, self._end)
+        return -1 if index < 0 else index - self._start
+
+    def _consume(self, num_bytes: int) -> None:
+        self._start += num_bytes
+        if self._start == self._end:
+            self.clear()
+
+    def read(self, num_bytes: int) -> bytearray:
+        """Consumes and returns a copy of the first ``num_bytes`` buffered bytes"""
+        if num_bytes > len(self):
+            raise ValueError(f"Cannot read {num_bytes} bytes, only {len(self)} are buffered")
+
+        data = bytearray(self._view[self._start : self._start + num_bytes])
+        self._consume(num_bytes)
+        return data
+
+    def read_into(self, destination: memoryview) -> int:
+        """Consumes as many buffered bytes as fits into ``destination``, copying them there
+
+        :returns: The number of bytes copied
+        """
+        num_bytes = min(len(destination), len(self))
+        destination[:num_bytes] = self._view[self._start : self._start + num_bytes]
+        self._consume(num_bytes)
+        return num_bytes
@@ -15,6 +15,7 @@ from typing import Optional, Tuple, Union
 import serial
 
 from .buffered_link import BufferedLink, LinkError
+from .receive_buffer import ReceiveBuffer
 
 
 log = logging.getLogger(__name__)
@@ -101,7 +102,7 @@ class ExploreSerialLink(SerialLink):
 
     def __init__(self, port: str, flowcontrol: bool = True) -> None:
         super().__init__(port, flowcontrol)
-        self._buf = bytearray()
+        self._rx = ReceiveBuffer(self._SERIAL_READ_PACKET_SIZE)
 
     def _update_timeout(self) -> None:
         pass
@@ -116,55 +117,48 @@ class ExploreSerialLink(SerialLink):
         self._ser.port = self._port
         self._ser.rtscts = self._flowcontrol
         self._ser.open()
-        self._buf = bytearray()
+        self._rx.clear()
 
         if platform.system().lower() == "windows":
             self._ser.set_buffer_size(rx_size=10**6, tx_size=10**6)
 
         self.send_break()
 
+    def _read_into_buffer(self) -> None:
+        assert self._ser is not None
+        try:
+            self._rx.extend(self._ser.read(self._SERIAL_READ_PACKET_SIZE))
+        except OSError as e:
+            raise LinkError from e
+
     def recv(self, num_bytes: int) -> bytes:
         assert self._ser is not None
         t0 = time()
-        while len(self._buf) < num_bytes:
+        while len(self._rx) < num_bytes:
             if time() - t0 > self._timeout:
                 raise LinkError("recv timeout")
 
-            try:
-                r = bytearray(self._ser.read(self._SERIAL_READ_PACKET_SIZE))
-            except OSError as e:
-                raise LinkError from e
-            self._buf.extend(r)
+            self._read_into_buffer()
 
-        data = self._buf[:num_bytes]
-        self._buf = self._buf[num_bytes:]
-        return data
+        return self._rx.read(num_bytes)
 
     def recv_until(self, bs: bytes) -> bytes:
         assert self._ser is not None
         t0 = time()
+        searched = 0
         while True:
-            try:
-                i = self._buf.index(bs)
-            except ValueError:
-                pass
-            else:
+            i = self._rx.find(bs, searched)
+            if i >= 0:
                 break
 
+            searched = max(0, len(self._rx) - len(bs) + 1)
+
             if time() - t0 > self._timeout:
                 raise LinkError("recv timeout")
 
-            try:
-                r = bytearray(self._ser.read(self._SERIAL_READ_PACKET_SIZE))
-            except OSError as e:
-                raise LinkError from e
-            self._buf.extend(r)
-
-        i += 1
-        data = self._buf[:i]
-        self._buf = self._buf[i:]
+            self._read_into_buffer()
 
-        return data
+        return self._rx.read(i + len(bs))
 
 
 class SerialProcessLink(BaseSerialLink):
@@ -7,17 +7,23 @@ from time import time
 from typing import Optional
 
 from .buffered_link import BufferedLink, LinkError
+from .receive_buffer import ReceiveBuffer
 
 
 class SocketLink(BufferedLink):
     _CHUNK_SIZE = 4096
     _PORT = 6110
 
-    def __init__(self, host: Optional[str] = None, port: Optional[int] = None) -> None:
+    def __init__(
+        self,
+        host: Optional[str] = None,
+        port: Optional[int] = None,
+        chunk_size: int = _CHUNK_SIZE,
+    ) -> None:
         super().__init__()
         self._host = host
         self._sock: Optional[socket.socket] = None
-        self._buf: bytearray = bytearray()
+        self._rx = ReceiveBuffer(chunk_size)
         self._port: int = self._PORT if (port is None) else port
 
     def _update_timeout(self) -> None:
@@ -35,46 +41,54 @@ class SocketLink(BufferedLink):
             self._sock = None
             raise LinkError("failed to connect") from e
 
-        self._buf = bytearray()
+        self._rx.clear()
+
+    def _recv_into(self, buffer: memoryview) -> int:
+        assert self._sock is not None
+        try:
+            num_received = self._sock.recv_into(buffer)
+        except OSError as e:
+            raise LinkError from e
+
+        if num_received == 0:
+            raise LinkError("connection closed")
+
+        return num_received
 
     def recv(self, num_bytes: int) -> bytes:
         assert self._sock is not None
-        while len(self._buf) < num_bytes:
-            try:
-                r = self._sock.recv(self._CHUNK_SIZE)
-            except OSError as e:
-                raise LinkError from e
-            self._buf.extend(r)
-
-        data = self._buf[:num_bytes]
-        self._buf = self._buf[num_bytes:]
+        data = bytearray(num_bytes)
+        view = memoryview(data)
+        received = self._rx.read_into(view)
+
+        while received < num_bytes:
+            if num_bytes - received < self._rx.chunk_size:
+                # Small remainders are received in whole chunks to save system calls
+                self._rx.fill_from(self._recv_into)
+                received += self._rx.read_into(view[received:])
+            else:
+                # Large remainders are received directly into the returned buffer
+                received += self._recv_into(view[received:])
+
         return data
 
     def recv_until(self, bs: bytes) -> bytes:
         assert self._sock is not None
         t0 = time()
+        searched = 0
         while True:
-            try:
-                i = self._buf.index(bs)
-            except ValueError:
-                pass
-            else:
+            i = self._rx.find(bs, searched)
+            if i >= 0:
                 break
 
+            searched = max(0, len(self._rx) - len(bs) + 1)
+
             if time() - t0 > self._timeout:
                 raise LinkError("recv timeout")
 
-            try:
-                r = self._sock.recv(self._CHUNK_SIZE)
-            except OSError as e:
-                raise LinkError from e
-            self._buf.extend(r)
-
-        i += 1
-        data = self._buf[:i]
-        self._buf = self._buf[i:]
+            self._rx.fill_from(self._recv_into)
 
-        return data
+        return self._rx.read(i + len(bs))
 
     def send(self, data: bytes) -> None:
         assert self._sock is not None
@@ -85,4 +99,4 @@ class SocketLink(BufferedLink):
             self._sock.shutdown(socket.SHUT_RDWR)
             self._sock.close()
             self._sock = None
-        self._buf = bytearray()
+        self._rx.clear()
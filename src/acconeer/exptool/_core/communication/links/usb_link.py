@@ -8,6 +8,7 @@ from typing import Any, Optional
 from acconeer.exptool._pyusb import PyUsbCdc
 
 from .buffered_link import BufferedLink, LinkError
+from .receive_buffer import ReceiveBuffer
 
 
 ComPort: Any
@@ -25,6 +26,7 @@ class USBLink(BufferedLink):
         self._vid = vid
         self._pid = pid
         self._serial = serial
+        self._rx = ReceiveBuffer()
 
     def _update_timeout(self) -> None:
         # timeout is manually handled in recv/recv_until
@@ -45,7 +47,7 @@ class USBLink(BufferedLink):
         if not self._port.open():
             raise LinkError(f"Unable to connect to port (vid={self._vid}, pid={self._pid}")
 
-        self._buf = bytearray()
+        self._rx.clear()
         self.send_break()
 
     def send_break(self) -> None:
@@ -53,46 +55,38 @@ class USBLink(BufferedLink):
         sleep(1.0)
         self._port.reset_input_buffer()
 
+    def _read_into_buffer(self) -> None:
+        try:
+            self._rx.extend(self._port.read())
+        except OSError as e:
+            raise LinkError from e
+
     def recv(self, num_bytes: int) -> bytes:
         t0 = time()
-        while len(self._buf) < num_bytes:
+        while len(self._rx) < num_bytes:
             if time() - t0 > self._timeout:
                 raise LinkError("recv timeout")
 
-            try:
-                r = bytearray(self._port.read())
-            except OSError as e:
-                raise LinkError from e
-            self._buf.extend(r)
+            self._read_into_buffer()
 
-        data = self._buf[:num_bytes]
-        self._buf = self._buf[num_bytes:]
-        return data
+        return self._rx.read(num_bytes)
 
     def recv_until(self, bs: bytes) -> bytes:
         t0 = time()
+        searched = 0
         while True:
-            try:
-                i = self._buf.index(bs)
-            except ValueError:
-                pass
-            else:
+            i = self._rx.find(bs, searched)
+            if i >= 0:
                 break
 
+            searched = max(0, len(self._rx) - len(bs) + 1)
+
             if time() - t0 > self._timeout:
                 raise LinkError("recv timeout")
 
-            try:
-                r = bytearray(self._port.read())
-            except OSError as e:
-                raise LinkError from e
-            self._buf.extend(r)
-
-        i += 1
-        data = self._buf[:i]
-        self._buf = self._buf[i:]
+            self._read_into_buffer()
 
-        return data
+        return self._rx.read(i + len(bs))
 
     def send(self, data: bytes) -> None:
         self._port.write(data)
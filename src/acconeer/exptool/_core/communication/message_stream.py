@@ -2,7 +2,10 @@
 # All rights reserved
 from __future__ import annotations
 
+import collections
+import enum
 import json
+import threading
 import time
 import typing as t
 
@@ -17,10 +20,35 @@ class MessageStreamError(Exception):
     pass
 
 
+class MessageStreamOverflowError(MessageStreamError):
+    pass
+
+
+class OverflowPolicy(enum.Enum):
+    """What the reader thread of a :class:`MessageStream` does when its queue is full"""
+
+    BLOCK = "block"
+    """Wait for the queue to be consumed, leaving incoming data in the OS buffers"""
+
+    DROP_OLDEST = "drop_oldest"
+    """Discard the oldest queued droppable message, e.g. result, to make room for the new one
+
+    Other messages, like error responses and logs, are never discarded. If no droppable
+    message is queued, a new droppable message is discarded and other messages are queued.
+    """
+
+    RAISE = "raise"
+    """Stop reading and raise :class:`MessageStreamOverflowError` in the consumer"""
+
+
 class MessageStream:
     """
     Helper object that automatically handles message parsing.
 
+    Messages are read from the link when they are asked for, unless a reader thread is
+    started (see :meth:`start_reader_thread`). The reader thread continuously reads and parses
+    messages into a bounded queue, so that receiving overlaps with processing.
+
     This class takes no responsibility of the passed link.
     """
 
@@ -37,7 +65,102 @@ class MessageStream:
 
         self.protocol = protocol
 
-        self._stream = self._get_stream()
+        self._queue: t.Deque[Message] = collections.deque()
+        self._queue_condition = threading.Condition()
+        self._max_queue_size = 0
+        self._overflow_policy = OverflowPolicy.BLOCK
+        self._droppable: t.Tuple[type[Message], ...] = ()
+        self._reader_thread: t.Optional[threading.Thread] = None
+        self._reader_is_running = False
+        self._reader_stop_requested = False
+        self._reader_error: t.Optional[Exception] = None
+        self._num_dropped_messages = 0
+        self._max_queue_depth = 0
+
+    @property
+    def reader_thread_is_running(self) -> bool:
+        return self._reader_is_running
+
+    @property
+    def queue_depth(self) -> int:
+        """The number of messages currently waiting in the queue"""
+        return len(self._queue)
+
+    @property
+    def max_queue_depth(self) -> int:
+        """The largest number of messages that has been waiting in the queue"""
+        return self._max_queue_depth
+
+    @property
+    def num_dropped_messages(self) -> int:
+        """The number of messages dropped due to :attr:`OverflowPolicy.DROP_OLDEST`"""
+        return self._num_dropped_messages
+
+    def start_reader_thread(
+        self,
+        max_queue_size: int = 100,
+        overflow_policy: OverflowPolicy = OverflowPolicy.BLOCK,
+        until: t.Optional[type[Message]] = None,
+        droppable: t.Tuple[type[Message], ...] = (),
+    ) -> None:
+        """Starts reading messages into a queue in a background thread
+
+        Messages are retrieved from the queue by :meth:`wait_for_message`, as usual. Errors in
+        the reader thread are passed on to ``link_error_callback`` in the consuming thread,
+        after the messages that were read before the error.
+
+        :param max_queue_size: The maximum number of queued messages
+        :param overflow_policy: What to do when the queue is full
+        :param until:
+            If given, the reader thread stops after having queued a message of this type.
+            Following messages are read from the link when asked for.
+        :param droppable:
+            The types of messages that may be discarded with :attr:`OverflowPolicy.DROP_OLDEST`
+        :raises MessageStreamError: If the reader thread is already running
+        """
+        if max_queue_size < 1:
+            raise ValueError("'max_queue_size' needs to be at least 1")
+
+        if overflow_policy is OverflowPolicy.DROP_OLDEST and not droppable:
+            raise ValueError("'droppable' needs to be given with OverflowPolicy.DROP_OLDEST")
+
+        if self._reader_is_running:
+            raise MessageStreamError("Reader thread is already running")
+
+        self._max_queue_size = max_queue_size
+        self._overflow_policy = overflow_policy
+        self._droppable = droppable
+        self._reader_stop_requested = False
+        self._reader_error = None
+        self._num_dropped_messages = 0
+        self._max_queue_depth = len(self._queue)
+        self._reader_is_running = True
+
+        self._reader_thread = threading.Thread(
+            target=self._read_into_queue,
+            args=(until,),
+            name="MessageStreamReader",
+            daemon=True,
+        )
+        self._reader_thread.start()
+
+    def stop_reader_thread(self, timeout_s: t.Optional[float] = None) -> None:
+        """Stops the reader thread, if running
+
+        Messages already in the queue are kept and retrieved before any new ones. If the
+        reader thread is waiting for data, it stops when data arrives, the link times out or
+        the link is disconnected. Errors raised by the reader thread after this call are ignored.
+
+        :param timeout_s: Limits the time spent waiting for the reader thread to stop
+        """
+        with self._queue_condition:
+            self._reader_stop_requested = True
+            self._queue_condition.notify_all()
+
+        if self._reader_thread is not None:
+            self._reader_thread.join(timeout_s)
+            if not self._reader_thread.is_alive():
+                self._reader_thread = None
 
     def send_command(self, command: bytes) -> None:
         try:
@@ -61,7 +184,9 @@ class MessageStream:
         """
         deadline = None if (timeout_s is None) else time.monotonic() + timeout_s
 
-        for message in self._stream:
+        while True:
+            message = self._next_message()
+
             if type(message) is message_type:
                 return message
             else:
@@ -72,30 +197,109 @@ class MessageStream:
                     f"Deadline was reached without finding message of type {message_type.__name__!r}"
                 )
 
-        raise MessageStreamError("No messages to consume")
+    def _receive(self) -> tuple[dict[str, t.Any], bytes]:
+        """Receives the header and payload of a message from the link"""
+        header_in_bytes = self._link.recv_until(self.protocol.end_sequence)
 
-    def _get_stream(self) -> t.Iterator[Message]:
-        """returns an iterator of parsed messages"""
-        while True:
-            try:
-                header_in_bytes = self._link.recv_until(self.protocol.end_sequence)
-            except Exception as e:
-                self._error_callback(e)
-
-            try:
-                header: dict[str, t.Any] = json.loads(header_in_bytes)
-            except json.JSONDecodeError:
-                self._error_callback(RuntimeError(f"Cannot decode header {header_in_bytes!r}"))
-
-            try:
-                payload_size = header["payload_size"]
-            except KeyError:
-                payload = bytes()
-            else:
+        try:
+            header: dict[str, t.Any] = json.loads(header_in_bytes)
+        except json.JSONDecodeError:
+            raise RuntimeError(f"Cannot decode header {header_in_bytes!r}")
+
+        try:
+            payload_size = header["payload_size"]
+        except KeyError:
+            payload = bytes()
+        else:
+            payload = self._link.recv(payload_size)
+
+        return header, payload
+
+    def _enqueue(self, message: Message) -> bool:
+        """Puts a message in the queue according to the overflow policy
+
+        :returns: Whether the reader thread should continue
+        """
+        with self._queue_condition:
+            if len(self._queue) >= self._max_queue_size:
+                if self._overflow_policy is OverflowPolicy.BLOCK:
+                    while (
+                        len(self._queue) >= self._max_queue_size
+                        and not self._reader_stop_requested
+                    ):
+                        self._queue_condition.wait()
+                elif self._overflow_policy is OverflowPolicy.DROP_OLDEST:
+                    if not self._drop_oldest_droppable() and isinstance(message, self._droppable):
+                        self._num_dropped_messages += 1
+                        return not self._reader_stop_requested
+                else:
+                    self._reader_error = MessageStreamOverflowError(
+                        f"More than {self._max_queue_size} messages were queued"
+                    )
+                    return False
+
+            self._queue.append(message)
+            self._max_queue_depth = max(self._max_queue_depth, len(self._queue))
+            self._queue_condition.notify_all()
+
+            return not self._reader_stop_requested
+
+    def _drop_oldest_droppable(self) -> bool:
+        """Removes the oldest queued message of a droppable type
+
+        :returns: Whether a message was removed
+        """
+        for idx, message in enumerate(self._queue):
+            if isinstance(message, self._droppable):
+                del self._queue[idx]
+                self._num_dropped_messages += 1
+                return True
+
+        return False
+
+    def _read_into_queue(self, until: t.Optional[type[Message]]) -> None:
+        try:
+            while not self._reader_stop_requested:
                 try:
-                    payload = self._link.recv(payload_size)
+                    message = self.protocol.parse_message(*self._receive())
                 except Exception as e:
-                    self._error_callback(e)
+                    if not self._reader_stop_requested:
+                        self._reader_error = e
+                    return
+
+                if not self._enqueue(message) or type(message) is until:
+                    return
+        finally:
+            with self._queue_condition:
+                self._reader_is_running = False
+                self._queue_condition.notify_all()
+
+    def _next_message(self) -> Message:
+        with self._queue_condition:
+            while True:
+                if isinstance(self._reader_error, MessageStreamOverflowError):
+                    break
+
+                if self._queue:
+                    message = self._queue.popleft()
+                    self._queue_condition.notify_all()
+                    return message
+
+                if not self._reader_is_running:
+                    break
+
+                self._queue_condition.wait()
+
+            error, self._reader_error = self._reader_error, None
+
+        if error is not None:
+            self._error_callback(error)
+            raise error
+
+        try:
+            header, payload = self._receive()
+        except Exception as e:
+            self._error_callback(e)
+            raise
 
-            resp = self.protocol.parse_message(header, payload)
-            yield resp
+        return self.protocol.parse_message(header, payload)
@@ -5,6 +5,9 @@ from __future__ import annotations
 
 from typing import Optional, Tuple
 
+import numpy as np
+import numpy.typing as npt
+
 
 def unwrap_ticks(
     ticks: list[int], minimum_tick: Optional[int], limit: int = 2**32
@@ -50,3 +53,57 @@ def unwrap_ticks(
         ticks = [num_wraps * limit + tick for tick in ticks]
 
     return ticks, max(ticks)
+
+
+def unwrap_ticks_array(
+    ticks: npt.NDArray[np.int64], minimum_tick: Optional[int], limit: int = 2**32
+) -> Tuple[npt.NDArray[np.int64], Optional[int]]:
+    """Unwraps the ticks of a sequence of collections of results in one go
+
+    Equivalent to calling :func:`unwrap_ticks` on each row of the 2-D array ``ticks``
+    (frames x ticks in each frame), passing the returned minimum tick on to the next row.
+    A 1-D array is treated as a single frame.
+
+    Since the number of wraps only ever increases between two consecutive frames, the
+    number of wraps added to each frame is a cumulative sum of per-frame increments,
+    which removes the sequential dependency between frames:
+
+    >>> ticks = np.array([[80, 90], [98, 2], [5, 10]])
+    >>> unwrapped, minimum_tick = unwrap_ticks_array(ticks, minimum_tick=None, limit=100)
+    >>> unwrapped.tolist(), minimum_tick
+    ([[80, 90], [98, 102], [105, 110]], 110)
+
+    If ``ticks`` is empty, ``minimum_tick`` is returned as-is.
+    """
+
+    ticks = np.asarray(ticks, dtype=np.int64)
+
+    if ticks.size == 0:
+        return ticks.copy(), minimum_tick
+
+    frames = ticks.reshape(-1, ticks.shape[-1])
+    lows = frames.min(axis=1)
+    highs = frames.max(axis=1)
+
+    if lows.min() < 0 or highs.max() >= limit:
+        raise ValueError("Tick value out of bounds")
+
+    half_limit = limit // 2
+    spans_wrap = (highs - lows) > half_limit
+
+    if spans_wrap.any():
+        frames = np.where(
+            spans_wrap[:, np.newaxis] & (frames < half_limit), frames + limit, frames
+        )
+        lows = frames.min(axis=1)
+        highs = frames.max(axis=1)
+
+    # ceil((previous maximum - current minimum) / limit), i.e. the number of wraps that needs to
+    # be added to a frame for all its ticks to be at least the previous maximum.
+    wrap_increments = np.empty(len(frames), dtype=np.int64)
+    wrap_increments[0] = 0 if minimum_tick is None else -((lows[0] - minimum_tick) // limit)
+    wrap_increments[1:] = -((lows[1:] - highs[:-1]) // limit)
+    num_wraps = np.cumsum(wrap_increments)
+
+    unwrapped = frames + num_wraps[:, np.newaxis] * limit
+    return unwrapped.reshape(ticks.shape), int(highs[-1] + num_wraps[-1] * limit)
@@ -12,14 +12,26 @@ from numpy import typing as npt
 INT_16_COMPLEX = np.dtype([("real", "int16"), ("imag", "int16")])
 
 
-def int16_complex_array_to_complex(array: npt.NDArray[t.Any]) -> npt.NDArray[np.complex_]:
+def int16_complex_array_to_complex(
+    array: npt.NDArray[t.Any],
+    dtype: npt.DTypeLike = np.complex128,
+    out: t.Optional[npt.NDArray[t.Any]] = None,
+) -> npt.NDArray[np.complex_]:
     """Converts an array with dtype = INT_16_COMPLEX
     (structured with parts "real" and "imag") into
     an array with plain complex dtype (non-structured).
+
+    The parts are written directly into the output array, which is allocated with ``dtype``
+    unless ``out`` is given.
     """
-    real = array["real"].astype("float")
-    imaginary = array["imag"].astype("float")
-    return real + 1.0j * imaginary  # type: ignore[no-any-return]
+    if out is None:
+        out = np.empty(array.shape, dtype=dtype)
+    elif out.shape != array.shape:
+        raise ValueError(f"Expected 'out' to have shape {array.shape}, got {out.shape}")
+
+    out.real = array["real"]
+    out.imag = array["imag"]
+    return out
 
 
 def complex_array_to_int16_complex(array: npt.NDArray[np.complex_]) -> npt.NDArray[t.Any]:
@@ -1,5 +1,5 @@
 # Copyright (c) Acconeer AB, 2023
 # All rights reserved
 
-from .h5_record import ChunkedH5Saver, H5Recorder, H5Saver
+from .h5_record import ChunkedH5Saver, H5Recorder, H5Saver, ThreadedH5Saver
 from .recorder import Recorder, RecorderAttachable
@@ -2,4 +2,4 @@
 # All rights reserved
 
 from .recorder import H5Recorder
-from .saver import ChunkedH5Saver, H5Saver
+from .saver import ChunkedH5Saver, H5Saver, ThreadedH5Saver
@@ -3,8 +3,10 @@
 
 from __future__ import annotations
 
+import queue
+import threading
 import typing as t
-from time import time
+from time import monotonic, time
 
 import h5py
 import typing_extensions as te
@@ -105,3 +107,134 @@ class ChunkedH5Saver(H5Saver[_ConfigT, _MetadataT, _ResultT, _ServerInfoT]):
             self._saver._sample(group, self._chunk_buffer)
             self._chunk_buffer = []
         self._saver._stop_session(group)
+
+
+_STOP = object()
+
+
+class ThreadedH5Saver(H5Saver[_ConfigT, _MetadataT, _ResultT, _ServerInfoT]):
+    """Writes results to file in a background thread, in batches
+
+    Results passed to :meth:`_sample` are queued and written by a writer thread. A batch is
+    written when it has ``flush_frames`` results, or when its first result has waited
+    ``flush_interval_ms`` milliseconds, whichever comes first. Thereby, file system access and
+    compression don't add to the latency of the sampling thread.
+
+    Stopping the session waits until all queued results are written. Errors raised by the
+    writer thread are raised in the sampling thread, by the next call to :meth:`_sample` or
+    :meth:`_stop_session`.
+
+    :param saver:
+        Saver used to write results to file
+    :param flush_frames:
+        The maximum number of results per batch. Defaults to 512.
+    :param flush_interval_ms:
+        The maximum time, in milliseconds, a result waits before being written. Defaults to 1000.
+    :param max_queue_size:
+        If larger than 0, :meth:`_sample` blocks while this many results are queued, instead of
+        letting the queue grow without limit.
+    """
+
+    _DEFAULT_FLUSH_FRAMES = 512
+    _DEFAULT_FLUSH_INTERVAL_MS = 1000.0
+
+    _saver: H5Saver[_ConfigT, _MetadataT, _ResultT, _ServerInfoT]
+    _queue: queue.Queue[t.Any]
+    _writer_thread: t.Optional[threading.Thread]
+    _writer_error: t.Optional[BaseException]
+
+    def __init__(
+        self,
+        saver: H5Saver[_ConfigT, _MetadataT, _ResultT, _ServerInfoT],
+        flush_frames: t.Optional[int] = None,
+        flush_interval_ms: t.Optional[float] = None,
+        max_queue_size: int = 0,
+    ) -> None:
+        if flush_frames is not None and flush_frames < 1:
+            raise ValueError("'flush_frames' needs to be at least 1")
+
+        if flush_interval_ms is not None and flush_interval_ms < 0:
+            raise ValueError("'flush_interval_ms' cannot be negative")
+
+        self._saver = saver
+        self._flush_frames = self._DEFAULT_FLUSH_FRAMES if flush_frames is None else flush_frames
+        self._flush_interval = (
+            self._DEFAULT_FLUSH_INTERVAL_MS if flush_interval_ms is None else flush_interval_ms
+        ) / 1000
+        self._queue = queue.Queue(maxsize=max_queue_size)
+        self._writer_thread = None
+        self._writer_error = None
+
+    def _start(self) -> None:
+        self._saver._start()
+
+    def _write_server_info(self, group: h5py.Group, server_info: _ServerInfoT) -> None:
+        self._saver._write_server_info(group, server_info)
+
+    def _start_session(
+        self, group: h5py.Group, *, config: _ConfigT, metadata: _MetadataT, **kwargs: t.Any
+    ) -> None:
+        self._saver._start_session(group, config=config, metadata=metadata, **kwargs)
+
+        self._writer_error = None
+        self._writer_thread = threading.Thread(
+            target=self._write_batches,
+            args=(group,),
+            name="H5SaverWriter",
+            daemon=True,
+        )
+        self._writer_thread.start()
+
+    def _sample(self, group: h5py.Group, results: t.Iterable[_ResultT]) -> None:
+        self._raise_writer_error()
+
+        if self._writer_thread is None:
+            raise RuntimeError("No session is started. This should not happen.")
+
+        for result in results:
+            self._queue.put(result)
+
+    def _stop_session(self, group: h5py.Group) -> None:
+        if self._writer_thread is not None:
+            self._queue.put(_STOP)
+            self._writer_thread.join()
+            self._writer_thread = None
+
+        self._saver._stop_session(group)
+        self._raise_writer_error()
+
+    def _raise_writer_error(self) -> None:
+        error, self._writer_error = self._writer_error, None
+        if error is not None:
+            raise error
+
+    def _write_batches(self, group: h5py.Group) -> None:
+        batch: list[_ResultT] = []
+        deadline = 0.0
+
+        while True:
+            timeout = max(0.0, deadline - monotonic()) if batch else None
+
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                item = None
+
+            stop = item is _STOP
+
+            if item is not None and not stop:
+                if not batch:
+                    deadline = monotonic() + self._flush_interval
+                batch.append(item)
+
+            if batch and (stop or len(batch) >= self._flush_frames or monotonic() >= deadline):
+                if self._writer_error is None:
+                    try:
+                        self._saver._sample(group, batch)
+                    except BaseException as e:
+                        # Keep consuming the queue, so that the sampling thread isn't blocked
+                        self._writer_error = e
+                batch = []
+
+            if stop:
+                return
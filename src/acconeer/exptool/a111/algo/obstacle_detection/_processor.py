@@ -28,6 +28,14 @@ DIR_PATH = os.path.dirname(os.path.realpath(__file__))
 log = logging.getLogger(__name__)
 
 
+def _sequential_sum(arr, axis):
+    """Sums ``arr`` along ``axis`` in element order, unlike the pairwise summation of np.sum"""
+    if arr.shape[axis] == 0:
+        return np.zeros(np.delete(arr.shape, axis))
+
+    return np.take(np.cumsum(arr, axis=axis), -1, axis=axis)
+
+
 def get_sensor_config():
     config = et.a111.IQServiceConfig()
     config.range_interval = [0.1, 0.5]
@@ -321,23 +329,14 @@ class Processor:
         """Resets all arrays used for calculations. This was done on first sweep before."""
         self.sweep_map = np.zeros((1, len_range, self.fft_len), dtype="complex")
         self.fft_bg = np.zeros((1, len_range, self.fft_len))
-        self.hamming_map = np.zeros((len_range, self.fft_len))
-
-        for i in range(len_range):
-            self.hamming_map[i, :] = np.hamming(self.fft_len)
+        self.hamming_map = np.tile(np.hamming(self.fft_len), (len_range, 1))
 
         self.env_xs = np.linspace(*self.sensor_config.range_interval * 100, len_range)
         self.peak_prop_num = 4
         self.peak_hist = np.zeros((1, self.nr_locals, self.peak_prop_num, self.peak_hist_len))
         self.peak_hist *= float(np.nan)
         self.mask = np.zeros((len_range, self.fft_len))
-        self.threshold_map = np.zeros((len_range, self.fft_len))
-
-        for dist in range(len_range):
-            for freq in range(self.fft_len):
-                self.threshold_map[dist, freq] = self.variable_thresholding(
-                    freq, dist, self.threshold, self.static_threshold
-                )
+        self.threshold_map = self.variable_threshold_map(self.threshold, self.static_threshold)
 
     def _process_single_sensor(self, sweep, fft_psd):
         self.push(sweep[0, :], self.sweep_map[0, :, :])
@@ -492,32 +491,14 @@ class Processor:
         static_pwl_amp = []
         static_pwl_dist = []
 
-        static_sum = 0.0
-        adjacent_sum = np.zeros(2)
-        moving_sum = 0.0
-        moving_sum_sqr = 0.0
-        moving_mean_array = np.zeros(dist_len)
-
-        moving_max = 0.0
-        moving_min = 0.0
-
-        for dist_index in range(dist_len):
-            static_sum += fft_bg[dist_index, static_idx]
-            adjacent_sum[0] += fft_bg[dist_index, adjacent_idx[0]]
-            adjacent_sum[1] += fft_bg[dist_index, adjacent_idx[1]]
-
-            current_dist_moving_sum = 0.0
-            for freq_index in moving_range:
-                val = fft_bg[dist_index, freq_index]
-                current_dist_moving_sum += val
-                if val > moving_max:
-                    moving_max = val
-                if val < moving_min:
-                    moving_min = val
-                moving_sum += val
-                moving_sum_sqr += val * val
-
-            moving_mean_array[dist_index] = current_dist_moving_sum / len(moving_range)
+        # Sums are accumulated in order (cumsum, not the pairwise np.sum) to get the exact same
+        # result as summing element by element
+        static_sum = _sequential_sum(fft_bg[:, static_idx], axis=0)
+        adjacent_sum = _sequential_sum(fft_bg[:, adjacent_idx], axis=0)
+
+        moving_bg = fft_bg[:, moving_range]
+        moving_max = moving_bg.max(initial=0.0)
+        moving_mean_array = _sequential_sum(moving_bg, axis=1) / len(moving_range)
 
         segs = self.adapt_background_segment_step(moving_mean_array, dist_len)
         segs_nr = int(len(segs) / 2)
@@ -533,22 +514,18 @@ class Processor:
 
         bin_width = dist_len / pwl_static_points
 
-        pwl_y_max = 0
-        pwl_x_max = 0
         for point_index in range(pwl_static_points):
             dist_begin = int(point_index * bin_width)
             dist_end = int((point_index + 1) * bin_width)
 
-            if point_index == pwl_static_points:
-                dist_end = dist_len
-
+            # The first maximum above zero of the bin, or (0, 0) if there is none
+            static_bin = fft_bg[dist_begin:dist_end, static_idx]
             pwl_x_max = 0.0
             pwl_y_max = 0.0
-            for dist_index in range(dist_begin, dist_end):
-                val = fft_bg[dist_index, static_idx]
-                if val > pwl_y_max:
-                    pwl_x_max = dist_index
-                    pwl_y_max = val
+            if static_bin.size > 0 and static_bin.max() > pwl_y_max:
+                bin_max_index = int(np.argmax(static_bin))
+                pwl_x_max = dist_begin + bin_max_index
+                pwl_y_max = static_bin[bin_max_index]
 
             static_pwl_dist.append(pwl_x_max)
             static_pwl_amp.append(pwl_y_max)
@@ -571,15 +548,8 @@ class Processor:
     def adapt_background_segment_step(self, data_y, data_length):
         mid_index = int(data_length / 2)
 
-        y1 = 0
-        for i in range(mid_index):
-            if y1 < data_y[i]:
-                y1 = data_y[i]
-
-        y2 = 0
-        for i in range(mid_index, int(data_length)):
-            if y2 < data_y[i]:
-                y2 = data_y[i]
+        y1 = max(0, np.max(data_y[:mid_index], initial=0))
+        y2 = max(0, np.max(data_y[mid_index : int(data_length)], initial=0))
 
         # Check the plateau levels and return early if the step is non-decreasing
         if y1 <= y2:
@@ -603,11 +573,10 @@ class Processor:
             x1 = 0
             return [x1, x2, y1, y2]
 
-        max_neg_slope = 0
-        for i in range(intersection_index):
-            neg_slope = (data_y[i] - y2) / float(intersection_index - i)
-            if max_neg_slope < neg_slope:
-                max_neg_slope = neg_slope
+        neg_slopes = (data_y[:intersection_index] - y2) / (
+            intersection_index - np.arange(intersection_index, dtype=float)
+        )
+        max_neg_slope = max(0, neg_slopes.max())
         x1 = x2 - (y1 - y2) / max_neg_slope
 
         return [x1, x2, y1, y2]
@@ -630,43 +599,64 @@ class Processor:
             fft_bg, static_idx, static_pwl_dist, static_pwl_amp, pwl_static_points
         )
 
-        for dist_index in range(dist_len):
-            static_val = fft_bg[dist_index, 8]
-            if static_val < moving_max:
-                static_val = moving_max
-                fft_bg[dist_index, static_idx] = static_val
+        static_vals = fft_bg[:, 8].copy()
+        below_moving_max = static_vals < moving_max
+        static_vals[below_moving_max] = moving_max
+        fft_bg[below_moving_max, static_idx] = moving_max
 
-            interp_adjacent = moving_max
-            if fac > 0:
-                interp_adjacent = static_val / fac
-                fft_bg[dist_index, adjacent_idx] = interp_adjacent
+        if fac > 0:
+            fft_bg[:, adjacent_idx] = (static_vals / fac)[:, None]
 
-        for freq_index in moving_range:
-            self.apply_pwl_segments(
-                fft_bg, freq_index, moving_pwl_dist, moving_pwl_amp, pwl_moving_points
-            )
+        # All moving frequencies share the same piecewise linear background
+        fft_bg[:, moving_range] = self.pwl_segments(
+            dist_len, moving_pwl_dist, moving_pwl_amp, pwl_moving_points
+        )[:, None]
 
     def apply_pwl_segments(self, fft_bg, freq_index, pwl_dist, pwl_amp, pwl_points):
-        dist_len = fft_bg.shape[0]
+        fft_bg[:, freq_index] = self.pwl_segments(fft_bg.shape[0], pwl_dist, pwl_amp, pwl_points)
 
-        x_start = 0
-        x_stop = pwl_dist[0]
-        y_start = pwl_amp[0]
-        y_stop = pwl_amp[0]
-
-        segment_stop = 0
-        for dist_index in range(dist_len):
-            if x_stop < dist_index:
-                x_start = x_stop
-                y_start = y_stop
-                segment_stop += 1
-                if segment_stop < pwl_points:
-                    x_stop = pwl_dist[segment_stop]
-                    y_stop = pwl_amp[segment_stop]
-                else:
-                    x_stop = dist_len - 1
-            interp = self.remap(dist_index, x_start, x_stop, y_start, y_stop)
-            fft_bg[dist_index, freq_index] = interp
+    def pwl_segments(self, dist_len, pwl_dist, pwl_amp, pwl_points):
+        """Interpolates the piecewise linear segments given by pwl_dist and pwl_amp
+
+        Going through the distances in order, the next segment is started at the first distance
+        past the end of the current one. At most one segment is started per distance.
+        """
+        x_starts = [0]
+        x_stops = [pwl_dist[0]]
+        y_starts = [pwl_amp[0]]
+        y_stops = [pwl_amp[0]]
+        segment_starts = []
+
+        segment_start = -1
+        for segment_stop in range(1, pwl_points + 1):
+            # The segment never ends if no later distance is past its end
+            if not x_stops[-1] < dist_len - 1 or segment_start + 1 > dist_len - 1:
+                break
+
+            segment_start = max(segment_start + 1, int(np.floor(x_stops[-1])) + 1)
+            segment_starts.append(segment_start)
+            x_starts.append(x_stops[-1])
+            y_starts.append(y_stops[-1])
+            if segment_stop < pwl_points:
+                x_stops.append(pwl_dist[segment_stop])
+                y_stops.append(pwl_amp[segment_stop])
+            else:
+                x_stops.append(dist_len - 1)
+                y_stops.append(y_stops[-1])
+
+        dist_indices = np.arange(dist_len)
+        segments = np.searchsorted(segment_starts, dist_indices, side="right")
+
+        interp = np.empty(dist_len)
+        for segment, (x_start, x_stop, y_start, y_stop) in enumerate(
+            zip(x_starts, x_stops, y_starts, y_stops)
+        ):
+            in_segment = segments == segment
+            interp[in_segment] = self.remap(
+                dist_indices[in_segment], x_start, x_stop, y_start, y_stop
+            )
+
+        return interp
 
     def find_peaks(self, arr):
         if not self.nr_locals:
@@ -677,9 +667,7 @@ class Processor:
         peak_avg = peak[1]
 
         peak_val = arr[peak[0], peak[1]]
-        thresh = self.variable_thresholding(
-            peak[1], peak[0], self.threshold, self.static_threshold
-        )
+        thresh = self.threshold_map[peak[0], peak[1]]
 
         if peak_val < thresh:
             peak = None
@@ -699,9 +687,7 @@ class Processor:
             for i in range(self.nr_locals - 1):
                 self.peak_masking(local_peaks[i, :])
                 p = np.asarray(unravel_index(np.argmax(self.mask), arr.shape))
-                thresh = self.variable_thresholding(
-                    p[1], p[0], self.threshold, self.static_threshold
-                )
+                thresh = self.threshold_map[p[0], p[1]]
                 peak_val = arr[p[0], p[1]]
                 if peak_val > thresh:
                     dist_edge = self.edge(arr[:, p[1]], p[0], self.edge_ratio)
@@ -755,28 +741,33 @@ class Processor:
         if distance_end_index + distance_index >= dist_len:
             distance_end_index = dist_len - distance_index - 1
 
-        for i in range(-angle_depth, angle_depth + 1):
-            wrapped_row = (angle_len + i + angle_index) % angle_len
-            for j in range(int(distance_start_index), int(distance_end_index) + 1):
-                dist_from_peak = (
-                    abs(i) * angle_scaling_per_index + abs(j) * distance_scaling_per_index
-                )
-                mask_val = (1 - dist_from_peak**2) * peak_val * amplitude_margin
-                if self.mask[int(j + distance_index), int(wrapped_row)] < mask_val:
-                    self.mask[int(j + distance_index), int(wrapped_row)] = 0
+        i = np.arange(-angle_depth, angle_depth + 1)
+        j = np.arange(int(distance_start_index), int(distance_end_index) + 1)
+        wrapped_rows = ((angle_len + i + angle_index) % angle_len).astype(int)
+        dist_from_peak = (
+            np.abs(i)[None, :] * angle_scaling_per_index
+            + np.abs(j)[:, None] * distance_scaling_per_index
+        )
+        mask_val = (1 - dist_from_peak**2) * peak_val * amplitude_margin
+
+        # All comparisons are made before masking, which gives the same result since masked
+        # values are only ever set to zero
+        rows = (j + distance_index).astype(int)[:, None]
+        cols = np.broadcast_to(wrapped_rows[None, :], mask_val.shape)
+        rows = np.broadcast_to(rows, mask_val.shape)
+        masked = self.mask[rows, cols] < mask_val
+        self.mask[rows[masked], cols[masked]] = 0
 
     def edge(self, arr, peak_idx, ratio=0.5):
         if ratio == 1.0:
             return peak_idx
 
         s0 = arr[peak_idx]
-        for i in range(peak_idx):
-            if peak_idx - i < 0:
-                peak_idx = 0
-                break
-            if arr[peak_idx - i] < s0 * ratio:
-                peak_idx -= i
-                break
+
+        # The closest index at or before the peak, but after index 0, below the ratio
+        below = arr[peak_idx:0:-1] < s0 * ratio
+        if below.any():
+            peak_idx -= int(np.argmax(below))
 
         return peak_idx
 
@@ -817,3 +808,46 @@ class Processor:
         thresh += self.clamp(thresh_add, 0, self.close_threshold_addition)
 
         return thresh
+
+    def variable_threshold_map(self, min_thresh, max_thresh):
+        """Evaluates :meth:`variable_thresholding` for all distances and frequencies at once"""
+        dist = self.env_xs
+        distance_gradient = self.static_dist_gradient
+        thresh = self.remap(
+            dist,
+            self.static_distance - distance_gradient,
+            self.static_distance,
+            max_thresh,
+            min_thresh,
+        )
+        thresh = np.minimum(np.maximum(thresh, min_thresh), max_thresh)
+        thresh = np.broadcast_to(thresh, dist.shape)[:, None]
+
+        null_frequency = self.fft_len / 2
+        frequency_gradient = self.static_freq_limit
+        freq_index = np.arange(self.fft_len)
+
+        freq = np.minimum(
+            np.maximum(freq_index, null_frequency - frequency_gradient), null_frequency
+        )
+        low_thresh = self.remap(
+            freq, null_frequency - frequency_gradient, null_frequency, min_thresh, thresh
+        )
+        freq = np.minimum(
+            np.maximum(freq_index, null_frequency), null_frequency + frequency_gradient
+        )
+        high_thresh = self.remap(
+            freq, null_frequency, null_frequency + frequency_gradient, thresh, min_thresh
+        )
+        thresh = np.where(freq_index <= null_frequency, low_thresh, high_thresh)
+
+        thresh_add = self.remap(
+            dist,
+            self.sensor_config.range_start * 100,
+            self.sensor_config.range_start * 100 + self.close_dist_limit,
+            self.close_threshold_addition,
+            0.0,
+        )
+        thresh_add = np.minimum(np.maximum(thresh_add, 0), self.close_threshold_addition)
+
+        return thresh + np.broadcast_to(thresh_add, dist.shape)[:, None]
@@ -129,6 +129,235 @@ class Recorder:
         return self.record
 
 
+class H5Recorder:
+    """Records directly to an HDF5 file, keeping a bounded number of frames in memory
+
+    Frames are buffered ``chunk_size`` at a time and appended to chunked, compressed datasets.
+    ``data_info`` is stored column-wise, one dataset per key with dimensions (frame, sensor),
+    in a ``data_info`` group. The file can be loaded with :func:`load`.
+
+    With ``max_len`` set, only the latest ``max_len`` frames are kept, overwriting the oldest
+    frame in place. The frames are put in chronological order on :meth:`close`.
+    """
+
+    def __init__(
+        self,
+        filename: Union[str, Path],
+        *,
+        sensor_config: configbase.SensorConfig,
+        session_info: dict,
+        module_key: Optional[str] = None,
+        processing_config: Optional[configbase.ProcessingConfig] = None,
+        rss_version: Optional[str] = None,
+        mode: Optional[_modes.Mode] = None,
+        max_len: Optional[int] = None,
+        chunk_size: int = 64,
+    ):
+        if not isinstance(sensor_config, configbase.SensorConfig):
+            raise TypeError("Unexpected sensor config type")
+
+        if processing_config is not None and not isinstance(
+            processing_config, configbase.ProcessingConfig
+        ):
+            raise TypeError("Unexpected processing config type")
+
+        if max_len is not None and max_len < 1:
+            raise ValueError("max_len must be at least 1")
+
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+
+        filename = str(filename)
+        if not filename.lower().endswith(".h5"):
+            filename = filename + ".h5"
+
+        self.mode = sensor_config.mode if mode is None else mode
+        self.max_len = max_len
+        self.chunk_size = chunk_size if max_len is None else min(chunk_size, max_len)
+
+        self._file = h5py.File(filename, "w")
+        self._num_buffered = 0
+        self._num_flushed = 0
+        self._data_buffer: Optional[np.ndarray] = None
+        self._sample_times_buffer = np.empty(self.chunk_size)
+        self._data_info_buffers: dict = {}
+
+        strings = {
+            "mode": self.mode.name.lower(),
+            "sensor_config_dump": sensor_config._dumps(),
+            "session_info": json.dumps(session_info),
+            "module_key": module_key,
+            "processing_config_dump": (
+                None if processing_config is None else processing_config._dumps()
+            ),
+            "rss_version": rss_version,
+            "lib_version": et.__version__,
+            "timestamp": datetime.datetime.now().isoformat(timespec="seconds"),
+        }
+        for k, v in strings.items():
+            if v is not None:
+                self._file.create_dataset(k, data=v, dtype=h5py.special_dtype(vlen=str))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+    @property
+    def num_frames(self) -> int:
+        """The number of frames in the recording, including buffered ones"""
+        num_frames = self._num_flushed + self._num_buffered
+        return num_frames if self.max_len is None else min(num_frames, self.max_len)
+
+    def sample(self, data_info: list, data: np.ndarray):
+        expected_num_dims = 3 if self.mode == _modes.Mode.SPARSE else 2
+        if data.ndim != expected_num_dims:  # then assume data is squeezed
+            # unsqueeze (add back sensor dim)
+            data = data[None, ...]
+            data_info = [data_info]
+
+        if self._data_buffer is None:
+            self._create_datasets(data_info, data)
+
+        i = self._num_buffered
+        self._data_buffer[i] = data
+        self._sample_times_buffer[i] = time.time()
+
+        if data_info and data_info[0].keys() != self._data_info_buffers.keys():
+            raise ValueError("data_info keys changed during the recording")
+
+        for k, buffer in self._data_info_buffers.items():
+            buffer[i] = [sensor_data_info[k] for sensor_data_info in data_info]
+
+        self._num_buffered += 1
+        if self._num_buffered == self.chunk_size:
+            self.flush()
+
+    def _create_datasets(self, data_info: list, data: np.ndarray):
+        if np.iscomplexobj(data):
+            dtype = np.dtype("complex")
+        elif np.all(data == data.astype("u2")):
+            # Widened on the fly if a later frame doesn't fit, see _flush_data
+            dtype = np.dtype("u2")
+        else:
+            dtype = np.dtype("float")
+
+        self._data_buffer = np.empty((self.chunk_size, *data.shape), dtype=data.dtype)
+        self._create_dataset("data", data.shape, dtype, compression="gzip")
+        self._create_dataset("sample_times", (), np.dtype("float"))
+
+        data_info_group = self._file.create_group("data_info")
+        data_info_group.attrs["keys"] = json.dumps(list(data_info[0].keys()) if data_info else [])
+        data_info_group.attrs["num_sensors"] = len(data_info)
+        for k, v in (data_info[0] if data_info else {}).items():
+            dtype = np.asarray(v).dtype
+            if dtype.kind not in "biuf":
+                raise TypeError(f"Unsupported data_info value type for '{k}': {type(v)}")
+
+            dtype = np.dtype(bool) if dtype.kind == "b" else np.dtype(dtype.kind + "8")
+            self._data_info_buffers[k] = np.empty((self.chunk_size, len(data_info)), dtype=dtype)
+            self._create_dataset(f"data_info/{k}", (len(data_info),), dtype)
+
+    def _create_dataset(self, name: str, frame_shape: tuple, dtype: np.dtype, **kwargs):
+        self._file.create_dataset(
+            name,
+            shape=(0, *frame_shape),
+            maxshape=(None if self.max_len is None else self.max_len, *frame_shape),
+            chunks=(self.chunk_size, *frame_shape),
+            dtype=dtype,
+            **kwargs,
+        )
+
+    def flush(self):
+        """Writes the buffered frames to the file"""
+        if self._num_buffered == 0:
+            return
+
+        n = self._num_buffered
+        self._flush_data(self._data_buffer[:n])
+        self._write_rows(self._file["sample_times"], self._sample_times_buffer[:n])
+        for k, buffer in self._data_info_buffers.items():
+            self._write_rows(self._file[f"data_info/{k}"], buffer[:n])
+
+        self._num_flushed += n
+        self._num_buffered = 0
+
+    def _flush_data(self, data: np.ndarray):
+        dataset = self._file["data"]
+
+        if dataset.dtype == np.dtype("u2") and not np.all(data == data.astype("u2")):
+            dataset = self._widen_data(np.dtype("float"))
+
+        self._write_rows(dataset, data)
+
+    def _widen_data(self, dtype: np.dtype) -> h5py.Dataset:
+        old = self._file["data"]
+        frame_shape = old.shape[1:]
+        self._create_dataset("data_widened", frame_shape, dtype, compression="gzip")
+        new = self._file["data_widened"]
+        new.resize(old.shape[0], axis=0)
+
+        for start in range(0, old.shape[0], self.chunk_size):
+            new[start : start + self.chunk_size] = old[start : start + self.chunk_size]
+
+        del self._file["data"]
+        self._file.move("data_widened", "data")
+        return self._file["data"]
+
+    def _write_rows(self, dataset: h5py.Dataset, rows: np.ndarray):
+        n = len(rows)
+
+        if self.max_len is None:
+            start = self._num_flushed
+            dataset.resize(start + n, axis=0)
+            dataset[start : start + n] = rows
+            return
+
+        start = self._num_flushed % self.max_len
+        dataset.resize(min(self._num_flushed + n, self.max_len), axis=0)
+
+        num_before_wrap = min(n, self.max_len - start)
+        dataset[start : start + num_before_wrap] = rows[:num_before_wrap]
+        if num_before_wrap < n:
+            dataset[: n - num_before_wrap] = rows[num_before_wrap:]
+
+    def close(self):
+        if not self._file:
+            return
+
+        self.flush()
+
+        if self._data_buffer is None:
+            self._file.create_dataset("data", data=np.empty(0))
+            self._file.create_dataset("sample_times", data=np.empty(0))
+            data_info_group = self._file.create_group("data_info")
+            data_info_group.attrs["keys"] = "[]"
+            data_info_group.attrs["num_sensors"] = 0
+
+        if self.max_len is not None and self._num_flushed > self.max_len:
+            shift = -(self._num_flushed % self.max_len)
+            datasets = [self._file["data"], self._file["sample_times"]]
+            datasets += [self._file[f"data_info/{k}"] for k in self._data_info_buffers]
+            for dataset in datasets:
+                dataset[...] = np.roll(dataset[...], shift, axis=0)
+
+        self._file.close()
+
+
+def _data_info_from_columns(group: h5py.Group, num_frames: int) -> list:
+    keys = json.loads(group.attrs["keys"])
+    columns = [group[k][()].tolist() for k in keys]
+
+    if not columns:
+        return [[{} for _ in range(group.attrs["num_sensors"])] for _ in range(num_frames)]
+
+    return [
+        [dict(zip(keys, sensor_values)) for sensor_values in zip(*frame_values)]
+        for frame_values in zip(*columns)
+    ]
+
+
 def save(filename: Union[str, Path], record: Record):
     filename = str(filename)
 
@@ -232,7 +461,8 @@ def unpack(packed: dict) -> Record:
     kwargs["mode"] = mode
 
     kwargs["session_info"] = json.loads(packed["session_info"])
-    kwargs["data_info"] = json.loads(packed["data_info"])
+    data_info = packed["data_info"]
+    kwargs["data_info"] = json.loads(data_info) if isinstance(data_info, str) else data_info
 
     kwargs["sample_times"] = packed.get("sample_times", None)
 
@@ -263,7 +493,10 @@ def load_h5(filename: Union[str, Path]) -> Record:
             raise Exception(
                 f"The file '{filename}' is not an A111 record, try a121.load_record instead"
             )
-        packed = {k: v[()] for k, v in f.items()}
+        packed = {k: v[()] for k, v in f.items() if isinstance(v, h5py.Dataset)}
+
+        if isinstance(f.get("data_info"), h5py.Group):  # written by H5Recorder
+            packed["data_info"] = _data_info_from_columns(f["data_info"], len(packed["data"]))
 
     for k, v in packed.items():
         if isinstance(v, bytes):
@@ -25,9 +25,14 @@ from ._cli import ExampleArgumentParser, get_client_args
 from ._core import (
     _H5PY_STR_DTYPE,
     PRF,
+    AsyncExplorationClient,
     Client,
     H5Record,
     H5Recorder,
+    H5RecordingProfile,
+    H5SessionRecord,
+    H5StackedResults,
+    H5WriteStatistics,
     IdleState,
     InMemoryRecord,
     Metadata,
@@ -44,12 +49,14 @@ from ._core import (
     SessionConfig,
     StackedResults,
     SubsweepConfig,
+    get_frame_dtype,
     iterate_extended_structure,
     iterate_extended_structure_values,
     load_record,
     open_record,
     save_record,
     save_record_to_h5,
+    set_frame_dtype,
     zip3_extended_structures,
     zip_extended_structures,
 )
@@ -9,6 +9,7 @@ from acconeer.exptool._core.int_16_complex import (
 )
 
 from .communication import (
+    AsyncExplorationClient,
     Client,
 )
 from .entities import (
@@ -26,11 +27,17 @@ from .entities import (
     SessionConfig,
     StackedResults,
     SubsweepConfig,
+    get_frame_dtype,
+    set_frame_dtype,
 )
 from .recording import (
     _H5PY_STR_DTYPE,
     H5Record,
     H5Recorder,
+    H5RecordingProfile,
+    H5SessionRecord,
+    H5StackedResults,
+    H5WriteStatistics,
     InMemoryRecord,
     Recorder,
     RecordError,
@@ -3,6 +3,7 @@
 
 from acconeer.exptool._core.communication.client import ClientError, ServerError
 
+from .async_exploration_client import AsyncExplorationClient
 from .client import Client
 from .exploration_client import ExplorationClient
 from .exploration_protocol import (
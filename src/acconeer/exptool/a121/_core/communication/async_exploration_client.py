@@ -0,0 +1,579 @@
+# Copyright (c) Acconeer AB, 2024
+# All rights reserved
+
+from __future__ import annotations
+
+import abc
+import asyncio
+import concurrent.futures
+import json
+import typing as t
+
+import typing_extensions as te
+
+from acconeer.exptool._core.communication import (
+    BufferedLink,
+    ClientError,
+    ExploreSerialLink,
+    Message,
+    SocketLink,
+)
+from acconeer.exptool._core.communication.communication_protocol import messages
+from acconeer.exptool._core.communication.communication_protocol.messages.log_message import (
+    ServerLog,
+)
+from acconeer.exptool._core.communication.links import LinkError
+from acconeer.exptool._core.entities import ClientInfo
+from acconeer.exptool.a121._core.entities import (
+    Metadata,
+    Result,
+    SensorCalibration,
+    SensorConfig,
+    ServerInfo,
+    SessionConfig,
+)
+from acconeer.exptool.a121._core.utils import unextend
+
+from .exploration_client import (
+    TickUnwrapper,
+    create_server_info,
+    extend_metadata,
+    get_baudrate_to_use,
+    get_streaming_timeout,
+    handle_message,
+)
+from .exploration_protocol import ExplorationProtocol, get_exploration_protocol
+from .exploration_protocol import messages as a121_messages
+from .utils import get_calibrations_provided
+
+
+_MessageT = t.TypeVar("_MessageT", bound=Message)
+_T = t.TypeVar("_T")
+
+
+class _AsyncTransport(abc.ABC):
+    """Asynchronous byte transport to an exploration server"""
+
+    DEFAULT_TIMEOUT: float = BufferedLink.DEFAULT_TIMEOUT
+
+    def __init__(self) -> None:
+        self._timeout = self.DEFAULT_TIMEOUT
+
+    @property
+    def timeout(self) -> float:
+        return self._timeout
+
+    @timeout.setter
+    def timeout(self, timeout: float) -> None:
+        self._timeout = timeout
+        self._update_timeout()
+
+    def _update_timeout(self) -> None:
+        """Propagates the newly set timeout (found in self._timeout)"""
+        pass
+
+    @abc.abstractmethod
+    async def read_until(self, separator: bytes) -> bytes:
+        """Reads all bytes up to, and including, ``separator``"""
+        pass
+
+    @abc.abstractmethod
+    async def read_exactly(self, num_bytes: int) -> bytes:
+        """Reads ``num_bytes`` bytes"""
+        pass
+
+    @abc.abstractmethod
+    async def write(self, data: bytes) -> None:
+        """Writes all of ``data``"""
+        pass
+
+    @abc.abstractmethod
+    async def close(self) -> None:
+        """Closes the transport"""
+        pass
+
+
+class _StreamTransport(_AsyncTransport):
+    """TCP transport built on asyncio streams"""
+
+    _STREAM_LIMIT = 2**20
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        super().__init__()
+        self._reader = reader
+        self._writer = writer
+
+    @classmethod
+    async def connect(cls, host: str, port: int) -> _StreamTransport:
+        try:
+            reader, writer = await asyncio.open_connection(host, port, limit=cls._STREAM_LIMIT)
+        except OSError as e:
+            raise LinkError("failed to connect") from e
+
+        return cls(reader, writer)
+
+    async def _read(self, read_coroutine: t.Awaitable[bytes]) -> bytes:
+        try:
+            return await asyncio.wait_for(read_coroutine, self._timeout)
+        except asyncio.TimeoutError as e:
+            raise LinkError("recv timeout") from e
+        except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, OSError) as e:
+            raise LinkError from e
+
+    async def read_until(self, separator: bytes) -> bytes:
+        return await self._read(self._reader.readuntil(separator))
+
+    async def read_exactly(self, num_bytes: int) -> bytes:
+        return await self._read(self._reader.readexactly(num_bytes))
+
+    async def write(self, data: bytes) -> None:
+        try:
+            self._writer.write(data)
+            await self._writer.drain()
+        except OSError as e:
+            raise LinkError from e
+
+    async def close(self) -> None:
+        self._writer.close()
+        try:
+            await self._writer.wait_closed()
+        except OSError:
+            pass
+
+
+class _ExecutorTransport(_AsyncTransport):
+    """Runs a blocking :class:`BufferedLink` in a thread of its own
+
+    A dedicated thread per link keeps the order of operations, and keeps a link waiting for
+    data from occupying the event loop's default executor.
+    """
+
+    def __init__(self, link: BufferedLink) -> None:
+        super().__init__()
+        self._link = link
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix=type(link).__name__
+        )
+
+    @property
+    def link(self) -> BufferedLink:
+        return self._link
+
+    def _update_timeout(self) -> None:
+        # The link handles the timeout, since blocking calls can't be cancelled
+        self._link.timeout = self._timeout
+
+    async def _run(self, func: t.Callable[..., _T], *args: t.Any) -> _T:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, func, *args)
+
+    async def connect(self) -> None:
+        await self._run(self._link.connect)
+
+    async def read_until(self, separator: bytes) -> bytes:
+        return await self._run(self._link.recv_until, separator)
+
+    async def read_exactly(self, num_bytes: int) -> bytes:
+        return await self._run(self._link.recv, num_bytes)
+
+    async def write(self, data: bytes) -> None:
+        await self._run(self._link.send, data)
+
+    async def close(self) -> None:
+        try:
+            await self._run(self._link.disconnect)
+        finally:
+            self._executor.shutdown(wait=False)
+
+
+class AsyncExplorationClient:
+    """Asyncio client for the exploration server
+
+    Uses the same protocol and messages as :class:`ExplorationClient`, but waits for data
+    without blocking the event loop. Thereby, many boards can be served concurrently from one
+    event loop:
+
+    .. code-block:: python
+
+        async with await AsyncExplorationClient.open(ip_address="192.168.0.10") as client:
+            await client.setup_session(a121.SensorConfig())
+            await client.start_session()
+
+            async for result in client.results():
+                ...
+
+    TCP connections use asyncio streams. Serial connections run a blocking serial link in a
+    thread of their own.
+
+    Use :meth:`open` to create a client.
+    """
+
+    _transport: _AsyncTransport
+    _protocol: t.Type[ExplorationProtocol]
+    _server_info: t.Optional[ServerInfo]
+    _metadata: t.Optional[list[dict[int, Metadata]]]
+    _session_config: t.Optional[SessionConfig]
+    _log_queue: list[ServerLog]
+
+    def __init__(self, transport: _AsyncTransport, client_info: ClientInfo) -> None:
+        self._transport = transport
+        self._client_info = client_info
+        self._protocol = ExplorationProtocol
+        self._server_info = None
+        self._metadata = None
+        self._session_config = None
+        self._sensor_calibrations: t.Optional[dict[int, SensorCalibration]] = None
+        self._calibrations_provided: dict[int, bool] = {}
+        self._log_queue = []
+        self._tick_unwrapper = TickUnwrapper()
+        self._session_is_started = False
+        self._stop_is_requested = False
+        self._stop_response_is_received = False
+        self._closed = False
+        self._read_lock = asyncio.Lock()
+
+    @classmethod
+    async def open(
+        cls,
+        ip_address: t.Optional[str] = None,
+        tcp_port: t.Optional[int] = None,
+        serial_port: t.Optional[str] = None,
+        override_baudrate: t.Optional[int] = None,
+    ) -> te.Self:
+        """Connects to an exploration server over TCP or serial
+
+        :param ip_address: The IP address of the server
+        :param tcp_port: The TCP port of the server. Defaults to 6110
+        :param serial_port: The serial port of the board
+        :param override_baudrate: Overrides the baudrate used for serial connections
+        """
+        if (ip_address is None) == (serial_port is None):
+            raise ValueError("Exactly one of 'ip_address' and 'serial_port' needs to be given")
+
+        client_info = ClientInfo._from_open(
+            ip_address=ip_address,
+            tcp_port=tcp_port,
+            serial_port=serial_port,
+            override_baudrate=override_baudrate,
+        )
+
+        transport: _AsyncTransport
+        if ip_address is not None:
+            port = SocketLink._PORT if tcp_port is None else tcp_port
+            transport = await _StreamTransport.connect(ip_address, port)
+        else:
+            assert serial_port is not None
+            executor_transport = _ExecutorTransport(ExploreSerialLink(serial_port))
+            await executor_transport.connect()
+            transport = executor_transport
+
+        client = cls(transport, client_info)
+
+        try:
+            await client._connect()
+        except BaseException:
+            await client.close()
+            raise
+
+        return client
+
+    async def __aenter__(self) -> te.Self:
+        return self
+
+    async def __aexit__(self, *_: t.Any) -> None:
+        await self.close()
+
+    async def _connect(self) -> None:
+        await self._send_command(self._protocol.get_system_info_command())
+        system_info_response = await self._wait_for_message(messages.SystemInfoResponse)
+
+        sensor = system_info_response.system_info.get("sensor")
+        if sensor != "a121":
+            raise ClientError(f"Wrong sensor version, expected a121 but got {sensor}")
+
+        await self._send_command(self._protocol.get_sensor_info_command())
+        sensor_info_response = await self._wait_for_message(a121_messages.SensorInfoResponse)
+
+        self._server_info = create_server_info(system_info_response, sensor_info_response)
+
+        if self._server_info.connected_sensors == []:
+            raise ClientError("Exploration server is running but no sensors are detected.")
+
+        self._protocol = get_exploration_protocol(self._server_info.parsed_rss_version)
+
+        await self._update_baudrate()
+
+    async def _update_baudrate(self) -> None:
+        # Only Change baudrate for ExploreSerialLink
+        if not isinstance(self._transport, _ExecutorTransport):
+            return
+
+        link = self._transport.link
+        if not isinstance(link, ExploreSerialLink) or self._client_info.serial is None:
+            return
+
+        baudrate_to_use = get_baudrate_to_use(
+            self._client_info.serial.override_baudrate, self.server_info.max_baudrate
+        )
+        if baudrate_to_use is None:
+            return
+
+        await self._send_command(self._protocol.set_baudrate_command(baudrate_to_use))
+        _ = await self._wait_for_message(messages.SetBaudrateResponse)
+
+        link.baudrate = baudrate_to_use
+
+    async def _send_command(self, command: bytes) -> None:
+        try:
+            await self._transport.write(command)
+        except Exception:
+            await self._close_after_crash()
+            raise
+
+    async def _receive_message(self) -> Message:
+        header_in_bytes = await self._transport.read_until(self._protocol.end_sequence)
+
+        try:
+            header: dict[str, t.Any] = json.loads(header_in_bytes)
+        except json.JSONDecodeError:
+            raise RuntimeError(f"Cannot decode header {header_in_bytes!r}")
+
+        try:
+            payload_size = header["payload_size"]
+        except KeyError:
+            payload = bytes()
+        else:
+            payload = await self._transport.read_exactly(payload_size)
+
+        return self._protocol.parse_message(header, payload)
+
+    async def _wait_for_message(self, message_type: type[_MessageT]) -> _MessageT:
+        """Receives and handles messages until a message of type ``message_type`` is received"""
+        return t.cast(_MessageT, await self._wait_for_any_message(message_type))
+
+    async def _wait_for_any_message(self, *message_types: type[Message]) -> Message:
+        """Receives and handles messages until a message of any of ``message_types`` is received"""
+        while True:
+            try:
+                message = await self._receive_message()
+            except Exception:
+                await self._close_after_crash()
+                raise
+
+            if type(message) in message_types:
+                return message
+            else:
+                handle_message(message, self._log_queue)
+
+    async def _close_after_crash(self) -> None:
+        self._session_is_started = False
+        await self.close()
+
+    @property
+    def client_info(self) -> ClientInfo:
+        return self._client_info
+
+    @property
+    def connected(self) -> bool:
+        return self._server_info is not None and not self._closed
+
+    @property
+    def server_info(self) -> ServerInfo:
+        self._assert_connected()
+        assert self._server_info is not None  # Should never happen if client is connected
+        return self._server_info
+
+    @property
+    def session_is_setup(self) -> bool:
+        return self._metadata is not None
+
+    @property
+    def session_is_started(self) -> bool:
+        return self._session_is_started
+
+    @property
+    def session_config(self) -> SessionConfig:
+        """The :class:`SessionConfig` for the current session"""
+        self._assert_session_setup()
+        assert self._session_config is not None  # Should never happen if session is setup
+        return self._session_config
+
+    @property
+    def extended_metadata(self) -> list[dict[int, Metadata]]:
+        """The extended :class:`Metadata` for the current session"""
+        self._assert_session_setup()
+        assert self._metadata is not None  # Should never happen if session is setup
+        return self._metadata
+
+    @property
+    def calibrations(self) -> dict[int, SensorCalibration]:
+        """A :class:`SensorCalibration` per used sensor for the current session"""
+        self._assert_session_setup()
+
+        if not self._sensor_calibrations:
+            raise ClientError("Server did not provide calibration")
+
+        return self._sensor_calibrations
+
+    @property
+    def calibrations_provided(self) -> dict[int, bool]:
+        """Whether a calibration was provided for each sensor in :meth:`setup_session`"""
+        return self._calibrations_provided
+
+    def _assert_connected(self) -> None:
+        if not self.connected:
+            raise ClientError("Client is not connected.")
+
+    def _assert_session_setup(self) -> None:
+        self._assert_connected()
+        if not self.session_is_setup:
+            raise ClientError("Session is not set up.")
+
+    def _assert_session_started(self) -> None:
+        self._assert_session_setup()
+        if not self.session_is_started:
+            raise ClientError("Session is not started.")
+
+    async def setup_session(
+        self,
+        config: t.Union[SensorConfig, SessionConfig],
+        calibrations: t.Optional[dict[int, SensorCalibration]] = None,
+    ) -> t.Union[Metadata, list[dict[int, Metadata]]]:
+        """Sets up the session specified by ``config``
+
+        :returns: The metadata of the session. Extended if ``config`` is.
+        """
+        self._assert_connected()
+
+        if self.session_is_started:
+            raise ClientError("Session is currently running, can't setup.")
+
+        if isinstance(config, SensorConfig):
+            config = SessionConfig(config)
+
+        config.validate()
+
+        self._calibrations_provided = get_calibrations_provided(config, calibrations)
+        self._session_config = config
+
+        async with self._read_lock:
+            await self._send_command(self._protocol.setup_command(config, calibrations))
+            setup_response = await self._wait_for_message(a121_messages.SetupResponse)
+
+        self._metadata = extend_metadata(setup_response.grouped_metadatas, config)
+        self._sensor_calibrations = setup_response.sensor_calibrations
+
+        if config.extended:
+            return self._metadata
+        else:
+            return unextend(self._metadata)
+
+    async def start_session(self) -> None:
+        """Starts the session set up by :meth:`setup_session`"""
+        self._assert_session_setup()
+
+        if self.session_is_started:
+            raise ClientError("Session is already started.")
+
+        self._transport.timeout = get_streaming_timeout(
+            self.session_config, self._metadata, self._transport.DEFAULT_TIMEOUT
+        )
+
+        async with self._read_lock:
+            await self._send_command(self._protocol.start_streaming_command())
+            _ = await self._wait_for_message(messages.StartStreamingResponse)
+
+        self._tick_unwrapper = TickUnwrapper()
+        self._stop_is_requested = False
+        self._stop_response_is_received = False
+        self._session_is_started = True
+
+    async def get_next(self) -> t.Union[Result, list[dict[int, Result]]]:
+        """Waits for the next result of the started session
+
+        :returns: The next result. Extended if the session config is.
+        """
+        extended_results = await self._get_next_extended()
+
+        if extended_results is None:
+            raise ClientError("Session is not started.")
+
+        if self.session_config.extended:
+            return extended_results
+        else:
+            return unextend(extended_results)
+
+    async def _get_next_extended(self) -> t.Optional[list[dict[int, Result]]]:
+        """Returns the next extended result, or None if the session was stopped meanwhile"""
+        self._assert_session_started()
+
+        async with self._read_lock:
+            if not self._session_is_started or self._stop_is_requested:
+                return None
+
+            # The stop response can arrive while waiting for a result, if the session is
+            # stopped by another task
+            message = await self._wait_for_any_message(
+                a121_messages.ResultMessage, messages.StopStreamingResponse
+            )
+
+            if type(message) is messages.StopStreamingResponse:
+                self._stop_response_is_received = True
+                return None
+
+            result_message = t.cast(a121_messages.ResultMessage, message)
+
+        return result_message.get_extended_results(
+            tps=self.server_info.ticks_per_second,
+            metadata=self.extended_metadata,
+            config_groups=self.session_config.groups,
+            ticks=self._tick_unwrapper.unwrap_frame(result_message.ticks),
+        )
+
+    async def results(self) -> t.AsyncIterator[t.Union[Result, list[dict[int, Result]]]]:
+        """Yields the results of the started session until it's stopped
+
+        The session can be stopped by another task, calling :meth:`stop_session`.
+        """
+        while self._session_is_started and not self._stop_is_requested:
+            extended_results = await self._get_next_extended()
+
+            if extended_results is None:
+                return
+
+            if self.session_config.extended:
+                yield extended_results
+            else:
+                yield unextend(extended_results)
+
+    async def stop_session(self) -> None:
+        """Stops the started session
+
+        Results received before the server stopped streaming are discarded.
+        """
+        self._assert_session_started()
+
+        self._stop_is_requested = True
+        await self._send_command(self._protocol.stop_streaming_command())
+
+        async with self._read_lock:
+            if not self._stop_response_is_received:
+                _ = await self._wait_for_message(messages.StopStreamingResponse)
+
+        self._transport.timeout = self._transport.DEFAULT_TIMEOUT
+        self._session_is_started = False
+        self._log_queue.clear()
+
+    async def close(self) -> None:
+        """Stops the session, if started, and closes the connection"""
+        if self._closed:
+            return
+
+        try:
+            if self._session_is_started:
+                await self.stop_session()
+        finally:
+            self._closed = True
+            self._session_is_started = False
+            self._log_queue.clear()
+            await self._transport.close()
@@ -6,6 +6,7 @@ from __future__ import annotations
 import abc
 import typing as t
 
+import numpy as np
 import typing_extensions as te
 
 from acconeer.exptool._core.communication import Client as BaseClient
@@ -18,9 +19,29 @@ from acconeer.exptool.a121._core.entities import (
     SensorConfig,
     ServerInfo,
     SessionConfig,
+    StackedResults,
 )
 from acconeer.exptool.a121._core.recording import Recorder
-from acconeer.exptool.a121._core.utils import unextend
+from acconeer.exptool.a121._core.utils import (
+    map_over_extended_structure,
+    transpose_extended_structures,
+    unextend,
+)
+
+
+_T = t.TypeVar("_T")
+
+
+def _stack_results(results: list[Result]) -> StackedResults:
+    return StackedResults(
+        data_saturated=np.array([result.data_saturated for result in results]),
+        frame_delayed=np.array([result.frame_delayed for result in results]),
+        calibration_needed=np.array([result.calibration_needed for result in results]),
+        temperature=np.array([result.temperature for result in results]),
+        tick=np.array([result.tick for result in results]),
+        frame=np.array([result._frame for result in results]),
+        context=results[0]._context,
+    )
 
 
 class Client(
@@ -64,8 +85,8 @@ class Client(
         self._session_config: t.Optional[SessionConfig] = None
 
     def _return_results(
-        self, extended_results: list[dict[int, Result]]
-    ) -> t.Union[Result, list[dict[int, Result]]]:
+        self, extended_results: list[dict[int, _T]]
+    ) -> t.Union[_T, list[dict[int, _T]]]:
         if self.session_config.extended:
             return extended_results
         else:
@@ -156,6 +177,40 @@ class Client(
         """
         ...
 
+    def get_next_batch(
+        self, num_frames: int
+    ) -> t.Union[StackedResults, list[dict[int, StackedResults]]]:
+        """Gets ``num_frames`` consecutive results from the server, stacked per entry.
+
+        Blocks until ``num_frames`` results have been received. Each entry's frames are stacked
+        in one 3-D array, see :class:`StackedResults`.
+
+        :param num_frames: The number of results to get.
+        :returns:
+            A ``StackedResults`` if the setup ``SessionConfig.extended is False``,
+            ``list[dict[int, StackedResults]]`` otherwise.
+        :raises:
+            ``ClientError`` if ``Client``'s session is not started.
+            ``ValueError`` if ``num_frames`` is less than 1.
+        """
+        self._assert_session_started()
+
+        if num_frames < 1:
+            raise ValueError("'num_frames' needs to be at least 1")
+
+        extended_results: list[list[dict[int, Result]]] = []
+        for _ in range(num_frames):
+            result = self.get_next()
+            if isinstance(result, Result):
+                extended_results.append([{self.session_config.sensor_id: result}])
+            else:
+                extended_results.append(result)
+
+        extended_stacked_results = map_over_extended_structure(
+            _stack_results, transpose_extended_structures(extended_results)
+        )
+        return self._return_results(extended_stacked_results)
+
     def _recorder_start(self, recorder: Recorder) -> None:
         recorder._start(
             client_info=self.client_info,
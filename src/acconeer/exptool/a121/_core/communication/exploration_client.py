@@ -4,9 +4,10 @@
 from __future__ import annotations
 
 import logging
-from typing import NoReturn, Optional, Tuple, Type, TypeVar, Union
+from typing import NoReturn, Optional, Type, TypeVar, Union
 
-import attrs
+import numpy as np
+import numpy.typing as npt
 import typing_extensions as te
 
 from acconeer.exptool._core.communication import (
@@ -16,6 +17,7 @@ from acconeer.exptool._core.communication import (
     ExploreSerialLink,
     Message,
     MessageStream,
+    OverflowPolicy,
 )
 from acconeer.exptool._core.communication.client import ServerError
 from acconeer.exptool._core.communication.communication_protocol import messages
@@ -23,7 +25,7 @@ from acconeer.exptool._core.communication.communication_protocol.messages.log_me
     ServerLog,
 )
 from acconeer.exptool._core.communication.links.helpers import ensure_connected_link
-from acconeer.exptool._core.communication.unwrap_ticks import unwrap_ticks
+from acconeer.exptool._core.communication.unwrap_ticks import unwrap_ticks, unwrap_ticks_array
 from acconeer.exptool._core.entities import ClientInfo
 from acconeer.exptool.a121._core.entities import (
     Metadata,
@@ -32,10 +34,10 @@ from acconeer.exptool.a121._core.entities import (
     SensorConfig,
     ServerInfo,
     SessionConfig,
+    StackedResults,
 )
 from acconeer.exptool.a121._core.utils import (
-    create_extended_structure,
-    iterate_extended_structure,
+    iterate_extended_structure_values,
     unextend,
 )
 from acconeer.exptool.a121._perf_calc import _SessionPerformanceCalc
@@ -101,6 +103,7 @@ class ExplorationClient(Client, register=True):
         self._log_queue = []
         self._closed = False
         self._crashing = False
+        self._background_reader_options: Optional[tuple[int, OverflowPolicy]] = None
 
         self._protocol = ExplorationProtocol
 
@@ -148,14 +151,7 @@ class ExplorationClient(Client, register=True):
             a121_messages.SensorInfoResponse
         )
 
-        return ServerInfo(
-            rss_version=system_info_response.system_info["rss_version"],
-            sensor_count=system_info_response.system_info["sensor_count"],
-            ticks_per_second=system_info_response.system_info["ticks_per_second"],
-            hardware_name=system_info_response.system_info.get("hw", None),
-            sensor_infos=sensor_info_response.sensor_infos,
-            max_baudrate=system_info_response.system_info.get("max_baudrate"),
-        )
+        return create_server_info(system_info_response, sensor_info_response)
 
     def _update_baudrate(self) -> None:
         # Only Change baudrate for ExploreSerialLink
@@ -165,22 +161,10 @@ class ExplorationClient(Client, register=True):
         if self.client_info.serial is None:
             return
 
-        DEFAULT_BAUDRATE = 115200
-        overridden_baudrate = self.client_info.serial.override_baudrate
-        max_baudrate = self.server_info.max_baudrate
-        baudrate_to_use = self.server_info.max_baudrate or DEFAULT_BAUDRATE
-
-        # Override baudrate?
-        if overridden_baudrate is not None and max_baudrate is not None:
-            # Valid Baudrate?
-            if overridden_baudrate > max_baudrate:
-                raise ClientError(f"Cannot set a baudrate higher than {max_baudrate}")
-            elif overridden_baudrate < DEFAULT_BAUDRATE:
-                raise ClientError(f"Cannot set a baudrate lower than {DEFAULT_BAUDRATE}")
-            baudrate_to_use = overridden_baudrate
-
-        # Do not change baudrate if DEFAULT_BAUDRATE
-        if baudrate_to_use == DEFAULT_BAUDRATE:
+        baudrate_to_use = get_baudrate_to_use(
+            self.client_info.serial.override_baudrate, self.server_info.max_baudrate
+        )
+        if baudrate_to_use is None:
             return
 
         self._server_stream.send_command(self._protocol.set_baudrate_command(baudrate_to_use))
@@ -188,6 +172,37 @@ class ExplorationClient(Client, register=True):
 
         self._link.baudrate = baudrate_to_use
 
+    def enable_background_reader(
+        self,
+        max_queue_size: int = 100,
+        overflow_policy: OverflowPolicy = OverflowPolicy.BLOCK,
+    ) -> None:
+        """Reads and decodes results in a background thread while a session is started
+
+        Results are queued until retrieved by :meth:`get_next`, so that slow processing
+        doesn't leave data waiting in the OS buffers. Takes effect from the next
+        :meth:`start_session`.
+
+        :param max_queue_size: The maximum number of queued results
+        :param overflow_policy:
+            What to do when the queue is full. :attr:`OverflowPolicy.DROP_OLDEST` only
+            discards results, never responses or logs
+        """
+        if max_queue_size < 1:
+            raise ValueError("'max_queue_size' needs to be at least 1")
+
+        self._background_reader_options = (max_queue_size, overflow_policy)
+
+    @property
+    def num_dropped_messages(self) -> int:
+        """The number of messages dropped by the background reader in the current session"""
+        return self._server_stream.num_dropped_messages
+
+    @property
+    def max_queue_depth(self) -> int:
+        """The largest number of messages queued by the background reader in the current session"""
+        return self._server_stream.max_queue_depth
+
     def setup_session(  # type: ignore[override]
         self,
         config: Union[SensorConfig, SessionConfig],
@@ -207,15 +222,7 @@ class ExplorationClient(Client, register=True):
         self._server_stream.send_command(self._protocol.setup_command(config, calibrations))
         setup_response = self._server_stream.wait_for_message(a121_messages.SetupResponse)
 
-        self._metadata = [
-            {
-                sensor_id: metadata
-                for metadata, sensor_id in zip(metadata_group, config_group.keys())
-            }
-            for metadata_group, config_group in zip(
-                setup_response.grouped_metadatas, self._session_config.groups
-            )
-        ]
+        self._metadata = extend_metadata(setup_response.grouped_metadatas, self._session_config)
         self._sensor_calibrations = setup_response.sensor_calibrations
 
         if self.session_config.extended:
@@ -224,16 +231,7 @@ class ExplorationClient(Client, register=True):
             return unextend(self._metadata)
 
     def _handle_messages(self, message: Message) -> None:
-        if type(message) is messages.LogMessage:
-            self._log_queue.append(message.message)
-        elif type(message) is a121_messages.EmptyResultMessage:
-            raise RuntimeError("Received an empty Result from Server.")
-        elif type(message) is messages.ErroneousMessage:
-            last_error = ""
-            for log in self._log_queue:
-                if log.level == "ERROR" and "exploration_server" not in log.module:
-                    last_error = f" ({log.log})"
-            raise ServerError(f"{message}{last_error}")
+        handle_message(message, self._log_queue)
 
     def start_session(self) -> None:
         self._assert_session_setup()
@@ -243,22 +241,22 @@ class ExplorationClient(Client, register=True):
 
         assert self._session_config is not None
 
-        pc = _SessionPerformanceCalc(self._session_config, self._metadata)
-
-        try:
-            # Use max of the calculate duration and update/frame rate to guarantee sufficient
-            # timeout.
-            timeout_duration = max(pc.update_duration, 1 / pc.update_rate)
-            # Increase timeout if update rate is very low, otherwise keep default
-            timeout = max(1.5 * timeout_duration + 1.0, self._link.DEFAULT_TIMEOUT)
-        except Exception:
-            timeout = self._link.DEFAULT_TIMEOUT
-
-        self._link.timeout = timeout
+        self._link.timeout = get_streaming_timeout(
+            self._session_config, self._metadata, self._link.DEFAULT_TIMEOUT
+        )
 
         self._server_stream.send_command(self._protocol.start_streaming_command())
         _ = self._server_stream.wait_for_message(messages.StartStreamingResponse)
 
+        if self._background_reader_options is not None:
+            max_queue_size, overflow_policy = self._background_reader_options
+            self._server_stream.start_reader_thread(
+                max_queue_size,
+                overflow_policy,
+                until=messages.StopStreamingResponse,
+                droppable=(a121_messages.ResultMessage, a121_messages.EmptyResultMessage),
+            )
+
         self._recorder_start_session()
         self._session_is_started = True
 
@@ -280,13 +278,53 @@ class ExplorationClient(Client, register=True):
             tps=self._server_info.ticks_per_second,
             metadata=self._metadata,
             config_groups=self._session_config.groups,
+            ticks=self._tick_unwrapper.unwrap_frame(result_message.ticks),
         )
 
-        extended_results = self._tick_unwrapper.unwrap_ticks(extended_results)
-
         self._recorder_sample(extended_results)
         return self._return_results(extended_results)
 
+    def get_next_batch(
+        self, num_frames: int
+    ) -> Union[StackedResults, list[dict[int, StackedResults]]]:
+        self._assert_session_started()
+
+        if num_frames < 1:
+            raise ValueError("'num_frames' needs to be at least 1")
+
+        if self._metadata is None:
+            raise RuntimeError(f"{self} has no metadata")
+
+        if self._server_info is None:
+            raise RuntimeError(f"{self} has no system info")
+
+        result_messages = [
+            self._server_stream.wait_for_message(a121_messages.ResultMessage)
+            for _ in range(num_frames)
+        ]
+
+        extended_stacked_results = a121_messages.ResultMessage.get_extended_stacked_results(
+            result_messages,
+            tps=self._server_info.ticks_per_second,
+            metadata=self._metadata,
+        )
+
+        self._tick_unwrapper.unwrap_stacked_ticks_in_place(extended_stacked_results)
+
+        if self._recorder is not None:
+            for frame_index in range(num_frames):
+                self._recorder_sample(
+                    [
+                        {
+                            sensor_id: stacked_results[frame_index]
+                            for sensor_id, stacked_results in group.items()
+                        }
+                        for group in extended_stacked_results
+                    ]
+                )
+
+        return self._return_results(extended_stacked_results)
+
     def stop_session(self) -> None:
         self._assert_session_started()
 
@@ -295,6 +333,7 @@ class ExplorationClient(Client, register=True):
             messages.StopStreamingResponse,
             timeout_s=self._link.timeout + 1,
         )
+        self._server_stream.stop_reader_thread()
 
         self._link.timeout = self._link.DEFAULT_TIMEOUT
         self._session_is_started = False
@@ -319,6 +358,7 @@ class ExplorationClient(Client, register=True):
             self._server_info = None
             self._metadata = None
             self._log_queue.clear()
+            self._server_stream.stop_reader_thread(timeout_s=0)
             self._link.disconnect()
             self._closed = True
 
@@ -334,20 +374,112 @@ class ExplorationClient(Client, register=True):
         return self._server_info
 
 
+def create_server_info(
+    system_info_response: messages.SystemInfoResponse,
+    sensor_info_response: a121_messages.SensorInfoResponse,
+) -> ServerInfo:
+    return ServerInfo(
+        rss_version=system_info_response.system_info["rss_version"],
+        sensor_count=system_info_response.system_info["sensor_count"],
+        ticks_per_second=system_info_response.system_info["ticks_per_second"],
+        hardware_name=system_info_response.system_info.get("hw", None),
+        sensor_infos=sensor_info_response.sensor_infos,
+        max_baudrate=system_info_response.system_info.get("max_baudrate"),
+    )
+
+
+def get_baudrate_to_use(
+    overridden_baudrate: Optional[int], max_baudrate: Optional[int]
+) -> Optional[int]:
+    """Returns the baudrate a serial link should change to, or None if it shouldn't change"""
+    DEFAULT_BAUDRATE = 115200
+    baudrate_to_use = max_baudrate or DEFAULT_BAUDRATE
+
+    # Override baudrate?
+    if overridden_baudrate is not None and max_baudrate is not None:
+        # Valid Baudrate?
+        if overridden_baudrate > max_baudrate:
+            raise ClientError(f"Cannot set a baudrate higher than {max_baudrate}")
+        elif overridden_baudrate < DEFAULT_BAUDRATE:
+            raise ClientError(f"Cannot set a baudrate lower than {DEFAULT_BAUDRATE}")
+        baudrate_to_use = overridden_baudrate
+
+    # Do not change baudrate if DEFAULT_BAUDRATE
+    if baudrate_to_use == DEFAULT_BAUDRATE:
+        return None
+
+    return baudrate_to_use
+
+
+def extend_metadata(
+    grouped_metadatas: list[list[Metadata]], session_config: SessionConfig
+) -> list[dict[int, Metadata]]:
+    return [
+        {sensor_id: metadata for metadata, sensor_id in zip(metadata_group, config_group.keys())}
+        for metadata_group, config_group in zip(grouped_metadatas, session_config.groups)
+    ]
+
+
+def handle_message(message: Message, log_queue: list[ServerLog]) -> None:
+    """Handles messages that aren't waited for, raising on errors reported by the server"""
+    if type(message) is messages.LogMessage:
+        log_queue.append(message.message)
+    elif type(message) is a121_messages.EmptyResultMessage:
+        raise RuntimeError("Received an empty Result from Server.")
+    elif type(message) is messages.ErroneousMessage:
+        last_error = ""
+        for log in log_queue:
+            if log.level == "ERROR" and "exploration_server" not in log.module:
+                last_error = f" ({log.log})"
+        raise ServerError(f"{message}{last_error}")
+
+
+def get_streaming_timeout(
+    session_config: SessionConfig,
+    metadata: Optional[list[dict[int, Metadata]]],
+    default_timeout: float,
+) -> float:
+    """Returns a timeout long enough to wait for the next result of a session"""
+    pc = _SessionPerformanceCalc(session_config, metadata)
+
+    try:
+        # Use max of the calculate duration and update/frame rate to guarantee sufficient
+        # timeout.
+        timeout_duration = max(pc.update_duration, 1 / pc.update_rate)
+        # Increase timeout if update rate is very low, otherwise keep default
+        return max(1.5 * timeout_duration + 1.0, default_timeout)
+    except Exception:
+        return default_timeout
+
+
 class TickUnwrapper:
-    """Wraps unwrap_ticks to be applied over extended results"""
+    """Unwraps the ticks of consecutive frames, keeping track of the minimum tick"""
 
     def __init__(self) -> None:
         self.next_minimum_tick: Optional[int] = None
 
-    def unwrap_ticks(self, extended_results: list[dict[int, Result]]) -> list[dict[int, Result]]:
-        result_items = list(iterate_extended_structure(extended_results))
-        ticks = [result.tick for _, _, result in result_items]
+    def unwrap_frame(self, ticks: list[int]) -> list[int]:
+        """Unwraps the ticks of a single frame
+
+        For the handful of ticks in a single frame, plain Python is faster than NumPy.
+        """
         unwrapped_ticks, self.next_minimum_tick = unwrap_ticks(ticks, self.next_minimum_tick)
+        return unwrapped_ticks
+
+    def unwrap(self, ticks: npt.NDArray[np.int64]) -> npt.NDArray[np.int64]:
+        """Unwraps the ticks of a frame (1-D) or a batch of frames (2-D, frame x entry)"""
+        unwrapped_ticks, self.next_minimum_tick = unwrap_ticks_array(ticks, self.next_minimum_tick)
+        return unwrapped_ticks
 
-        def f(result_item: Tuple[int, int, Result], updated_tick: int) -> Tuple[int, int, Result]:
-            group_index, sensor_id, result = result_item
-            updated_result = attrs.evolve(result, tick=updated_tick)
-            return (group_index, sensor_id, updated_result)
+    def unwrap_stacked_ticks_in_place(
+        self, extended_stacked_results: list[dict[int, StackedResults]]
+    ) -> None:
+        """Unwraps the tick columns of all entries in one vectorized pass, in place"""
+        tick_columns = [
+            stacked_results.tick
+            for stacked_results in iterate_extended_structure_values(extended_stacked_results)
+        ]
+        unwrapped_ticks = self.unwrap(np.stack(tick_columns, axis=1))
 
-        return create_extended_structure(map(f, result_items, unwrapped_ticks))
+        for tick_column, unwrapped_tick_column in zip(tick_columns, unwrapped_ticks.T):
+            tick_column[:] = unwrapped_tick_column
@@ -17,6 +17,7 @@ from acconeer.exptool.a121._core.entities import (
     Result,
     ResultContext,
     SensorConfig,
+    StackedResults,
 )
 from acconeer.exptool.a121._core.utils import map_over_extended_structure, zip3_extended_structures
 
@@ -29,6 +30,17 @@ class ResultInfoDict(te.TypedDict):
     temperature: int
 
 
+_RESULT_INFO_DTYPE = np.dtype(
+    [
+        ("tick", np.int64),
+        ("data_saturated", bool),
+        ("frame_delayed", bool),
+        ("calibration_needed", bool),
+        ("temperature", np.int64),
+    ]
+)
+
+
 class ResultMessageHeader(te.TypedDict):
     result_info: list[list[ResultInfoDict]]
     payload_size: int
@@ -74,31 +86,38 @@ class ResultMessage(Message):
 
     @classmethod
     def _get_array_from_blob(
-        cls, frame_blob: bytes, start: int, end: int, frame_shape: t.Tuple[int, int]
+        cls, frame_blob: bytes, offset: int, count: int, frame_shape: t.Tuple[int, int]
     ) -> npt.NDArray[t.Any]:
-        raw_frame_data = frame_blob[start:end]
-        assert len(raw_frame_data) == end - start
-        np_frame = np.frombuffer(raw_frame_data, dtype=INT_16_COMPLEX)
-        resized_frame = np.resize(np_frame, frame_shape)
-        return resized_frame
+        """Creates a view of ``count`` INT_16_COMPLEX elements, starting at byte ``offset``,
+        into ``frame_blob``.
+
+        No bytes are copied. The returned array references ``frame_blob`` (via ``ndarray.base``),
+        which keeps the buffer alive for as long as the array is.
+        """
+        np_frame = np.frombuffer(frame_blob, dtype=INT_16_COMPLEX, count=count, offset=offset)
+        return np_frame.reshape(frame_shape)
 
     @classmethod
     def _divide_frame_blob(
         cls, frame_blob: bytes, extended_metadata: list[dict[int, Metadata]]
     ) -> list[dict[int, npt.NDArray[t.Any]]]:
-        start = 0
+        offset = 0
         result = []
         for metadata_group in extended_metadata:
             result_group: dict[int, npt.NDArray[t.Any]] = {}
             result.append(result_group)
             for sensor_id, metadata in metadata_group.items():
-                end = start + metadata.frame_data_length * 4  # 4 = sizeof(int_16_complex)
+                count = metadata.frame_data_length
+                end = offset + count * INT_16_COMPLEX.itemsize
+
+                if end > len(frame_blob):
+                    raise ValueError("Result payload is smaller than specified by metadata")
 
                 result_group[sensor_id] = cls._get_array_from_blob(
-                    frame_blob, start, end, metadata.frame_shape
+                    frame_blob, offset, count, metadata.frame_shape
                 )
 
-                start = end
+                offset = end
 
         return result
 
@@ -110,22 +129,50 @@ class ResultMessage(Message):
         except KeyError as ke:
             raise ParseError from ke
 
+    @property
+    def ticks(self) -> list[int]:
+        """The ticks of all results in the message, in entry order"""
+        return [
+            result_info["tick"]
+            for result_info_group in self.grouped_result_infos
+            for result_info in result_info_group
+        ]
+
     def get_extended_results(
         self,
         tps: int,
         metadata: list[dict[int, Metadata]],
         config_groups: list[dict[int, SensorConfig]],
+        ticks: t.Optional[t.Sequence[int]] = None,
     ) -> list[dict[int, Result]]:
+        """Creates the extended results of this message
+
+        :param ticks:
+            If given, these ticks (e.g. unwrapped ones) are used instead of the ticks in the
+            message. Needs to be in the same order as :attr:`ticks`.
+        """
         extended_frames = self._divide_frame_blob(self.frame_blob, metadata)
         extended_contexts = map_over_extended_structure(
             functools.partial(self._create_result_context, ticks_per_second=tps), metadata
         )
+
+        result_infos = self.grouped_result_infos
+        if ticks is not None:
+            tick_iterator = iter(ticks)
+            result_infos = [
+                [
+                    t.cast(ResultInfoDict, {**result_info, "tick": next(tick_iterator)})
+                    for result_info in result_info_group
+                ]
+                for result_info_group in result_infos
+            ]
+
         extended_result_infos = [
             {
                 sensor_id: result_info
                 for result_info, sensor_id in zip(result_info_group, config_group.keys())
             }
-            for result_info_group, config_group in zip(self.grouped_result_infos, config_groups)
+            for result_info_group, config_group in zip(result_infos, config_groups)
         ]
 
         extended_results = map_over_extended_structure(
@@ -134,3 +181,64 @@ class ResultMessage(Message):
         )
 
         return extended_results
+
+    @classmethod
+    def get_extended_stacked_results(
+        cls,
+        result_messages: t.Sequence[ResultMessage],
+        tps: int,
+        metadata: list[dict[int, Metadata]],
+    ) -> list[dict[int, StackedResults]]:
+        """Decodes a sequence of result messages into stacked results
+
+        The frames of each entry are copied into one preallocated 3-D array with dimensions
+        (frame, sweep, distance). Ticks are not unwrapped.
+        """
+        num_frames = len(result_messages)
+
+        extended_frames = map_over_extended_structure(
+            lambda m: np.empty((num_frames, *m.frame_shape), dtype=INT_16_COMPLEX), metadata
+        )
+        extended_result_infos = map_over_extended_structure(
+            lambda _: np.empty(num_frames, dtype=_RESULT_INFO_DTYPE), metadata
+        )
+
+        for frame_index, result_message in enumerate(result_messages):
+            frame_views = cls._divide_frame_blob(result_message.frame_blob, metadata)
+
+            for result_info_group, frame_view_group, frame_group, result_info_array_group in zip(
+                result_message.grouped_result_infos,
+                frame_views,
+                extended_frames,
+                extended_result_infos,
+            ):
+                for result_info, (sensor_id, frame_view) in zip(
+                    result_info_group, frame_view_group.items()
+                ):
+                    frame_group[sensor_id][frame_index] = frame_view
+                    result_info_array_group[sensor_id][frame_index] = (
+                        result_info["tick"],
+                        result_info["data_saturated"],
+                        result_info["frame_delayed"],
+                        result_info["calibration_needed"],
+                        result_info["temperature"],
+                    )
+
+        def create_stacked_results(
+            args: tuple[npt.NDArray[t.Any], npt.NDArray[t.Any], Metadata]
+        ) -> StackedResults:
+            result_infos, frames, entry_metadata = args
+            return StackedResults(
+                data_saturated=result_infos["data_saturated"].copy(),
+                frame_delayed=result_infos["frame_delayed"].copy(),
+                calibration_needed=result_infos["calibration_needed"].copy(),
+                temperature=result_infos["temperature"].copy(),
+                tick=result_infos["tick"].copy(),
+                frame=frames,
+                context=cls._create_result_context(entry_metadata, ticks_per_second=tps),
+            )
+
+        return map_over_extended_structure(
+            create_stacked_results,
+            zip3_extended_structures(extended_result_infos, extended_frames, metadata),
+        )
@@ -27,4 +27,6 @@ from .containers import (
     ServerInfo,
     SessionRecord,
     StackedResults,
+    get_frame_dtype,
+    set_frame_dtype,
 )
@@ -8,7 +8,7 @@ from acconeer.exptool._core.int_16_complex import (
 
 from .metadata import Metadata
 from .record import PersistentRecord, Record, RecordException, SessionRecord
-from .result import Result, ResultContext
+from .result import Result, ResultContext, get_frame_dtype, set_frame_dtype
 from .sensor_calibration import SensorCalibration
 from .server_info import SensorInfo, ServerInfo
 from .stacked_results import StackedResults
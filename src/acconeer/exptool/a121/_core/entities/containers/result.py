@@ -16,6 +16,55 @@ from .metadata import Metadata
 from .utils import get_subsweeps_from_frame
 
 
+_FRAME_DTYPES = (np.dtype(np.complex128), np.dtype(np.complex64))
+_frame_dtype: np.dtype[t.Any] = np.dtype(np.complex128)
+
+
+def set_frame_dtype(dtype: npt.DTypeLike) -> None:
+    """Sets the dtype of converted frames, e.g. :attr:`Result.frame`, in this process
+
+    ``numpy.complex64`` halves the memory use and bandwidth of the processing chain compared to
+    the default, ``numpy.complex128``. All int16 values are represented exactly by both.
+    """
+    global _frame_dtype
+
+    dtype = np.dtype(dtype)
+    if dtype not in _FRAME_DTYPES:
+        raise ValueError(f"Frame dtype needs to be complex64 or complex128, got {dtype}")
+
+    _frame_dtype = dtype
+
+
+def get_frame_dtype() -> np.dtype[t.Any]:
+    """Gets the dtype of converted frames, see :func:`set_frame_dtype`"""
+    return _frame_dtype
+
+
+def _get_converted_frame(
+    frame: npt.NDArray[t.Any],
+    converted_frames: dict[np.dtype[t.Any], npt.NDArray[t.Any]],
+    dtype: t.Optional[npt.DTypeLike],
+) -> npt.NDArray[t.Any]:
+    """Converts a frame, or gets it from the cache of already converted frames
+
+    Converted frames are read-only, since they are shared by all callers.
+    """
+    dtype = _frame_dtype if dtype is None else np.dtype(dtype)
+
+    try:
+        return converted_frames[dtype]
+    except KeyError:
+        pass
+
+    if dtype not in _FRAME_DTYPES:
+        raise ValueError(f"Frame dtype needs to be complex64 or complex128, got {dtype}")
+
+    converted_frame = int16_complex_array_to_complex(frame, dtype=dtype)
+    converted_frame.flags.writeable = False
+    converted_frames[dtype] = converted_frame
+    return converted_frame
+
+
 @attrs.frozen(kw_only=True)
 class ResultContext:
     metadata: Metadata = attrs.field()
@@ -61,20 +110,35 @@ class Result:
 
     _context: ResultContext = attrs.field()
 
+    _converted_frames: t.Dict[np.dtype[t.Any], npt.NDArray[t.Any]] = attrs.field(
+        factory=dict, init=False, eq=False, repr=False
+    )
+
     @property
     def frame(self) -> npt.NDArray[np.complex_]:
         """Frame data in a complex float data format
 
-        2-D with dimensions (sweep, distance).
+        2-D with dimensions (sweep, distance). Converted once and read-only. The dtype is
+        ``complex128``, unless changed by :func:`set_frame_dtype`.
         """
 
-        return int16_complex_array_to_complex(self._frame)
+        return self.get_frame()
 
     @property
     def subframes(self) -> list[npt.NDArray[np.complex_]]:
         """Frame split up into subframes, one for every subsweep config used"""
 
-        return get_subsweeps_from_frame(self.frame, self._context.metadata)
+        return self.get_subframes()
+
+    def get_frame(self, dtype: t.Optional[npt.DTypeLike] = None) -> npt.NDArray[t.Any]:
+        """Like :attr:`frame`, but converted to ``dtype`` (``complex64`` or ``complex128``)"""
+
+        return _get_converted_frame(self._frame, self._converted_frames, dtype)
+
+    def get_subframes(self, dtype: t.Optional[npt.DTypeLike] = None) -> list[npt.NDArray[t.Any]]:
+        """Like :attr:`subframes`, but converted to ``dtype`` (``complex64`` or ``complex128``)"""
+
+        return get_subsweeps_from_frame(self.get_frame(dtype), self._context.metadata)
 
     @property
     def tick_time(self) -> float:
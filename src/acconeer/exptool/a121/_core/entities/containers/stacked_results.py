@@ -10,9 +10,8 @@ import numpy as np
 import numpy.typing as npt
 
 from acconeer.exptool._core.class_creation.attrs import attrs_ndarray_eq
-from acconeer.exptool._core.int_16_complex import int16_complex_array_to_complex
 
-from .result import Result, ResultContext
+from .result import Result, ResultContext, _get_converted_frame
 from .utils import get_subsweeps_from_frame
 
 
@@ -44,13 +43,23 @@ class StackedResults:
 
     _context: ResultContext = attrs.field()
 
+    _converted_frames: t.Dict[np.dtype[t.Any], npt.NDArray[t.Any]] = attrs.field(
+        factory=dict, init=False, eq=False, repr=False
+    )
+
     @property
     def frame(self) -> npt.NDArray[np.complex_]:
-        return int16_complex_array_to_complex(self._frame)
+        return self.get_frame()
 
     @property
     def subframes(self) -> list[npt.NDArray[np.complex_]]:
-        return get_subsweeps_from_frame(self.frame, self._context.metadata)
+        return self.get_subframes()
+
+    def get_frame(self, dtype: t.Optional[npt.DTypeLike] = None) -> npt.NDArray[t.Any]:
+        return _get_converted_frame(self._frame, self._converted_frames, dtype)
+
+    def get_subframes(self, dtype: t.Optional[npt.DTypeLike] = None) -> list[npt.NDArray[t.Any]]:
+        return get_subsweeps_from_frame(self.get_frame(dtype), self._context.metadata)
 
     @property
     def tick_time(self) -> npt.NDArray[np.float_]:
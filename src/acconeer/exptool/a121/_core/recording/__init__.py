@@ -5,6 +5,10 @@ from .h5_record import (
     _H5PY_STR_DTYPE,
     H5Record,
     H5Recorder,
+    H5RecordingProfile,
+    H5SessionRecord,
+    H5StackedResults,
+    H5WriteStatistics,
     RecordError,
     load_record,
     open_record,
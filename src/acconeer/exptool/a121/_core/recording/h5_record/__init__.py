@@ -1,6 +1,8 @@
 # Copyright (c) Acconeer AB, 2022-2023
 # All rights reserved
 
-from .record import H5Record
+from .lazy_stacked_results import H5StackedResults
+from .record import H5Record, H5SessionRecord
 from .record_io import RecordError, load_record, open_record, save_record, save_record_to_h5
 from .recorder import _H5PY_STR_DTYPE, H5Recorder
+from .recording_profile import H5RecordingProfile, H5WriteStatistics
@@ -0,0 +1,140 @@
+# Copyright (c) Acconeer AB, 2024
+# All rights reserved
+
+from __future__ import annotations
+
+import typing as t
+
+import h5py
+import numpy as np
+import numpy.typing as npt
+
+from acconeer.exptool._core.int_16_complex import int16_complex_array_to_complex
+from acconeer.exptool.a121._core.entities import (
+    Result,
+    ResultContext,
+    StackedResults,
+    get_frame_dtype,
+)
+from acconeer.exptool.a121._core.entities.containers.utils import get_subsweeps_from_frame
+
+
+class H5StackedResults:
+    """Stacked results, read lazily from a recorded session
+
+    Has the same attributes/properties as :class:`StackedResults`, but keeps references to the
+    datasets of the recording instead of loading them. Each access reads only the frames in the
+    window of this object from file. Slicing, e.g. ``stacked[1000:2000]``, returns a new
+    :class:`H5StackedResults` for that window without reading anything.
+
+    The ticks are kept in memory, since they are unwrapped over the whole session.
+    """
+
+    def __init__(
+        self,
+        datasets: t.Mapping[str, h5py.Dataset],
+        tick: npt.NDArray[np.int64],
+        context: ResultContext,
+        window: t.Optional[range] = None,
+    ) -> None:
+        self._datasets = datasets
+        self._tick = tick
+        self._context = context
+        self._window = range(len(tick)) if window is None else window
+
+    @property
+    def data_saturated(self) -> npt.NDArray[np.bool_]:
+        return self._read("data_saturated")
+
+    @property
+    def frame_delayed(self) -> npt.NDArray[np.bool_]:
+        return self._read("frame_delayed")
+
+    @property
+    def calibration_needed(self) -> npt.NDArray[np.bool_]:
+        return self._read("calibration_needed")
+
+    @property
+    def temperature(self) -> npt.NDArray[t.Any]:
+        return self._read("temperature")
+
+    @property
+    def tick(self) -> npt.NDArray[np.int64]:
+        return self._tick[self._window_slice()]
+
+    @property
+    def _frame(self) -> npt.NDArray[t.Any]:
+        return self._read("frame")
+
+    @property
+    def frame(self) -> npt.NDArray[np.complex_]:
+        return int16_complex_array_to_complex(self._frame, dtype=get_frame_dtype())
+
+    @property
+    def subframes(self) -> list[npt.NDArray[np.complex_]]:
+        return get_subsweeps_from_frame(self.frame, self._context.metadata)
+
+    @property
+    def tick_time(self) -> npt.NDArray[np.float_]:
+        return self.tick / self._context.ticks_per_second
+
+    def __len__(self) -> int:
+        return len(self._window)
+
+    @t.overload
+    def __getitem__(self, key: int) -> Result:
+        ...
+
+    @t.overload
+    def __getitem__(self, key: slice) -> H5StackedResults:
+        ...
+
+    def __getitem__(self, key: t.Union[int, slice]) -> t.Union[Result, H5StackedResults]:
+        if isinstance(key, slice):
+            return H5StackedResults(self._datasets, self._tick, self._context, self._window[key])
+
+        frame_no = self._window[key]
+        return Result(
+            calibration_needed=self._datasets["calibration_needed"][frame_no],
+            data_saturated=self._datasets["data_saturated"][frame_no],
+            frame_delayed=self._datasets["frame_delayed"][frame_no],
+            temperature=self._datasets["temperature"][frame_no],
+            tick=self._tick[frame_no],
+            frame=self._datasets["frame"][frame_no],
+            context=self._context,
+        )
+
+    def load(self) -> StackedResults:
+        """Reads the window into memory as :class:`StackedResults`"""
+        return StackedResults(
+            data_saturated=self.data_saturated,
+            frame_delayed=self.frame_delayed,
+            calibration_needed=self.calibration_needed,
+            temperature=self.temperature,
+            tick=self.tick,
+            frame=self._frame,
+            context=self._context,
+        )
+
+    def _window_slice(self) -> slice:
+        window = self._window
+        if window.step > 0 or len(window) == 0:
+            return slice(window.start, window.stop, window.step)
+        else:
+            return slice(window.start, window.stop if window.stop >= 0 else None, window.step)
+
+    def _read(self, dataset_name: str) -> npt.NDArray[t.Any]:
+        """Reads the hyperslab of the window from a dataset"""
+        dataset = self._datasets[dataset_name]
+        window = self._window
+
+        if len(window) == 0:
+            return np.empty((0, *dataset.shape[1:]), dtype=dataset.dtype)
+
+        if window.step > 0:
+            return dataset[window.start : window.stop : window.step]  # type: ignore[no-any-return]
+
+        # h5py only supports increasing indices
+        reversed_window = window[::-1]
+        data = dataset[reversed_window.start : reversed_window.stop : reversed_window.step]
+        return data[::-1]  # type: ignore[no-any-return]
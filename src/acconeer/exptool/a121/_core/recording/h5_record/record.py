@@ -5,14 +5,16 @@ from __future__ import annotations
 
 import re
 import warnings
-from typing import Callable, Iterator, Tuple, TypeVar
+from typing import Callable, Iterator, Optional, Tuple, TypeVar
 
 import h5py
 import numpy as np
+import numpy.typing as npt
 from packaging.version import Version
 
 import acconeer.exptool
 from acconeer.exptool._core import ClientInfo
+from acconeer.exptool._core.communication.unwrap_ticks import unwrap_ticks_array
 from acconeer.exptool._core.recording.h5_session_schema import SessionSchema
 from acconeer.exptool.a121._core import utils
 from acconeer.exptool.a121._core.entities import (
@@ -29,6 +31,9 @@ from acconeer.exptool.a121._core.entities import (
 )
 from acconeer.exptool.utils import get_module_version
 
+from .lazy_stacked_results import H5StackedResults
+from .saver import _NUM_FRAMES_ATTR
+
 
 T = TypeVar("T")
 
@@ -37,27 +42,102 @@ class H5RecordException(RecordException):
     pass
 
 
+def _unwrap_tick_columns_in_place(tick_columns: list[npt.NDArray[np.int64]]) -> None:
+    """Unwraps the recorded tick columns of all entries in a session, in place
+
+    Records created by versions of Exploration Tool that did not unwrap ticks contain ticks that
+    wrap at 2^32. Ticks that are already unwrapped are left as-is.
+    """
+    if not tick_columns or tick_columns[0].size == 0:
+        return
+
+    ticks = np.stack(tick_columns, axis=1)
+
+    if ticks.min() < 0 or ticks.max() >= 2**32:
+        return
+
+    unwrapped_ticks, _ = unwrap_ticks_array(ticks, minimum_tick=None)
+
+    for tick_column, unwrapped_tick_column in zip(tick_columns, unwrapped_ticks.T):
+        tick_column[:] = unwrapped_tick_column
+
+
 class H5SessionRecord(SessionRecord):
+    """Session record reading from an HDF5 session group
+
+    The entry structure, result contexts and dataset handles are looked up once and cached.
+    Results are read ``_READ_CHUNK_SIZE`` frames at a time when iterating.
+
+    Only the written frames are read, as given by the ``num_frames`` attribute of the result
+    groups if present, since the datasets of a session that was never stopped are longer.
+    """
+
+    _READ_CHUNK_SIZE = 256
+
     def __init__(self, group: h5py.Group, ticks_per_second: int) -> None:
         self._group = group
         self._ticks_per_second = ticks_per_second
+        self._entries: Optional[list[dict[int, h5py.Group]]] = None
+        self._result_contexts: Optional[list[dict[int, ResultContext]]] = None
+        self._result_datasets: Optional[list[dict[int, dict[str, h5py.Dataset]]]] = None
+        self._extended_ticks: Optional[list[dict[int, npt.NDArray[np.int64]]]] = None
 
     @property
     def extended_metadata(self) -> list[dict[int, Metadata]]:
-        return self._map_over_entries(self._get_metadata_for_entry_group)
+        return utils.map_over_extended_structure(
+            lambda context: context.metadata, self._get_result_contexts()
+        )
 
     @property
     def extended_results(self) -> Iterator[list[dict[int, Result]]]:
-        for frame_no in range(self.num_frames):
-            yield self._get_result_for_all_entries(frame_no)
+        num_frames = self.num_frames
+        for start in range(0, num_frames, self._READ_CHUNK_SIZE):
+            yield from self._read_results(start, min(start + self._READ_CHUNK_SIZE, num_frames))
 
     @property
     def extended_stacked_results(self) -> list[dict[int, StackedResults]]:
-        return self._map_over_entries(self._entry_group_to_stacked_results)
+        num_frames = self.num_frames
+        return utils.map_over_extended_structure(
+            lambda entry: self._entry_to_stacked_results(entry, num_frames),
+            utils.zip3_extended_structures(
+                self._get_result_datasets(),
+                self._get_extended_ticks(),
+                self._get_result_contexts(),
+            ),
+        )
+
+    @property
+    def extended_lazy_stacked_results(self) -> list[dict[int, H5StackedResults]]:
+        """Like :attr:`extended_stacked_results`, but data is read from file when accessed
+
+        Use for recordings too large to load into memory, e.g.
+        ``session.lazy_stacked_results[1000:2000].frame`` only reads frames 1000 to 1999.
+        """
+        return utils.map_over_extended_structure(
+            lambda entry: H5StackedResults(*entry),
+            utils.zip3_extended_structures(
+                self._get_result_datasets(),
+                self._get_extended_ticks(),
+                self._get_result_contexts(),
+            ),
+        )
+
+    @property
+    def lazy_stacked_results(self) -> H5StackedResults:
+        """Like :attr:`stacked_results`, but data is read from file when accessed
+
+        :raises: ValueError if there are multiple entries in the session
+        """
+        return utils.unextend(self.extended_lazy_stacked_results)
 
     @property
     def num_frames(self) -> int:
-        (num_frames,) = {len(entry["result/frame"]) for _, _, entry in self._iterate_entries()}
+        (num_frames,) = {
+            int(result_group.attrs.get(_NUM_FRAMES_ATTR, len(result_group["frame"])))
+            for result_group in utils.iterate_extended_structure_values(
+                self._map_over_entries(lambda entry_group: entry_group["result"])
+            )
+        }
         return num_frames
 
     @property
@@ -90,37 +170,107 @@ class H5SessionRecord(SessionRecord):
         return Metadata.from_json(g["metadata"][()])
 
     def _get_result_for_all_entries(self, frame_no: int) -> list[dict[int, Result]]:
-        def entry_group_to_result(entry_group: h5py.Group) -> Result:
-            return Result(
-                data_saturated=entry_group["result/data_saturated"][frame_no],
-                frame_delayed=entry_group["result/frame_delayed"][frame_no],
-                calibration_needed=entry_group["result/calibration_needed"][frame_no],
-                temperature=entry_group["result/temperature"][frame_no],
-                tick=entry_group["result/tick"][frame_no],
-                frame=np.array(entry_group["result/frame"][frame_no]),
-                context=self._get_result_context_for_entry_group(entry_group),
-            )
+        (extended_result,) = self._read_results(frame_no, frame_no + 1)
+        return extended_result
 
-        return self._map_over_entries(entry_group_to_result)
+    def _read_results(self, start: int, stop: int) -> list[list[dict[int, Result]]]:
+        """Reads the results of frames ``start`` to ``stop`` with one read per dataset
 
-    def _entry_group_to_stacked_results(self, entry_group: h5py.Group) -> StackedResults:
-        return StackedResults(
-            data_saturated=entry_group["result/data_saturated"][()],
-            calibration_needed=entry_group["result/calibration_needed"][()],
-            temperature=entry_group["result/temperature"][()],
-            tick=entry_group["result/tick"][()],
-            frame_delayed=entry_group["result/frame_delayed"][()],
-            frame=entry_group["result/frame"][()],
-            context=self._get_result_context_for_entry_group(entry_group),
+        The frames of the returned results are views into the read chunk.
+        """
+        num_frames = stop - start
+
+        def read_entry(
+            entry: Tuple[dict[str, h5py.Dataset], npt.NDArray[np.int64], ResultContext],
+        ) -> list[Result]:
+            datasets, ticks, context = entry
+            data_saturated = datasets["data_saturated"][start:stop]
+            frame_delayed = datasets["frame_delayed"][start:stop]
+            calibration_needed = datasets["calibration_needed"][start:stop]
+            temperature = datasets["temperature"][start:stop]
+            frame = datasets["frame"][start:stop]
+
+            return [
+                Result(
+                    data_saturated=data_saturated[i],
+                    frame_delayed=frame_delayed[i],
+                    calibration_needed=calibration_needed[i],
+                    temperature=temperature[i],
+                    tick=ticks[start + i],
+                    frame=frame[i],
+                    context=context,
+                )
+                for i in range(num_frames)
+            ]
+
+        results_per_entry = utils.map_over_extended_structure(
+            read_entry,
+            utils.zip3_extended_structures(
+                self._get_result_datasets(),
+                self._get_extended_ticks(),
+                self._get_result_contexts(),
+            ),
         )
 
-    def _get_result_context_for_entry_group(self, entry_group: h5py.Group) -> ResultContext:
-        return ResultContext(
-            metadata=self._get_metadata_for_entry_group(entry_group),
-            ticks_per_second=self._ticks_per_second,
+        return [
+            utils.map_over_extended_structure(lambda results: results[i], results_per_entry)
+            for i in range(num_frames)
+        ]
+
+    @staticmethod
+    def _entry_to_stacked_results(
+        entry: Tuple[dict[str, h5py.Dataset], npt.NDArray[np.int64], ResultContext],
+        num_frames: int,
+    ) -> StackedResults:
+        datasets, ticks, context = entry
+        return StackedResults(
+            data_saturated=datasets["data_saturated"][:num_frames],
+            calibration_needed=datasets["calibration_needed"][:num_frames],
+            temperature=datasets["temperature"][:num_frames],
+            tick=ticks.copy(),
+            frame_delayed=datasets["frame_delayed"][:num_frames],
+            frame=datasets["frame"][:num_frames],
+            context=context,
         )
 
+    def _get_extended_ticks(self) -> list[dict[int, npt.NDArray[np.int64]]]:
+        """Reads and unwraps the tick columns of all entries once"""
+        if self._extended_ticks is None:
+            num_frames = self.num_frames
+            extended_ticks = utils.map_over_extended_structure(
+                lambda datasets: np.asarray(datasets["tick"][:num_frames], dtype=np.int64),
+                self._get_result_datasets(),
+            )
+            _unwrap_tick_columns_in_place(
+                list(utils.iterate_extended_structure_values(extended_ticks))
+            )
+            self._extended_ticks = extended_ticks
+
+        return self._extended_ticks
+
+    def _get_result_contexts(self) -> list[dict[int, ResultContext]]:
+        if self._result_contexts is None:
+            self._result_contexts = self._map_over_entries(
+                lambda entry_group: ResultContext(
+                    metadata=self._get_metadata_for_entry_group(entry_group),
+                    ticks_per_second=self._ticks_per_second,
+                )
+            )
+
+        return self._result_contexts
+
+    def _get_result_datasets(self) -> list[dict[int, dict[str, h5py.Dataset]]]:
+        if self._result_datasets is None:
+            self._result_datasets = self._map_over_entries(
+                lambda entry_group: dict(entry_group["result"].items())
+            )
+
+        return self._result_datasets
+
     def _get_entries(self) -> list[dict[int, h5py.Group]]:
+        if self._entries is not None:
+            return self._entries
+
         structure: dict[int, dict[int, h5py.Group]] = {}
 
         for k, v in self._group.items():
@@ -136,7 +286,8 @@ class H5SessionRecord(SessionRecord):
                 sensor_id = vv["sensor_id"][()]
                 structure[group_index][sensor_id] = vv
 
-        return [structure[i] for i in range(len(structure))]
+        self._entries = [structure[i] for i in range(len(structure))]
+        return self._entries
 
     def _iterate_entries(self) -> Iterator[Tuple[int, int, h5py.Group]]:
         """Iterates over "Entry" items in this record.
@@ -234,6 +385,22 @@ class H5Record(PersistentRecord):
             ticks_per_second=self.server_info.ticks_per_second,
         )
 
+    @property
+    def extended_lazy_stacked_results(self) -> list[dict[int, H5StackedResults]]:
+        """The lazy stacked results of the first session
+
+        See :attr:`H5SessionRecord.extended_lazy_stacked_results`.
+        """
+        return self.session(0).extended_lazy_stacked_results
+
+    @property
+    def lazy_stacked_results(self) -> H5StackedResults:
+        """The sole lazy stacked results of the first session
+
+        See :attr:`H5SessionRecord.lazy_stacked_results`.
+        """
+        return self.session(0).lazy_stacked_results
+
     @property
     def num_sessions(self) -> int:
         return len(self._schema.session_groups_on_disk(self.file))
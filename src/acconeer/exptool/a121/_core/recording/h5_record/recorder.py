@@ -3,6 +3,7 @@
 
 from __future__ import annotations
 
+import os
 import typing as t
 
 import h5py
@@ -18,6 +19,7 @@ from acconeer.exptool.a121._core.entities import (
     SessionConfig,
 )
 
+from .recording_profile import H5RecordingProfile, H5WriteStatistics
 from .saver import H5Saver
 
 
@@ -53,6 +55,19 @@ class H5Recorder(
     :param mode:
         The file mode to use if a path-like object was given for ``path_or_file``. Default value is
         'x', meaning that we open for exclusive creation, failing if the file already exists.
+    :param recording_profile:
+        Compression and chunk layout of the recorded result datasets. Defaults to gzip
+        compression with chunk shapes picked by h5py.
+    :param background_writer:
+        If True, data is written to file by a background thread, so that compression and file
+        system access don't delay the acquisition. All queued data is written when the session
+        is stopped.
+    :param flush_frames:
+        Only with ``background_writer``. The background thread writes data at least every
+        ``flush_frames``:th sample. Defaults to 512.
+    :param flush_interval_ms:
+        Only with ``background_writer``. The background thread writes data at least every
+        ``flush_interval_ms`` milliseconds. Defaults to 1000.
     :param _chunk_size:
         If given, data will be written to file every ``_chunk_size`` samples.
 
@@ -79,15 +94,43 @@ class H5Recorder(
         ] = None,
         mode: str = "x",
         *,
+        recording_profile: t.Optional[H5RecordingProfile] = None,
+        background_writer: bool = False,
+        flush_frames: t.Optional[int] = None,
+        flush_interval_ms: t.Optional[float] = None,
         _chunk_size: t.Optional[int] = None,
         _lib_version: t.Optional[str] = None,
         _timestamp: t.Optional[str] = None,
         _uuid: t.Optional[str] = None,
     ) -> None:
+        self._a121_saver = H5Saver(recording_profile)
+
+        saver: h5_record.H5Saver[
+            SessionConfig,
+            t.List[t.Dict[int, Metadata]],
+            t.List[t.Dict[int, Result]],
+            ServerInfo,
+        ]
+        if background_writer:
+            if _chunk_size is not None:
+                raise ValueError("'_chunk_size' cannot be used with 'background_writer'")
+
+            saver = h5_record.ThreadedH5Saver(
+                self._a121_saver, flush_frames=flush_frames, flush_interval_ms=flush_interval_ms
+            )
+        else:
+            if flush_frames is not None or flush_interval_ms is not None:
+                raise ValueError(
+                    "'flush_frames' and 'flush_interval_ms' can only be used with "
+                    + "'background_writer'"
+                )
+
+            saver = h5_record.ChunkedH5Saver(self._a121_saver, _chunk_size=_chunk_size)
+
         super().__init__(
             path_or_file,
             "a121",
-            h5_record.ChunkedH5Saver(H5Saver(), _chunk_size=_chunk_size),
+            saver,
             attachable,
             mode,
             _lib_version=_lib_version,
@@ -111,3 +154,23 @@ class H5Recorder(
             calibrations_provided=calibrations_provided,
             **kwargs,
         )
+
+    @property
+    def write_statistics(self) -> H5WriteStatistics:
+        """Statistics of the data written so far, like write throughput and file size
+
+        Data still waiting to be written, e.g. in the background writer, is not included.
+        """
+        if self.file.id.valid:
+            file_size: t.Optional[int] = self.file.id.get_filesize()
+        elif self.path is not None:
+            file_size = os.path.getsize(self.path)
+        else:
+            file_size = None
+
+        return H5WriteStatistics(
+            num_frames=self._a121_saver.num_frames_written,
+            num_bytes=self._a121_saver.num_bytes_written,
+            write_time_s=self._a121_saver.write_time_s,
+            file_size=file_size,
+        )
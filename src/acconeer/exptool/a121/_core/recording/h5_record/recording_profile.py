@@ -0,0 +1,84 @@
+# Copyright (c) Acconeer AB, 2024
+# All rights reserved
+
+from __future__ import annotations
+
+import typing as t
+
+import attrs
+
+
+_COMPRESSION_FILTERS = ("lzf", "gzip")
+
+
+@attrs.frozen(kw_only=True)
+class H5RecordingProfile:
+    """Compression and chunk layout of the result datasets of recorded sessions
+
+    The default profile compresses with gzip at the default level and lets h5py pick the chunk
+    shape. For high frame rates, ``H5RecordingProfile(compression="lzf", shuffle=True)`` or
+    ``H5RecordingProfile(compression=None)`` costs less CPU time per frame. For archival,
+    ``H5RecordingProfile(compression="gzip", compression_level=9, shuffle=True)`` gives smaller
+    files.
+    """
+
+    compression: t.Optional[str] = attrs.field(default="gzip")
+    """Compression filter; ``None``, ``"lzf"`` or ``"gzip"``"""
+
+    compression_level: t.Optional[int] = attrs.field(
+        default=None,
+        validator=attrs.validators.optional([attrs.validators.ge(0), attrs.validators.le(9)]),
+    )
+    """The gzip compression level, 0-9. If ``None``, the h5py default is used"""
+
+    shuffle: bool = attrs.field(default=False)
+    """Whether to apply the shuffle filter before compressing"""
+
+    chunk_frames: t.Optional[int] = attrs.field(
+        default=None, validator=attrs.validators.optional(attrs.validators.ge(1))
+    )
+    """The number of frames per chunk. If ``None``, the chunk shape is picked by h5py"""
+
+    @compression.validator
+    def _validate_compression(self, _: t.Any, compression: t.Optional[str]) -> None:
+        if compression is not None and compression not in _COMPRESSION_FILTERS:
+            raise ValueError(f"Unknown compression filter {compression!r}")
+
+    @compression_level.validator
+    def _validate_compression_level(self, _: t.Any, compression_level: t.Optional[int]) -> None:
+        if compression_level is not None and self.compression != "gzip":
+            raise ValueError("'compression_level' can only be set for gzip compression")
+
+    def _dataset_kwargs(self, frame_shape: t.Tuple[int, ...] = ()) -> t.Dict[str, t.Any]:
+        """Keyword arguments to ``h5py.Group.create_dataset`` for a dataset of frames"""
+        return dict(
+            compression=self.compression,
+            compression_opts=self.compression_level,
+            shuffle=self.shuffle,
+            chunks=True if self.chunk_frames is None else (self.chunk_frames, *frame_shape),
+        )
+
+
+@attrs.frozen(kw_only=True)
+class H5WriteStatistics:
+    """Statistics of the writes made by a :class:`H5Recorder`"""
+
+    num_frames: int
+    """The number of written (extended) frames"""
+
+    num_bytes: int
+    """The number of written bytes, before compression"""
+
+    write_time_s: float
+    """The time spent writing, in seconds"""
+
+    file_size: t.Optional[int]
+    """The size of the file in bytes, if available"""
+
+    @property
+    def throughput(self) -> float:
+        """The written bytes per second spent writing, before compression"""
+        if self.write_time_s == 0:
+            return 0.0
+
+        return self.num_bytes / self.write_time_s
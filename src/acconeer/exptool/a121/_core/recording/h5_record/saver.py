@@ -4,6 +4,7 @@
 from __future__ import annotations
 
 import typing as t
+from time import perf_counter
 
 import h5py
 import numpy as np
@@ -19,6 +20,8 @@ from acconeer.exptool.a121._core.entities import (
     SessionConfig,
 )
 
+from .recording_profile import H5RecordingProfile
+
 
 def get_h5py_str_dtype() -> t.Any:
     return h5py.special_dtype(vlen=str)
@@ -26,6 +29,17 @@ def get_h5py_str_dtype() -> t.Any:
 
 _H5PY_STR_DTYPE = get_h5py_str_dtype()
 
+_NUM_FRAMES_ATTR = "num_frames"
+
+_RESULT_DATASET_NAMES = [
+    "data_saturated",
+    "frame_delayed",
+    "calibration_needed",
+    "temperature",
+    "tick",
+    "frame",
+]
+
 
 class H5Saver(
     h5_record.H5Saver[
@@ -35,12 +49,37 @@ class H5Saver(
         ServerInfo,  # Server info type
     ]
 ):
-    """H5Saver for A121 data"""
+    """H5Saver for A121 data
 
-    _num_frames_current_session: int
+    Result datasets are grown ahead of the written data, in steps of ``_DATASET_GROWTH`` frames,
+    and trimmed to the number of written frames when the session is stopped. Until then, the
+    ``num_frames`` attribute of each result group holds the number of written frames, so that
+    sessions that are never stopped (e.g. if the process is killed) are read without the
+    unwritten frames.
 
-    def __init__(self) -> None:
+    :param recording_profile: Compression and chunk layout of the result datasets
+    """
+
+    _DATASET_GROWTH = 1024
+
+    _num_frames_current_session: int
+    _capacity_current_session: int
+    _result_group_names: t.List[str]
+    _recording_profile: H5RecordingProfile
+    num_frames_written: int
+    num_bytes_written: int
+    write_time_s: float
+
+    def __init__(self, recording_profile: t.Optional[H5RecordingProfile] = None) -> None:
         self._num_frames_current_session = 0
+        self._capacity_current_session = 0
+        self._result_group_names = []
+        self._recording_profile = (
+            H5RecordingProfile() if recording_profile is None else recording_profile
+        )
+        self.num_frames_written = 0
+        self.num_bytes_written = 0
+        self.write_time_s = 0.0
 
     def _start(self) -> None:
         pass
@@ -85,6 +124,7 @@ class H5Saver(
 
                 result_group = entry_group.create_group("result")
                 self._create_result_datasets(result_group, single_metadata)
+                self._result_group_names.append(result_group.name)
 
         if (calibrations is None) != (calibrations_provided is None):
             raise ValueError(
@@ -103,21 +143,27 @@ class H5Saver(
                 )
 
     def _sample(self, group: h5py.Group, results: t.Iterable[t.List[t.Dict[int, Result]]]) -> None:
-        self._num_frames_current_session += self._write_results_to_file(
+        start = perf_counter()
+        num_frames = self._write_results_to_file(
             group=group,
             start_idx=self._num_frames_current_session,
             results=list(results),
         )
+        self.write_time_s += perf_counter() - start
+        self.num_frames_written += num_frames
+        self._num_frames_current_session += num_frames
+
+    def _create_result_datasets(self, g: h5py.Group, metadata: Metadata) -> None:
+        g.attrs[_NUM_FRAMES_ATTR] = 0
+        scalar_kwargs = self._recording_profile._dataset_kwargs()
 
-    @staticmethod
-    def _create_result_datasets(g: h5py.Group, metadata: Metadata) -> None:
         g.create_dataset(
             "data_saturated",
             shape=(0,),
             maxshape=(None,),
             dtype=bool,
             track_times=False,
-            compression="gzip",
+            **scalar_kwargs,
         )
         g.create_dataset(
             "frame_delayed",
@@ -125,7 +171,7 @@ class H5Saver(
             maxshape=(None,),
             dtype=bool,
             track_times=False,
-            compression="gzip",
+            **scalar_kwargs,
         )
         g.create_dataset(
             "calibration_needed",
@@ -133,7 +179,7 @@ class H5Saver(
             maxshape=(None,),
             dtype=bool,
             track_times=False,
-            compression="gzip",
+            **scalar_kwargs,
         )
         g.create_dataset(
             "temperature",
@@ -141,7 +187,7 @@ class H5Saver(
             maxshape=(None,),
             dtype=int,
             track_times=False,
-            compression="gzip",
+            **scalar_kwargs,
         )
 
         g.create_dataset(
@@ -150,7 +196,7 @@ class H5Saver(
             maxshape=(None,),
             dtype=np.dtype("int64"),
             track_times=False,
-            compression="gzip",
+            **scalar_kwargs,
         )
 
         g.create_dataset(
@@ -159,7 +205,7 @@ class H5Saver(
             maxshape=(None, *metadata.frame_shape),
             dtype=INT_16_COMPLEX,
             track_times=False,
-            compression="gzip",
+            **self._recording_profile._dataset_kwargs(metadata.frame_shape),
         )
 
     def _write_results_to_file(
@@ -172,42 +218,66 @@ class H5Saver(
         if len(results) == 0:
             return 0
 
+        end_idx = start_idx + len(results)
+        if end_idx > self._capacity_current_session:
+            growth = self._DATASET_GROWTH
+            self._resize_result_datasets(group, -(-end_idx // growth) * growth)
+
         res: t.List[Result]
         for group_idx, entry_idx, res in utils.iterate_extended_structure_as_entry_list(
             utils.transpose_extended_structures(results)
         ):
-            self._write_results(
-                g=group[f"group_{group_idx}/entry_{entry_idx}/result"],
+            result_group = group[f"group_{group_idx}/entry_{entry_idx}/result"]
+            self.num_bytes_written += self._write_results(
+                g=result_group,
                 start_index=start_idx,
                 results=res,
             )
+            result_group.attrs[_NUM_FRAMES_ATTR] = end_idx
 
         return len(results)
 
+    def _resize_result_datasets(self, group: h5py.Group, size: int) -> None:
+        for result_group_name in self._result_group_names:
+            g = group.file[result_group_name]
+            for dataset_name in _RESULT_DATASET_NAMES:
+                g[dataset_name].resize(size=size, axis=0)
+
+        self._capacity_current_session = size
+
     @staticmethod
-    def _write_results(g: h5py.Group, start_index: int, results: list[Result]) -> None:
-        """Extends the Dataset to the appropriate (new) size with .resize,
-        and then copies the data over
-        """
-        datasets_to_extend = [
-            "data_saturated",
-            "frame_delayed",
-            "calibration_needed",
-            "temperature",
-            "tick",
-            "frame",
-        ]
-        for dataset_name in datasets_to_extend:
-            g[dataset_name].resize(size=start_index + len(results), axis=0)
+    def _write_results(g: h5py.Group, start_index: int, results: list[Result]) -> int:
+        """Copies the data over to the (already grown) Datasets, one array per Dataset
 
+        :returns: the number of bytes written, before compression.
+        """
         dataset_slice = slice(start_index, start_index + len(results))
 
-        g["data_saturated"][dataset_slice] = [result.data_saturated for result in results]
-        g["frame_delayed"][dataset_slice] = [result.frame_delayed for result in results]
-        g["calibration_needed"][dataset_slice] = [result.calibration_needed for result in results]
-        g["temperature"][dataset_slice] = [result.temperature for result in results]
-        g["tick"][dataset_slice] = [result.tick for result in results]
-        g["frame"][dataset_slice] = [result._frame for result in results]
+        arrays = {
+            "data_saturated": np.array([result.data_saturated for result in results], dtype=bool),
+            "frame_delayed": np.array([result.frame_delayed for result in results], dtype=bool),
+            "calibration_needed": np.array(
+                [result.calibration_needed for result in results], dtype=bool
+            ),
+            "temperature": np.array(
+                [result.temperature for result in results], dtype=g["temperature"].dtype
+            ),
+            "tick": np.array([result.tick for result in results], dtype=np.int64),
+            "frame": np.stack([result._frame for result in results]),
+        }
+
+        for dataset_name, array in arrays.items():
+            g[dataset_name][dataset_slice] = array
+
+        return sum(array.nbytes for array in arrays.values())
 
     def _stop_session(self, group: h5py.Group) -> None:
+        if (
+            group is not None
+            and self._capacity_current_session != self._num_frames_current_session
+        ):
+            self._resize_result_datasets(group, self._num_frames_current_session)
+
         self._num_frames_current_session = 0
+        self._capacity_current_session = 0
+        self._result_group_names = []
@@ -1,4 +1,5 @@
 # Copyright (c) Acconeer AB, 2022
 # All rights reserved
 
-from ._replaying_client import _ReplayingClient, _StopReplay
+from ._loopback_server import _LoopbackServer, _LoopbackServerStatistics
+from ._replaying_client import _ReplayingClient, _ReplayStatistics, _StopReplay
@@ -0,0 +1,399 @@
+# Copyright (c) Acconeer AB, 2024
+# All rights reserved
+
+from __future__ import annotations
+
+import json
+import math
+import socket
+import threading
+import time
+from typing import Any, Optional
+
+import attrs
+
+from acconeer.exptool.a121 import (
+    SDK_VERSION,
+    Profile,
+    SensorConfig,
+    SessionConfig,
+    SubsweepConfig,
+)
+from acconeer.exptool.a121._core.communication.exploration_protocol import ExplorationProtocol
+from acconeer.exptool.a121._core.communication.mock_client import MockClient
+
+
+_TICK_WRAP = 2**32
+
+
+@attrs.frozen(kw_only=True)
+class _LoopbackServerStatistics:
+    num_frames: int
+    """The number of frames sent in the current (or latest) streaming session"""
+
+    num_bytes: int
+    """The number of result message bytes, headers included, sent in the session"""
+
+    num_delayed_frames: int
+    """The number of frames sent later than scheduled, marked with ``frame_delayed``"""
+
+    duration_s: float
+    """The time between starting the session and sending the latest frame"""
+
+    @property
+    def frames_per_second(self) -> float:
+        """The achieved frame rate. NaN until a frame has been sent"""
+        if self.duration_s <= 0:
+            return math.nan
+
+        return self.num_frames / self.duration_s
+
+    @property
+    def bytes_per_second(self) -> float:
+        """The achieved throughput. NaN until a frame has been sent"""
+        if self.duration_s <= 0:
+            return math.nan
+
+        return self.num_bytes / self.duration_s
+
+
+def _session_config_from_setup_command(command: dict[str, Any]) -> SessionConfig:
+    """Reverses :meth:`ExplorationProtocol.setup_command`"""
+    prfs = {value: key for key, value in ExplorationProtocol.PRF_MAPPING.items()}
+    idle_states = {value: key for key, value in ExplorationProtocol.IDLE_STATE_MAPPING.items()}
+
+    def sensor_config_from_dict(d: dict[str, Any]) -> SensorConfig:
+        d = d.copy()
+        d["subsweeps"] = [
+            SubsweepConfig.from_dict(
+                {
+                    **subsweep_d,
+                    "prf": prfs[subsweep_d["prf"]],
+                    "profile": Profile(subsweep_d["profile"]),
+                }
+            )
+            for subsweep_d in d["subsweeps"]
+        ]
+        d["inter_frame_idle_state"] = idle_states[d["inter_frame_idle_state"]]
+        d["inter_sweep_idle_state"] = idle_states[d["inter_sweep_idle_state"]]
+        d["sweep_rate"] = d["sweep_rate"] or None
+        d["frame_rate"] = d["frame_rate"] or None
+        return SensorConfig(**d)
+
+    return SessionConfig(
+        [
+            {entry["sensor_id"]: sensor_config_from_dict(entry["config"]) for entry in group}
+            for group in command["groups"]
+        ],
+        update_rate=command.get("update_rate"),
+    )
+
+
+class _LoopbackServer:
+    """A stand-in for the exploration server, streaming synthetic frames over TCP
+
+    Speaks the subset of the exploration protocol used by :class:`ExplorationClient`, so that
+    the client, links and message stream can be stress tested without hardware. Frames are
+    generated once per setup, the size given by the session config, and sent at ``frame_rate``
+    for as long as the session is started.
+
+    Frames that are sent later than scheduled, typically since the client doesn't keep up, are
+    marked with ``frame_delayed``, as by the sensor. Ticks wrap around like those of the sensor.
+
+    Use as a context manager, or call :meth:`start` and :meth:`stop`::
+
+        with _LoopbackServer(frame_rate=None) as server:
+            client = a121.Client.open(ip_address=server.host, tcp_port=server.port)
+    """
+
+    SENSOR_COUNT = MockClient.SENSOR_COUNT
+    TICKS_PER_SECOND = MockClient.TICKS_PER_SECOND
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        *,
+        frame_rate: Optional[float] = None,
+        use_session_rate: bool = True,
+    ) -> None:
+        """
+        :param host: The address to listen on
+        :param port: The port to listen on. Any free port if 0, see :attr:`port`
+        :param frame_rate:
+            The rate to send frames at. If None, the update rate or frame rate of the session
+            config is used if ``use_session_rate``, else frames are sent as fast as possible
+        :param use_session_rate: Whether to fall back to the rate of the session config
+        """
+        if frame_rate is not None and not frame_rate > 0:
+            raise ValueError("'frame_rate' needs to be positive")
+
+        self._frame_rate = frame_rate
+        self._use_session_rate = use_session_rate
+
+        self._listening_socket = socket.create_server((host, port))
+        self._listening_socket.settimeout(0.1)
+        self.host, self.port = self._listening_socket.getsockname()[:2]
+
+        self._connection: Optional[socket.socket] = None
+        self._send_lock = threading.Lock()
+        self._stop_requested = threading.Event()
+        self._streaming_stop_requested = threading.Event()
+        self._serve_thread: Optional[threading.Thread] = None
+        self._streaming_thread: Optional[threading.Thread] = None
+
+        self._session_config: Optional[SessionConfig] = None
+        self._payload = b""
+        self._statistics_lock = threading.Lock()
+        self._statistics = _LoopbackServerStatistics(
+            num_frames=0, num_bytes=0, num_delayed_frames=0, duration_s=0.0
+        )
+
+    def __enter__(self) -> _LoopbackServer:
+        self.start()
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        self.stop()
+
+    @property
+    def statistics(self) -> _LoopbackServerStatistics:
+        with self._statistics_lock:
+            return self._statistics
+
+    def start(self) -> None:
+        """Starts accepting connections, one at a time, in a background thread"""
+        if self._serve_thread is not None:
+            raise RuntimeError("Server is already started")
+
+        self._serve_thread = threading.Thread(
+            target=self._serve, name="LoopbackServer", daemon=True
+        )
+        self._serve_thread.start()
+
+    def stop(self) -> None:
+        """Stops streaming, closes the connection and stops accepting new ones"""
+        self._stop_requested.set()
+
+        connection = self._connection
+        if connection is not None:
+            try:
+                connection.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+
+        if self._serve_thread is not None:
+            self._serve_thread.join()
+            self._serve_thread = None
+
+        self._listening_socket.close()
+
+    def _serve(self) -> None:
+        while not self._stop_requested.is_set():
+            try:
+                connection, _ = self._listening_socket.accept()
+            except socket.timeout:
+                continue
+            except OSError:
+                return
+
+            connection.settimeout(None)
+            connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            self._connection = connection
+            try:
+                self._handle_connection(connection)
+            except OSError:
+                pass
+            finally:
+                self._stop_streaming()
+                self._connection = None
+                connection.close()
+
+    def _handle_connection(self, connection: socket.socket) -> None:
+        with connection.makefile("rb") as commands:
+            for line in commands:
+                if self._stop_requested.is_set():
+                    return
+
+                command = json.loads(line)
+                response = self._handle_command(command)
+                if response is not None:
+                    self._send(json.dumps(response).encode("ascii") + b"\n")
+
+    def _handle_command(self, command: dict[str, Any]) -> Optional[dict[str, Any]]:
+        cmd = command.get("cmd")
+
+        if cmd == "get_system_info":
+            return {
+                "status": "ok",
+                "system_info": {
+                    "rss_version": f"a121-v{SDK_VERSION}",
+                    "sensor": "a121",
+                    "sensor_count": self.SENSOR_COUNT,
+                    "ticks_per_second": self.TICKS_PER_SECOND,
+                    "hw": "loopback",
+                },
+            }
+        elif cmd == "get_sensor_info":
+            return {
+                "status": "ok",
+                "sensor_info": [
+                    {"connected": True, "serial": f"SN{i}"}
+                    for i in range(1, self.SENSOR_COUNT + 1)
+                ],
+            }
+        elif cmd == "setup":
+            return self._setup(command)
+        elif cmd == "start_streaming":
+            if self._session_config is None:
+                return {"status": "error", "message": "session is not set up"}
+
+            self._send(b'{"status": "start"}\n')
+            self._start_streaming()
+            return None
+        elif cmd == "stop_streaming":
+            self._stop_streaming()
+            return {"status": "stop"}
+        else:
+            return {"status": "error", "message": f"unknown command '{cmd}'"}
+
+    def _setup(self, command: dict[str, Any]) -> dict[str, Any]:
+        try:
+            session_config = _session_config_from_setup_command(command)
+            extended_metadata = MockClient._session_config_to_metadata(session_config)
+
+            payload = bytearray()
+            for group, metadata_group in zip(session_config.groups, extended_metadata):
+                for sensor_id, sensor_config in group.items():
+                    frame = MockClient._sensor_config_to_frame(
+                        sensor_id, sensor_config, metadata_group[sensor_id]
+                    )
+                    payload += frame.tobytes()
+        except Exception as e:
+            return {"status": "error", "message": f"invalid setup: {e}"}
+
+        self._session_config = session_config
+        self._payload = bytes(payload)
+
+        tick_period = next(iter(extended_metadata[0].values())).tick_period
+        return {
+            "status": "ok",
+            "tick_period": tick_period,
+            "metadata": [
+                [
+                    {
+                        "frame_data_length": metadata.frame_data_length,
+                        "sweep_data_length": metadata.sweep_data_length,
+                        "subsweep_data_offset": metadata.subsweep_data_offset.tolist(),
+                        "subsweep_data_length": metadata.subsweep_data_length.tolist(),
+                        "calibration_temperature": metadata.calibration_temperature,
+                        "base_step_length_m": metadata.base_step_length_m,
+                        "max_sweep_rate": metadata.max_sweep_rate,
+                        "high_speed_mode": metadata.high_speed_mode,
+                    }
+                    for metadata in metadata_group.values()
+                ]
+                for metadata_group in extended_metadata
+            ],
+        }
+
+    def _get_frame_rate(self, session_config: SessionConfig) -> Optional[float]:
+        if self._frame_rate is not None or not self._use_session_rate:
+            return self._frame_rate
+
+        if session_config.update_rate is not None:
+            return session_config.update_rate
+
+        frame_rates = [
+            sensor_config.frame_rate
+            for group in session_config.groups
+            for sensor_config in group.values()
+            if sensor_config.frame_rate is not None
+        ]
+        return min(frame_rates) if frame_rates else None
+
+    def _send(self, data: bytes) -> None:
+        connection = self._connection
+        assert connection is not None
+
+        with self._send_lock:
+            connection.sendall(data)
+
+    def _start_streaming(self) -> None:
+        self._stop_streaming()
+        self._streaming_stop_requested.clear()
+        self._streaming_thread = threading.Thread(
+            target=self._stream, name="LoopbackServerStreamer", daemon=True
+        )
+        self._streaming_thread.start()
+
+    def _stop_streaming(self) -> None:
+        self._streaming_stop_requested.set()
+
+        if self._streaming_thread is not None:
+            self._streaming_thread.join()
+            self._streaming_thread = None
+
+    def _stream(self) -> None:
+        session_config = self._session_config
+        assert session_config is not None
+
+        frame_rate = self._get_frame_rate(session_config)
+        period_s = 0.0 if frame_rate is None else 1 / frame_rate
+        num_entries = [len(group) for group in session_config.groups]
+        payload = self._payload
+
+        num_frames = 0
+        num_bytes = 0
+        num_delayed_frames = 0
+        start_time = time.perf_counter()
+        next_frame_time = start_time
+
+        with self._statistics_lock:
+            self._statistics = _LoopbackServerStatistics(
+                num_frames=0, num_bytes=0, num_delayed_frames=0, duration_s=0.0
+            )
+
+        while not self._streaming_stop_requested.is_set():
+            now = time.perf_counter()
+            if now < next_frame_time:
+                self._streaming_stop_requested.wait(next_frame_time - now)
+                continue
+
+            # A frame is delayed when a whole frame period passed since it was due, i.e. when
+            # the previous frame couldn't be sent in time. The schedule then starts over.
+            frame_delayed = period_s > 0 and now - next_frame_time > period_s
+            if frame_delayed:
+                next_frame_time = now
+                num_delayed_frames += 1
+
+            result_info = {
+                "tick": int((now - start_time) * self.TICKS_PER_SECOND) % _TICK_WRAP,
+                "data_saturated": False,
+                "frame_delayed": frame_delayed,
+                "calibration_needed": False,
+                "temperature": MockClient.CALIBRATION_TEMPERATURE,
+            }
+            header = {
+                "status": "ok",
+                "result_info": [[result_info] * n for n in num_entries],
+                "payload_size": len(payload),
+            }
+            message = json.dumps(header).encode("ascii") + b"\n" + payload
+
+            try:
+                self._send(message)
+            except OSError:
+                return
+
+            num_frames += 1
+            num_bytes += len(message)
+            next_frame_time += period_s
+
+            with self._statistics_lock:
+                self._statistics = _LoopbackServerStatistics(
+                    num_frames=num_frames,
+                    num_bytes=num_bytes,
+                    num_delayed_frames=num_delayed_frames,
+                    duration_s=time.perf_counter() - start_time,
+                )
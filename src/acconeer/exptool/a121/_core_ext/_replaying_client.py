@@ -1,11 +1,16 @@
-# Copyright (c) Acconeer AB, 2022-2023
+# Copyright (c) Acconeer AB, 2022-2024
 # All rights reserved
 
 from __future__ import annotations
 
+import collections
+import math
+import threading
 import time
 import warnings
-from typing import Any, Iterator, Optional, Union
+from typing import Any, Deque, Iterator, Optional, Union
+
+import attrs
 
 import acconeer.exptool.a121._core.utils as core_utils
 from acconeer.exptool._core import ClientInfo
@@ -26,6 +31,97 @@ class _StopReplay(Exception):
     pass
 
 
+@attrs.frozen(kw_only=True)
+class _ReplayStatistics:
+    num_frames: int
+    """The number of frames replayed in the current session"""
+
+    record_duration_s: float
+    """The time between the first and the latest replayed frame, as recorded"""
+
+    replay_duration_s: float
+    """The time between replaying the first and the latest frame"""
+
+    @property
+    def time_ratio(self) -> float:
+        """The replay-to-record time ratio, e.g. 0.1 when replaying 10 times faster than recorded
+
+        NaN until two frames have been replayed.
+        """
+        if self.record_duration_s <= 0:
+            return math.nan
+
+        return self.replay_duration_s / self.record_duration_s
+
+
+class _PrefetchingIterator(Iterator[Any]):
+    """Iterates over ``iterator`` in a background thread, keeping up to ``max_size`` items ahead
+
+    Exceptions raised by ``iterator`` are raised by :meth:`__next__`, after the items before them.
+    """
+
+    def __init__(self, iterator: Iterator[Any], max_size: int) -> None:
+        if max_size < 1:
+            raise ValueError("'max_size' needs to be at least 1")
+
+        self._iterator = iterator
+        self._max_size = max_size
+        self._queue: Deque[Any] = collections.deque()
+        self._condition = threading.Condition()
+        self._is_exhausted = False
+        self._error: Optional[BaseException] = None
+        self._stop_requested = False
+        self._thread = threading.Thread(
+            target=self._prefetch, name="ReplayingClientPrefetcher", daemon=True
+        )
+        self._thread.start()
+
+    def _prefetch(self) -> None:
+        try:
+            for item in self._iterator:
+                with self._condition:
+                    while len(self._queue) >= self._max_size and not self._stop_requested:
+                        self._condition.wait()
+
+                    if self._stop_requested:
+                        return
+
+                    self._queue.append(item)
+                    self._condition.notify_all()
+        except BaseException as e:
+            with self._condition:
+                self._error = e
+
+        with self._condition:
+            self._is_exhausted = True
+            self._condition.notify_all()
+
+    def __next__(self) -> Any:
+        with self._condition:
+            while not self._queue and not self._is_exhausted:
+                self._condition.wait()
+
+            if self._queue:
+                item = self._queue.popleft()
+                self._condition.notify_all()
+                return item
+
+            if self._error is not None:
+                error, self._error = self._error, None
+                raise error
+
+            raise StopIteration
+
+    def close(self) -> None:
+        """Stops the background thread and discards the prefetched items"""
+        with self._condition:
+            self._stop_requested = True
+            self._queue.clear()
+            self._condition.notify_all()
+
+        self._thread.join()
+
+
 class _ReplayingClient(Client, register=False):
     def __init__(
         self,
@@ -33,6 +129,8 @@ class _ReplayingClient(Client, register=False):
         *,
         cycled_session_idx: Optional[int] = None,
         realtime_replay: bool = True,
+        replay_speed: Optional[float] = None,
+        prefetch_frames: int = 0,
     ):
         """
         :param record: The Record to replay from
@@ -40,6 +138,13 @@ class _ReplayingClient(Client, register=False):
             If specified, cycle (reuse as next session) the session
             specified by 'cycled_session_idx'.
         :param realtime_replay: If True, replays the data at the rate of recording
+        :param replay_speed:
+            If specified, replays the data at this multiple of the rate of recording,
+            e.g. 0.5 or 10. ``math.inf`` replays as fast as possible. Overrides
+            'realtime_replay'.
+        :param prefetch_frames:
+            If positive, frames are read from the record in a background thread, up to
+            this many frames ahead of :meth:`get_next`.
         """
         super().__init__(record.client_info)
         self._record = record
@@ -48,7 +153,35 @@ class _ReplayingClient(Client, register=False):
         self._origin_time: Optional[float] = None
         self._session_idx = 0
         self._cycled_session_idx = cycled_session_idx
-        self._realtime_replay = realtime_replay
+        if replay_speed is None:
+            replay_speed = 1.0 if realtime_replay else math.inf
+
+        if not replay_speed > 0:
+            raise ValueError("'replay_speed' needs to be positive")
+
+        if prefetch_frames < 0:
+            raise ValueError("'prefetch_frames' cannot be negative")
+
+        self._replay_speed = replay_speed
+        self._prefetch_frames = prefetch_frames
+        self._origin_tick_time: Optional[float] = None
+        self._num_replayed_frames = 0
+        self._record_duration_s = 0.0
+        self._replay_duration_s = 0.0
+
+    @property
+    def replay_speed(self) -> float:
+        """The multiple of the rate of recording that the data is replayed at"""
+        return self._replay_speed
+
+    @property
+    def replay_statistics(self) -> _ReplayStatistics:
+        """Replay timing of the current, or latest, session"""
+        return _ReplayStatistics(
+            num_frames=self._num_replayed_frames,
+            record_duration_s=self._record_duration_s,
+            replay_duration_s=self._replay_duration_s,
+        )
 
     @property
     def _actual_session_idx(self) -> int:
@@ -91,9 +224,17 @@ class _ReplayingClient(Client, register=False):
             return core_utils.unextend(self.extended_metadata)
 
     def start_session(self) -> None:
-        self._result_iterator = self._record.session(self._actual_session_idx).extended_results
+        result_iterator = self._record.session(self._actual_session_idx).extended_results
+        if self._prefetch_frames > 0:
+            result_iterator = _PrefetchingIterator(result_iterator, self._prefetch_frames)
+
+        self._result_iterator = result_iterator
         self._is_started = True
         self._origin_time = None
+        self._origin_tick_time = None
+        self._num_replayed_frames = 0
+        self._record_duration_s = 0.0
+        self._replay_duration_s = 0.0
 
     def get_next(self) -> Union[Result, list[dict[int, Result]]]:  # type: ignore[override]
         if not self.session_is_setup:
@@ -108,16 +249,24 @@ class _ReplayingClient(Client, register=False):
 
         some_result = next(core_utils.iterate_extended_structure_values(result))
 
-        if self._realtime_replay:
-            now = time.monotonic() - some_result.tick_time
+        now = time.monotonic()
+
+        if self._origin_time is None or self._origin_tick_time is None:
+            self._origin_time = now
+            self._origin_tick_time = some_result.tick_time
 
-            if self._origin_time is None:
-                self._origin_time = now
+        record_duration_s = some_result.tick_time - self._origin_tick_time
 
-            delta = now - self._origin_time
+        if math.isfinite(self._replay_speed):
+            delay = self._origin_time + record_duration_s / self._replay_speed - now
 
-            if delta < 0:
-                time.sleep(-delta)
+            if delay > 0:
+                time.sleep(delay)
+                now = time.monotonic()
+
+        self._num_replayed_frames += 1
+        self._record_duration_s = record_duration_s
+        self._replay_duration_s = now - self._origin_time
 
         if self.session_config.extended:
             return result
@@ -132,6 +281,9 @@ class _ReplayingClient(Client, register=False):
         else:
             warnings.warn(f"Results of session {self._actual_session_idx} were not exhausted.")
 
+        if isinstance(self._result_iterator, _PrefetchingIterator):
+            self._result_iterator.close()
+
         self._session_idx += 1
         self._is_started = False
 
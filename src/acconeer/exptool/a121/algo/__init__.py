@@ -16,21 +16,30 @@ from ._utils import (
     ENVELOPE_FWHM_M,
     PERCEIVED_WAVELENGTH,
     RLG_PER_HWAAS_MAP,
+    SIGNAL_PROCESSING_CACHE_SIZE,
     PeakSortingMethod,
     ReflectorShape,
+    RingBuffer,
     _convert_amplitude_to_strength,
+    _convert_amplitudes_to_strengths_batch,
     _convert_multiple_amplitudes_to_strengths,
     calc_processing_gain,
     calculate_loopback_peak_location,
     double_buffering_frame_filter,
     exponential_smoothing_coefficient,
     find_peaks,
+    find_peaks_batch,
     get_approx_fft_vels,
+    get_butter_coeffs,
     get_distance_filter_coeffs,
     get_distance_filter_edge_margin,
     get_distance_offset,
     get_distances_m,
+    get_fft_frequencies,
     get_temperature_adjustment_factors,
+    get_window,
     interpolate_peaks,
+    interpolate_peaks_batch,
     select_prf,
+    two_sided_welch,
 )
@@ -5,10 +5,12 @@ from __future__ import annotations
 
 import copy
 import enum
+import functools
 from typing import Any, Optional, Tuple, Union
 
 import numpy as np
 import numpy.typing as npt
+import scipy.signal
 from scipy.signal import butter, filtfilt
 
 from acconeer.exptool import a121
@@ -53,6 +55,9 @@ RLG_PER_HWAAS_MAP = {
 
 SPARSE_IQ_PPC = 24
 
+# Number of entries kept per cached filter, window and frequency grid function.
+SIGNAL_PROCESSING_CACHE_SIZE = 64
+
 
 class ReflectorShape(AlgoParamEnum):
     """Reflector shape.
@@ -78,6 +83,76 @@ class PeakSortingMethod(AlgoParamEnum):
     STRONGEST = enum.auto()
 
 
+class RingBuffer:
+    """Fixed-capacity FIFO buffer of array elements, e.g. a history of sweeps
+
+    Appending is O(1) in the capacity, as opposed to shifting a history array with
+    ``np.roll``. Every element is stored twice, so the elements are always available as a
+    contiguous array from the oldest to the newest through :meth:`view`.
+
+    :param capacity: The number of elements in the buffer
+    :param element_shape: The shape of each element
+    :param dtype: The data type of the elements
+    :param fill_value: The initial value of all elements
+    """
+
+    def __init__(
+        self,
+        capacity: int,
+        element_shape: Tuple[int, ...] = (),
+        dtype: npt.DTypeLike = float,
+        fill_value: Any = 0,
+    ) -> None:
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+
+        self._capacity = capacity
+        self._data = np.full((2 * capacity, *element_shape), fill_value, dtype=dtype)
+        self._oldest = 0
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    def __len__(self) -> int:
+        return self._capacity
+
+    def append(self, element: npt.ArrayLike) -> None:
+        """Replaces the oldest element with ``element``"""
+        self._data[self._oldest] = element
+        self._data[self._oldest + self._capacity] = element
+        self._oldest = (self._oldest + 1) % self._capacity
+
+    def extend(self, elements: npt.ArrayLike) -> None:
+        """Appends ``elements`` along their first axis, oldest first"""
+        elements = np.asarray(elements)[-self._capacity :]
+        num_elements = len(elements)
+
+        # Elements up to the end of the first half, and the rest from its start
+        num_first = min(num_elements, self._capacity - self._oldest)
+        for start, part in [
+            (self._oldest, elements[:num_first]),
+            (0, elements[num_first:]),
+        ]:
+            self._data[start : start + len(part)] = part
+            self._data[start + self._capacity : start + self._capacity + len(part)] = part
+
+        self._oldest = (self._oldest + num_elements) % self._capacity
+
+    def view(self) -> npt.NDArray[Any]:
+        """A read-only, contiguous view of the elements, from the oldest to the newest
+
+        The view is only valid until the buffer is modified.
+        """
+        view = self._data[self._oldest : self._oldest + self._capacity].view()
+        view.flags.writeable = False
+        return view
+
+    def ordered(self) -> npt.NDArray[Any]:
+        """A copy of the elements, from the oldest to the newest"""
+        return self._data[self._oldest : self._oldest + self._capacity].copy()
+
+
 def get_distance_offset(
     peak_location: Optional[float], profile: a121.Profile, temperature: Optional[Union[float, int]]
 ) -> float:
@@ -174,7 +249,7 @@ def get_approx_fft_vels(
 
     spf = config.sweeps_per_frame
     f_res = 1 / spf
-    freqs = np.fft.fftshift(np.fft.fftfreq(spf))
+    freqs = get_fft_frequencies(spf, shifted=True)
     f_to_v = 2.5e-3 * sweep_rate
     return freqs * f_to_v, f_res * f_to_v
 
@@ -198,19 +273,52 @@ def interpolate_peaks(
     :param step_length: Step length in points.
     :param step_length_m: Step length in meters.
     """
-    estimated_distances = []
-    estimated_amplitudes = []
-    for peak_idx in peak_idxs:
-        x = np.arange(peak_idx - 1, peak_idx + 2, 1)
-        y = abs_sweep[peak_idx - 1 : peak_idx + 2]
-        a = (x[0] * (y[2] - y[1]) + x[1] * (y[0] - y[2]) + x[2] * (y[1] - y[0])) / (
-            (x[0] - x[1]) * (x[0] - x[2]) * (x[1] - x[2])
-        )
-        b = (y[1] - y[0]) / (x[1] - x[0]) - a * (x[0] + x[1])
-        c = y[0] - a * x[0] ** 2 - b * x[0]
-        peak_loc = -b / (2 * a)
-        estimated_distances.append((start_point + peak_loc * step_length) * step_length_m)
-        estimated_amplitudes.append(a * peak_loc**2 + b * peak_loc + c)
+    (estimated_distances, estimated_amplitudes) = interpolate_peaks_batch(
+        abs_sweeps=np.asarray(abs_sweep)[np.newaxis],
+        frame_idxs=np.zeros(len(peak_idxs), dtype=int),
+        peak_idxs=np.asarray(peak_idxs, dtype=int),
+        start_point=start_point,
+        step_length=step_length,
+        step_length_m=step_length_m,
+    )
+    return list(estimated_distances), list(estimated_amplitudes)
+
+
+def interpolate_peaks_batch(
+    abs_sweeps: npt.NDArray[np.float_],
+    frame_idxs: npt.NDArray[np.int_],
+    peak_idxs: npt.NDArray[np.int_],
+    start_point: int,
+    step_length: int,
+    step_length_m: float,
+) -> Tuple[npt.NDArray[np.float_], npt.NDArray[np.float_]]:
+    """Like :func:`interpolate_peaks`, for peaks in multiple sweeps
+
+    :param abs_sweeps: Absolute values of mean sweeps, 2-D with dimensions (frame, distance).
+    :param frame_idxs: The frame (row) index of every peak, e.g. from :func:`find_peaks_batch`.
+    :param peak_idxs: The point (column) index of every peak.
+    :param start_point: Start point.
+    :param step_length: Step length in points.
+    :param step_length_m: Step length in meters.
+    :returns: The estimated distances and amplitudes of the peaks.
+    """
+    if np.any(peak_idxs < 1) or np.any(peak_idxs > abs_sweeps.shape[-1] - 2):
+        raise IndexError("Peaks need to have neighboring points on both sides")
+
+    x0 = peak_idxs - 1
+    x1 = peak_idxs
+    x2 = peak_idxs + 1
+    y0 = abs_sweeps[frame_idxs, x0]
+    y1 = abs_sweeps[frame_idxs, x1]
+    y2 = abs_sweeps[frame_idxs, x2]
+
+    a = (x0 * (y2 - y1) + x1 * (y0 - y2) + x2 * (y1 - y0)) / ((x0 - x1) * (x0 - x2) * (x1 - x2))
+    b = (y1 - y0) / (x1 - x0) - a * (x0 + x1)
+    c = y0 - a * x0**2 - b * x0
+    peak_loc = -b / (2 * a)
+
+    estimated_distances = (start_point + peak_loc * step_length) * step_length_m
+    estimated_amplitudes = a * peak_loc**2 + b * peak_loc + c
     return estimated_distances, estimated_amplitudes
 
 
@@ -246,6 +354,94 @@ def find_peaks(abs_sweep: npt.NDArray[np.float_], threshold: npt.NDArray[np.floa
     """
     if threshold is None:
         raise ValueError
+
+    (_, peak_idxs) = find_peaks_batch(
+        np.asarray(abs_sweep)[np.newaxis], np.asarray(threshold)[np.newaxis]
+    )
+    return peak_idxs.tolist()  # type: ignore[no-any-return]
+
+
+def find_peaks_batch(
+    abs_sweeps: npt.NDArray[np.float_], thresholds: npt.NDArray[np.float_]
+) -> Tuple[npt.NDArray[np.int_], npt.NDArray[np.int_]]:
+    """Like :func:`find_peaks`, for multiple sweeps
+
+    :param abs_sweeps: Absolute values of mean sweeps, 2-D with dimensions (frame, distance).
+    :param thresholds: Thresholds, either one per sweep (2-D) or one for all sweeps (1-D).
+    :returns:
+        The frame (row) and point (column) indexes of the found peaks, ordered by frame and
+        point.
+    """
+    abs_sweeps = np.asarray(abs_sweeps)
+    thresholds = np.broadcast_to(thresholds, abs_sweeps.shape)
+    (num_frames, num_points) = abs_sweeps.shape
+
+    if num_points < 3:
+        return np.empty(0, dtype=int), np.empty(0, dtype=int)
+
+    # A threshold is typically NaN in margins at the start and end of the sweep. Then, all points
+    # between the margins are searched and the peaks can be found with array operations. Other
+    # threshold layouts, and NaN in sweeps, are handled by the sequential search.
+    has_threshold = ~np.isnan(thresholds)
+    first = np.argmax(has_threshold, axis=1)
+    last = num_points - 1 - np.argmax(has_threshold[:, ::-1], axis=1)
+    idxs = np.arange(num_points)
+    in_margins = (idxs < first[:, np.newaxis]) | (idxs > last[:, np.newaxis])
+    is_vectorizable = (
+        has_threshold.any(axis=1)
+        & (has_threshold | in_margins).all(axis=1)
+        & ~np.isnan(abs_sweeps).any(axis=1)
+    )
+
+    # Points above threshold, within the margins, that can be part of a peak
+    limit = np.minimum(last, num_points - 2)[:, np.newaxis]
+    above = (abs_sweeps > thresholds) & (idxs >= first[:, np.newaxis]) & (idxs <= limit)
+
+    # Rising edges: a point above threshold, greater than its (above threshold) predecessor
+    is_rising = np.zeros_like(above)
+    is_rising[:, 1:] = above[:, 1:] & above[:, :-1] & (abs_sweeps[:, 1:] > abs_sweeps[:, :-1])
+
+    # A rising edge is a peak if it, after a plateau of equal values above threshold, is followed
+    # by a smaller value above threshold
+    continues_plateau = np.zeros_like(above)
+    continues_plateau[:, :-1] = above[:, 1:] & (abs_sweeps[:, 1:] == abs_sweeps[:, :-1])
+    plateau_ends = np.flatnonzero(~continues_plateau)
+    (rising_frames, rising_points) = np.nonzero(is_rising & is_vectorizable[:, np.newaxis])
+    rising_flat = rising_frames * num_points + rising_points
+    after_plateau = plateau_ends[np.searchsorted(plateau_ends, rising_flat)] + 1
+    after_plateau_point = after_plateau - rising_frames * num_points
+    is_peak = (after_plateau_point < num_points) & (
+        above.ravel()[np.minimum(after_plateau, above.size - 1)]
+    )
+    is_peak &= (
+        abs_sweeps.ravel()[np.minimum(after_plateau, above.size - 1)]
+        < (abs_sweeps[rising_frames, rising_points])
+    )
+
+    frame_idxs = rising_frames[is_peak]
+    peak_idxs = rising_points[is_peak]
+
+    if not is_vectorizable.all():
+        sequential_frames = np.flatnonzero(~is_vectorizable)
+        sequential_peaks = [
+            _find_peaks_sequential(abs_sweeps[frame], thresholds[frame])
+            for frame in sequential_frames
+        ]
+        frame_idxs = np.concatenate(
+            [frame_idxs, np.repeat(sequential_frames, [len(p) for p in sequential_peaks])]
+        ).astype(int)
+        peak_idxs = np.concatenate([peak_idxs, *sequential_peaks]).astype(int)
+        order = np.lexsort((peak_idxs, frame_idxs))
+        frame_idxs = frame_idxs[order]
+        peak_idxs = peak_idxs[order]
+
+    return frame_idxs, peak_idxs
+
+
+def _find_peaks_sequential(
+    abs_sweep: npt.NDArray[np.float_], threshold: npt.NDArray[np.float_]
+) -> list[int]:
+    """Sequential search used by :func:`find_peaks_batch` for sweeps it cannot vectorize"""
     found_peaks = []
     d = 1
     N = len(abs_sweep)
@@ -335,12 +531,109 @@ def get_temperature_adjustment_factors(
     return (signal_adjustment_factor, deviation_adjustment_factor)
 
 
-def get_distance_filter_coeffs(profile: a121.Profile, step_length: int) -> Any:
+def _read_only(array: npt.NDArray[Any]) -> npt.NDArray[Any]:
+    array.flags.writeable = False
+    return array
+
+
+@functools.lru_cache(maxsize=SIGNAL_PROCESSING_CACHE_SIZE)
+def get_distance_filter_coeffs(
+    profile: a121.Profile, step_length: int
+) -> Tuple[npt.NDArray[np.float_], npt.NDArray[np.float_]]:
     """Calculates the IIR coefficients corresponding to a matched filter, based on the profile and
     the step length.
+
+    The coefficients are cached and read-only.
     """
     wnc = APPROX_BASE_STEP_LENGTH_M * step_length / (ENVELOPE_FWHM_M[profile])
-    return butter(N=2, Wn=wnc)
+    return get_butter_coeffs(2, wnc)
+
+
+@functools.lru_cache(maxsize=SIGNAL_PROCESSING_CACHE_SIZE)
+def get_butter_coeffs(
+    order: int,
+    cutoff: Union[float, Tuple[float, float]],
+    btype: str = "lowpass",
+    fs: Optional[float] = None,
+) -> Tuple[npt.NDArray[np.float_], npt.NDArray[np.float_]]:
+    """Cached, read-only Butterworth IIR coefficients (b, a), see ``scipy.signal.butter``
+
+    :param order: The order of the filter
+    :param cutoff: The critical frequency, or a (low, high) tuple for band filters
+    :param btype: The type of filter, e.g. "lowpass" or "bandpass"
+    :param fs: The sample rate. Normalized frequencies are used if None
+    """
+    b, a = butter(N=order, Wn=cutoff, btype=btype, fs=fs)
+    return (_read_only(b), _read_only(a))
+
+
+_SYMMETRIC_WINDOWS = {
+    "bartlett": np.bartlett,
+    "blackman": np.blackman,
+    "hamming": np.hamming,
+    "hann": np.hanning,
+}
+
+
+@functools.lru_cache(maxsize=SIGNAL_PROCESSING_CACHE_SIZE)
+def get_window(name: str, length: int, *, symmetric: bool = False) -> npt.NDArray[np.float_]:
+    """Cached, read-only window of the given length
+
+    Periodic windows, as used for spectral estimation, are the ones of
+    ``scipy.signal.get_window``. Symmetric windows are the ones of numpy, e.g.
+    ``np.hamming``, which supports "bartlett", "blackman", "hamming" and "hann".
+    """
+    if symmetric:
+        window = _SYMMETRIC_WINDOWS[name](length)
+    else:
+        window = scipy.signal.get_window(name, length)
+
+    return _read_only(window)
+
+
+@functools.lru_cache(maxsize=SIGNAL_PROCESSING_CACHE_SIZE)
+def get_fft_frequencies(
+    length: int, sample_rate: float = 1.0, *, onesided: bool = False, shifted: bool = False
+) -> npt.NDArray[np.float_]:
+    """Cached, read-only frequency grid of an FFT of the given length
+
+    :param length: The length of the FFT
+    :param sample_rate: The sample rate
+    :param onesided: Whether to return the grid of a real FFT, ``np.fft.rfftfreq``
+    :param shifted: Whether to order the frequencies as ``np.fft.fftshift``
+    """
+    if onesided:
+        freqs = np.fft.rfftfreq(length, 1 / sample_rate)
+    else:
+        freqs = np.fft.fftfreq(length, 1 / sample_rate)
+
+    if shifted:
+        freqs = np.fft.fftshift(freqs)
+
+    return _read_only(freqs)
+
+
+def two_sided_welch(
+    x: npt.NDArray[Any], sample_rate: float, segment_length: int
+) -> Tuple[npt.NDArray[np.float_], npt.NDArray[np.float_]]:
+    """Estimates the two-sided power spectral density along the first axis of ``x``
+
+    All other axes, e.g. distances, are processed in one computation. Welch's method is
+    used with non-overlapping Hann windowed segments.
+
+    :returns: Shifted frequencies and the PSD, with the frequencies along the first axis
+    """
+    freqs, psd = scipy.signal.welch(
+        x,
+        fs=sample_rate,
+        window=get_window("hann", segment_length),
+        nperseg=segment_length,
+        noverlap=0,
+        average="mean",
+        axis=0,
+        return_onesided=False,
+    )
+    return np.fft.fftshift(freqs), np.fft.fftshift(psd, axes=0)
 
 
 def get_distance_filter_edge_margin(profile: a121.Profile, step_length: int) -> int:
@@ -575,6 +868,36 @@ def _convert_multiple_amplitudes_to_strengths(
     return strengths
 
 
+def _convert_amplitudes_to_strengths_batch(
+    amplitudes: npt.NDArray[np.float_],
+    distances: npt.NDArray[np.float_],
+    subsweeps: list[a121.SubsweepConfig],
+    bg_noise_std: list[float],
+    reflector_shape: ReflectorShape,
+) -> npt.NDArray[np.float_]:
+    """Like :func:`_convert_multiple_amplitudes_to_strengths`, for arrays of peaks"""
+    start_points = [subsweep.start_point for subsweep in subsweeps]
+    bpts_m = np.array(start_points) * APPROX_BASE_STEP_LENGTH_M
+    subsweep_idxs = np.sum(bpts_m[np.newaxis, :] < distances[:, np.newaxis], axis=1) - 1
+
+    strengths = np.empty(amplitudes.shape)
+    for subsweep_idx in np.unique(subsweep_idxs):
+        subsweep_config = subsweeps[subsweep_idx]
+        in_subsweep = subsweep_idxs == subsweep_idx
+
+        processing_gain_db = 10 * np.log10(
+            calc_processing_gain(subsweep_config.profile, subsweep_config.step_length)
+        )
+        s_db = 20 * np.log10(amplitudes[in_subsweep])
+        n_db = 20 * np.log10(bg_noise_std[subsweep_idx])
+        r_db = reflector_shape.exponent * 10 * np.log10(distances[in_subsweep])
+        rlg_db = RLG_PER_HWAAS_MAP[subsweep_config.profile] + 10 * np.log10(subsweep_config.hwaas)
+
+        strengths[in_subsweep] = s_db - n_db - rlg_db + r_db - processing_gain_db
+
+    return strengths
+
+
 def _convert_amplitude_to_strength(
     subsweep_config: a121.SubsweepConfig,
     amplitude: float,
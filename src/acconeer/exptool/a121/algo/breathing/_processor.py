@@ -3,13 +3,12 @@
 from __future__ import annotations
 
 import enum
-from typing import List, Optional
+from typing import Any, List, Optional
 
 import attrs
 import numpy as np
 import numpy.typing as npt
 from attributes_doc import attributes_doc
-from scipy.signal import butter
 
 from acconeer.exptool import a121
 from acconeer.exptool._core.class_creation.attrs import attrs_ndarray_isclose
@@ -18,7 +17,11 @@ from acconeer.exptool.a121.algo import (
     AlgoParamEnum,
     AlgoProcessorConfigBase,
     ProcessorBase,
+    RingBuffer,
     exponential_smoothing_coefficient,
+    get_butter_coeffs,
+    get_fft_frequencies,
+    get_window,
 )
 from acconeer.exptool.a121.algo.presence import Processor as PresenceProcessor
 from acconeer.exptool.a121.algo.presence import ProcessorConfig as PresenceProcessorConfig
@@ -100,13 +103,13 @@ class BreathingProcessor(ProcessorBase[BreathingProcessorResult]):
     # Type declarations
     start_point: int
     end_point: int
-    sparse_iq_buffer: npt.NDArray[np.complex_]
-    filt_sparse_iq_buffer: npt.NDArray[np.complex_]
-    angle_buffer: npt.NDArray[np.float_]
-    filt_angle_buffer: npt.NDArray[np.float_]
-    breathing_motion_buffer: npt.NDArray[np.float_]
-    breathing_rate_history: npt.NDArray[np.float_]
-    all_breathing_rate_history: npt.NDArray[np.float_]
+    sparse_iq_buffer: RingBuffer
+    filt_sparse_iq_buffer: RingBuffer
+    angle_buffer: RingBuffer
+    filt_angle_buffer: RingBuffer
+    breathing_motion_buffer: RingBuffer
+    breathing_rate_history: RingBuffer
+    all_breathing_rate_history: RingBuffer
 
     start_time: float
     init_counter: int
@@ -135,19 +138,22 @@ class BreathingProcessor(ProcessorBase[BreathingProcessorResult]):
         self.num_points = sensor_config.num_points
 
         # Filter coefficients.
-        self.b_static, self.a_static = butter(
-            N=2, Wn=lowest_breathing_rate_hz, btype="lowpass", fs=self.frame_rate
+        self.b_static, self.a_static = get_butter_coeffs(
+            2, lowest_breathing_rate_hz, btype="lowpass", fs=self.frame_rate
         )
-        self.b_angle, self.a_angle = butter(
-            N=2,
-            Wn=[lowest_breathing_rate_hz, highest_breathing_rate_hz],
+        self.b_angle, self.a_angle = get_butter_coeffs(
+            2,
+            (lowest_breathing_rate_hz, highest_breathing_rate_hz),
             btype="bandpass",
             fs=self.frame_rate,
         )
         self.sf = exponential_smoothing_coefficient(self.frame_rate, self.time_series_length_s)
 
         # PSD frequency vector.
-        self.frequencies = np.fft.rfftfreq(self.padded_time_series_length, 1 / self.frame_rate)
+        self.frequencies = get_fft_frequencies(
+            self.padded_time_series_length, self.frame_rate, onesided=True
+        )
+        self.window = get_window("hamming", self.time_series_length, symmetric=True)
         self.time_vector = np.linspace(-self.HISTORY_S, 0, int(self.frame_rate * self.HISTORY_S))
 
         self.reinitialize_processor(0, self.num_points)
@@ -156,16 +162,14 @@ class BreathingProcessor(ProcessorBase[BreathingProcessorResult]):
         frame = result.frame[:, self.start_point : self.end_point]
         mean_sweep = frame.mean(axis=0)
 
-        # Estimate static component
-        self.sparse_iq_buffer = np.roll(self.sparse_iq_buffer, shift=1, axis=0)
-        self.sparse_iq_buffer[0] = mean_sweep
+        # Estimate static component. The IIR filter memories are used newest first.
+        self.sparse_iq_buffer.append(mean_sweep)
 
         filt_sparse_iq = -np.sum(
-            self.a_static[1:][:, np.newaxis] * self.filt_sparse_iq_buffer, axis=0
-        ) + np.sum(self.b_static[:, np.newaxis] * self.sparse_iq_buffer, axis=0)
+            self.a_static[1:][:, np.newaxis] * self.filt_sparse_iq_buffer.view()[::-1], axis=0
+        ) + np.sum(self.b_static[:, np.newaxis] * self.sparse_iq_buffer.view()[::-1], axis=0)
 
-        self.filt_sparse_iq_buffer = np.roll(self.filt_sparse_iq_buffer, shift=1, axis=0)
-        self.filt_sparse_iq_buffer[0] = filt_sparse_iq
+        self.filt_sparse_iq_buffer.append(filt_sparse_iq)
 
         # Remove static components by subtracting the estimated mean.
         zm_sweep = mean_sweep - filt_sparse_iq
@@ -184,25 +188,21 @@ class BreathingProcessor(ProcessorBase[BreathingProcessorResult]):
         angle_diff[np.pi < angle_diff] -= 2 * np.pi
         angle_diff[angle_diff < -np.pi] += 2 * np.pi
         self.angle_unwrapped = self.angle_unwrapped + angle_diff
-        self.angle_buffer = np.roll(self.angle_buffer, shift=1, axis=0)
-        self.angle_buffer[0] = self.angle_unwrapped
+        self.angle_buffer.append(self.angle_unwrapped)
         self.prev_angle = angle
 
         # Bandpass filter angles.
         filt_angle = -np.sum(
-            self.a_angle[1:][:, np.newaxis] * self.filt_angle_buffer, axis=0
-        ) + np.sum(self.b_angle[:, np.newaxis] * self.angle_buffer, axis=0)
-        self.filt_angle_buffer = np.roll(self.filt_angle_buffer, shift=1, axis=0)
-        self.filt_angle_buffer[0] = filt_angle
+            self.a_angle[1:][:, np.newaxis] * self.filt_angle_buffer.view()[::-1], axis=0
+        ) + np.sum(self.b_angle[:, np.newaxis] * self.angle_buffer.view()[::-1], axis=0)
+        self.filt_angle_buffer.append(filt_angle)
 
         # Add filtered angle to breathing motion fifo buffer.
-        self.breathing_motion_buffer = np.roll(self.breathing_motion_buffer, shift=-1, axis=0)
-        self.breathing_motion_buffer[-1] = filt_angle
+        self.breathing_motion_buffer.append(filt_angle)
+        breathing_motion_buffer = self.breathing_motion_buffer.view()
 
         # Calculate psd of signal.
-        windowed_breathing_motion_buffer = (
-            self.breathing_motion_buffer * np.hamming(self.time_series_length)[:, np.newaxis]
-        )
+        windowed_breathing_motion_buffer = breathing_motion_buffer * self.window[:, np.newaxis]
         psd = np.fft.rfft(
             windowed_breathing_motion_buffer, axis=0, n=self.padded_time_series_length
         )
@@ -224,27 +224,28 @@ class BreathingProcessor(ProcessorBase[BreathingProcessorResult]):
             self.init_counter += 1
             estimated_breathing_rate = None
 
-        # Shift breathing rate history and add latest estimate.
-        self.all_breathing_rate_history = np.roll(self.all_breathing_rate_history, shift=-1)
-        self.all_breathing_rate_history[-1] = estimated_breathing_rate
-        self.breathing_rate_history = np.roll(self.breathing_rate_history, shift=-1)
+        # Add latest estimate to breathing rate history, NaN if there is none.
+        breathing_rate_or_nan = (
+            np.nan if estimated_breathing_rate is None else estimated_breathing_rate
+        )
+        self.all_breathing_rate_history.append(breathing_rate_or_nan)
 
         # Report breathing rate if enough time has elapsed since last estimate.
         if self.time_series_length - self.analysis_overlap <= self.point_counter:
-            self.breathing_rate_history[-1] = estimated_breathing_rate
+            self.breathing_rate_history.append(breathing_rate_or_nan)
             self.point_counter = 0
         else:
-            self.breathing_rate_history[-1] = np.nan
+            self.breathing_rate_history.append(np.nan)
             self.point_counter += 1
 
         # Prepare extra result, used for plotting.
         extra_result = BreathingProcessorExtraResult(
             psd=psd_weighted,
             frequencies=self.frequencies,
-            breathing_motion=self.breathing_motion_buffer[:, self.center_distance_idx],
+            breathing_motion=breathing_motion_buffer[:, self.center_distance_idx].copy(),
             time_vector=self.time_vector,
-            all_breathing_rate_history=self.all_breathing_rate_history,
-            breathing_rate_history=self.breathing_rate_history,
+            all_breathing_rate_history=self.all_breathing_rate_history.ordered(),
+            breathing_rate_history=self.breathing_rate_history.ordered(),
         )
 
         return BreathingProcessorResult(
@@ -259,19 +260,19 @@ class BreathingProcessor(ProcessorBase[BreathingProcessorResult]):
         self.center_distance_idx = int(num_points_to_analyze / 2)
 
         # Memory of IIR filters.
-        self.sparse_iq_buffer = np.zeros(
-            shape=(self.b_static.size, num_points_to_analyze), dtype="complex128"
+        self.sparse_iq_buffer = RingBuffer(
+            self.b_static.size, (num_points_to_analyze,), dtype="complex128"
         )
-        self.filt_sparse_iq_buffer = np.zeros(
-            shape=(self.a_static.size - 1, num_points_to_analyze), dtype="complex128"
+        self.filt_sparse_iq_buffer = RingBuffer(
+            self.a_static.size - 1, (num_points_to_analyze,), dtype="complex128"
         )
 
-        self.angle_buffer = np.zeros(shape=(self.b_angle.size, num_points_to_analyze))
-        self.filt_angle_buffer = np.zeros(shape=(self.a_angle.size - 1, num_points_to_analyze))
+        self.angle_buffer = RingBuffer(self.b_angle.size, (num_points_to_analyze,))
+        self.filt_angle_buffer = RingBuffer(self.a_angle.size - 1, (num_points_to_analyze,))
 
         # Memory for breathing motion time series.
-        self.breathing_motion_buffer = np.zeros(
-            shape=(self.time_series_length, num_points_to_analyze)
+        self.breathing_motion_buffer = RingBuffer(
+            self.time_series_length, (num_points_to_analyze,)
         )
 
         # State variables.
@@ -282,11 +283,11 @@ class BreathingProcessor(ProcessorBase[BreathingProcessorResult]):
         self.angle_unwrapped = np.zeros(shape=num_points_to_analyze)
 
         # Memory for breathing rate history.
-        self.breathing_rate_history = np.full(
-            shape=int(self.frame_rate * self.HISTORY_S), fill_value=np.nan
+        self.breathing_rate_history = RingBuffer(
+            int(self.frame_rate * self.HISTORY_S), fill_value=np.nan
         )
-        self.all_breathing_rate_history = np.full(
-            shape=int(self.frame_rate * self.HISTORY_S), fill_value=np.nan
+        self.all_breathing_rate_history = RingBuffer(
+            int(self.frame_rate * self.HISTORY_S), fill_value=np.nan
         )
 
     @staticmethod
@@ -310,6 +311,8 @@ def get_presence_config() -> PresenceProcessorConfig:
     return presence_config
 
 
+@attributes_doc
+@attrs.mutable(kw_only=True)
 class ProcessorConfig(AlgoProcessorConfigBase):
     num_distances_to_analyze: int = attrs.field(default=3)
     """Indicates the number of distance to analyzed, centered around the distance where presence
@@ -322,8 +325,21 @@ class ProcessorConfig(AlgoProcessorConfigBase):
     """If True, use the presence processor to determine distance to subject."""
 
     breathing_config: BreathingProcessorConfig = attrs.field(factory=BreathingProcessorConfig)
+    """Breathing configuration."""
 
     presence_config: PresenceProcessorConfig = attrs.field(factory=get_presence_config)
+    """Presence configuration."""
+
+    @classmethod
+    def from_dict(cls, d: dict[str, Any]) -> ProcessorConfig:
+        d = dict(d)
+        if "breathing_config" in d:
+            d["breathing_config"] = BreathingProcessorConfig.from_dict(d["breathing_config"])
+
+        if "presence_config" in d:
+            d["presence_config"] = PresenceProcessorConfig.from_dict(d["presence_config"])
+
+        return cls(**d)
 
     def _collect_validation_results(
         self, config: a121.SessionConfig
@@ -12,6 +12,7 @@ from ._detector import DetailedStatus, Detector, DetectorConfig, DetectorContext
 from ._processors import (
     MeasurementType,
     Processor,
+    ProcessorBatchResult,
     ProcessorConfig,
     ProcessorContext,
     ProcessorMode,
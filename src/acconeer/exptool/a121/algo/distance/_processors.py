@@ -5,7 +5,7 @@ from __future__ import annotations
 
 import copy
 import enum
-from typing import List, Optional
+from typing import Any, List, Optional
 
 import attrs
 import numpy as np
@@ -13,7 +13,10 @@ import numpy.typing as npt
 from scipy.signal import filtfilt
 
 from acconeer.exptool import a121
-from acconeer.exptool._core.class_creation.attrs import attrs_optional_ndarray_isclose
+from acconeer.exptool._core.class_creation.attrs import (
+    attrs_ndarray_isclose,
+    attrs_optional_ndarray_isclose,
+)
 from acconeer.exptool.a121.algo import (
     APPROX_BASE_STEP_LENGTH_M,
     ENVELOPE_FWHM_M,
@@ -22,14 +25,17 @@ from acconeer.exptool.a121.algo import (
     AlgoProcessorConfigBase,
     ProcessorBase,
     ReflectorShape,
+    _convert_amplitudes_to_strengths_batch,
     _convert_multiple_amplitudes_to_strengths,
     calc_processing_gain,
     find_peaks,
+    find_peaks_batch,
     get_distance_filter_coeffs,
     get_distance_filter_edge_margin,
     get_distance_offset,
     get_temperature_adjustment_factors,
     interpolate_peaks,
+    interpolate_peaks_batch,
 )
 
 
@@ -145,6 +151,46 @@ class ProcessorResult:
     extra_result: ProcessorExtraResult = attrs.field(factory=ProcessorExtraResult)
 
 
+@attrs.frozen(kw_only=True)
+class ProcessorBatchResult:
+    """Array-backed distance estimation results of multiple frames
+
+    The peaks of all frames are stored in flat arrays, ordered by frame and then distance.
+    ``frame_idxs`` holds the frame each peak belongs to. Indexing gives the
+    :class:`ProcessorResult` of a single frame.
+    """
+
+    frame_idxs: npt.NDArray[np.int_] = attrs.field(eq=attrs_ndarray_isclose)
+    estimated_distances: npt.NDArray[np.float_] = attrs.field(eq=attrs_ndarray_isclose)
+    estimated_strengths: npt.NDArray[np.float_] = attrs.field(eq=attrs_ndarray_isclose)
+    near_edge_status: npt.NDArray[np.bool_] = attrs.field(eq=attrs_ndarray_isclose)
+    abs_sweeps: npt.NDArray[np.float_] = attrs.field(eq=attrs_ndarray_isclose)
+    """Absolute values of the filtered sweeps, with dimensions (frame, distance)"""
+    used_thresholds: npt.NDArray[np.float_] = attrs.field(eq=attrs_ndarray_isclose)
+    """The thresholds, with dimensions (frame, distance)"""
+    distances_m: npt.NDArray[np.float_] = attrs.field(eq=attrs_ndarray_isclose)
+    """The distances of the points in ``abs_sweeps`` and ``used_thresholds``"""
+
+    def __len__(self) -> int:
+        return len(self.near_edge_status)
+
+    def __getitem__(self, frame_idx: int) -> ProcessorResult:
+        if not -len(self) <= frame_idx < len(self):
+            raise IndexError("Frame index out of range")
+
+        in_frame = self.frame_idxs == frame_idx % len(self)
+        return ProcessorResult(
+            estimated_distances=self.estimated_distances[in_frame].tolist(),
+            estimated_strengths=self.estimated_strengths[in_frame].tolist(),
+            near_edge_status=bool(self.near_edge_status[frame_idx]),
+            extra_result=ProcessorExtraResult(
+                abs_sweep=self.abs_sweeps[frame_idx],
+                used_threshold=self.used_thresholds[frame_idx],
+                distances_m=self.distances_m,
+            ),
+        )
+
+
 class Processor(ProcessorBase[ProcessorResult]):
     """Distance processor
 
@@ -382,6 +428,97 @@ class Processor(ProcessorBase[ProcessorResult]):
 
         raise RuntimeError
 
+    def process_batch(self, stacked_results: a121.StackedResults) -> ProcessorBatchResult:
+        """Processes multiple frames at once
+
+        Filtering, thresholding and peak search are done along a frame axis, which is much
+        faster than calling :meth:`process` once per frame when reprocessing recorded data.
+        Only available in the stateless ``DISTANCE_ESTIMATION`` mode. The per-frame results are
+        the same as the ones from :meth:`process`, up to floating point rounding.
+
+        :param stacked_results: The frames to process
+        """
+        if self.processor_mode != ProcessorMode.DISTANCE_ESTIMATION:
+            raise ValueError("Batch processing is only available for distance estimation")
+
+        subframes = stacked_results.subframes
+        frames = np.concatenate([subframes[i] for i in self.range_subsweep_indexes], axis=2)
+        if self.processor_config.measurement_type == MeasurementType.CLOSE_RANGE:
+            lb_angles = np.angle(subframes[self.CLOSE_RANGE_LOOPBACK_IDX]).astype(float)
+            frames = self._apply_phase_jitter_compensation(self.context, frames, lb_angles)
+
+        sweeps = frames.mean(axis=1)
+        filtered_sweeps = filtfilt(self.b, self.a, sweeps, axis=1)
+        abs_sweeps = np.abs(filtered_sweeps)
+        abs_sweeps = abs_sweeps[:, self.filt_margin : -self.filt_margin]
+
+        thresholds = self._get_batch_thresholds(abs_sweeps, stacked_results.temperature)
+
+        (frame_idxs, peak_idxs) = find_peaks_batch(abs_sweeps, thresholds)
+        (estimated_distances, estimated_amplitudes) = interpolate_peaks_batch(
+            abs_sweeps,
+            frame_idxs,
+            peak_idxs,
+            self.start_point_cropped,
+            self.step_length,
+            self.base_step_length_m,
+        )
+
+        if self.processor_config.threshold_method == ThresholdMethod.CFAR:
+            cfar_margin_slice = slice(self.cfar_margin, -self.cfar_margin)
+            abs_sweeps = abs_sweeps[:, cfar_margin_slice]
+            thresholds = thresholds[:, cfar_margin_slice]
+            distances_m = self.distances_m[cfar_margin_slice]
+        else:
+            distances_m = self.distances_m
+
+        # See _process_distance_estimation for why strengths are calculated before the offset
+        # is applied.
+        estimated_strengths = _convert_amplitudes_to_strengths_batch(
+            estimated_amplitudes,
+            estimated_distances,
+            self.range_subsweep_configs,
+            self.context.bg_noise_std,  # type: ignore[arg-type]
+            self.processor_config.reflector_shape,
+        )
+
+        return ProcessorBatchResult(
+            frame_idxs=frame_idxs,
+            estimated_distances=estimated_distances - self.offset_m,
+            estimated_strengths=estimated_strengths,
+            near_edge_status=self._detect_close_objects(abs_sweeps, thresholds),
+            abs_sweeps=abs_sweeps,
+            used_thresholds=thresholds,
+            distances_m=distances_m,
+        )
+
+    def _get_batch_thresholds(
+        self, abs_sweeps: npt.NDArray[np.float_], temperatures: npt.NDArray[Any]
+    ) -> npt.NDArray[np.float_]:
+        """The thresholds of :meth:`_update_threshold` for multiple frames"""
+        if self.threshold_method == ThresholdMethod.CFAR:
+            return self._calculate_cfar_thresholds(
+                abs_sweeps,
+                self.window_length,
+                self.guard_half_length,
+                self.num_stds_in_threshold,
+                self.cfar_abs_noise,
+            )
+        elif (
+            self.threshold_method == ThresholdMethod.FIXED
+            or self.threshold_method == ThresholdMethod.FIXED_STRENGTH
+        ):
+            return np.broadcast_to(self.threshold, abs_sweeps.shape)
+        elif self.threshold_method == ThresholdMethod.RECORDED:
+            # The recorded threshold only depends on the temperature
+            (unique_temperatures, inverse) = np.unique(temperatures, return_inverse=True)
+            unique_thresholds = np.array(
+                [self._update_threshold(abs_sweeps[0], t) for t in unique_temperatures]
+            )
+            return unique_thresholds[inverse]
+        else:
+            raise RuntimeError
+
     @staticmethod
     def _apply_phase_jitter_compensation(
         context: ProcessorContext,
@@ -664,6 +801,30 @@ class Processor(ProcessorBase[ProcessorResult]):
         threshold += abs_noise_std * num_stds
         return threshold
 
+    @staticmethod
+    def _calculate_cfar_thresholds(
+        abs_sweeps: npt.NDArray[np.float_],
+        window_length: int,
+        guard_half_length: int,
+        num_stds: float,
+        abs_noise_std: npt.NDArray[np.float_],
+    ) -> npt.NDArray[np.float_]:
+        """Like :meth:`_calculate_cfar_threshold`, for sweeps with dimensions (frame, distance)"""
+
+        thresholds = np.full(abs_sweeps.shape, np.nan)
+        margin = window_length + guard_half_length
+        sweep_len_without_margins = abs_sweeps.shape[1] - 2 * margin
+
+        windows = np.lib.stride_tricks.sliding_window_view(abs_sweeps, window_length, axis=1)
+        filt_abs_sweeps = windows.sum(axis=2) / window_length
+        thresholds[:, margin:-margin] = (
+            filt_abs_sweeps[:, :sweep_len_without_margins]
+            + filt_abs_sweeps[:, -sweep_len_without_margins:]
+        ) / 2
+
+        thresholds += abs_noise_std * num_stds
+        return thresholds
+
     def _calculate_fixed_strength_threshold(
         self,
         subsweeps: list[a121.SubsweepConfig],
@@ -714,6 +875,20 @@ class Processor(ProcessorBase[ProcessorResult]):
         else:
             return False
 
+    @staticmethod
+    def _detect_close_objects(
+        abs_sweeps: npt.NDArray[np.float_], thresholds: npt.NDArray[np.float_]
+    ) -> npt.NDArray[np.bool_]:
+        """Like :meth:`_detect_close_object`, for sweeps with dimensions (frame, distance)"""
+
+        if abs_sweeps.shape[1] < 6:
+            return np.zeros(abs_sweeps.shape[0], dtype=bool)
+
+        decreasing: npt.NDArray[np.bool_] = np.sum(abs_sweeps[:, 0:3], axis=1) >= np.sum(
+            abs_sweeps[:, 3:6], axis=1
+        )
+        return decreasing & (abs_sweeps[:, 0] >= thresholds[:, 0])
+
 
 def calculate_bg_noise_std(
     subframe: npt.NDArray[np.complex_], subsweep_config: a121.SubsweepConfig
@@ -17,6 +17,7 @@ from acconeer.exptool.a121.algo import (
     ENVELOPE_FWHM_M,
     AlgoConfigBase,
     Controller,
+    RingBuffer,
 )
 from acconeer.exptool.a121.algo.presence._processors import (
     Processor,
@@ -184,7 +185,7 @@ class ExampleApp(Controller[ExampleAppConfig, ExampleAppResult]):
 
     def _reinitialize_state_variables(self) -> None:
         num_points_history = int(self.HISTORY_LENGTH_S * self.config.frame_rate)
-        self.history = np.zeros(num_points_history)
+        self.history = RingBuffer(num_points_history)
         self.history_time = np.linspace(-self.HISTORY_LENGTH_S, 0, num_points_history)
         self.has_detected = False
         self.update_index = 0
@@ -223,10 +224,9 @@ class ExampleApp(Controller[ExampleAppConfig, ExampleAppResult]):
             detection_state = DetectionState.RETENTION
 
         # Prepare extra result(used for plotting).
-        self.history = np.roll(self.history, shift=-1, axis=0)
-        self.history[-1] = max_presence_score
+        self.history.append(max_presence_score)
         extra_result = ExtraResult(
-            history=self.history,
+            history=self.history.ordered(),
             history_time=self.history_time,
             threshold=config.threshold,
         )
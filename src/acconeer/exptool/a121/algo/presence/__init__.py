@@ -2,4 +2,10 @@
 # All rights reserved
 
 from ._detector import Detector, DetectorConfig, DetectorContext, DetectorMetadata, DetectorResult
-from ._processors import Processor, ProcessorConfig, ProcessorExtraResult, ProcessorResult
+from ._processors import (
+    Processor,
+    ProcessorBatchResult,
+    ProcessorConfig,
+    ProcessorExtraResult,
+    ProcessorResult,
+)
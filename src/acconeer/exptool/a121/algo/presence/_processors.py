@@ -3,12 +3,13 @@
 
 from __future__ import annotations
 
-from typing import Optional
+from typing import Any, Optional
 
 import attrs
 import numpy as np
 import numpy.typing as npt
 from numpy import cos, pi, sqrt, square
+from scipy.signal import lfilter
 from scipy.special import binom
 
 from acconeer.exptool import a121
@@ -89,6 +90,78 @@ class ProcessorResult:
     extra_result: ProcessorExtraResult = attrs.field()
 
 
+@attrs.frozen(kw_only=True)
+class ProcessorBatchResult:
+    """Results of multiple frames, as arrays with the frame as the first dimension
+
+    Indexing gives the :class:`ProcessorResult` of a single frame.
+    """
+
+    intra_presence_score: npt.NDArray[np.float_] = attrs.field(eq=attrs_ndarray_isclose)
+    intra: npt.NDArray[np.float_] = attrs.field(eq=attrs_ndarray_isclose)
+    inter_presence_score: npt.NDArray[np.float_] = attrs.field(eq=attrs_ndarray_isclose)
+    inter: npt.NDArray[np.float_] = attrs.field(eq=attrs_ndarray_isclose)
+    presence_distance: npt.NDArray[np.float_] = attrs.field(eq=attrs_ndarray_isclose)
+    presence_detected: npt.NDArray[np.bool_] = attrs.field(eq=attrs_ndarray_isclose)
+    frame: npt.NDArray[np.complex_] = attrs.field(eq=attrs_ndarray_isclose)
+    abs_mean_sweep: npt.NDArray[np.float_] = attrs.field(eq=attrs_ndarray_isclose)
+    fast_lp_mean_sweep: npt.NDArray[np.float_] = attrs.field(eq=attrs_ndarray_isclose)
+    slow_lp_mean_sweep: npt.NDArray[np.float_] = attrs.field(eq=attrs_ndarray_isclose)
+    lp_noise: npt.NDArray[np.float_] = attrs.field(eq=attrs_ndarray_isclose)
+    presence_distance_index: npt.NDArray[np.int_] = attrs.field(eq=attrs_ndarray_isclose)
+
+    def __len__(self) -> int:
+        return len(self.presence_detected)
+
+    def __getitem__(self, frame_idx: int) -> ProcessorResult:
+        return ProcessorResult(
+            intra_presence_score=float(self.intra_presence_score[frame_idx]),
+            intra=self.intra[frame_idx],
+            inter_presence_score=float(self.inter_presence_score[frame_idx]),
+            inter=self.inter[frame_idx],
+            presence_distance=float(self.presence_distance[frame_idx]),
+            presence_detected=bool(self.presence_detected[frame_idx]),
+            extra_result=ProcessorExtraResult(
+                frame=self.frame[frame_idx],
+                abs_mean_sweep=self.abs_mean_sweep[frame_idx],
+                fast_lp_mean_sweep=self.fast_lp_mean_sweep[frame_idx],
+                slow_lp_mean_sweep=self.slow_lp_mean_sweep[frame_idx],
+                lp_noise=self.lp_noise[frame_idx],
+                presence_distance_index=int(self.presence_distance_index[frame_idx]),
+            ),
+        )
+
+    @classmethod
+    def _from_processor_results(
+        cls, results: list[ProcessorResult], num_distances: int, frame_shape: tuple[int, ...]
+    ) -> ProcessorBatchResult:
+        def stack(values: list[Any], shape: tuple[int, ...]) -> npt.NDArray[Any]:
+            return np.array(values).reshape(len(results), *shape)
+
+        return cls(
+            intra_presence_score=stack([r.intra_presence_score for r in results], ()),
+            intra=stack([r.intra for r in results], (num_distances,)),
+            inter_presence_score=stack([r.inter_presence_score for r in results], ()),
+            inter=stack([r.inter for r in results], (num_distances,)),
+            presence_distance=stack([r.presence_distance for r in results], ()),
+            presence_detected=stack([r.presence_detected for r in results], ()),
+            frame=stack([r.extra_result.frame for r in results], frame_shape),
+            abs_mean_sweep=stack(
+                [r.extra_result.abs_mean_sweep for r in results], (num_distances,)
+            ),
+            fast_lp_mean_sweep=stack(
+                [r.extra_result.fast_lp_mean_sweep for r in results], (num_distances,)
+            ),
+            slow_lp_mean_sweep=stack(
+                [r.extra_result.slow_lp_mean_sweep for r in results], (num_distances,)
+            ),
+            lp_noise=stack([r.extra_result.lp_noise for r in results], (num_distances,)),
+            presence_distance_index=stack(
+                [r.extra_result.presence_distance_index for r in results], ()
+            ),
+        )
+
+
 class Processor(ProcessorBase[ProcessorResult]):
     # lp(f): low pass (filtered)
     # cut: cutoff frequency [Hz]
@@ -214,6 +287,39 @@ class Processor(ProcessorBase[ProcessorResult]):
     def _dynamic_sf(static_sf: float, update_index: int) -> float:
         return min(static_sf, 1.0 - 1.0 / (1.0 + update_index))
 
+    @staticmethod
+    def _dynamic_sf_lp_batch(static_sf: float, x: npt.NDArray[Any]) -> npt.NDArray[Any]:
+        """Low pass filters ``x`` along the first (frame) axis, using :meth:`_dynamic_sf`
+
+        Gives the filter states after each frame, starting from the initial state. While the
+        dynamic smoothing factor is below ``static_sf``, the filter state is the mean of all
+        frames so far. After that, it is a first order IIR filter with a constant coefficient.
+        The initial state never contributes, since the first smoothing factor is 0.
+        """
+        num_frames = x.shape[0]
+        dynamic_sfs = 1.0 - 1.0 / (1.0 + np.arange(num_frames))
+        num_averaged = int(np.searchsorted(dynamic_sfs, static_sf))
+
+        head_shape = (num_averaged,) + (1,) * (x.ndim - 1)
+        head = np.cumsum(x[:num_averaged], axis=0) / np.arange(1, num_averaged + 1).reshape(
+            head_shape
+        )
+
+        if num_averaged == 0:
+            previous_state = np.zeros((1, *x.shape[1:]), dtype=x.dtype)
+        else:
+            previous_state = head[-1:]
+
+        tail, _ = lfilter(
+            [1.0 - static_sf],
+            [1.0, -static_sf],
+            x[num_averaged:],
+            axis=0,
+            zi=static_sf * previous_state,
+        )
+
+        return np.concatenate([head, tail], axis=0)
+
     @staticmethod
     def _abs_dev(
         a: npt.NDArray[np.complex_],
@@ -314,6 +420,183 @@ class Processor(ProcessorBase[ProcessorResult]):
         )
         self.mean_sweep_sf = self._tc_to_sf(self.mean_sweep_tc / scaling_factor, self.f)
 
+    def process_batch(self, stacked_results: a121.StackedResults) -> ProcessorBatchResult:
+        """Replays the processing of multiple frames at once
+
+        Gives the same results as creating a new processor and calling :meth:`process` for each
+        frame, up to floating point rounding. The low pass filters are evaluated along the frame
+        axis for all frames at once. Only the scalar presence score is evaluated frame by frame
+        when ``inter_frame_presence_timeout`` is set. If ``inter_phase_boost`` is also set, the
+        phase weighting depends on the presence score, and all frames are processed one by one.
+
+        The state of this processor is neither used nor updated.
+
+        :param stacked_results: The frames to process, starting from the first frame
+        """
+        subframes = stacked_results.subframes
+        frames = np.concatenate([subframes[i] for i in self.subsweep_indexes], axis=2)
+        num_frames = frames.shape[0]
+
+        if self.inter_frame_presence_timeout and self.inter_phase_boost:
+            processor = Processor(
+                sensor_config=self.sensor_config,
+                metadata=self.metadata,
+                processor_config=self.processor_config,
+                subsweep_indexes=self.subsweep_indexes,
+                context=ProcessorContext(estimated_frame_rate=self.f),
+            )
+            return ProcessorBatchResult._from_processor_results(
+                [processor.process(stacked_results[i]) for i in range(num_frames)],
+                self.num_distances,
+                frames.shape[1:],
+            )
+
+        frame_range = np.arange(num_frames)
+
+        # Noise estimation
+
+        noise_diff = np.diff(frames, n=self.noise_est_diff_order, axis=1)
+        noise = self._abs_dev(noise_diff, axis=1, subtract_mean=False)
+        noise /= self.noise_norm_factor
+        lp_noise = self._dynamic_sf_lp_batch(self.noise_sf, noise)
+
+        # Intra-frame part
+
+        sweep_dev = self._abs_dev(frames, axis=1, ddof=1)
+        lp_intra_dev = self._dynamic_sf_lp_batch(self.intra_sf, sweep_dev)
+
+        intra = np.divide(
+            lp_intra_dev,
+            lp_noise,
+            out=np.zeros_like(lp_intra_dev),
+            where=(lp_noise > 1.0),
+        )
+
+        intra_presence_distance_index = np.argmax(intra, axis=1)
+        intra_presence_score, _ = lfilter(
+            [1.0 - self.intra_output_sf],
+            [1.0, -self.intra_output_sf],
+            intra[frame_range, intra_presence_distance_index],
+            zi=[0.0],
+        )
+
+        # Inter-frame part
+
+        mean_sweep = frames.mean(axis=1)
+        abs_mean_sweep = np.abs(mean_sweep)
+
+        fast_lp_mean_sweep = self._dynamic_sf_lp_batch(self.fast_sf, abs_mean_sweep)
+        slow_lp_mean_sweep = self._dynamic_sf_lp_batch(self.slow_sf, abs_mean_sweep)
+
+        inter_dev = np.abs(fast_lp_mean_sweep - slow_lp_mean_sweep)
+        lp_inter_dev = self._dynamic_sf_lp_batch(self.inter_dev_sf, inter_dev)
+
+        inter = np.divide(
+            lp_inter_dev,
+            lp_noise,
+            out=np.zeros_like(lp_inter_dev),
+            where=(lp_noise > 1.0),
+        )
+
+        inter *= np.sqrt(self.sweeps_per_frame)
+
+        # Phase and amplitude weighting of inter-frame part
+
+        if self.inter_phase_boost:
+            # The phase shift of a frame is calculated before lp_mean_sweep_for_phase is updated
+            lp_mean_sweep_for_phase = self._dynamic_sf_lp_batch(self.mean_sweep_sf, mean_sweep)
+            phase_references = np.concatenate([mean_sweep[:1], lp_mean_sweep_for_phase[:-1]])
+            phases_unwrapped = np.unwrap(
+                [np.angle(phase_references), np.angle(mean_sweep)], axis=0
+            )
+            phase_shift = np.abs(phases_unwrapped[0] - phases_unwrapped[1])
+            lp_phase_shift = self._dynamic_sf_lp_batch(self.inter_dev_sf, phase_shift)
+
+            lp_mean_sweep_for_abs = self._dynamic_sf_lp_batch(self.inter_dev_sf, mean_sweep)
+            abs_lp_mean_sweep = np.abs(lp_mean_sweep_for_abs)
+
+            norm_abs_mean_sweep = np.divide(
+                abs_lp_mean_sweep,
+                lp_noise,
+                out=np.zeros_like(abs_lp_mean_sweep),
+                where=(lp_noise > 1.0),
+            )
+            norm_abs_mean_sweep *= np.sqrt(self.sweeps_per_frame)
+            norm_abs_mean_sweep = np.minimum(norm_abs_mean_sweep, self.MAX_AMPLITUDE_WEIGHT)
+
+            inter = inter * lp_phase_shift * norm_abs_mean_sweep
+
+        inter_presence_distance_index = np.argmax(inter, axis=1)
+        inter_max = inter[frame_range, inter_presence_distance_index]
+
+        if self.inter_frame_presence_timeout:
+            inter_presence_score = self._inter_presence_scores_with_timeout(inter_max)
+        else:
+            inter_presence_score = self._dynamic_sf_lp_batch(self.inter_output_sf, inter_max)
+
+        # Presence distance - intra presence distance is prioritized due to faster reaction time
+
+        intra_detected = (intra_presence_score > self.intra_threshold) & self.intra_enable
+        inter_detected = (inter_presence_score > self.inter_threshold) & self.inter_enable
+        presence_detected = intra_detected | inter_detected
+
+        detected_index = np.where(
+            intra_detected, intra_presence_distance_index, inter_presence_distance_index
+        )
+        # The presence distance index is kept from the last frame with detected presence
+        last_detected_frame = np.maximum.accumulate(np.where(presence_detected, frame_range, -1))
+        presence_distance_index = np.where(
+            last_detected_frame >= 0, detected_index[last_detected_frame], 0
+        )
+        presence_distance = np.where(
+            presence_detected, self.distances[presence_distance_index], 0.0
+        )
+
+        return ProcessorBatchResult(
+            intra_presence_score=intra_presence_score,
+            intra=intra,
+            inter_presence_score=inter_presence_score,
+            inter=inter,
+            presence_distance=presence_distance,
+            presence_detected=presence_detected,
+            frame=frames,
+            abs_mean_sweep=abs_mean_sweep,
+            fast_lp_mean_sweep=fast_lp_mean_sweep,
+            slow_lp_mean_sweep=slow_lp_mean_sweep,
+            lp_noise=lp_noise,
+            presence_distance_index=presence_distance_index,
+        )
+
+    def _inter_presence_scores_with_timeout(
+        self, inter_max: npt.NDArray[np.float_]
+    ) -> npt.NDArray[np.float_]:
+        """The inter presence score of each frame, with the timeout scaling of :meth:`process`
+
+        The scaling depends on the previous scores, so this is evaluated frame by frame.
+        """
+        assert self.inter_frame_presence_timeout is not None
+
+        timeout_frames = self.inter_frame_presence_timeout * self.f
+        sfs = np.minimum(self.inter_output_sf, 1.0 - 1.0 / (1.0 + np.arange(len(inter_max))))
+
+        scores = np.empty(len(inter_max))
+        score = 0.0
+        previous_score = 0.0
+        negative_count = 0
+        for i, (sf, value) in enumerate(zip(sfs.tolist(), inter_max.tolist())):
+            score = sf * score + (1.0 - sf) * value
+
+            if score - previous_score < 0:
+                negative_count += 1
+            else:
+                negative_count = 0
+
+            score /= np.exp(max(negative_count - timeout_frames, 0) / timeout_frames)
+            previous_score = score
+            scores[i] = score
+
+        return scores
+
     def process(self, result: a121.Result) -> ProcessorResult:
         range_subframes = [result.subframes[i] for i in self.subsweep_indexes]
         frame = np.concatenate(range_subframes, axis=1)
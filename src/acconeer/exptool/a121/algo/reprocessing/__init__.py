@@ -0,0 +1,16 @@
+# Copyright (c) Acconeer AB, 2024
+# All rights reserved
+
+from ._reprocessing import (
+    ALGORITHMS,
+    ProgressCallback,
+    ReprocessingAlgorithm,
+    ReprocessingJob,
+    ReprocessingJobResult,
+    find_recordings,
+    get_jobs,
+    load_reprocessed,
+    reprocess,
+    reprocess_session,
+    reprocess_to_file,
+)
@@ -0,0 +1,10 @@
+# Copyright (c) Acconeer AB, 2024
+# All rights reserved
+
+import sys
+
+from ._cli import main
+
+
+if __name__ == "__main__":
+    sys.exit(main())
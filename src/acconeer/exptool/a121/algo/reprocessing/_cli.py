@@ -0,0 +1,81 @@
+# Copyright (c) Acconeer AB, 2024
+# All rights reserved
+
+from __future__ import annotations
+
+import sys
+import typing as t
+from argparse import ArgumentParser
+from pathlib import Path
+
+from ._reprocessing import (
+    ALGORITHMS,
+    ReprocessingJobResult,
+    find_recordings,
+    get_jobs,
+    reprocess_to_file,
+)
+
+
+def _get_parser() -> ArgumentParser:
+    parser = ArgumentParser(
+        prog="python -m acconeer.exptool.a121.algo.reprocessing",
+        description="Reprocesses all A121 recordings in a directory with an algorithm processor",
+    )
+    parser.add_argument("directory", type=Path, help="directory searched for .h5 recordings")
+    parser.add_argument("algorithm", choices=sorted(ALGORITHMS))
+    parser.add_argument("output", type=Path, help="consolidated output .h5 file")
+    parser.add_argument(
+        "-c",
+        "--config",
+        type=Path,
+        metavar="path",
+        help="processor config as JSON, the default config if not given",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        metavar="n",
+        help="number of worker processes, the number of CPUs if not given",
+    )
+    parser.add_argument("-f", "--force", action="store_true", help="overwrite output")
+    parser.add_argument("-q", "--quiet", action="store_true", help="no progress reporting")
+    return parser
+
+
+def _print_progress(num_completed: int, num_jobs: int, job_result: ReprocessingJobResult) -> None:
+    status = "ok" if job_result.error is None else "FAILED"
+    job = job_result.job
+    sys.stderr.write(
+        f"[{num_completed}/{num_jobs}] {job.recording} (session {job.session_index}): {status}\n"
+    )
+
+
+def main(argv: t.Optional[t.List[str]] = None) -> int:
+    args = _get_parser().parse_args(argv)
+
+    if not args.force and args.output.exists():
+        sys.stderr.write("error: output file already exists (try using -f)\n")
+        return 1
+
+    processor_config_type = ALGORITHMS[args.algorithm].processor_config_type
+    processor_config = (
+        None if args.config is None else processor_config_type.from_json(args.config.read_text())
+    )
+
+    jobs = get_jobs(find_recordings(args.directory, exclude=[args.output]))
+    num_failed = reprocess_to_file(
+        jobs,
+        args.algorithm,
+        args.output,
+        processor_config,
+        max_workers=args.jobs,
+        progress_callback=None if args.quiet else _print_progress,
+    )
+
+    if num_failed > 0:
+        sys.stderr.write(f"{num_failed} of {len(jobs)} sessions failed, see {args.output}\n")
+        return 1
+
+    return 0
@@ -0,0 +1,362 @@
+# Copyright (c) Acconeer AB, 2024
+# All rights reserved
+
+from __future__ import annotations
+
+import concurrent.futures
+import os
+import traceback
+import typing as t
+from pathlib import Path
+
+import attrs
+import h5py
+
+from acconeer.exptool import a121, opser
+from acconeer.exptool.a121.algo import (
+    AlgoProcessorConfigBase,
+    ProcessorBase,
+    breathing,
+    phase_tracking,
+    presence,
+    speed,
+    surface_velocity,
+    touchless_button,
+    vibration,
+    waste_level,
+)
+
+
+_JOBS_IN_FLIGHT_PER_WORKER = 2
+
+_ProcessorFactory = t.Callable[
+    [a121.SensorConfig, a121.Metadata, t.Any],
+    ProcessorBase[t.Any],
+]
+
+
+@attrs.frozen
+class ReprocessingAlgorithm:
+    """Describes how to reprocess recorded sessions with the processor of an algorithm"""
+
+    processor_config_type: t.Type[AlgoProcessorConfigBase]
+    """The processor config type, loaded from JSON given to :func:`reprocess`"""
+
+    result_type: type
+    """The type of the processor results, used when persisting the results"""
+
+    create_processor: _ProcessorFactory
+    """Creates a processor given sensor config, metadata and processor config"""
+
+
+def _processor_factory(processor_type: t.Any) -> _ProcessorFactory:
+    def create_processor(
+        sensor_config: a121.SensorConfig, metadata: a121.Metadata, processor_config: t.Any
+    ) -> ProcessorBase[t.Any]:
+        return processor_type(  # type: ignore[no-any-return]
+            sensor_config=sensor_config, metadata=metadata, processor_config=processor_config
+        )
+
+    return create_processor
+
+
+ALGORITHMS: t.Dict[str, ReprocessingAlgorithm] = {
+    "breathing": ReprocessingAlgorithm(
+        breathing.ProcessorConfig,
+        breathing.ProcessorResult,
+        _processor_factory(breathing.Processor),
+    ),
+    "phase_tracking": ReprocessingAlgorithm(
+        phase_tracking.ProcessorConfig,
+        phase_tracking.ProcessorResult,
+        _processor_factory(phase_tracking.Processor),
+    ),
+    "presence": ReprocessingAlgorithm(
+        presence.ProcessorConfig,
+        presence.ProcessorResult,
+        _processor_factory(presence.Processor),
+    ),
+    "speed": ReprocessingAlgorithm(
+        speed.ProcessorConfig,
+        speed.ProcessorResult,
+        _processor_factory(speed.Processor),
+    ),
+    "surface_velocity": ReprocessingAlgorithm(
+        surface_velocity.ProcessorConfig,
+        surface_velocity.ProcessorResult,
+        _processor_factory(surface_velocity.Processor),
+    ),
+    "touchless_button": ReprocessingAlgorithm(
+        touchless_button.ProcessorConfig,
+        touchless_button.ProcessorResult,
+        _processor_factory(touchless_button.Processor),
+    ),
+    "vibration": ReprocessingAlgorithm(
+        vibration.ProcessorConfig,
+        vibration.ProcessorResult,
+        _processor_factory(vibration.Processor),
+    ),
+    "waste_level": ReprocessingAlgorithm(
+        waste_level.ProcessorConfig,
+        waste_level.ProcessorResult,
+        _processor_factory(waste_level.Processor),
+    ),
+}
+"""The algorithms available for reprocessing, by key
+
+Processors that need a calibration context, or a sensor config only produced by their detector
+(like the distance processor), are not available.
+"""
+
+
+@attrs.frozen
+class ReprocessingJob:
+    """One session of a recording to reprocess"""
+
+    recording: Path
+    session_index: int
+
+
+@attrs.frozen
+class ReprocessingJobResult:
+    job: ReprocessingJob
+    results: t.List[t.Any]
+    """The processor results, one per frame. Empty if the job failed"""
+
+    error: t.Optional[str] = None
+    """The formatted exception if the job failed, else None"""
+
+
+ProgressCallback = t.Callable[[int, int, ReprocessingJobResult], None]
+"""Called with the number of completed jobs, the total number of jobs and the completed job"""
+
+
+def _get_algorithm(algorithm_key: str) -> ReprocessingAlgorithm:
+    try:
+        return ALGORITHMS[algorithm_key]
+    except KeyError:
+        msg = f"Unknown algorithm '{algorithm_key}', expected one of {', '.join(ALGORITHMS)}"
+        raise ValueError(msg) from None
+
+
+def find_recordings(
+    directory: t.Union[str, os.PathLike[str]],
+    exclude: t.Iterable[t.Union[str, os.PathLike[str]]] = (),
+) -> t.List[Path]:
+    """Recursively finds all .h5 files in ``directory``, sorted by path
+
+    :param exclude: Files to leave out, e.g. the output file of a previous run
+    """
+    excluded = {Path(path).resolve() for path in exclude}
+    return sorted(path for path in Path(directory).rglob("*.h5") if path.resolve() not in excluded)
+
+
+def get_jobs(recordings: t.Iterable[Path]) -> t.List[ReprocessingJob]:
+    """Creates one job per session of each recording, in the given order of recordings
+
+    A file that can't be opened as an A121 record, e.g. an A111 recording, gets a single job.
+    It fails when reprocessed, and is reported like any other failed job.
+    """
+    jobs: t.List[ReprocessingJob] = []
+    for recording in recordings:
+        try:
+            with a121.open_record(recording) as record:
+                num_sessions = record.num_sessions
+        except Exception:
+            num_sessions = 1
+
+        jobs.extend(ReprocessingJob(recording, idx) for idx in range(num_sessions))
+
+    return jobs
+
+
+def reprocess_session(
+    algorithm_key: str, processor_config: AlgoProcessorConfigBase, job: ReprocessingJob
+) -> ReprocessingJobResult:
+    """Runs the processor of an algorithm over all frames of one recorded session
+
+    The session must contain a single sensor. Exceptions are not raised, but reported in
+    :attr:`ReprocessingJobResult.error`.
+    """
+    algorithm = ALGORITHMS[algorithm_key]
+
+    try:
+        with a121.open_record(job.recording) as record:
+            session = record.session(job.session_index)
+            processor = algorithm.create_processor(
+                session.session_config.sensor_config, session.metadata, processor_config
+            )
+            results = [processor.process(result) for result in session.results]
+    except Exception:
+        return ReprocessingJobResult(job, [], error=traceback.format_exc())
+
+    return ReprocessingJobResult(job, results)
+
+
+def reprocess(
+    jobs: t.Sequence[ReprocessingJob],
+    algorithm_key: str,
+    processor_config: t.Optional[AlgoProcessorConfigBase] = None,
+    *,
+    max_workers: t.Optional[int] = None,
+    progress_callback: t.Optional[ProgressCallback] = None,
+) -> t.Iterator[ReprocessingJobResult]:
+    """Reprocesses recorded sessions in a process pool
+
+    Every job is processed in a separate worker process, and the results are yielded in the
+    order of ``jobs``, regardless of the order in which the jobs complete. To bound the number
+    of results held while waiting for an earlier job, at most ``_JOBS_IN_FLIGHT_PER_WORKER``
+    jobs per worker, counted from the next job to yield, are submitted or waiting at a time.
+
+    :param jobs: The sessions to reprocess, see :func:`get_jobs`
+    :param algorithm_key: A key of :data:`ALGORITHMS`
+    :param processor_config: The processor config. The default one of the algorithm if None
+    :param max_workers: The number of worker processes. Defaults to the number of CPUs.
+        If 1, the jobs are processed in the calling process
+    :param progress_callback: Called every time a job completes
+    """
+    algorithm = _get_algorithm(algorithm_key)
+    if processor_config is None:
+        processor_config = algorithm.processor_config_type()
+
+    return _reprocess(jobs, algorithm_key, processor_config, max_workers, progress_callback)
+
+
+def _reprocess(
+    jobs: t.Sequence[ReprocessingJob],
+    algorithm_key: str,
+    processor_config: AlgoProcessorConfigBase,
+    max_workers: t.Optional[int],
+    progress_callback: t.Optional[ProgressCallback],
+) -> t.Iterator[ReprocessingJobResult]:
+    num_jobs = len(jobs)
+
+    if max_workers == 1:
+        for num_completed, job in enumerate(jobs, start=1):
+            job_result = reprocess_session(algorithm_key, processor_config, job)
+            if progress_callback is not None:
+                progress_callback(num_completed, num_jobs, job_result)
+            yield job_result
+        return
+
+    num_workers = (os.cpu_count() or 1) if max_workers is None else max_workers
+    max_jobs_in_flight = _JOBS_IN_FLIGHT_PER_WORKER * num_workers
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures: t.Dict[concurrent.futures.Future[ReprocessingJobResult], int] = {}
+
+        # Completed jobs wait here until all jobs before them have been yielded
+        pending: t.Dict[int, ReprocessingJobResult] = {}
+        next_job_idx = 0
+        next_submitted_job_idx = 0
+        num_completed = 0
+
+        while next_job_idx < num_jobs:
+            while next_submitted_job_idx < min(num_jobs, next_job_idx + max_jobs_in_flight):
+                future = executor.submit(
+                    reprocess_session,
+                    algorithm_key,
+                    processor_config,
+                    jobs[next_submitted_job_idx],
+                )
+                futures[future] = next_submitted_job_idx
+                next_submitted_job_idx += 1
+
+            done, _ = concurrent.futures.wait(
+                futures, return_when=concurrent.futures.FIRST_COMPLETED
+            )
+            for future in done:
+                job_result = future.result()
+                pending[futures.pop(future)] = job_result
+                num_completed += 1
+
+                if progress_callback is not None:
+                    progress_callback(num_completed, num_jobs, job_result)
+
+            while next_job_idx in pending:
+                yield pending.pop(next_job_idx)
+                next_job_idx += 1
+
+
+def reprocess_to_file(
+    jobs: t.Sequence[ReprocessingJob],
+    algorithm_key: str,
+    output_path: t.Union[str, os.PathLike[str]],
+    processor_config: t.Optional[AlgoProcessorConfigBase] = None,
+    *,
+    max_workers: t.Optional[int] = None,
+    progress_callback: t.Optional[ProgressCallback] = None,
+) -> int:
+    """Reprocesses recorded sessions, see :func:`reprocess`, into one consolidated H5 file
+
+    The file contains a group ``jobs/<index>`` per job, in the order of ``jobs``, with the
+    attributes ``recording`` and ``session_index`` and the persisted ``results``. Failed jobs
+    have an ``error`` attribute instead of results. Use :func:`load_reprocessed` to read it.
+
+    :returns: The number of failed jobs
+    """
+    algorithm = _get_algorithm(algorithm_key)
+
+    if processor_config is None:
+        processor_config = algorithm.processor_config_type()
+
+    num_failed = 0
+
+    with h5py.File(output_path, "w") as f:
+        f.attrs["algorithm"] = algorithm_key
+        f.attrs["processor_config"] = processor_config.to_json()
+        jobs_group = f.create_group("jobs")
+
+        job_results = reprocess(
+            jobs,
+            algorithm_key,
+            processor_config,
+            max_workers=max_workers,
+            progress_callback=progress_callback,
+        )
+        for job_idx, job_result in enumerate(job_results):
+            group = jobs_group.create_group(f"{job_idx:06d}")
+            group.attrs["recording"] = str(job_result.job.recording)
+            group.attrs["session_index"] = job_result.job.session_index
+
+            if job_result.error is None:
+                opser.serialize(
+                    job_result.results,
+                    group.create_group("results"),
+                    override_type=t.List[algorithm.result_type],  # type: ignore[name-defined]
+                )
+            else:
+                group.attrs["error"] = job_result.error
+                num_failed += 1
+
+    return num_failed
+
+
+def load_reprocessed(
+    path: t.Union[str, os.PathLike[str]],
+) -> t.Tuple[str, AlgoProcessorConfigBase, t.List[ReprocessingJobResult]]:
+    """Loads a file written by :func:`reprocess_to_file`
+
+    :returns: The algorithm key, the processor config and the job results in job order
+    """
+    with h5py.File(path, "r") as f:
+        algorithm_key = str(f.attrs["algorithm"])
+        algorithm = _get_algorithm(algorithm_key)
+        processor_config = algorithm.processor_config_type.from_json(f.attrs["processor_config"])
+
+        job_results = []
+        for group in f["jobs"].values():
+            job = ReprocessingJob(
+                Path(group.attrs["recording"]), int(group.attrs["session_index"])
+            )
+
+            if "error" in group.attrs:
+                job_results.append(ReprocessingJobResult(job, [], error=str(group.attrs["error"])))
+            else:
+                results = opser.deserialize(
+                    group["results"],
+                    t.List[algorithm.result_type],  # type: ignore[name-defined]
+                )
+                job_results.append(ReprocessingJobResult(job, results))
+
+    return algorithm_key, processor_config, job_results
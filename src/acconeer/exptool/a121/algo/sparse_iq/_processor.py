@@ -16,6 +16,7 @@ from acconeer.exptool.a121.algo import (
     AlgoParamEnum,
     AlgoProcessorConfigBase,
     ExtendedProcessorBase,
+    get_window,
 )
 
 
@@ -66,7 +67,7 @@ class Processor(ExtendedProcessorBase[ProcessorResult]):
     @staticmethod
     def _get_hanning_widow(sensor_config: a121.SensorConfig) -> npt.NDArray[np.float_]:
         spf = sensor_config.sweeps_per_frame
-        window = np.hanning(spf)[:, None]
+        window = get_window("hann", spf, symmetric=True)[:, None]
         return window / np.sum(window)  # type: ignore[no-any-return]
 
     def _process_entry(
@@ -8,10 +8,14 @@ from typing import Optional, Tuple
 import attrs
 import numpy as np
 import numpy.typing as npt
-from scipy.signal import welch
 
 from acconeer.exptool import a121
-from acconeer.exptool.a121.algo import PERCEIVED_WAVELENGTH, AlgoProcessorConfigBase, ProcessorBase
+from acconeer.exptool.a121.algo import (
+    PERCEIVED_WAVELENGTH,
+    AlgoProcessorConfigBase,
+    ProcessorBase,
+    two_sided_welch,
+)
 
 
 @attrs.mutable(kw_only=True)
@@ -74,19 +78,7 @@ class Processor(ProcessorBase[ProcessorResult]):
     def get_welch(
         self, sweep: npt.NDArray[np.complex_]
     ) -> Tuple[npt.NDArray[np.float_], npt.NDArray[np.float_]]:
-        freqs, psd = welch(
-            sweep,
-            fs=self.sweep_rate,
-            window="hann",
-            nperseg=self.segment_length,
-            noverlap=0,
-            average="mean",
-            axis=0,
-            return_onesided=False,
-        )
-        psd = np.fft.fftshift(psd, axes=0)
-        freqs = np.fft.fftshift(freqs, axes=0)
-        return freqs, psd
+        return two_sided_welch(sweep, self.sweep_rate, self.segment_length)
 
     def interpolate_peak(self, freqs: npt.NDArray[np.float_], peak_ind: int) -> float:
         # we assume indices to be -1,0,1 and take a inverse based on that.
@@ -2,4 +2,4 @@
 # All rights reserved
 
 from ._example_app import ExampleApp, ExampleAppConfig, ExampleAppResult
-from ._processor import Processor, ProcessorResult
+from ._processor import Processor, ProcessorConfig, ProcessorResult
@@ -8,15 +8,15 @@ from typing import Optional, Tuple
 import attrs
 import numpy as np
 import numpy.typing as npt
-import scipy
-from scipy.signal import welch
 
 from acconeer.exptool import a121
 from acconeer.exptool._core.class_creation.attrs import attrs_ndarray_isclose
 from acconeer.exptool.a121.algo import (
     AlgoProcessorConfigBase,
     ProcessorBase,
+    RingBuffer,
     double_buffering_frame_filter,
+    two_sided_welch,
 )
 from acconeer.exptool.a121.algo._utils import (
     APPROX_BASE_STEP_LENGTH_M,
@@ -133,8 +133,8 @@ class Processor(ProcessorBase[ProcessorResult]):
 
             self.time_series_length = processor_config.time_series_length
 
-        self.time_series = np.zeros(
-            [self.time_series_length, self.num_distances], dtype=np.complex_
+        self.time_series = RingBuffer(
+            self.time_series_length, (self.num_distances,), dtype=np.complex_
         )
 
         self.surface_distance = processor_config.surface_distance
@@ -154,7 +154,7 @@ class Processor(ProcessorBase[ProcessorResult]):
 
         self.middle_idx = int(np.around(self.segment_length / 2))
 
-        _, bin_fs = self.scipy_welch(self.time_series, self.sweep_rate)
+        _, bin_fs = self.scipy_welch(self.time_series.view(), self.sweep_rate)
         self.bin_rad_vs = bin_fs * PERCEIVED_WAVELENGTH
 
         self.max_bin_vertical_vs = self.bin_rad_vs * self.get_angle_correction(self.distances[0])
@@ -185,23 +185,8 @@ class Processor(ProcessorBase[ProcessorResult]):
     def scipy_welch(
         self, sweeps: npt.NDArray[np.complex_], sweep_rate: float
     ) -> Tuple[npt.NDArray[np.float_], npt.NDArray[np.float_]]:
-        psds = []
-        for i in np.arange(self.num_distances):
-            freqs, psd = welch(
-                x=sweeps[:, i],
-                fs=sweep_rate,
-                window="hann",
-                nperseg=self.segment_length,
-                noverlap=0,
-                average="mean",
-                axis=0,
-                return_onesided=False,
-            )
-            freqs = scipy.fft.fftshift(freqs)
-            psd = scipy.fft.fftshift(psd)
-            psds.append(psd)
-
-        return np.array(psds).T, freqs
+        freqs, psds = two_sided_welch(sweeps, sweep_rate, self.segment_length)
+        return psds, freqs
 
     def get_angle_correction(self, distance: float) -> float:
         # distanca > self.surface_distance is checked in sensor config
@@ -323,11 +308,15 @@ class Processor(ProcessorBase[ProcessorResult]):
 
     def process(self, result: a121.Result) -> ProcessorResult:
         data_segment = double_buffering_frame_filter(result._frame)
+        if data_segment is None:
+            # Frames too short to be filtered give NaN sweeps
+            data_segment = np.full(
+                (self.sweeps_per_frame, self.num_distances), complex(np.nan, np.nan)
+            )
 
-        self.time_series = np.roll(self.time_series, axis=0, shift=-self.sweeps_per_frame)
-        self.time_series[-self.sweeps_per_frame :, :] = data_segment
+        self.time_series.extend(data_segment)
 
-        psds, _ = self.scipy_welch(self.time_series, self.sweep_rate)
+        psds, _ = self.scipy_welch(self.time_series.view(), self.sweep_rate)
         if self.update_index * self.sweeps_per_frame < self.time_series_length:
             self.lp_psds = psds
 
@@ -18,6 +18,7 @@ from acconeer.exptool.a121.algo import (
     AlgoParamEnum,
     AlgoProcessorConfigBase,
     ProcessorBase,
+    RingBuffer,
     double_buffering_frame_filter,
 )
 
@@ -207,7 +208,7 @@ class Processor(ProcessorBase[ProcessorResult]):
 
         if self._frames_since_last_cal > self._cal_interval_frames:
             self._reset_background()
-        elif not np.any(np.isnan(self._dynamic_background)):
+        elif not np.any(np.isnan(self._dynamic_background.view())):
             y = self._calc_variance(frame)
 
         threshold = self._get_threshold_from_sensitivity(sensitivity)
@@ -290,15 +291,11 @@ class Processor(ProcessorBase[ProcessorResult]):
 
     def _reset_background(self) -> None:
         assert self._sensor_config.sweep_rate is not None
-        self._dynamic_background = np.full(
-            (
-                int(
-                    self._processor_config.calibration_duration_s * self._sensor_config.sweep_rate
-                ),
-                self._metadata.sweep_data_length,
-            ),
-            np.nan,
+        self._dynamic_background = RingBuffer(
+            int(self._processor_config.calibration_duration_s * self._sensor_config.sweep_rate),
+            (self._metadata.sweep_data_length,),
             dtype="complex",
+            fill_value=np.nan,
         )
         self._dynamic_background_guard = np.full(
             (self._sweeps_per_frame, self._metadata.sweep_data_length),
@@ -311,10 +308,11 @@ class Processor(ProcessorBase[ProcessorResult]):
         xn = np.full((self._sweeps_per_frame, self._metadata.sweep_data_length), 0, dtype=float)
         y = np.full((self._sweeps_per_frame, self._metadata.sweep_data_length), 0, dtype=float)
 
-        arg_norm = np.mean(self._dynamic_background, axis=0)
+        dynamic_background = self._dynamic_background.view()
+        arg_norm = np.mean(dynamic_background, axis=0)
         arg_norm = np.conj(arg_norm) / np.abs(arg_norm)
 
-        arg_norm_ref = self._dynamic_background * arg_norm
+        arg_norm_ref = dynamic_background * arg_norm
         ref_ampls = np.abs(arg_norm_ref)
         ampl_mean = np.mean(ref_ampls, axis=0)
         ampl_std = np.std(ref_ampls, axis=0)
@@ -473,10 +471,7 @@ class Processor(ProcessorBase[ProcessorResult]):
         raise AssertionError
 
     def _update_background(self) -> None:
-        self._dynamic_background = np.roll(
-            self._dynamic_background, -self._sweeps_per_frame, axis=0
-        )
-        self._dynamic_background[-self._sweeps_per_frame :, :] = self._dynamic_background_guard
+        self._dynamic_background.extend(self._dynamic_background_guard)
         self._frames_since_last_cal = 0
 
     @staticmethod
@@ -21,7 +21,9 @@ from acconeer.exptool.a121.algo import (
     AlgoParamEnum,
     AlgoProcessorConfigBase,
     ProcessorBase,
+    RingBuffer,
     double_buffering_frame_filter,
+    get_fft_frequencies,
 )
 from acconeer.exptool.utils import is_power_of_2
 
@@ -247,13 +249,13 @@ class Processor(ProcessorBase[ProcessorResult]):
 
         self.radians_to_displacement = PERCEIVED_WAVELENGTH * 10**6 / (2 * np.pi)
 
-        self.freq = np.fft.rfftfreq(
-            processor_config.time_series_length,
-            1 / sensor_config.sweep_rate,
+        self.freq = get_fft_frequencies(
+            processor_config.time_series_length, sensor_config.sweep_rate, onesided=True
         )[1:]
 
         # Variables
-        self.time_series = np.zeros(shape=processor_config.time_series_length)
+        self._time_series_buffer = RingBuffer(processor_config.time_series_length)
+        self.time_series = self._time_series_buffer.ordered()
         self.lp_displacements = np.zeros_like(self.freq)
 
         self.has_init = False
@@ -286,9 +288,15 @@ class Processor(ProcessorBase[ProcessorResult]):
             filter_output = double_buffering_frame_filter(complex_array_to_int16_complex(frame))
             if filter_output is not None:
                 frame = filter_output
-            self.time_series = np.roll(self.time_series, -self.spf)
-            self.time_series[-self.spf :] = np.angle(frame.squeeze(axis=1))
-            self.time_series = np.unwrap(self.time_series)
+            phases = np.angle(frame.squeeze(axis=1))
+            if len(phases) < self.time_series_length:
+                # The history is already unwrapped, so only the new samples are unwrapped,
+                # continuing from the newest sample of the history
+                newest = self._time_series_buffer.view()[-1:]
+                self._time_series_buffer.extend(np.unwrap(np.concatenate([newest, phases]))[1:])
+            else:
+                self._time_series_buffer.extend(np.unwrap(phases))
+            self.time_series = self._time_series_buffer.view()
         else:
             self.time_series = np.unwrap(np.angle(frame.squeeze(axis=1)))
 
@@ -3,6 +3,7 @@
 
 from . import algo
 from .api import (
+    average_current_vs_rate,
     configured_rate,
     converged_average_current,
     frame_active,
@@ -11,6 +12,7 @@ from .api import (
     group_idle,
     power_state,
     session,
+    steady_state_average_current,
     subsweep_active,
     sweep_active,
     sweep_idle,
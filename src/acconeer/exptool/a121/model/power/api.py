@@ -51,6 +51,9 @@ from __future__ import annotations
 import collections
 import typing as t
 
+import numpy as np
+import numpy.typing as npt
+
 from acconeer.exptool import a121
 from acconeer.exptool.a121._core import utils as core_utils
 
@@ -64,6 +67,11 @@ _T = t.TypeVar("_T")
 _ms = _mA = 1e-3
 _us = _uA = 1e-6
 
+_GROUP_ACTIVE_CACHE_SIZE = 64
+_group_active_cache: collections.OrderedDict[
+    t.Hashable, tuple[algo.Algorithm, Sensor, Module, domain.EnergyRegion]
+] = collections.OrderedDict()
+
 
 def configured_rate(config: a121.SessionConfig) -> t.Optional[float]:
     """
@@ -296,7 +304,49 @@ def group_active(
 ) -> domain.EnergyRegion:
     """
     Describes the active part of a group.
+
+    The region trees are memoized per sensor configs (i.e. the groups of the session config),
+    lower idle state, algorithm, sensor and module, since they don't depend on the rate.
+    Equal configs can therefore return the same (immutable) region.
     """
+    key = (
+        tuple(
+            tuple(
+                (sensor_id, sensor_config.to_json()) for sensor_id, sensor_config in group.items()
+            )
+            for group in session_config.groups
+        ),
+        lower_idle_state,
+        id(algorithm),
+        id(sensor),
+        id(module),
+    )
+
+    # The algorithm, sensor and module are kept in the cache (and compared by identity) so that
+    # their ids cannot be reused by other objects while cached.
+    cached = _group_active_cache.get(key)
+    if cached is not None:
+        (cached_algorithm, cached_sensor, cached_module, cached_region) = cached
+        if cached_algorithm is algorithm and cached_sensor is sensor and cached_module is module:
+            _group_active_cache.move_to_end(key)
+            return cached_region
+
+    region = _create_group_active(session_config, lower_idle_state, algorithm, sensor, module)
+
+    _group_active_cache[key] = (algorithm, sensor, module, region)
+    if len(_group_active_cache) > _GROUP_ACTIVE_CACHE_SIZE:
+        _group_active_cache.popitem(last=False)
+
+    return region
+
+
+def _create_group_active(
+    session_config: a121.SessionConfig,
+    lower_idle_state: t.Optional[Sensor.LowerIdleState],
+    algorithm: algo.Algorithm,
+    sensor: Sensor,
+    module: Module,
+) -> domain.EnergyRegion:
     frame_actives = [
         {sid: frame_active(sensor_config, sensor, module) for sid, sensor_config in group.items()}
         for group in session_config.groups
@@ -436,6 +486,8 @@ def converged_average_current(
     """
     Simulates the session until the average current has been within 'absolute_tolerance'.
     for 'convergence_window' iterations.
+
+    See 'steady_state_average_current' for the value it converges to, without simulating.
     """
     gen = session_generator(
         session_config,
@@ -463,6 +515,68 @@ def converged_average_current(
     return average_currents[-1]
 
 
+def steady_state_average_current(
+    session_config: a121.SessionConfig,
+    lower_idle_state: t.Optional[Sensor.LowerIdleState],
+    algorithm: algo.Algorithm = di.DEFAULT_ALGO,
+    sensor: Sensor = di.DEFAULT_SENSOR,
+    module: Module = di.DEFAULT_MODULE,
+) -> float:
+    """
+    Returns the average current of the session once it has settled.
+
+    This is the value 'converged_average_current' approaches, but calculated in closed form
+    from a single period (group active and group idle) of the session.
+    """
+    rate = configured_rate(session_config)
+
+    if rate is None:
+        return group_active(
+            session_config, lower_idle_state, algorithm, sensor, module
+        ).average_current
+
+    (average_current,) = average_current_vs_rate(
+        session_config, lower_idle_state, [rate], algorithm, sensor, module
+    )
+    return float(average_current)
+
+
+def average_current_vs_rate(
+    session_config: a121.SessionConfig,
+    lower_idle_state: t.Optional[Sensor.LowerIdleState],
+    rates: npt.ArrayLike,
+    algorithm: algo.Algorithm = di.DEFAULT_ALGO,
+    sensor: Sensor = di.DEFAULT_SENSOR,
+    module: Module = di.DEFAULT_MODULE,
+) -> npt.NDArray[np.float_]:
+    """
+    Returns the steady-state average current of the session (see
+    'steady_state_average_current') for every rate in 'rates', as if each were the update rate.
+
+    The group active region is the same for all rates, so it's only modelled once.
+    At rates too high to keep, where there is no time left for group idle,
+    the average current is that of group active.
+    """
+    rates = np.asarray(rates, dtype=float)
+
+    if np.any(rates <= 0):
+        raise ValueError("Rates need to be positive")
+
+    active = group_active(session_config, lower_idle_state, algorithm, sensor, module)
+    idle = group_idle(
+        lower_idle_state or algo.last_inter_frame_idle_state(session_config),
+        0.0,
+        sensor=sensor,
+        module=module,
+    )
+
+    idle_durations = np.maximum(1 / rates - active.duration, 0.0)
+
+    return (active.charge + idle.average_current * idle_durations) / (
+        active.duration + idle_durations
+    )
+
+
 def dump_region(region: domain.EnergyRegion, indent: str = "") -> None:
     if isinstance(region, domain.SimpleRegion):
         print(
@@ -132,13 +132,33 @@ class CompositeRegion(EnergyRegion):
     regions: tuple[EnergyRegion, ...]
     description: str = ""
 
+    # The regions are immutable, so their total duration and charge are computed once
+    # instead of recursing over the whole tree on every access.
+    _duration: float = attrs.field(init=False, repr=False, eq=False)
+    _charge: float = attrs.field(init=False, repr=False, eq=False)
+
+    @_duration.default
+    def _default_duration(self) -> float:
+        return duration(*self.regions)
+
+    @_charge.default
+    def _default_charge(self) -> float:
+        return sum(r.charge for r in self.regions)
+
     @property
     def average_current(self) -> float:
-        return sum(r.average_current * r.duration / self.duration for r in self.regions)
+        if len(self.regions) == 0:
+            return 0.0
+
+        return self._charge / self._duration
 
     @property
     def duration(self) -> float:
-        return duration(*self.regions)
+        return self._duration
+
+    @property
+    def charge(self) -> float:
+        return self._charge
 
     def truncate(self, new_duration: float) -> CompositeRegion:
         durations = (r.duration for r in self.regions)
@@ -4,13 +4,11 @@
 from __future__ import annotations
 
 import copy
-import functools
 import itertools
 import typing as t
 
 import typing_extensions as te
 
-from PySide6.QtCore import QTimer
 from PySide6.QtWidgets import QTabWidget, QVBoxLayout, QWidget
 
 import pyqtgraph as pg
@@ -34,25 +32,6 @@ from .session_config_input import SessionConfigEvent
 _T = t.TypeVar("_T")
 
 
-def incremental_plot(
-    xs: list[float],
-    f: t.Callable[[float], float],
-    ordering_strategy: t.Callable[[int], t.Iterable[int]],
-) -> t.Iterator[tuple[list[float], list[float]]]:
-    """Generator that adds one (x, y)-point to the plot each time it's iterated"""
-    done: list[tuple[float, float]] = []
-
-    for i in ordering_strategy(len(xs)):
-        x = xs[i]
-
-        done += [(x, f(x))]
-        done.sort(key=lambda t: t[0])
-
-        all_xs = [done_x for done_x, _ in done]
-        all_ys = [done_y for _, done_y in done]
-        yield (all_xs, all_ys)
-
-
 class _PowerConsumptionVsRatePlot(pg.PlotWidget):
     def __init__(self, algorithm: power.algo.Algorithm) -> None:
         super().__init__()
@@ -65,21 +44,6 @@ class _PowerConsumptionVsRatePlot(pg.PlotWidget):
         self.getPlotItem().addLegend()
         self.getViewBox().setMouseMode(pg.ViewBox.PanMode)
 
-        self._ready_plotter: t.Iterator[tuple[list[float], list[float]]] = iter([])
-        self._sleep_plotter: t.Iterator[tuple[list[float], list[float]]] = iter([])
-        self._deep_sleep_plotter: t.Iterator[tuple[list[float], list[float]]] = iter([])
-        self._hibernate_plotter: t.Iterator[tuple[list[float], list[float]]] = iter([])
-        self._off_plotter: t.Iterator[tuple[list[float], list[float]]] = iter([])
-
-        self._ready_curve: t.Optional[pg.PlotDataItem] = None
-        self._sleep_curve: t.Optional[pg.PlotDataItem] = None
-        self._deep_sleep_curve: t.Optional[pg.PlotDataItem] = None
-        self._hibernate_curve: t.Optional[pg.PlotDataItem] = None
-        self._off_curve: t.Optional[pg.PlotDataItem] = None
-
-        self._plot_increment_timer = QTimer()
-        self._plot_increment_timer.timeout.connect(self._increment_plots)
-
     @staticmethod
     def _get_update_rates(update_rate: float) -> list[float]:
         return list(
@@ -111,54 +75,6 @@ class _PowerConsumptionVsRatePlot(pg.PlotWidget):
 
         return config_copy
 
-    def _increment_plots(self) -> None:
-        (self._sleep_curve, sleep_done) = self._increment_plot(
-            "Sleep", pg_pen_cycler(0), self._sleep_plotter, self._sleep_curve
-        )
-        (self._deep_sleep_curve, deep_sleep_done) = self._increment_plot(
-            "Deep sleep", pg_pen_cycler(1), self._deep_sleep_plotter, self._deep_sleep_curve
-        )
-        (self._hibernate_curve, hibernate_done) = self._increment_plot(
-            "Hibernate", pg_pen_cycler(2), self._hibernate_plotter, self._hibernate_curve
-        )
-        (self._off_curve, off_done) = self._increment_plot(
-            "Off", pg_pen_cycler(3), self._off_plotter, self._off_curve
-        )
-        (self._ready_curve, ready_done) = self._increment_plot(
-            "Ready", pg_pen_cycler(4), self._ready_plotter, self._ready_curve
-        )
-
-        if all([sleep_done, deep_sleep_done, hibernate_done, off_done]):
-            self._plot_increment_timer.stop()
-
-    def _increment_plot(
-        self,
-        name: str,
-        pen: t.Any,
-        incremental_plotter: t.Iterator[tuple[list[float], list[float]]],
-        reused_curve: t.Optional[pg.PlotDataItem],
-    ) -> tuple[pg.PlotDataItem, bool]:
-        """
-        Plots the next increment of incremental_plotter.
-        If reused_curve is None, a new curve will be created with name and pen.
-
-        Returns the updated curve (migth be the same as reused_curve) and whether
-        plotting is completed
-        """
-        try:
-            (xs, ys) = next(incremental_plotter)
-        except StopIteration:
-            return (reused_curve, True)
-        else:
-            if reused_curve is None:
-                return (
-                    self.plot(xs, ys, name=name, pen=pen),
-                    False,
-                )
-            else:
-                reused_curve.setData(xs, ys)
-                return (reused_curve, False)
-
     @staticmethod
     def _will_keep_rate(
         config: a121.SessionConfig,
@@ -178,7 +94,6 @@ class _PowerConsumptionVsRatePlot(pg.PlotWidget):
         config: a121.SessionConfig,
         lower_idle_state: t.Optional[power.Sensor.LowerIdleState],
     ) -> None:
-        self._plot_increment_timer.stop()
         self.clear()
 
         configured_rate = power.configured_rate(config)
@@ -202,133 +117,65 @@ class _PowerConsumptionVsRatePlot(pg.PlotWidget):
         self.enableAutoRange()
         self.setXRange(min(update_rates), max(update_rates))
 
-        self._ready_curve = None
-        self._sleep_curve = None
-        self._deep_sleep_curve = None
-        self._hibernate_curve = None
-        self._off_curve = None
-        self._increment_plots()
-        self.addItem(
-            pg.ScatterPlotItem(
-                [configured_rate],
-                [
-                    power.converged_average_current(
-                        config,
-                        lower_idle_state=lower_idle_state,
-                        absolute_tolerance=1e-3,
-                        algorithm=self._algorithm,
-                    )
-                ],
-                name="Current config",
-            )
-        )
+        # (name, config, lower idle state) of every curve
+        curves: list[tuple[str, a121.SessionConfig, t.Optional[power.Sensor.LowerIdleState]]] = [
+            (
+                "Sleep",
+                self._evolve_config(config, inter_frame_idle_state=a121.IdleState.SLEEP),
+                None,
+            ),
+            (
+                "Deep sleep",
+                self._evolve_config(config, inter_frame_idle_state=a121.IdleState.DEEP_SLEEP),
+                None,
+            ),
+            ("Hibernate", config, power.Sensor.IdleState.HIBERNATE),
+            ("Off", config, power.Sensor.IdleState.OFF),
+        ]
 
-        curves_that_wont_keep_rate = []
         if any(
             sensor_config.inter_frame_idle_state == a121.IdleState.READY
             for sensor_config in core_utils.iterate_extended_structure_values(config.groups)
         ):
-            ready_config_evolver = functools.partial(
-                self._evolve_config,
-                inter_frame_idle_state=a121.IdleState.READY,
-            )
-            if not self._will_keep_rate(
-                ready_config_evolver(config, update_rate=max(update_rates)),
-                lower_idle_state=None,
-                algorithm=self._algorithm,
-            ):
-                curves_that_wont_keep_rate += ["Ready"]
-
-            def ready_f(update_rate: float) -> float:
-                return power.converged_average_current(
-                    ready_config_evolver(config, update_rate=update_rate),
-                    lower_idle_state=None,
-                    absolute_tolerance=1e-3,
-                    algorithm=self._algorithm,
+            curves += [
+                (
+                    "Ready",
+                    self._evolve_config(config, inter_frame_idle_state=a121.IdleState.READY),
+                    None,
                 )
+            ]
 
-            self._ready_plotter = incremental_plot(update_rates, ready_f, ordering_strategy=range)
-
-        sleep_config_evolver = functools.partial(
-            self._evolve_config,
-            inter_frame_idle_state=a121.IdleState.SLEEP,
-        )
-        if not self._will_keep_rate(
-            sleep_config_evolver(config, update_rate=max(update_rates)),
-            lower_idle_state=None,
-            algorithm=self._algorithm,
-        ):
-            curves_that_wont_keep_rate += ["Sleep"]
-
-        def sleep_f(update_rate: float) -> float:
-            return power.converged_average_current(
-                sleep_config_evolver(config, update_rate=update_rate),
-                lower_idle_state=None,
-                absolute_tolerance=1e-3,
+        curves_that_wont_keep_rate = []
+        for pen_index, (name, curve_config, curve_lower_idle_state) in enumerate(curves):
+            if not self._will_keep_rate(
+                self._evolve_config(curve_config, update_rate=max(update_rates)),
+                lower_idle_state=curve_lower_idle_state,
                 algorithm=self._algorithm,
-            )
-
-        self._sleep_plotter = incremental_plot(update_rates, sleep_f, ordering_strategy=range)
-
-        deep_sleep_config_evolver = functools.partial(
-            self._evolve_config,
-            inter_frame_idle_state=a121.IdleState.DEEP_SLEEP,
-        )
-        if not self._will_keep_rate(
-            deep_sleep_config_evolver(config, update_rate=max(update_rates)),
-            lower_idle_state=None,
-            algorithm=self._algorithm,
-        ):
-            curves_that_wont_keep_rate += ["Deep Sleep"]
+            ):
+                curves_that_wont_keep_rate += [name]
 
-        def deep_sleep_f(update_rate: float) -> float:
-            return power.converged_average_current(
-                deep_sleep_config_evolver(config, update_rate=update_rate),
-                lower_idle_state=None,
-                absolute_tolerance=1e-3,
+            average_currents = power.average_current_vs_rate(
+                curve_config,
+                lower_idle_state=curve_lower_idle_state,
+                rates=update_rates,
                 algorithm=self._algorithm,
             )
+            self.plot(update_rates, average_currents, name=name, pen=pg_pen_cycler(pen_index))
 
-        self._deep_sleep_plotter = incremental_plot(
-            update_rates, deep_sleep_f, ordering_strategy=range
-        )
-
-        if not self._will_keep_rate(
-            self._evolve_config(config, update_rate=max(update_rates)),
-            lower_idle_state=power.Sensor.IdleState.HIBERNATE,
-            algorithm=self._algorithm,
-        ):
-            curves_that_wont_keep_rate += ["Hibernate"]
-
-        def hibernate_f(update_rate: float) -> float:
-            return power.converged_average_current(
-                self._evolve_config(config, update_rate=update_rate),
-                lower_idle_state=power.Sensor.IdleState.HIBERNATE,
-                absolute_tolerance=1e-3,
-                algorithm=self._algorithm,
+        self.addItem(
+            pg.ScatterPlotItem(
+                [configured_rate],
+                [
+                    power.steady_state_average_current(
+                        config,
+                        lower_idle_state=lower_idle_state,
+                        algorithm=self._algorithm,
+                    )
+                ],
+                name="Current config",
             )
-
-        self._hibernate_plotter = incremental_plot(
-            update_rates, hibernate_f, ordering_strategy=range
         )
 
-        if not self._will_keep_rate(
-            self._evolve_config(config, update_rate=max(update_rates)),
-            lower_idle_state=power.Sensor.IdleState.OFF,
-            algorithm=self._algorithm,
-        ):
-            curves_that_wont_keep_rate += ["Off"]
-
-        def off_f(update_rate: float) -> float:
-            return power.converged_average_current(
-                self._evolve_config(config, update_rate=update_rate),
-                lower_idle_state=power.Sensor.IdleState.OFF,
-                absolute_tolerance=1e-3,
-                algorithm=self._algorithm,
-            )
-
-        self._off_plotter = incremental_plot(update_rates, off_f, ordering_strategy=range)
-
         if curves_that_wont_keep_rate:
             rate_warning_text = pg.InfiniteLine(
                 pos=0.003,
@@ -347,8 +194,6 @@ class _PowerConsumptionVsRatePlot(pg.PlotWidget):
             )
             self.addItem(rate_warning_text)
 
-        self._plot_increment_timer.start(10)
-
 
 class PowerConsumptionVsRateOutput(QWidget):
     INTERESTS: t.ClassVar[set[type]] = {
@@ -21,7 +21,7 @@ def serialize(
     """
     Serialize and save an arbitrary object to the specified group
     """
-    type_tree = core.create_type_tree(override_type or type(instance))
+    type_tree = core.get_type_tree(override_type or type(instance))
     core.sanitize_instance(instance, type_tree)
     RegistryPersistor(group, "./", type_tree).save(instance)
 
@@ -32,7 +32,7 @@ def deserialize(group: h5py.Group, typ: t.Type[_T]) -> _T:
 
     Will raise an exception if anything goes wrong.
     """
-    type_tree = core.create_type_tree(typ)
+    type_tree = core.get_type_tree(typ)
     loaded = RegistryPersistor(group, "./", type_tree).load()
     core.sanitize_instance(loaded, type_tree)
 
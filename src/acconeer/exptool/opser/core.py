@@ -261,14 +261,25 @@ def is_ndarray(__type: TypeLike) -> bool:
 
 
 def get_class_type_hints(__type: type) -> dict[str, TypeLike]:
+    """Returns the type hints of the members to persist
+
+    Members of attrs classes that are not passed to ``__init__`` (e.g. caches) are excluded,
+    since they cannot be passed back when loading.
+    """
     try:
-        return t.get_type_hints(__type)
+        hints = t.get_type_hints(__type)
     except TypeError as error:
         raise TypeError(
             f"{__type} is annotated with built-ins (list, dict, etc.). "
             + "Use 'typing' counterpart instead (typing.List, typing.Dict, etc.)"
         ) from error
 
+    if attrs.has(__type):
+        non_init_fields = {field.name for field in attrs.fields(__type) if not field.init}
+        hints = {name: hint for name, hint in hints.items() if name not in non_init_fields}
+
+    return hints
+
 
 def sequence_index(index: t.Union[str, int] = "X") -> str:
     return f"sequence_index_{index}"
@@ -329,6 +340,27 @@ def create_type_tree(__type: TypeLike, parent: t.Optional[Node] = None) -> Node:
         raise TypeError(f"{__type} is recursive. Recursively defined classes are not supported")
 
 
+_TYPE_TREE_CACHE: t.Dict[TypeLike, Node] = {}
+
+
+def get_type_tree(__type: TypeLike) -> Node:
+    """
+    Like :func:`create_type_tree`, but only creates the type tree of a type once.
+
+    The returned type tree is shared between calls and should not be modified.
+    """
+    try:
+        return _TYPE_TREE_CACHE[__type]
+    except KeyError:
+        pass
+    except TypeError:  # unhashable type
+        return create_type_tree(__type)
+
+    type_tree = create_type_tree(__type)
+    _TYPE_TREE_CACHE[__type] = type_tree
+    return type_tree
+
+
 def sanitize_instance(instance: t.Any, type_tree: Node) -> None:
     """
     Asserts that the instance conforms to its type and type annotations with instance-checks
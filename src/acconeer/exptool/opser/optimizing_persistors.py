@@ -88,6 +88,9 @@ class RaggedNumpyArrayPersistor(core.Persistor):
         if max(np.ndim(array) for array in data) > 1:
             raise core.SaveError("Only 1-dimensional arrays can be ragged.")
 
+        if any(array is None for array in data):
+            raise core.SaveError("None cannot be stored in a ragged dataset.")
+
         try:
             (dtype,) = {arr.dtype for arr in data if arr is not None}
         except ValueError as ve:
@@ -111,6 +114,51 @@ class RaggedNumpyArrayPersistor(core.Persistor):
         return list(self.dataset[()])
 
 
+@RegistryPersistor.register_persistor
+class StackedNumpyArrayPersistor(core.Persistor):
+    """
+    Persists lists of numpy arrays with equal shapes and dtypes as a single Dataset,
+    stacked along a new first axis.
+
+    Lists with ``None``s, differing shapes or differing dtypes are left to
+    :class:`RaggedNumpyArrayPersistor` and :class:`ListPersistor`.
+    """
+
+    PRIORITY: t.ClassVar[int] = RegistryPersistor.priority_higher_than(RaggedNumpyArrayPersistor)
+
+    STACKABLE_KINDS = "biufc"
+
+    @classmethod
+    def is_applicable(cls, __type: core.TypeLike) -> bool:
+        return RaggedNumpyArrayPersistor.is_applicable(__type)
+
+    def save(self, data: t.Any) -> None:
+        if not isinstance(data, list):
+            raise core.TypeMissmatchError
+
+        if len(data) == 0:
+            raise core.SaveError("Cannot infer shape and dtype of an empty list.")
+
+        if any(not isinstance(array, np.ndarray) for array in data):
+            raise core.SaveError("Only lists of arrays (without None) can be stacked.")
+
+        (first, *_) = data
+
+        if any(array.shape != first.shape or array.dtype != first.dtype for array in data):
+            raise core.SaveError("Only arrays with equal shapes and dtypes can be stacked.")
+
+        if first.dtype.kind not in self.STACKABLE_KINDS:
+            raise core.SaveError(f"Arrays with dtype {first.dtype} cannot be stacked.")
+
+        self.create_own_dataset(np.stack(data))
+
+    def load(self) -> t.List[t.Any]:
+        if self.dataset.attrs.get("persistor") != type(self).__name__:
+            raise core.LoadError
+
+        return list(self.dataset[()])
+
+
 @RegistryPersistor.register_persistor
 class TrileanListPersistor(core.Persistor):
     """
@@ -365,6 +413,8 @@ class SausageableAttrsPersistor(core.Persistor):
         Foo([1, 2, 3, ...], [1.0, 2.0, 3.0, ...])
 
     which can allow the fields ``i`` and ``f`` to be saved more efficiently.
+    Together with e.g. :class:`ScalarListPersistor` and :class:`StackedNumpyArrayPersistor`,
+    this stores the list as a struct of arrays, one dataset per field.
     """
 
     PRIORITY: t.ClassVar[int] = RegistryPersistor.priority_higher_than(ListPersistor)
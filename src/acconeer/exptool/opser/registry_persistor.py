@@ -19,6 +19,10 @@ class RegistryPersistor(core.Persistor):
     """
 
     _REGISTRY: t.ClassVar[t.Dict[str, t.Type[core.Persistor]]] = {}
+    _REGISTRY_VERSION: t.ClassVar[int] = 0
+    _APPLICABLE_PERSISTORS_CACHE: t.ClassVar[
+        t.Dict[t.Tuple[core.TypeLike, int], t.Tuple[t.Type[core.Persistor], ...]]
+    ] = {}
 
     @classmethod
     def register_persistor(cls, __persistor: t.Type[core.Persistor]) -> t.Type[core.Persistor]:
@@ -27,7 +31,11 @@ class RegistryPersistor(core.Persistor):
 
         This can be called many times with the same persistor without repercussions.
         """
-        cls._REGISTRY[__persistor.__name__] = __persistor
+        if cls._REGISTRY.get(__persistor.__name__) is not __persistor:
+            cls._REGISTRY[__persistor.__name__] = __persistor
+            cls._REGISTRY_VERSION += 1
+            cls._APPLICABLE_PERSISTORS_CACHE.clear()
+
         return __persistor
 
     @classmethod
@@ -39,18 +47,49 @@ class RegistryPersistor(core.Persistor):
             raise RuntimeError(f"Persistor {__persistor} is not in the registry")
 
     @classmethod
-    def _get_applicable_persistors(cls, __type: type) -> t.List[t.Type[core.Persistor]]:
-        """Retrieves the persistors that can handle the specified type"""
-        return sorted(
-            (persistor for persistor in cls._REGISTRY.values() if persistor.is_applicable(__type)),
-            key=lambda p: p.PRIORITY,
-            reverse=True,
+    def _get_applicable_persistors(
+        cls, __type: core.TypeLike
+    ) -> t.Tuple[t.Type[core.Persistor], ...]:
+        """
+        Retrieves the persistors that can handle the specified type, in the order they are tried.
+
+        The result is cached per type and registry version, since this is called for every
+        node of the type tree on every save and load.
+        """
+        key = (__type, cls._REGISTRY_VERSION)
+
+        try:
+            return cls._APPLICABLE_PERSISTORS_CACHE[key]
+        except KeyError:
+            pass
+        except TypeError:  # unhashable type
+            return cls._find_applicable_persistors(__type)
+
+        persistors = cls._find_applicable_persistors(__type)
+        cls._APPLICABLE_PERSISTORS_CACHE[key] = persistors
+        return persistors
+
+    @classmethod
+    def _find_applicable_persistors(
+        cls, __type: core.TypeLike
+    ) -> t.Tuple[t.Type[core.Persistor], ...]:
+        return tuple(
+            sorted(
+                (p for p in cls._REGISTRY.values() if p.is_applicable(__type)),
+                key=lambda p: p.PRIORITY,
+                reverse=True,
+            )
         )
 
     @classmethod
     def registry_size(cls) -> int:
         return len(cls._REGISTRY)
 
+    @classmethod
+    def registry_version(cls) -> int:
+        """Returns a number that changes every time the set of registered persistors changes"""
+        return cls._REGISTRY_VERSION
+
     @classmethod
     def is_applicable(cls, __type: core.TypeLike) -> bool:
         return len(cls._get_applicable_persistors(__type)) > 0
@@ -0,0 +1,29 @@
+# Copyright (c) Acconeer AB, 2024
+# All rights reserved
+from __future__ import annotations
+
+import typing as t
+
+import h5py
+import numpy as np
+import pytest
+
+import acconeer.exptool as et
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_benchmark_update_machine_info(config: t.Any, machine_info: dict[str, t.Any]) -> None:
+    """Adds the versions that the benchmark results depend on to the machine info
+
+    Makes it possible to track results from ``--benchmark-json`` across releases.
+    """
+    machine_info["acconeer_exptool"] = et.__version__
+    machine_info["numpy"] = np.__version__
+    machine_info["h5py"] = h5py.__version__
+
+    try:
+        import scipy
+    except ImportError:
+        pass
+    else:
+        machine_info["scipy"] = scipy.__version__
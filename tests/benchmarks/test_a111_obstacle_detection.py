@@ -0,0 +1,53 @@
+# Copyright (c) Acconeer AB, 2024
+# All rights reserved
+from __future__ import annotations
+
+import typing as t
+from pathlib import Path
+
+import pytest
+
+from acconeer.exptool import a111
+from acconeer.exptool.a111.algo.obstacle_detection import ProcessingConfiguration, Processor
+
+
+pytest.importorskip("pytest_benchmark")
+
+_INPUT_PATH = Path(__file__).parents[1] / "processing" / "a111" / "obstacle_detection" / "input.h5"
+
+
+@pytest.fixture(scope="module")
+def record() -> t.Any:
+    return a111.recording.load(_INPUT_PATH)
+
+
+@pytest.fixture(params=[1, 3], ids=lambda nr_peaks: f"nr_peaks={nr_peaks}")
+def processing_config(request: t.Any) -> ProcessingConfiguration:
+    processing_config = ProcessingConfiguration()
+    processing_config.nr_peaks = request.param
+    processing_config.threshold = 0.01
+    return processing_config
+
+
+@pytest.mark.benchmark(group="a111_obstacle_detection")
+def test_create_processor(
+    benchmark: t.Any, record: t.Any, processing_config: ProcessingConfiguration
+) -> None:
+    benchmark(Processor, record.sensor_config, processing_config, record.session_info)
+
+
+@pytest.mark.benchmark(group="a111_obstacle_detection")
+def test_process_recording(
+    benchmark: t.Any, record: t.Any, processing_config: ProcessingConfiguration
+) -> None:
+    """Processes the whole recording, including the background estimation"""
+
+    def setup() -> t.Any:
+        processor = Processor(record.sensor_config, processing_config, record.session_info)
+        return (processor,), {}
+
+    def process(processor: Processor) -> None:
+        for data_info, data in record:
+            processor.process(data.squeeze(0), data_info[0])
+
+    benchmark.pedantic(process, setup=setup, rounds=3)
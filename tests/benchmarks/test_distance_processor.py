@@ -0,0 +1,76 @@
+# Copyright (c) Acconeer AB, 2024
+# All rights reserved
+from __future__ import annotations
+
+import typing as t
+
+import numpy as np
+import pytest
+
+from acconeer.exptool import a121
+from acconeer.exptool._core.int_16_complex import INT_16_COMPLEX
+from acconeer.exptool.a121._core.communication import MockClient
+from acconeer.exptool.a121._core.entities import ResultContext
+from acconeer.exptool.a121.algo import distance
+
+
+pytest.importorskip("pytest_benchmark")
+
+_NUM_FRAMES = 200
+
+
+@pytest.fixture
+def processor_kwargs_and_stacked_results() -> t.Tuple[t.Dict[str, t.Any], a121.StackedResults]:
+    sensor_config = a121.SensorConfig(
+        sweeps_per_frame=4,
+        subsweeps=[
+            a121.SubsweepConfig(
+                start_point=100, num_points=200, step_length=2, phase_enhancement=True
+            ),
+            a121.SubsweepConfig(
+                start_point=500, num_points=200, step_length=2, phase_enhancement=True
+            ),
+        ],
+    )
+    metadata = MockClient._sensor_config_to_metadata(sensor_config, None)
+
+    rng = np.random.default_rng(0)
+    shape = (_NUM_FRAMES, sensor_config.sweeps_per_frame, metadata.sweep_data_length)
+    frame = np.zeros(shape, dtype=INT_16_COMPLEX)
+    frame["real"] = rng.normal(0, 50, shape)
+    frame["imag"] = rng.normal(0, 50, shape)
+    frame["real"][..., 150:160] += 2000
+
+    stacked_results = a121.StackedResults(
+        data_saturated=np.zeros(_NUM_FRAMES, dtype=bool),
+        frame_delayed=np.zeros(_NUM_FRAMES, dtype=bool),
+        calibration_needed=np.zeros(_NUM_FRAMES, dtype=bool),
+        temperature=np.full(_NUM_FRAMES, 25),
+        tick=np.arange(_NUM_FRAMES),
+        frame=frame,
+        context=ResultContext(metadata=metadata, ticks_per_second=1000000),
+    )
+    processor_kwargs = dict(
+        sensor_config=sensor_config,
+        metadata=metadata,
+        processor_config=distance.ProcessorConfig(),
+        context=distance.ProcessorContext(bg_noise_std=[10.0, 10.0]),
+    )
+    return processor_kwargs, stacked_results
+
+
+@pytest.mark.benchmark(group="distance_processor")
+def test_process_per_frame(benchmark: t.Any, processor_kwargs_and_stacked_results: t.Any) -> None:
+    processor_kwargs, stacked_results = processor_kwargs_and_stacked_results
+    processor = distance.Processor(**processor_kwargs)
+    results = [stacked_results[i] for i in range(len(stacked_results))]
+
+    benchmark(lambda: [processor.process(result) for result in results])
+
+
+@pytest.mark.benchmark(group="distance_processor")
+def test_process_batch(benchmark: t.Any, processor_kwargs_and_stacked_results: t.Any) -> None:
+    processor_kwargs, stacked_results = processor_kwargs_and_stacked_results
+    processor = distance.Processor(**processor_kwargs)
+
+    benchmark(processor.process_batch, stacked_results)
@@ -0,0 +1,70 @@
+# Copyright (c) Acconeer AB, 2024
+# All rights reserved
+from __future__ import annotations
+
+import typing as t
+
+import pytest
+
+from acconeer.exptool import a121
+from acconeer.exptool.a121._core_ext import _LoopbackServer
+
+
+pytest.importorskip("pytest_benchmark")
+
+_NUM_FRAMES = 200
+
+
+@pytest.fixture(
+    scope="module",
+    params=[(4, 40), (16, 160), (32, 120)],
+    ids=lambda p: f"sweeps_per_frame={p[0]}-num_points={p[1]}",
+)
+def client(request: t.Any) -> t.Iterator[t.Tuple[_LoopbackServer, a121.Client]]:
+    """An exploration client, set up against a loopback server sending as fast as possible"""
+    sweeps_per_frame, num_points = request.param
+
+    with _LoopbackServer(frame_rate=None, use_session_rate=False) as server, a121.Client.open(
+        ip_address=server.host, tcp_port=server.port
+    ) as client:
+        client.setup_session(
+            a121.SensorConfig(sweeps_per_frame=sweeps_per_frame, num_points=num_points)
+        )
+        yield server, client
+
+
+def _report_server_statistics(benchmark: t.Any, server: _LoopbackServer) -> None:
+    statistics = server.statistics
+    benchmark.extra_info["server_frames_per_second"] = statistics.frames_per_second
+    benchmark.extra_info["server_bytes_per_second"] = statistics.bytes_per_second
+    benchmark.extra_info["server_delayed_frames"] = statistics.num_delayed_frames
+
+
+@pytest.mark.benchmark(group="exploration_client_loopback")
+def test_get_next(benchmark: t.Any, client: t.Any) -> None:
+    server, client = client
+
+    def receive() -> None:
+        for _ in range(_NUM_FRAMES):
+            client.get_next()
+
+    client.start_session()
+    try:
+        benchmark.pedantic(receive, rounds=5, warmup_rounds=1)
+    finally:
+        client.stop_session()
+
+    _report_server_statistics(benchmark, server)
+
+
+@pytest.mark.benchmark(group="exploration_client_loopback")
+def test_get_next_batch(benchmark: t.Any, client: t.Any) -> None:
+    server, client = client
+
+    client.start_session()
+    try:
+        benchmark.pedantic(client.get_next_batch, args=(_NUM_FRAMES,), rounds=5, warmup_rounds=1)
+    finally:
+        client.stop_session()
+
+    _report_server_statistics(benchmark, server)
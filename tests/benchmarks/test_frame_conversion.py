@@ -0,0 +1,107 @@
+# Copyright (c) Acconeer AB, 2024
+# All rights reserved
+from __future__ import annotations
+
+import typing as t
+
+import numpy as np
+import numpy.typing as npt
+import pytest
+
+from acconeer.exptool import a121
+from acconeer.exptool._core.int_16_complex import INT_16_COMPLEX, int16_complex_array_to_complex
+from acconeer.exptool.a121._core.entities import ResultContext
+from acconeer.exptool.a121._core.entities.containers.utils import get_subsweeps_from_frame
+
+
+pytest.importorskip("pytest_benchmark")
+
+_NUM_SUBSWEEPS = 4
+_NUM_POINTS = 100
+
+
+def _temporaries_int16_complex_array_to_complex(
+    array: npt.NDArray[t.Any],
+) -> npt.NDArray[np.complex_]:
+    """The conversion used before the parts were written into a preallocated output"""
+    real = array["real"].astype("float")
+    imaginary = array["imag"].astype("float")
+    return real + 1.0j * imaginary  # type: ignore[no-any-return]
+
+
+@pytest.fixture(params=[1, 16, 64], ids=lambda p: f"sweeps_per_frame={p}")
+def int16_complex_frame(request: t.Any) -> npt.NDArray[t.Any]:
+    rng = np.random.default_rng(0)
+    frame = np.empty((request.param, _NUM_SUBSWEEPS * _NUM_POINTS), dtype=INT_16_COMPLEX)
+    frame["real"] = rng.integers(-1000, 1000, frame.shape)
+    frame["imag"] = rng.integers(-1000, 1000, frame.shape)
+    return frame
+
+
+def _result(frame: npt.NDArray[t.Any]) -> a121.Result:
+    metadata = a121.Metadata(
+        frame_data_length=frame.size,
+        sweep_data_length=frame.shape[1],
+        subsweep_data_offset=np.arange(_NUM_SUBSWEEPS) * _NUM_POINTS,
+        subsweep_data_length=np.full(_NUM_SUBSWEEPS, _NUM_POINTS),
+        calibration_temperature=0,
+        tick_period=0,
+        base_step_length_m=0,
+        max_sweep_rate=0,
+        high_speed_mode=False,
+    )
+    return a121.Result(
+        data_saturated=False,
+        frame_delayed=False,
+        calibration_needed=False,
+        temperature=25,
+        tick=0,
+        frame=frame,
+        context=ResultContext(metadata=metadata, ticks_per_second=1000000),
+    )
+
+
+@pytest.mark.benchmark(group="frame_conversion")
+def test_convert_with_temporaries(benchmark: t.Any, int16_complex_frame: t.Any) -> None:
+    benchmark(_temporaries_int16_complex_array_to_complex, int16_complex_frame)
+
+
+@pytest.mark.benchmark(group="frame_conversion")
+@pytest.mark.parametrize("dtype", [np.complex128, np.complex64])
+def test_convert_into_preallocated(
+    benchmark: t.Any, int16_complex_frame: t.Any, dtype: t.Any
+) -> None:
+    converted = benchmark(int16_complex_array_to_complex, int16_complex_frame, dtype)
+
+    np.testing.assert_array_equal(
+        converted, _temporaries_int16_complex_array_to_complex(int16_complex_frame)
+    )
+
+
+@pytest.mark.benchmark(group="subframes_per_result")
+def test_subframes_converted_per_access(benchmark: t.Any, int16_complex_frame: t.Any) -> None:
+    """The access pattern of processors, converting the whole frame once per subsweep"""
+
+    def get_subframes() -> list[npt.NDArray[np.complex_]]:
+        result = _result(int16_complex_frame)
+        metadata = result._context.metadata
+        return [
+            get_subsweeps_from_frame(
+                _temporaries_int16_complex_array_to_complex(result._frame), metadata
+            )[i]
+            for i in range(_NUM_SUBSWEEPS)
+        ]
+
+    benchmark(get_subframes)
+
+
+@pytest.mark.benchmark(group="subframes_per_result")
+@pytest.mark.parametrize("dtype", [np.complex128, np.complex64])
+def test_subframes_converted_once(
+    benchmark: t.Any, int16_complex_frame: t.Any, dtype: t.Any
+) -> None:
+    def get_subframes() -> list[npt.NDArray[t.Any]]:
+        result = _result(int16_complex_frame)
+        return [result.get_subframes(dtype)[i] for i in range(_NUM_SUBSWEEPS)]
+
+    benchmark(get_subframes)
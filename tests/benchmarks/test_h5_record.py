@@ -0,0 +1,45 @@
+# Copyright (c) Acconeer AB, 2024
+# All rights reserved
+from __future__ import annotations
+
+import importlib.resources
+import typing as t
+
+import h5py
+import pytest
+
+from acconeer.exptool import a121
+
+from tests.processing.a121 import data_files
+
+
+pytest.importorskip("pytest_benchmark")
+
+
+@pytest.fixture(
+    params=["input-presence-default.h5", "breathing-sitting.h5", "vibration.h5"],
+)
+def record(request: t.Any) -> t.Iterator[a121.H5Record]:
+    with importlib.resources.path(data_files.recorded_data, request.param) as path:
+        with h5py.File(path) as f:
+            yield a121.H5Record(f)
+
+
+@pytest.mark.benchmark(group="h5_record_read")
+def test_iterate_extended_results(benchmark: t.Any, record: a121.H5Record) -> None:
+    benchmark(lambda: sum(1 for _ in record.session(0).extended_results))
+
+
+@pytest.mark.benchmark(group="h5_record_read")
+def test_iterate_extended_results_frames(benchmark: t.Any, record: a121.H5Record) -> None:
+    def iterate() -> None:
+        for extended_result in record.session(0).extended_results:
+            for result in a121.iterate_extended_structure_values(extended_result):
+                result.frame
+
+    benchmark(iterate)
+
+
+@pytest.mark.benchmark(group="h5_record_read")
+def test_read_stacked_results(benchmark: t.Any, record: a121.H5Record) -> None:
+    benchmark(lambda: record.session(0).lazy_stacked_results[:].frame)
@@ -0,0 +1,110 @@
+# Copyright (c) Acconeer AB, 2024
+# All rights reserved
+from __future__ import annotations
+
+import itertools
+import typing as t
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from acconeer.exptool import a121
+from acconeer.exptool._core.int_16_complex import INT_16_COMPLEX
+from acconeer.exptool.a121._core.entities import ResultContext, SensorInfo
+
+
+pytest.importorskip("pytest_benchmark")
+
+_NUM_FRAMES = 500
+_SWEEPS_PER_FRAME = 16
+_NUM_POINTS = 160
+
+
+def _extended_metadata() -> list[dict[int, a121.Metadata]]:
+    return [
+        {
+            1: a121.Metadata(
+                frame_data_length=_SWEEPS_PER_FRAME * _NUM_POINTS,
+                sweep_data_length=_NUM_POINTS,
+                subsweep_data_offset=np.array([0]),
+                subsweep_data_length=np.array([_NUM_POINTS]),
+                calibration_temperature=0,
+                tick_period=0,
+                base_step_length_m=0,
+                max_sweep_rate=0,
+                high_speed_mode=False,
+            )
+        }
+    ]
+
+
+def _extended_results() -> list[list[dict[int, a121.Result]]]:
+    rng = np.random.default_rng(0)
+    context = ResultContext(metadata=_extended_metadata()[0][1], ticks_per_second=1000000)
+    results = []
+    for i in range(_NUM_FRAMES):
+        frame = np.zeros((_SWEEPS_PER_FRAME, _NUM_POINTS), dtype=INT_16_COMPLEX)
+        frame["real"] = rng.normal(0, 200, frame.shape)
+        frame["imag"] = rng.normal(0, 200, frame.shape)
+        result = a121.Result(
+            data_saturated=False,
+            frame_delayed=False,
+            calibration_needed=False,
+            temperature=25,
+            tick=i * 1000,
+            frame=frame,
+            context=context,
+        )
+        results.append([{1: result}])
+    return results
+
+
+_PROFILES = {
+    "none": a121.H5RecordingProfile(compression=None),
+    "lzf": a121.H5RecordingProfile(compression="lzf"),
+    "lzf_shuffle": a121.H5RecordingProfile(compression="lzf", shuffle=True),
+    "gzip_default": a121.H5RecordingProfile(),
+    "gzip1_shuffle": a121.H5RecordingProfile(compression_level=1, shuffle=True),
+    "gzip9_shuffle_64": a121.H5RecordingProfile(
+        compression_level=9, shuffle=True, chunk_frames=64
+    ),
+}
+
+
+@pytest.mark.benchmark(group="h5_recorder_profile")
+@pytest.mark.parametrize("profile_name", list(_PROFILES))
+def test_record_with_profile(benchmark: t.Any, tmp_path: Path, profile_name: str) -> None:
+    extended_results = _extended_results()
+    counter = itertools.count()
+
+    def record() -> a121.H5WriteStatistics:
+        with a121.H5Recorder(
+            tmp_path / f"{next(counter)}.h5", recording_profile=_PROFILES[profile_name]
+        ) as recorder:
+            recorder._start(
+                client_info=a121.ClientInfo._from_open(mock=True),
+                server_info=a121.ServerInfo(
+                    rss_version="a121-v1.0.0",
+                    sensor_count=1,
+                    ticks_per_second=1000000,
+                    sensor_infos={1: SensorInfo(connected=True)},
+                    hardware_name="xm125",
+                ),
+            )
+            recorder._start_session(
+                config=a121.SessionConfig(
+                    a121.SensorConfig(sweeps_per_frame=_SWEEPS_PER_FRAME, num_points=_NUM_POINTS)
+                ),
+                metadata=_extended_metadata(),
+            )
+            for result in extended_results:
+                recorder._sample(result)
+
+        return recorder.write_statistics
+
+    statistics = benchmark(record)
+
+    assert statistics.num_frames == _NUM_FRAMES
+    benchmark.extra_info["write_throughput_bytes_per_s"] = statistics.throughput
+    benchmark.extra_info["file_size_bytes"] = statistics.file_size
@@ -0,0 +1,85 @@
+# Copyright (c) Acconeer AB, 2024
+# All rights reserved
+from __future__ import annotations
+
+import typing as t
+
+import attrs
+import pytest
+
+from acconeer.exptool import a121
+from acconeer.exptool.a121._core.communication import MockClient
+from acconeer.exptool.a121.algo import presence, sparse_iq
+
+
+pytest.importorskip("pytest_benchmark")
+
+_NUM_FRAMES = 20
+
+
+@pytest.fixture(
+    scope="module",
+    params=[(4, 40), (16, 160), (64, 400)],
+    ids=lambda p: f"sweeps_per_frame={p[0]}-num_points={p[1]}",
+)
+def sensor_config_and_results(
+    request: t.Any,
+) -> t.Tuple[a121.SensorConfig, a121.Metadata, t.List[a121.Result]]:
+    """Synthetic frames of the mock client, generated without its rate limiting"""
+    sweeps_per_frame, num_points = request.param
+    sensor_config = a121.SensorConfig(
+        sweeps_per_frame=sweeps_per_frame,
+        num_points=num_points,
+        step_length=1,
+        frame_rate=10.0,
+    )
+    client = MockClient()
+    metadata = client._sensor_config_to_metadata(sensor_config, sensor_config.frame_rate)
+    results = [client._sensor_config_to_result(1, sensor_config) for _ in range(_NUM_FRAMES)]
+    return sensor_config, metadata, results
+
+
+@pytest.mark.benchmark(group="mock_client_frames")
+def test_frame_conversion(benchmark: t.Any, sensor_config_and_results: t.Any) -> None:
+    _, _, results = sensor_config_and_results
+
+    def convert() -> None:
+        for result in results:
+            # Converted frames are cached in the result, so the conversion is done on a copy
+            attrs.evolve(result).frame
+
+    benchmark(convert)
+
+
+@pytest.mark.benchmark(group="mock_client_frames")
+def test_presence_process(benchmark: t.Any, sensor_config_and_results: t.Any) -> None:
+    sensor_config, metadata, results = sensor_config_and_results
+
+    def setup() -> t.Tuple[t.Tuple[t.Any], t.Dict[str, t.Any]]:
+        processor = presence.Processor(
+            sensor_config=sensor_config,
+            metadata=metadata,
+            processor_config=presence.ProcessorConfig(),
+        )
+        return (processor,), {}
+
+    def process(processor: presence.Processor) -> None:
+        for result in results:
+            processor.process(result)
+
+    benchmark.pedantic(process, setup=setup, rounds=10)
+
+
+@pytest.mark.benchmark(group="mock_client_frames")
+def test_sparse_iq_process(benchmark: t.Any, sensor_config_and_results: t.Any) -> None:
+    sensor_config, _, results = sensor_config_and_results
+    processor = sparse_iq.Processor(
+        session_config=a121.SessionConfig(sensor_config),
+        processor_config=sparse_iq.ProcessorConfig(),
+    )
+
+    def process() -> None:
+        for result in results:
+            processor.process([{1: result}])
+
+    benchmark(process)
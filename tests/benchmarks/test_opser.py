@@ -0,0 +1,123 @@
+# Copyright (c) Acconeer AB, 2024
+# All rights reserved
+from __future__ import annotations
+
+import typing as t
+from pathlib import Path
+
+import attrs
+import h5py
+import numpy as np
+import numpy.typing as npt
+import pytest
+
+from acconeer.exptool import a121, opser
+from acconeer.exptool.a121.algo import distance
+from acconeer.exptool.a121.algo.distance import _detector as distance_detector
+
+
+pytest.importorskip("pytest_benchmark")
+
+opser.register_json_presentable(a121.SessionConfig)
+
+
+NUM_ELEMENTS = 1000
+
+
+@attrs.frozen
+class _Result:
+    sweeps: npt.NDArray[np.complex_]
+    distances: npt.NDArray[np.float_]
+    score: float
+    detected: bool
+
+
+@pytest.fixture
+def results() -> t.List[_Result]:
+    rng = np.random.default_rng(0)
+    return [
+        _Result(
+            sweeps=rng.standard_normal((8, 40)) + 1j * rng.standard_normal((8, 40)),
+            distances=rng.standard_normal(4),
+            score=float(i),
+            detected=i % 2 == 0,
+        )
+        for i in range(NUM_ELEMENTS)
+    ]
+
+
+@pytest.mark.benchmark(group="opser")
+def test_serialize_list_of_attrs(
+    benchmark: t.Any, results: t.List[_Result], tmp_path: Path
+) -> None:
+    def serialize() -> None:
+        with h5py.File(tmp_path / "results.h5", "w") as f:
+            opser.serialize(results, f, override_type=t.List[_Result])
+
+    benchmark(serialize)
+
+
+@pytest.mark.benchmark(group="opser")
+def test_deserialize_list_of_attrs(
+    benchmark: t.Any, results: t.List[_Result], tmp_path: Path
+) -> None:
+    path = tmp_path / "results.h5"
+    with h5py.File(path, "w") as f:
+        opser.serialize(results, f, override_type=t.List[_Result])
+
+    def deserialize() -> t.Any:
+        with h5py.File(path, "r") as f:
+            return opser.deserialize(f, t.List[_Result])
+
+    assert len(benchmark(deserialize)) == NUM_ELEMENTS
+
+
+@pytest.fixture
+def detector_context() -> distance.DetectorContext:
+    rng = np.random.default_rng(0)
+    return distance.DetectorContext(
+        single_sensor_contexts={
+            sensor_id: distance_detector.SingleSensorContext(
+                loopback_peak_location_m=0.1,
+                direct_leakage=rng.standard_normal(40) + 1j * rng.standard_normal(40),
+                phase_jitter_comp_reference=rng.standard_normal(4),
+                recorded_thresholds_mean_sweep=[rng.standard_normal(40) for _ in range(3)],
+                recorded_thresholds_noise_std=[
+                    [rng.standard_normal(40) for _ in range(3)] for _ in range(3)
+                ],
+                bg_noise_std=[[1.0, 2.0] for _ in range(3)],
+                session_config_used_during_calibration=a121.SessionConfig(),
+                reference_temperature=25,
+                sensor_calibration=a121.SensorCalibration(temperature=25, data="calibration"),
+                extra_context=distance_detector.SingleSensorExtraContext(),
+            )
+            for sensor_id in [1, 2]
+        }
+    )
+
+
+@pytest.mark.benchmark(group="opser_detector_context")
+def test_serialize_detector_context(
+    benchmark: t.Any, detector_context: distance.DetectorContext
+) -> None:
+    with h5py.File("context.h5", "w", driver="core", backing_store=False) as f:
+
+        def serialize() -> None:
+            for key in list(f.keys()):
+                del f[key]
+
+            opser.serialize(detector_context, f)
+
+        benchmark(serialize)
+
+
+@pytest.mark.benchmark(group="opser_detector_context")
+def test_deserialize_detector_context(
+    benchmark: t.Any, detector_context: distance.DetectorContext
+) -> None:
+    with h5py.File("context.h5", "w", driver="core", backing_store=False) as f:
+        opser.serialize(detector_context, f)
+
+        loaded = benchmark(opser.deserialize, f, distance.DetectorContext)
+
+    assert loaded == detector_context
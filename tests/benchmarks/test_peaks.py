@@ -0,0 +1,57 @@
+# Copyright (c) Acconeer AB, 2024
+# All rights reserved
+from __future__ import annotations
+
+import typing as t
+
+import numpy as np
+import numpy.typing as npt
+import pytest
+
+from acconeer.exptool.a121.algo import (
+    _utils,
+    find_peaks,
+    find_peaks_batch,
+    interpolate_peaks_batch,
+)
+
+
+pytest.importorskip("pytest_benchmark")
+
+_NUM_FRAMES = 100
+_NUM_POINTS = 300
+
+
+@pytest.fixture
+def abs_sweeps_and_threshold() -> t.Tuple[npt.NDArray[np.float_], npt.NDArray[np.float_]]:
+    rng = np.random.default_rng(0)
+    abs_sweeps = np.abs(rng.normal(0, 100, (_NUM_FRAMES, _NUM_POINTS)))
+    threshold = np.full(_NUM_POINTS, 100.0)
+    threshold[:5] = np.nan
+    threshold[-5:] = np.nan
+    return abs_sweeps, threshold
+
+
+@pytest.mark.benchmark(group="find_peaks")
+def test_find_peaks_sequential(benchmark: t.Any, abs_sweeps_and_threshold: t.Any) -> None:
+    abs_sweeps, threshold = abs_sweeps_and_threshold
+    benchmark(lambda: [_utils._find_peaks_sequential(s, threshold) for s in abs_sweeps])
+
+
+@pytest.mark.benchmark(group="find_peaks")
+def test_find_peaks_per_frame(benchmark: t.Any, abs_sweeps_and_threshold: t.Any) -> None:
+    abs_sweeps, threshold = abs_sweeps_and_threshold
+    benchmark(lambda: [find_peaks(s, threshold) for s in abs_sweeps])
+
+
+@pytest.mark.benchmark(group="find_peaks")
+def test_find_and_interpolate_peaks_batch(
+    benchmark: t.Any, abs_sweeps_and_threshold: t.Any
+) -> None:
+    abs_sweeps, threshold = abs_sweeps_and_threshold
+
+    def find_and_interpolate() -> t.Any:
+        frame_idxs, peak_idxs = find_peaks_batch(abs_sweeps, threshold)
+        return interpolate_peaks_batch(abs_sweeps, frame_idxs, peak_idxs, 0, 1, 0.0025)
+
+    benchmark(find_and_interpolate)
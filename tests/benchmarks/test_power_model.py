@@ -0,0 +1,64 @@
+# Copyright (c) Acconeer AB, 2024
+# All rights reserved
+from __future__ import annotations
+
+import typing as t
+
+import numpy as np
+import pytest
+
+from acconeer.exptool import a121
+from acconeer.exptool.a121.model import power
+
+
+pytest.importorskip("pytest_benchmark")
+
+# Like the power consumption vs rate plot of the resource tab, with its tolerance
+UPDATE_RATES = np.concatenate([np.arange(1, 100) / 100, 1 + np.arange(90) / 10, np.arange(10, 30)])
+INTER_FRAME_IDLE_STATES = [a121.IdleState.READY, a121.IdleState.SLEEP, a121.IdleState.DEEP_SLEEP]
+LOWER_IDLE_STATES = [power.Sensor.IdleState.HIBERNATE, power.Sensor.IdleState.OFF]
+
+
+def _session_config(
+    update_rate: float, inter_frame_idle_state: a121.IdleState = a121.IdleState.DEEP_SLEEP
+) -> a121.SessionConfig:
+    return a121.SessionConfig(
+        a121.SensorConfig(
+            start_point=80,
+            num_points=160,
+            sweeps_per_frame=32,
+            inter_frame_idle_state=inter_frame_idle_state,
+        ),
+        update_rate=update_rate,
+    )
+
+
+@pytest.mark.benchmark(group="power_vs_rate")
+def test_converged_average_current_per_rate(benchmark: t.Any) -> None:
+    def power_curves() -> None:
+        for update_rate in UPDATE_RATES:
+            for inter_frame_idle_state in INTER_FRAME_IDLE_STATES:
+                power.converged_average_current(
+                    _session_config(update_rate, inter_frame_idle_state),
+                    None,
+                    absolute_tolerance=1e-3,
+                )
+            for lower_idle_state in LOWER_IDLE_STATES:
+                power.converged_average_current(
+                    _session_config(update_rate), lower_idle_state, absolute_tolerance=1e-3
+                )
+
+    benchmark.pedantic(power_curves, rounds=1)
+
+
+@pytest.mark.benchmark(group="power_vs_rate")
+def test_average_current_vs_rate(benchmark: t.Any) -> None:
+    def power_curves() -> None:
+        for inter_frame_idle_state in INTER_FRAME_IDLE_STATES:
+            power.average_current_vs_rate(
+                _session_config(1.0, inter_frame_idle_state), None, UPDATE_RATES
+            )
+        for lower_idle_state in LOWER_IDLE_STATES:
+            power.average_current_vs_rate(_session_config(1.0), lower_idle_state, UPDATE_RATES)
+
+    benchmark(power_curves)
@@ -0,0 +1,83 @@
+# Copyright (c) Acconeer AB, 2024
+# All rights reserved
+from __future__ import annotations
+
+import importlib.resources
+import typing as t
+
+import h5py
+import pytest
+
+from acconeer.exptool import a121
+
+from tests.processing.a121 import (
+    breathing_test,
+    data_files,
+    distance_test,
+    hand_motion_test,
+    presence_test,
+    smart_presence_test,
+    surface_velocity_test,
+    tank_level_test,
+    touchless_button_test,
+    vibration_test,
+    waste_level_test,
+)
+
+
+pytest.importorskip("pytest_benchmark")
+
+_ROUNDS = 3
+
+AlgorithmFactory = t.Callable[[a121.H5Record], t.Any]
+
+
+@pytest.mark.benchmark(group="algorithm_recorded_data")
+@pytest.mark.parametrize(
+    ("algorithm_factory", "resource_name"),
+    [
+        (breathing_test.breathing_controller, "breathing-sitting.h5"),
+        (distance_test.distance_processor, "input.h5"),
+        (
+            distance_test.distance_detector,
+            "input-distance-detector-5_to_200_cm_close_range_cancellation_disabled.h5",
+        ),
+        (hand_motion_test.hand_motion_app, "hand-motion-default.h5"),
+        (presence_test.presence_default, "input-presence-default.h5"),
+        (smart_presence_test.smart_presence_controller, "smart_presence.h5"),
+        (surface_velocity_test.surface_velocity_controller, "input_surface_velocity_default.h5"),
+        (tank_level_test.tank_level_controller, "small_tank.h5"),
+        (touchless_button_test.touchless_button_wrapper, "input-touchless_button_default.h5"),
+        (vibration_test.vibration_controller, "vibration.h5"),
+        (waste_level_test.waste_level_processor, "input-waste-level-25-percent.h5"),
+    ],
+    ids=lambda param: getattr(param, "__name__", param),
+)
+def test_process_recorded_data(
+    benchmark: t.Any, algorithm_factory: AlgorithmFactory, resource_name: str
+) -> None:
+    """Processes all frames of a recording, as in tests/processing, in a fresh algorithm per round
+
+    The results are read from file beforehand for processors. Detectors, apps and
+    controllers replay the recording themselves, which is included in the timing.
+    """
+    with importlib.resources.path(data_files.recorded_data, resource_name) as path:
+        with h5py.File(path) as f:
+            record = a121.H5Record(f)
+            num_frames = sum(record.session(idx).num_frames for idx in range(record.num_sessions))
+            # Only processors, which take single-sensor results, need the results up front
+            is_single_sensor = record.num_sessions == 1 and not record.session_config.extended
+            results = list(record.results) if is_single_sensor else []
+
+            def setup() -> t.Tuple[t.Tuple[t.Any], t.Dict[str, t.Any]]:
+                return (algorithm_factory(record),), {}
+
+            def process(algorithm: t.Any) -> None:
+                if hasattr(algorithm, "process"):
+                    for result in results:
+                        algorithm.process(result)
+                else:
+                    for _ in range(num_frames):
+                        algorithm.get_next()
+
+            benchmark.pedantic(process, setup=setup, rounds=_ROUNDS)
@@ -0,0 +1,79 @@
+# Copyright (c) Acconeer AB, 2024
+# All rights reserved
+from __future__ import annotations
+
+import typing as t
+
+import numpy as np
+import numpy.typing as npt
+import pytest
+
+from acconeer.exptool import a121
+from acconeer.exptool._core.int_16_complex import INT_16_COMPLEX
+from acconeer.exptool.a121._core.communication.exploration_protocol.messages import (
+    ResultMessage,
+)
+
+
+pytest.importorskip("pytest_benchmark")
+
+
+def _copying_divide_frame_blob(
+    frame_blob: bytes, extended_metadata: list[dict[int, a121.Metadata]]
+) -> list[dict[int, npt.NDArray[t.Any]]]:
+    """The decode path used before frames were created as views into the payload"""
+    start = 0
+    result = []
+    for metadata_group in extended_metadata:
+        result_group = {}
+        result.append(result_group)
+        for sensor_id, metadata in metadata_group.items():
+            end = start + metadata.frame_data_length * 4
+            np_frame = np.frombuffer(frame_blob[start:end], dtype=INT_16_COMPLEX)
+            result_group[sensor_id] = np.resize(np_frame, metadata.frame_shape)
+            start = end
+    return result
+
+
+def _metadata(sweeps_per_frame: int, num_points: int) -> a121.Metadata:
+    return a121.Metadata(
+        frame_data_length=sweeps_per_frame * num_points,
+        sweep_data_length=num_points,
+        subsweep_data_offset=np.array([0]),
+        subsweep_data_length=np.array([num_points]),
+        calibration_temperature=0,
+        tick_period=0,
+        base_step_length_m=0,
+        max_sweep_rate=0,
+        high_speed_mode=False,
+    )
+
+
+@pytest.fixture(
+    params=[(1, 1, 100), (4, 16, 200), (2, 64, 2000)], ids=lambda p: "x".join(map(str, p))
+)
+def blob_and_metadata(request: t.Any) -> tuple[bytearray, list[dict[int, a121.Metadata]]]:
+    num_sensors, sweeps_per_frame, num_points = request.param
+    extended_metadata = [
+        {
+            sensor_id: _metadata(sweeps_per_frame, num_points)
+            for sensor_id in range(1, num_sensors + 1)
+        }
+    ]
+    num_bytes = num_sensors * sweeps_per_frame * num_points * INT_16_COMPLEX.itemsize
+    return bytearray(np.random.default_rng(0).bytes(num_bytes)), extended_metadata
+
+
+@pytest.mark.benchmark(group="result_message_decode")
+def test_decode_copying(benchmark: t.Any, blob_and_metadata: t.Any) -> None:
+    benchmark(_copying_divide_frame_blob, *blob_and_metadata)
+
+
+@pytest.mark.benchmark(group="result_message_decode")
+def test_decode_zero_copy(benchmark: t.Any, blob_and_metadata: t.Any) -> None:
+    frames = benchmark(ResultMessage._divide_frame_blob, *blob_and_metadata)
+    reference = _copying_divide_frame_blob(*blob_and_metadata)
+
+    for group, ref_group in zip(frames, reference):
+        for sensor_id, frame in group.items():
+            np.testing.assert_array_equal(frame, ref_group[sensor_id])
@@ -0,0 +1,44 @@
+# Copyright (c) Acconeer AB, 2024
+# All rights reserved
+from __future__ import annotations
+
+import typing as t
+
+import numpy as np
+import numpy.typing as npt
+import pytest
+
+from acconeer.exptool.a121._core.communication.exploration_client import TickUnwrapper
+
+
+pytest.importorskip("pytest_benchmark")
+
+_NUM_FRAMES = 10000
+
+
+@pytest.fixture(params=[1, 4], ids=lambda n: f"num_entries={n}")
+def wrapped_ticks(request: t.Any) -> npt.NDArray[np.int64]:
+    """Ticks of frames at 1 kHz that wrap a few times, with slightly shuffled entries"""
+    rng = np.random.default_rng(0)
+    num_entries = request.param
+    ticks = np.arange(_NUM_FRAMES, dtype=np.int64)[:, None] * 1_500_000 + rng.integers(
+        0, 100, (_NUM_FRAMES, num_entries)
+    )
+    return ticks % 2**32
+
+
+@pytest.mark.benchmark(group="tick_unwrapper")
+def test_unwrap_per_frame(benchmark: t.Any, wrapped_ticks: npt.NDArray[np.int64]) -> None:
+    ticks_per_frame = wrapped_ticks.tolist()
+
+    def unwrap() -> None:
+        unwrapper = TickUnwrapper()
+        for ticks in ticks_per_frame:
+            unwrapper.unwrap_frame(ticks)
+
+    benchmark(unwrap)
+
+
+@pytest.mark.benchmark(group="tick_unwrapper")
+def test_unwrap_batch(benchmark: t.Any, wrapped_ticks: npt.NDArray[np.int64]) -> None:
+    benchmark(lambda: TickUnwrapper().unwrap(wrapped_ticks))
@@ -0,0 +1,107 @@
+# Copyright (c) Acconeer AB, 2024
+# All rights reserved
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from acconeer.exptool import a121
+from acconeer.exptool._core.communication import ClientError
+
+
+@pytest.fixture
+def open_client(worker_tcp_port: int, a121_exploration_server: None):
+    def open_client() -> asyncio.Future[a121.AsyncExplorationClient]:
+        return a121.AsyncExplorationClient.open(ip_address="localhost", tcp_port=worker_tcp_port)
+
+    return open_client
+
+
+def test_can_setup_start_and_stop_session(open_client):
+    async def run() -> None:
+        async with await open_client() as client:
+            assert client.connected
+
+            metadata = await client.setup_session(a121.SensorConfig())
+            assert isinstance(metadata, a121.Metadata)
+            assert client.session_is_setup
+
+            await client.start_session()
+            result = await client.get_next()
+            assert isinstance(result, a121.Result)
+
+            await client.stop_session()
+            assert not client.session_is_started
+
+        assert not client.connected
+
+    asyncio.run(run())
+
+
+def test_results_are_yielded_until_session_is_stopped(open_client):
+    async def run() -> list[a121.Result]:
+        async with await open_client() as client:
+            await client.setup_session(a121.SensorConfig())
+            await client.start_session()
+
+            results = []
+            async for result in client.results():
+                results.append(result)
+                if len(results) == 5:
+                    await client.stop_session()
+
+            return results
+
+    results = asyncio.run(run())
+
+    assert len(results) == 5
+    ticks = [result.tick for result in results]
+    assert all(b > a for a, b in zip(ticks, ticks[1:]))
+
+
+def test_session_can_be_stopped_from_another_task(open_client):
+    async def run() -> int:
+        async with await open_client() as client:
+            await client.setup_session(a121.SensorConfig())
+            await client.start_session()
+
+            num_results = 0
+
+            async def consume() -> None:
+                nonlocal num_results
+                async for _ in client.results():
+                    num_results += 1
+
+            consumer = asyncio.ensure_future(consume())
+            await asyncio.sleep(0.5)
+            await client.stop_session()
+            await asyncio.wait_for(consumer, timeout=5)
+
+            return num_results
+
+    assert asyncio.run(run()) > 0
+
+
+def test_many_clients_can_be_served_from_one_event_loop(open_client):
+    async def get_results(num_results: int) -> list[a121.Result]:
+        async with await open_client() as client:
+            await client.setup_session(a121.SensorConfig())
+            await client.start_session()
+            return [await client.get_next() for _ in range(num_results)]
+
+    async def run() -> list[list[a121.Result]]:
+        return await asyncio.gather(*(get_results(3) for _ in range(3)))
+
+    assert [len(results) for results in asyncio.run(run())] == [3, 3, 3]
+
+
+def test_cannot_get_next_before_session_is_started(open_client):
+    async def run() -> None:
+        async with await open_client() as client:
+            await client.setup_session(a121.SensorConfig())
+
+            with pytest.raises(ClientError):
+                await client.get_next()
+
+    asyncio.run(run())
@@ -334,6 +334,25 @@ class TestAStartedClient(CannotPlayAroundWithRecorder):
         for result_a, result_b in zip(record.results, results):
             assert result_a == result_b
 
+    def test_can_get_next_batch(self, client):
+        stacked_results = client.get_next_batch(5)
+
+        assert len(stacked_results) == 5
+        assert stacked_results.frame.shape[0] == 5
+        assert all(
+            tick_diff > 0 for tick_diff in stacked_results.tick[1:] - stacked_results.tick[:-1]
+        )
+
+    def test_get_next_batch_records_all_results(
+        self, client_with_recorder: a121.Client, tmp_h5_file_path
+    ):
+        stacked_results = client_with_recorder.get_next_batch(5)
+        client_with_recorder.stop_session()
+        record = a121.load_record(tmp_h5_file_path)
+
+        for i, result in enumerate(record.results):
+            assert result == stacked_results[i]
+
     def test_can_stop(self, client):
         client.stop_session()
         assert not client.session_is_started
@@ -415,3 +434,20 @@ class TestADisconnectedClient(TestAClosedClient):
         yield c
         if c.connected:
             c.close()
+
+
+def test_background_reader_delivers_consecutive_results(
+    worker_tcp_port: int, a121_exploration_server: None
+):
+    with a121.Client.open(ip_address="localhost", tcp_port=worker_tcp_port) as client:
+        client.enable_background_reader(max_queue_size=10)
+        client.setup_session(a121.SessionConfig())
+        client.start_session()
+        results = [client.get_next() for _ in range(10)]
+        client.stop_session()
+
+        assert client.num_dropped_messages == 0
+        assert 1 <= client.max_queue_depth <= 10
+
+    ticks = [result.tick for result in results]
+    assert all(b > a for a, b in zip(ticks, ticks[1:]))
@@ -0,0 +1,121 @@
+# Copyright (c) Acconeer AB, 2024
+# All rights reserved
+
+from __future__ import annotations
+
+import typing as t
+
+import numpy as np
+import pytest
+
+from acconeer.exptool import a121
+from acconeer.exptool.a121.model import power
+
+
+_mA = 1e-3
+
+ALGORITHMS = [power.algo.SparseIq(), power.algo.Presence(), power.algo.Distance()]
+LOWER_IDLE_STATES = [None, power.Sensor.IdleState.HIBERNATE, power.Sensor.IdleState.OFF]
+
+
+def _session_config(
+    update_rate: t.Optional[float],
+    inter_frame_idle_state: a121.IdleState = a121.IdleState.DEEP_SLEEP,
+) -> a121.SessionConfig:
+    return a121.SessionConfig(
+        a121.SensorConfig(sweeps_per_frame=8, inter_frame_idle_state=inter_frame_idle_state),
+        update_rate=update_rate,
+    )
+
+
+@pytest.mark.parametrize("algorithm", ALGORITHMS, ids=lambda a: type(a).__name__)
+@pytest.mark.parametrize("lower_idle_state", LOWER_IDLE_STATES)
+@pytest.mark.parametrize("inter_frame_idle_state", list(a121.IdleState))
+@pytest.mark.parametrize("update_rate", [0.5, 10.0, 2000.0, None])
+def test_steady_state_average_current_is_what_the_simulation_converges_to(
+    algorithm: power.algo.Algorithm,
+    lower_idle_state: t.Optional[power.Sensor.LowerIdleState],
+    inter_frame_idle_state: a121.IdleState,
+    update_rate: t.Optional[float],
+) -> None:
+    config = _session_config(update_rate, inter_frame_idle_state)
+
+    converged = power.converged_average_current(
+        config, lower_idle_state, absolute_tolerance=1e-3 * _mA, algorithm=algorithm
+    )
+    steady_state = power.steady_state_average_current(
+        config, lower_idle_state, algorithm=algorithm
+    )
+
+    assert steady_state == pytest.approx(converged, abs=1e-3 * _mA)
+
+
+@pytest.mark.parametrize("algorithm", ALGORITHMS, ids=lambda a: type(a).__name__)
+@pytest.mark.parametrize("lower_idle_state", LOWER_IDLE_STATES)
+def test_average_current_vs_rate_equals_steady_state_average_current_per_rate(
+    algorithm: power.algo.Algorithm,
+    lower_idle_state: t.Optional[power.Sensor.LowerIdleState],
+) -> None:
+    rates = [0.01, 0.5, 1.0, 10.0, 100.0, 1000.0, 10000.0]
+
+    currents = power.average_current_vs_rate(
+        _session_config(10.0), lower_idle_state, rates, algorithm=algorithm
+    )
+
+    assert currents.shape == (len(rates),)
+    for rate, current in zip(rates, currents):
+        assert current == pytest.approx(
+            power.steady_state_average_current(
+                _session_config(rate), lower_idle_state, algorithm=algorithm
+            )
+        )
+
+
+def test_average_current_vs_rate_is_the_group_active_current_above_the_max_rate() -> None:
+    active = power.group_active(_session_config(None), None)
+
+    currents = power.average_current_vs_rate(
+        _session_config(None), None, [0.5 / active.duration, 2 / active.duration]
+    )
+
+    assert currents[0] < active.average_current
+    assert currents[1] == pytest.approx(active.average_current)
+
+
+def test_average_current_vs_rate_requires_positive_rates() -> None:
+    with pytest.raises(ValueError):
+        power.average_current_vs_rate(_session_config(10.0), None, [1.0, 0.0])
+
+
+def test_group_active_is_memoized_per_sensor_configs() -> None:
+    algorithm = power.algo.SparseIq()
+
+    region = power.group_active(_session_config(1.0), None, algorithm)
+
+    assert power.group_active(_session_config(100.0), None, algorithm) is region
+    assert power.group_active(_session_config(1.0), None, power.algo.SparseIq()) is not region
+    assert (
+        power.group_active(_session_config(1.0, a121.IdleState.SLEEP), None, algorithm)
+        is not region
+    )
+    assert (
+        power.group_active(_session_config(1.0), power.Sensor.IdleState.OFF, algorithm)
+        is not region
+    )
+
+
+def test_composite_region_duration_and_average_current() -> None:
+    regions = (
+        power.SimpleRegion(1.0, 2.0),
+        power.CompositeRegion((power.SimpleRegion(4.0, 1.0), power.SimpleRegion(1.0, 1.0))),
+    )
+    region = power.CompositeRegion(regions)
+
+    assert region.duration == 4.0
+    assert region.charge == 7.0
+    assert region.average_current == 1.75
+    assert power.CompositeRegion(()).average_current == 0.0
+    np.testing.assert_allclose(
+        region.average_current,
+        sum(r.average_current * r.duration for r in region.flat_iter()) / region.duration,
+    )
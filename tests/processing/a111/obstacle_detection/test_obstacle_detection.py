@@ -281,6 +281,67 @@ def test_preloaded_bg_params(parameter_set):
     assert compare_dicts(actual, expected)
 
 
+@pytest.mark.parametrize(
+    "parameter_set",
+    [{}, {"fft_length": 12, "static_freq": 0.0, "static_grad": 0.0, "close_dist": 0.0}],
+)
+def test_threshold_map_equals_variable_thresholding(parameter_set):
+    input_record = et.a111.recording.load(HERE / "input.h5")
+
+    processing_config = ProcessingConfiguration()
+    for k, v in parameter_set.items():
+        setattr(processing_config, k, v)
+
+    processor = Processor(
+        input_record.sensor_config,
+        processing_config,
+        input_record.session_info,
+    )
+
+    for dist in range(processor.len_range):
+        for freq in range(processor.fft_len):
+            assert processor.threshold_map[dist, freq] == processor.variable_thresholding(
+                freq, dist, processor.threshold, processor.static_threshold
+            )
+
+
+@pytest.mark.parametrize(
+    ("pwl_dist", "pwl_amp"),
+    [
+        ([-3.5, 120.25], [2.0, 1.0]),
+        ([10.0, 10.0, 3.0, 50.0, 0.0], [1.0, 5.0, 2.0, 3.0, 4.0]),
+        ([0.0, 0.0, 0.0, 0.0, 0.0], [0.0, 0.0, 0.0, 0.0, 0.0]),
+        ([400.0, 500.0], [1.0, 2.0]),
+    ],
+)
+def test_pwl_segments(pwl_dist, pwl_amp):
+    input_record = et.a111.recording.load(HERE / "input.h5")
+    processor = Processor(
+        input_record.sensor_config,
+        ProcessingConfiguration(),
+        input_record.session_info,
+    )
+    dist_len = 200
+
+    # The segments, as started one distance at a time
+    expected = np.empty(dist_len)
+    x_start, x_stop, y_start, y_stop = 0, pwl_dist[0], pwl_amp[0], pwl_amp[0]
+    segment_stop = 0
+    for dist_index in range(dist_len):
+        if x_stop < dist_index:
+            x_start, y_start = x_stop, y_stop
+            segment_stop += 1
+            if segment_stop < len(pwl_dist):
+                x_stop, y_stop = pwl_dist[segment_stop], pwl_amp[segment_stop]
+            else:
+                x_stop = dist_len - 1
+        expected[dist_index] = processor.remap(dist_index, x_start, x_stop, y_start, y_stop)
+
+    actual = processor.pwl_segments(dist_len, pwl_dist, pwl_amp, len(pwl_dist))
+
+    np.testing.assert_array_equal(actual, expected)
+
+
 if __name__ == "__main__":
     import argparse
 
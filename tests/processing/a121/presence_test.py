@@ -1,6 +1,8 @@
 # Copyright (c) Acconeer AB, 2022-2024
 # All rights reserved
 
+from __future__ import annotations
+
 import typing as t
 
 import attrs
@@ -51,6 +53,13 @@ class ProcessorWrapper:
     def process(self, result: a121.Result) -> ProcessorResultSlice:
         return ProcessorResultSlice.from_processor_result(self.processor.process(result))
 
+    def process_batch(self, stacked_results: a121.StackedResults) -> t.List[ProcessorResultSlice]:
+        batch_result = self.processor.process_batch(stacked_results)
+        return [
+            ProcessorResultSlice.from_processor_result(batch_result[i])
+            for i in range(len(batch_result))
+        ]
+
 
 def presence_default(record: a121.H5Record) -> ProcessorWrapper:
     return ProcessorWrapper(
@@ -103,3 +112,15 @@ def presence_medium_range_phase_boost_no_timeout(record: a121.H5Record) -> Proce
             metadata=utils.unextend(record.extended_metadata),
         )
     )
+
+
+def presence_medium_range_phase_boost(record: a121.H5Record) -> ProcessorWrapper:
+    processor_config = presence.Detector._get_processor_config(get_medium_range_config())
+    processor_config.inter_phase_boost = True
+    return ProcessorWrapper(
+        presence.Processor(
+            sensor_config=record.session_config.sensor_config,
+            processor_config=processor_config,
+            metadata=utils.unextend(record.extended_metadata),
+        )
+    )
@@ -2,15 +2,21 @@
 # All rights reserved
 from __future__ import annotations
 
+import concurrent.futures
 import contextlib
 import importlib.resources
+import threading
 import typing as t
 from pathlib import Path
 
+import attrs
 import h5py
+import numpy as np
 import pytest
 
 from acconeer.exptool import a121, opser
+from acconeer.exptool.a121.algo import presence, reprocessing
+from acconeer.exptool.a121.algo.reprocessing import _cli as reprocessing_cli
 
 from .a121 import (
     breathing_test,
@@ -290,3 +296,242 @@ def test_input_output(
 
     for i, (expected_result, actual_result) in enumerate(zip(expected_results, actual_results)):
         assert expected_result == actual_result, f"failed at {i}"
+
+
+@pytest.mark.parametrize(
+    ("algorithm_factory", "resource_name"),
+    [
+        (presence_test.presence_default, "input-frame_rate_10Hz-sweeps_per_frame_4.h5"),
+        (presence_test.presence_default, "input-presence-default.h5"),
+        (presence_test.presence_short_range, "input-presence-short_range.h5"),
+        (presence_test.presence_long_range, "input-presence-long_range.h5"),
+        (presence_test.presence_low_power, "input-presence-low_power.h5"),
+        (
+            presence_test.presence_medium_range_phase_boost_no_timeout,
+            "input-presence-medium_range_phase_boost_no_timeout.h5",
+        ),
+    ],
+)
+def test_presence_batch_processing(
+    algorithm_factory: AlgorithmFactory, input_path: Path, output_path: Path
+) -> None:
+    with h5py.File(input_path) as f:
+        r = a121.H5Record(f)
+        actual_results = algorithm_factory(r).process_batch(r.stacked_results)
+
+    with h5py.File(output_path, "r") as out:
+        expected_results = opser.deserialize(out, t.List[presence_test.ProcessorResultSlice])
+
+    assert len(expected_results) == len(actual_results)
+
+    for i, (expected_result, actual_result) in enumerate(zip(expected_results, actual_results)):
+        assert expected_result == actual_result, f"failed at {i}"
+
+
+@pytest.mark.parametrize(
+    "algorithm_factory",
+    [
+        presence_test.presence_default,
+        presence_test.presence_medium_range_phase_boost,
+        presence_test.presence_medium_range_phase_boost_no_timeout,
+    ],
+)
+@pytest.mark.parametrize(
+    "resource_name",
+    ["input-presence-default.h5", "input-presence-medium_range_phase_boost_no_timeout.h5"],
+)
+def test_presence_batch_processing_equals_process(
+    algorithm_factory: AlgorithmFactory, input_path: Path
+) -> None:
+    with h5py.File(input_path) as f:
+        r = a121.H5Record(f)
+        batch_result = algorithm_factory(r).processor.process_batch(r.stacked_results)
+        processor = algorithm_factory(r).processor
+        expected_results = [processor.process(result) for result in r.results]
+
+    assert len(batch_result) == len(expected_results)
+
+    for i, expected_result in enumerate(expected_results):
+        actual_result = batch_result[i]
+        assert presence_test.ProcessorResultSlice.from_processor_result(
+            actual_result
+        ) == presence_test.ProcessorResultSlice.from_processor_result(
+            expected_result
+        ), f"failed at {i}"
+        assert actual_result.extra_result == expected_result.extra_result, f"failed at {i}"
+
+
+def test_reprocessing_to_file(tmp_path: Path) -> None:
+    resource_names = [
+        "input-presence-default.h5",
+        "input-presence-short_range.h5",
+        "input-presence-low_power.h5",
+        "vibration.h5",  # Fails, since it has no frame rate set
+    ]
+    (tmp_path / "recordings").mkdir()
+    for resource_name in resource_names:
+        with importlib.resources.path(data_files.recorded_data, resource_name) as path:
+            (tmp_path / "recordings" / resource_name).write_bytes(path.read_bytes())
+
+    jobs = reprocessing.get_jobs(reprocessing.find_recordings(tmp_path / "recordings"))
+    progress: list[int] = []
+    num_failed = reprocessing.reprocess_to_file(
+        jobs,
+        "presence",
+        tmp_path / "output.h5",
+        max_workers=2,
+        progress_callback=lambda num_completed, num_jobs, _: progress.append(num_completed),
+    )
+
+    assert num_failed == 1
+    assert progress == [1, 2, 3, 4]
+
+    algorithm_key, processor_config, job_results = reprocessing.load_reprocessed(
+        tmp_path / "output.h5"
+    )
+    assert algorithm_key == "presence"
+    assert processor_config == presence.ProcessorConfig()
+    assert [job_result.job for job_result in job_results] == jobs
+    assert [job_result.job.recording.name for job_result in job_results] == sorted(resource_names)
+
+    for job_result in job_results:
+        if job_result.job.recording.name == "vibration.h5":
+            assert job_result.error is not None
+            continue
+
+        with h5py.File(job_result.job.recording) as f:
+            r = a121.H5Record(f)
+            processor = presence.Processor(
+                sensor_config=r.session_config.sensor_config,
+                metadata=r.metadata,
+                processor_config=presence.ProcessorConfig(),
+            )
+            expected_results = [processor.process(result) for result in r.results]
+
+        assert job_result.error is None
+        assert len(job_result.results) == len(expected_results)
+        for i, (expected_result, actual_result) in enumerate(
+            zip(expected_results, job_result.results)
+        ):
+            assert presence_test.ProcessorResultSlice.from_processor_result(
+                actual_result
+            ) == presence_test.ProcessorResultSlice.from_processor_result(
+                expected_result
+            ), f"failed at {i}"
+
+
+REPROCESSING_RESOURCE_NAMES = {
+    "breathing": "breathing-sitting.h5",
+    "phase_tracking": "input-touchless_button_default.h5",
+    "presence": "input-presence-default.h5",
+    "speed": "vibration.h5",
+    "surface_velocity": "input_surface_velocity_default.h5",
+    "touchless_button": "input-touchless_button_default.h5",
+    "vibration": "vibration.h5",
+    "waste_level": "input-waste-level-full.h5",
+}
+
+
+def test_all_reprocessing_algorithms_have_a_recording() -> None:
+    assert REPROCESSING_RESOURCE_NAMES.keys() == reprocessing.ALGORITHMS.keys()
+
+
+@pytest.mark.parametrize(("algorithm_key", "resource_name"), REPROCESSING_RESOURCE_NAMES.items())
+def test_reprocessing_algorithms(
+    algorithm_key: str, resource_name: str, input_path: Path, tmp_path: Path
+) -> None:
+    algorithm = reprocessing.ALGORITHMS[algorithm_key]
+    jobs = reprocessing.get_jobs([input_path])
+
+    num_failed = reprocessing.reprocess_to_file(
+        jobs, algorithm_key, tmp_path / "output.h5", max_workers=1
+    )
+
+    assert num_failed == 0
+
+    _, processor_config, job_results = reprocessing.load_reprocessed(tmp_path / "output.h5")
+    assert processor_config == algorithm.processor_config_type()
+
+    with h5py.File(input_path) as f:
+        r = a121.H5Record(f)
+        processor = algorithm.create_processor(
+            r.session_config.sensor_config, r.metadata, processor_config
+        )
+        expected_results = [processor.process(result) for result in r.results]
+
+    (job_result,) = job_results
+    assert job_result.error is None
+    assert len(job_result.results) == len(expected_results)
+    for i, (expected_result, actual_result) in enumerate(
+        zip(expected_results, job_result.results)
+    ):
+        assert isinstance(actual_result, algorithm.result_type)
+        np.testing.assert_equal(
+            attrs.asdict(actual_result), attrs.asdict(expected_result), err_msg=f"failed at {i}"
+        )
+
+
+def test_reprocessing_keeps_a_bounded_number_of_jobs_in_flight(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    max_workers = 2
+    max_jobs_in_flight = reprocessing._reprocessing._JOBS_IN_FLIGHT_PER_WORKER * max_workers
+    first_job_may_complete = threading.Event()
+    started_job_idxs: list[int] = []
+    num_started_when_first_job_completed: list[int] = []
+
+    def reprocess_session(
+        algorithm_key: str, processor_config: t.Any, job: reprocessing.ReprocessingJob
+    ) -> reprocessing.ReprocessingJobResult:
+        started_job_idxs.append(job.session_index)
+        if job.session_index == 0:
+            first_job_may_complete.wait()
+            num_started_when_first_job_completed.append(len(started_job_idxs))
+
+        return reprocessing.ReprocessingJobResult(job, [job.session_index])
+
+    # Threads instead of processes, so that the patched reprocess_session is used
+    monkeypatch.setattr(
+        reprocessing._reprocessing.concurrent.futures,
+        "ProcessPoolExecutor",
+        concurrent.futures.ThreadPoolExecutor,
+    )
+    monkeypatch.setattr(reprocessing._reprocessing, "reprocess_session", reprocess_session)
+
+    jobs = [reprocessing.ReprocessingJob(Path("recording.h5"), idx) for idx in range(20)]
+    threading.Timer(0.2, first_job_may_complete.set).start()
+    job_results = list(reprocessing.reprocess(jobs, "presence", max_workers=max_workers))
+
+    assert [job_result.results for job_result in job_results] == [[idx] for idx in range(20)]
+    assert num_started_when_first_job_completed[0] <= max_jobs_in_flight
+
+
+def test_reprocessing_cli(tmp_path: Path) -> None:
+    with importlib.resources.path(data_files.recorded_data, "input-presence-default.h5") as path:
+        (tmp_path / "presence.h5").write_bytes(path.read_bytes())
+    (tmp_path / "junk.h5").write_bytes(b"not a recording")
+    output_path = tmp_path / "output.h5"
+
+    processor_config = presence.ProcessorConfig(intra_detection_threshold=2.0)
+    config_path = tmp_path / "config.json"
+    config_path.write_text(processor_config.to_json())
+
+    argv = [str(tmp_path), "presence", str(output_path), "-c", str(config_path), "-j", "1", "-q"]
+
+    # The junk file fails, but doesn't stop the other recordings from being reprocessed
+    assert reprocessing_cli.main(argv) == 1
+    assert reprocessing_cli.main(argv) == 1  # Output already exists
+    assert reprocessing_cli.main([*argv, "-f"]) == 1  # The output isn't searched for recordings
+
+    algorithm_key, loaded_processor_config, job_results = reprocessing.load_reprocessed(
+        output_path
+    )
+    assert algorithm_key == "presence"
+    assert loaded_processor_config == processor_config
+    assert [job_result.job.recording.name for job_result in job_results] == [
+        "junk.h5",
+        "presence.h5",
+    ]
+    assert job_results[0].error is not None
+    assert job_results[1].error is None
+    assert len(job_results[1].results) > 0
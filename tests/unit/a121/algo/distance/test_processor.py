@@ -6,6 +6,9 @@ import numpy.testing as npt
 import pytest
 
 from acconeer.exptool import a121
+from acconeer.exptool._core.int_16_complex import INT_16_COMPLEX
+from acconeer.exptool.a121._core.communication import MockClient
+from acconeer.exptool.a121._core.entities import ResultContext
 from acconeer.exptool.a121.algo import (
     distance,
     find_peaks,
@@ -255,3 +258,116 @@ def test_calc_cfar_window_length() -> None:
         profile=profile, step_length=step_length
     )
     assert actual_margin == 7
+
+
+def _stacked_results_with_peaks(
+    sensor_config: a121.SensorConfig, metadata: a121.Metadata, num_frames: int
+) -> a121.StackedResults:
+    rng = np.random.default_rng(0)
+    shape = (num_frames, sensor_config.sweeps_per_frame, metadata.sweep_data_length)
+    points = np.arange(shape[2])
+
+    envelope = np.zeros(shape[2])
+    for peak_point in rng.integers(0, shape[2], 4):
+        envelope += rng.uniform(500, 2000) * np.exp(-0.5 * ((points - peak_point) / 4) ** 2)
+
+    frame = np.zeros(shape, dtype=INT_16_COMPLEX)
+    frame["real"] = envelope + rng.normal(0, 50, shape)
+    frame["imag"] = rng.normal(0, 50, shape)
+
+    return a121.StackedResults(
+        data_saturated=np.zeros(num_frames, dtype=bool),
+        frame_delayed=np.zeros(num_frames, dtype=bool),
+        calibration_needed=np.zeros(num_frames, dtype=bool),
+        temperature=rng.integers(20, 23, num_frames),  # type: ignore[arg-type]
+        tick=np.arange(num_frames),
+        frame=frame,
+        context=ResultContext(metadata=metadata, ticks_per_second=1000000),
+    )
+
+
+@pytest.mark.parametrize(
+    ("threshold_method", "context"),
+    [
+        (distance.ThresholdMethod.CFAR, distance.ProcessorContext(bg_noise_std=[10.0, 20.0])),
+        (distance.ThresholdMethod.FIXED, distance.ProcessorContext(bg_noise_std=[10.0, 20.0])),
+        (
+            distance.ThresholdMethod.FIXED_STRENGTH,
+            distance.ProcessorContext(bg_noise_std=[10.0, 20.0]),
+        ),
+        (
+            distance.ThresholdMethod.RECORDED,
+            distance.ProcessorContext(
+                bg_noise_std=[10.0, 20.0],
+                recorded_threshold_mean_sweep=np.full(344, 50.0),
+                recorded_threshold_noise_std=[np.float_(0.1), np.float_(0.2)],
+                reference_temperature=25,
+            ),
+        ),
+    ],
+)
+def test_process_batch_equals_process(
+    threshold_method: distance.ThresholdMethod, context: distance.ProcessorContext
+) -> None:
+    sensor_config = a121.SensorConfig(
+        sweeps_per_frame=4,
+        subsweeps=[
+            a121.SubsweepConfig(
+                start_point=100, num_points=200, step_length=2, phase_enhancement=True
+            ),
+            a121.SubsweepConfig(
+                start_point=500, num_points=200, step_length=2, phase_enhancement=True
+            ),
+        ],
+    )
+    metadata = MockClient._sensor_config_to_metadata(sensor_config, None)
+    processor_config = distance.ProcessorConfig(
+        threshold_method=threshold_method, fixed_strength_threshold_value=-20.0
+    )
+    stacked_results = _stacked_results_with_peaks(sensor_config, metadata, num_frames=20)
+
+    batch_result = distance.Processor(
+        sensor_config=sensor_config,
+        metadata=metadata,
+        processor_config=processor_config,
+        context=context,
+    ).process_batch(stacked_results)
+
+    processor = distance.Processor(
+        sensor_config=sensor_config,
+        metadata=metadata,
+        processor_config=processor_config,
+        context=context,
+    )
+    assert len(batch_result) == len(stacked_results)
+    assert len(batch_result.estimated_distances) > 0
+
+    for i in range(len(stacked_results)):
+        expected = processor.process(stacked_results[i])
+        actual = batch_result[i]
+
+        assert actual.estimated_distances is not None
+        assert expected.estimated_distances is not None
+        assert actual.estimated_strengths is not None
+        assert expected.estimated_strengths is not None
+        npt.assert_allclose(actual.estimated_distances, expected.estimated_distances)
+        npt.assert_allclose(actual.estimated_strengths, expected.estimated_strengths)
+        assert actual.near_edge_status == expected.near_edge_status
+        assert actual.extra_result == expected.extra_result
+
+
+def test_process_batch_requires_distance_estimation() -> None:
+    sensor_config = a121.SensorConfig(phase_enhancement=True)
+    processor = distance.Processor(
+        sensor_config=sensor_config,
+        metadata=MockClient._sensor_config_to_metadata(sensor_config, None),
+        processor_config=distance.ProcessorConfig(
+            processor_mode=distance.ProcessorMode.RECORDED_THRESHOLD_CALIBRATION
+        ),
+        context=distance.ProcessorContext(bg_noise_std=[10.0]),
+    )
+
+    with pytest.raises(ValueError):
+        processor.process_batch(
+            _stacked_results_with_peaks(sensor_config, processor.metadata, num_frames=2)
+        )
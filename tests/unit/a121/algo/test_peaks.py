@@ -0,0 +1,184 @@
+# Copyright (c) Acconeer AB, 2024
+# All rights reserved
+
+from __future__ import annotations
+
+import typing as t
+
+import numpy as np
+import numpy.typing as npt
+import pytest
+
+from acconeer.exptool.a121.algo import (
+    find_peaks,
+    find_peaks_batch,
+    interpolate_peaks,
+    interpolate_peaks_batch,
+)
+
+
+def reference_find_peaks(
+    abs_sweep: npt.NDArray[t.Any], threshold: npt.NDArray[t.Any]
+) -> list[int]:
+    """The sequential implementation that the vectorized one replaced"""
+    found_peaks = []
+    d = 1
+    N = len(abs_sweep)
+    while d < (N - 1):
+        if np.isnan(threshold[d - 1]):
+            d += 1
+            continue
+        if np.isnan(threshold[d + 1]):
+            break
+        if abs_sweep[d] <= threshold[d]:
+            d += 2
+            continue
+        if abs_sweep[d - 1] <= threshold[d - 1]:
+            d += 1
+            continue
+        if abs_sweep[d - 1] >= abs_sweep[d]:
+            d += 1
+            continue
+        d_upper = d + 1
+        while True:
+            if (d_upper) >= (N - 1):
+                break
+            if np.isnan(threshold[d_upper]):
+                break
+            if abs_sweep[d_upper] <= threshold[d_upper]:
+                break
+            if abs_sweep[d_upper] > abs_sweep[d]:
+                break
+            elif abs_sweep[d_upper] < abs_sweep[d]:
+                found_peaks.append(int(np.argmax(abs_sweep[d:d_upper]) + d))
+                break
+            else:
+                d_upper += 1
+        d = d_upper
+    return found_peaks
+
+
+def reference_interpolate_peaks(
+    abs_sweep: npt.NDArray[t.Any],
+    peak_idxs: list[int],
+    start_point: int,
+    step_length: int,
+    step_length_m: float,
+) -> t.Tuple[list[float], list[float]]:
+    """The per-peak implementation that the vectorized one replaced"""
+    estimated_distances = []
+    estimated_amplitudes = []
+    for peak_idx in peak_idxs:
+        x = np.arange(peak_idx - 1, peak_idx + 2, 1)
+        y = abs_sweep[peak_idx - 1 : peak_idx + 2]
+        a = (x[0] * (y[2] - y[1]) + x[1] * (y[0] - y[2]) + x[2] * (y[1] - y[0])) / (
+            (x[0] - x[1]) * (x[0] - x[2]) * (x[1] - x[2])
+        )
+        b = (y[1] - y[0]) / (x[1] - x[0]) - a * (x[0] + x[1])
+        c = y[0] - a * x[0] ** 2 - b * x[0]
+        peak_loc = -b / (2 * a)
+        estimated_distances.append((start_point + peak_loc * step_length) * step_length_m)
+        estimated_amplitudes.append(a * peak_loc**2 + b * peak_loc + c)
+    return estimated_distances, estimated_amplitudes
+
+
+def random_sweeps_and_thresholds(
+    seed: int, num_frames: int, num_points: int
+) -> t.Tuple[npt.NDArray[np.float_], npt.NDArray[np.float_]]:
+    """Sweeps with plateaus, and thresholds with NaN margins and sometimes NaN inside"""
+    rng = np.random.default_rng(seed)
+
+    # Few distinct values give many plateaus
+    abs_sweeps = rng.integers(0, 6, size=(num_frames, num_points)).astype(float)
+    thresholds = rng.integers(0, 3, size=(num_frames, num_points)).astype(float)
+
+    for frame in range(num_frames):
+        start_margin = rng.integers(0, 4)
+        end_margin = rng.integers(0, 4)
+        thresholds[frame, :start_margin] = np.nan
+        thresholds[frame, num_points - end_margin :] = np.nan
+
+        if rng.random() < 0.2:
+            thresholds[frame, rng.integers(0, num_points, rng.integers(1, 3))] = np.nan
+
+        if rng.random() < 0.05:
+            abs_sweeps[frame, rng.integers(0, num_points)] = np.nan
+
+    return abs_sweeps, thresholds
+
+
+@pytest.mark.parametrize("num_points", [1, 2, 3, 4, 10, 100])
+@pytest.mark.parametrize("seed", range(5))
+def test_find_peaks_equals_reference(seed: int, num_points: int) -> None:
+    abs_sweeps, thresholds = random_sweeps_and_thresholds(seed, 200, num_points)
+
+    for abs_sweep, threshold in zip(abs_sweeps, thresholds):
+        assert find_peaks(abs_sweep, threshold) == reference_find_peaks(abs_sweep, threshold)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_find_peaks_batch_equals_reference(seed: int) -> None:
+    abs_sweeps, thresholds = random_sweeps_and_thresholds(seed, 200, 30)
+
+    frame_idxs, peak_idxs = find_peaks_batch(abs_sweeps, thresholds)
+
+    expected = [
+        (frame, peak)
+        for frame, (abs_sweep, threshold) in enumerate(zip(abs_sweeps, thresholds))
+        for peak in reference_find_peaks(abs_sweep, threshold)
+    ]
+    assert list(zip(frame_idxs.tolist(), peak_idxs.tolist())) == expected
+
+
+def test_find_peaks_batch_with_shared_threshold() -> None:
+    abs_sweeps, thresholds = random_sweeps_and_thresholds(0, 50, 30)
+    threshold = thresholds[0]
+
+    frame_idxs, peak_idxs = find_peaks_batch(abs_sweeps, threshold)
+
+    expected = [
+        (frame, peak)
+        for frame, abs_sweep in enumerate(abs_sweeps)
+        for peak in reference_find_peaks(abs_sweep, threshold)
+    ]
+    assert list(zip(frame_idxs.tolist(), peak_idxs.tolist())) == expected
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_interpolate_peaks_equals_reference(seed: int) -> None:
+    rng = np.random.default_rng(seed)
+    abs_sweeps = rng.random((20, 50)) * 1000
+
+    for abs_sweep in abs_sweeps:
+        threshold = np.full_like(abs_sweep, 200.0)
+        peak_idxs = find_peaks(abs_sweep, threshold)
+
+        actual = interpolate_peaks(abs_sweep, peak_idxs, 40, 2, 0.0025)
+        expected = reference_interpolate_peaks(abs_sweep, peak_idxs, 40, 2, 0.0025)
+
+        # The squares of the scalar loop go through libm pow, which may round differently
+        assert actual[0] == expected[0]
+        np.testing.assert_allclose(actual[1], expected[1], rtol=1e-12)
+
+
+def test_interpolate_peaks_batch_equals_reference() -> None:
+    rng = np.random.default_rng(0)
+    abs_sweeps = rng.random((20, 50)) * 1000
+
+    frame_idxs, peak_idxs = find_peaks_batch(abs_sweeps, np.full(50, 200.0))
+    distances, amplitudes = interpolate_peaks_batch(
+        abs_sweeps, frame_idxs, peak_idxs, 40, 2, 0.0025
+    )
+
+    for frame, abs_sweep in enumerate(abs_sweeps):
+        expected = reference_interpolate_peaks(
+            abs_sweep, peak_idxs[frame_idxs == frame].tolist(), 40, 2, 0.0025
+        )
+        assert distances[frame_idxs == frame].tolist() == expected[0]
+        np.testing.assert_allclose(amplitudes[frame_idxs == frame], expected[1], rtol=1e-12)
+
+
+@pytest.mark.parametrize("peak_idx", [0, 9])
+def test_interpolate_peaks_rejects_peaks_at_the_edges(peak_idx: int) -> None:
+    with pytest.raises(IndexError):
+        interpolate_peaks(np.ones(10), [peak_idx], 0, 1, 0.0025)
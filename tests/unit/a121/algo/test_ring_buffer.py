@@ -0,0 +1,77 @@
+# Copyright (c) Acconeer AB, 2024
+# All rights reserved
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from acconeer.exptool.a121.algo import RingBuffer
+
+
+def test_initial_contents() -> None:
+    buffer = RingBuffer(3, (2,), dtype=complex, fill_value=np.nan)
+
+    assert len(buffer) == buffer.capacity == 3
+    assert buffer.view().shape == (3, 2)
+    assert buffer.view().dtype == complex
+    assert np.isnan(buffer.view()).all()
+
+
+def test_capacity_must_be_positive() -> None:
+    with pytest.raises(ValueError):
+        RingBuffer(0)
+
+
+@pytest.mark.parametrize("capacity", [1, 4, 7])
+def test_append_equals_roll(capacity: int) -> None:
+    buffer = RingBuffer(capacity, (3,))
+    reference = np.zeros((capacity, 3))
+
+    for i in range(3 * capacity):
+        element = np.arange(3) + 10.0 * i
+        buffer.append(element)
+        reference = np.roll(reference, shift=-1, axis=0)
+        reference[-1] = element
+
+        np.testing.assert_array_equal(buffer.view(), reference)
+        np.testing.assert_array_equal(buffer.ordered(), reference)
+
+
+@pytest.mark.parametrize("num_elements", [0, 1, 3, 5, 6, 13])
+def test_extend_equals_roll(num_elements: int) -> None:
+    capacity = 5
+    buffer = RingBuffer(capacity)
+    reference = np.zeros(capacity)
+
+    # Start from a position that is not at the start of the buffer, to wrap around
+    buffer.append(-1.0)
+    buffer.append(-2.0)
+    reference[-2:] = [-1.0, -2.0]
+
+    for i in range(3):
+        elements = np.arange(num_elements) + 100.0 * i
+        buffer.extend(elements)
+        reference = np.roll(reference, shift=-num_elements)
+        reference[capacity - min(num_elements, capacity) :] = elements[-capacity:]
+
+        np.testing.assert_array_equal(buffer.view(), reference)
+
+
+def test_view_is_read_only_and_contiguous() -> None:
+    buffer = RingBuffer(4, (2,))
+    buffer.extend(np.ones((3, 2)))
+
+    view = buffer.view()
+    assert view.flags.c_contiguous
+    with pytest.raises(ValueError):
+        view[0] = 1.0
+
+
+def test_ordered_is_a_copy() -> None:
+    buffer = RingBuffer(2)
+    ordered = buffer.ordered()
+    buffer.append(1.0)
+
+    np.testing.assert_array_equal(ordered, [0.0, 0.0])
+    np.testing.assert_array_equal(buffer.ordered(), [0.0, 1.0])
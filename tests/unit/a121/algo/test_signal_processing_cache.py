@@ -0,0 +1,84 @@
+# Copyright (c) Acconeer AB, 2024
+# All rights reserved
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+import scipy.signal
+
+from acconeer.exptool import a121
+from acconeer.exptool.a121.algo import (
+    get_butter_coeffs,
+    get_distance_filter_coeffs,
+    get_fft_frequencies,
+    get_window,
+    two_sided_welch,
+)
+
+
+def test_distance_filter_coeffs_are_cached_and_read_only() -> None:
+    b, a = get_distance_filter_coeffs(a121.Profile.PROFILE_3, 2)
+
+    assert get_distance_filter_coeffs(a121.Profile.PROFILE_3, 2)[0] is b
+    assert not b.flags.writeable
+    assert not a.flags.writeable
+
+    (expected_b, expected_a) = scipy.signal.butter(N=2, Wn=2.5e-3 * 2 / 0.14)
+    np.testing.assert_array_equal(b, expected_b)
+    np.testing.assert_array_equal(a, expected_a)
+
+
+def test_butter_coeffs_band() -> None:
+    b, a = get_butter_coeffs(2, (0.1, 0.5), btype="bandpass", fs=10.0)
+    (expected_b, expected_a) = scipy.signal.butter(N=2, Wn=[0.1, 0.5], btype="bandpass", fs=10.0)
+
+    np.testing.assert_array_equal(b, expected_b)
+    np.testing.assert_array_equal(a, expected_a)
+
+
+@pytest.mark.parametrize("length", [1, 16, 101])
+def test_windows(length: int) -> None:
+    np.testing.assert_array_equal(
+        get_window("hann", length), scipy.signal.get_window("hann", length)
+    )
+    np.testing.assert_array_equal(get_window("hann", length, symmetric=True), np.hanning(length))
+    np.testing.assert_array_equal(
+        get_window("hamming", length, symmetric=True), np.hamming(length)
+    )
+
+    with pytest.raises(ValueError):
+        get_window("hann", length)[0] = 1.0
+
+
+@pytest.mark.parametrize("length", [8, 9])
+def test_fft_frequencies(length: int) -> None:
+    np.testing.assert_array_equal(
+        get_fft_frequencies(length, 100.0), np.fft.fftfreq(length, 1 / 100.0)
+    )
+    np.testing.assert_array_equal(
+        get_fft_frequencies(length, 100.0, onesided=True), np.fft.rfftfreq(length, 1 / 100.0)
+    )
+    np.testing.assert_array_equal(
+        get_fft_frequencies(length, shifted=True), np.fft.fftshift(np.fft.fftfreq(length))
+    )
+
+
+def test_two_sided_welch_equals_welch_per_column() -> None:
+    rng = np.random.default_rng(0)
+    sweeps = rng.standard_normal((128, 4)) + 1j * rng.standard_normal((128, 4))
+
+    freqs, psds = two_sided_welch(sweeps, 1000.0, 32)
+
+    for i in range(sweeps.shape[1]):
+        expected_freqs, expected_psd = scipy.signal.welch(
+            sweeps[:, i],
+            fs=1000.0,
+            window="hann",
+            nperseg=32,
+            noverlap=0,
+            average="mean",
+            return_onesided=False,
+        )
+        np.testing.assert_array_equal(freqs, np.fft.fftshift(expected_freqs))
+        np.testing.assert_allclose(psds[:, i], np.fft.fftshift(expected_psd), rtol=1e-12)
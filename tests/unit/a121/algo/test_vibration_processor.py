@@ -0,0 +1,75 @@
+# Copyright (c) Acconeer AB, 2024
+# All rights reserved
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from acconeer.exptool import a121
+from acconeer.exptool._core.int_16_complex import INT_16_COMPLEX
+from acconeer.exptool.a121._core.communication import MockClient
+from acconeer.exptool.a121._core.entities import ResultContext
+from acconeer.exptool.a121.algo import double_buffering_frame_filter, vibration
+
+
+TIME_SERIES_LENGTH = 64
+
+
+@pytest.mark.parametrize("sweeps_per_frame", [8, TIME_SERIES_LENGTH])
+def test_continuous_time_series_is_unwrapped_over_frames(sweeps_per_frame: int) -> None:
+    sensor_config = a121.SensorConfig(
+        num_points=1,
+        sweeps_per_frame=sweeps_per_frame,
+        sweep_rate=1000.0,
+        double_buffering=True,
+        continuous_sweep_mode=True,
+        inter_frame_idle_state=a121.IdleState.READY,
+        inter_sweep_idle_state=a121.IdleState.READY,
+    )
+    metadata = MockClient._sensor_config_to_metadata(sensor_config, None)
+    processor = vibration.Processor(
+        sensor_config=sensor_config,
+        metadata=metadata,
+        processor_config=vibration.ProcessorConfig(
+            time_series_length=TIME_SERIES_LENGTH, amplitude_threshold=0.0
+        ),
+    )
+
+    # A phase drifting through many turns, with steps up to almost half a turn
+    rng = np.random.default_rng(0)
+    num_frames = 20
+    phases = np.cumsum(rng.uniform(0.0, 3.0, num_frames * sweeps_per_frame))
+
+    recorded_phases = np.empty(0)
+    for frame_idx in range(num_frames):
+        frame_phases = phases[frame_idx * sweeps_per_frame : (frame_idx + 1) * sweeps_per_frame]
+        frame = np.zeros((sweeps_per_frame, 1), dtype=INT_16_COMPLEX)
+        frame["real"] = np.round(10000 * np.cos(frame_phases))[:, None]
+        frame["imag"] = np.round(10000 * np.sin(frame_phases))[:, None]
+        processor.process(
+            a121.Result(
+                data_saturated=False,
+                frame_delayed=False,
+                calibration_needed=False,
+                temperature=25,
+                tick=0,
+                frame=frame,
+                context=ResultContext(metadata=metadata, ticks_per_second=1000000),
+            )
+        )
+
+        filtered_frame = double_buffering_frame_filter(frame)
+        if filtered_frame is None:
+            filtered_frame = frame["real"] + 1j * frame["imag"]
+        recorded_phases = np.concatenate([recorded_phases, np.angle(filtered_frame[:, 0])])
+
+        if sweeps_per_frame < TIME_SERIES_LENGTH:
+            # The history, initially zeros, is unwrapped together with all frames
+            history = np.concatenate([np.zeros(TIME_SERIES_LENGTH), recorded_phases])
+        else:
+            # Every frame replaces the whole history
+            history = recorded_phases[-TIME_SERIES_LENGTH:]
+        expected_time_series = np.unwrap(history)[-TIME_SERIES_LENGTH:]
+
+        np.testing.assert_allclose(processor.time_series, expected_time_series)
@@ -4,9 +4,12 @@ from __future__ import annotations
 
 import typing as t
 
+import numpy as np
 import pytest
 
+from acconeer.exptool import a121
 from acconeer.exptool._core.communication.communication_protocol import messages
+from acconeer.exptool._core.int_16_complex import INT_16_COMPLEX
 from acconeer.exptool.a121._core.communication.exploration_protocol import (
     ExplorationProtocol,
 )
@@ -57,5 +60,88 @@ class TestResultMessage:
         with pytest.raises(messages.ParseError):
             a121_messages.ResultMessage.parse(invalid_server_message, server_payload)
 
+    @pytest.fixture
+    def extended_metadata(self) -> list[dict[int, a121.Metadata]]:
+        def metadata(sweeps_per_frame: int, num_points: int) -> a121.Metadata:
+            return a121.Metadata(
+                frame_data_length=sweeps_per_frame * num_points,
+                sweep_data_length=num_points,
+                subsweep_data_offset=np.array([0]),
+                subsweep_data_length=np.array([num_points]),
+                calibration_temperature=0,
+                tick_period=0,
+                base_step_length_m=0,
+                max_sweep_rate=0,
+                high_speed_mode=False,
+            )
+
+        return [{1: metadata(2, 3), 2: metadata(1, 5)}, {1: metadata(4, 2)}]
+
+    def test_divide_frame_blob_creates_views(
+        self, extended_metadata: list[dict[int, a121.Metadata]]
+    ) -> None:
+        num_elements = 2 * 3 + 1 * 5 + 4 * 2
+        raw = np.zeros(num_elements, dtype=INT_16_COMPLEX)
+        raw["real"] = np.arange(num_elements)
+        raw["imag"] = -np.arange(num_elements)
+        frame_blob = bytearray(raw.tobytes())
+
+        frames = a121_messages.ResultMessage._divide_frame_blob(frame_blob, extended_metadata)
+
+        assert frames[0][1].shape == (2, 3)
+        assert frames[0][2].shape == (1, 5)
+        assert frames[1][1].shape == (4, 2)
+
+        np.testing.assert_array_equal(frames[0][1].flatten(), raw[0:6])
+        np.testing.assert_array_equal(frames[0][2].flatten(), raw[6:11])
+        np.testing.assert_array_equal(frames[1][1].flatten(), raw[11:19])
+
+        for frame in [frames[0][1], frames[0][2], frames[1][1]]:
+            assert np.shares_memory(frame, np.frombuffer(frame_blob, dtype=np.uint8))
+
+    def test_divide_frame_blob_raises_on_short_payload(
+        self, extended_metadata: list[dict[int, a121.Metadata]]
+    ) -> None:
+        with pytest.raises(ValueError):
+            a121_messages.ResultMessage._divide_frame_blob(bytes(4 * 10), extended_metadata)
+
+    def test_get_extended_stacked_results_matches_get_extended_results(
+        self, extended_metadata: list[dict[int, a121.Metadata]]
+    ) -> None:
+        num_elements = 2 * 3 + 1 * 5 + 4 * 2
+        rng = np.random.default_rng(0)
+        config_groups = [
+            {1: a121.SensorConfig(), 2: a121.SensorConfig()},
+            {1: a121.SensorConfig()},
+        ]
+
+        result_messages = []
+        for frame_index in range(4):
+            result_info: a121_messages.result_message.ResultInfoDict = {
+                "tick": 100 * frame_index,
+                "data_saturated": frame_index == 1,
+                "frame_delayed": frame_index == 2,
+                "calibration_needed": frame_index == 3,
+                "temperature": 20 + frame_index,
+            }
+            result_messages.append(
+                a121_messages.ResultMessage(
+                    [[result_info, result_info], [result_info]],
+                    rng.bytes(num_elements * INT_16_COMPLEX.itemsize),
+                )
+            )
+
+        extended_stacked_results = a121_messages.ResultMessage.get_extended_stacked_results(
+            result_messages, tps=1000, metadata=extended_metadata
+        )
+
+        for frame_index, result_message in enumerate(result_messages):
+            extended_results = result_message.get_extended_results(
+                tps=1000, metadata=extended_metadata, config_groups=config_groups
+            )
+            for group, stacked_group in zip(extended_results, extended_stacked_results):
+                for sensor_id, result in group.items():
+                    assert stacked_group[sensor_id][frame_index] == result
+
     def test_apply(self) -> None:
         pytest.skip("Hard to unit test. Relies on system tests for correctness.")
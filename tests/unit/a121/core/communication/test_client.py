@@ -0,0 +1,59 @@
+# Copyright (c) Acconeer AB, 2024
+# All rights reserved
+from __future__ import annotations
+
+import typing as t
+
+import pytest
+
+from acconeer.exptool import a121
+from acconeer.exptool.a121._core.communication import MockClient
+
+
+@pytest.fixture
+def mock_client() -> t.Iterator[MockClient]:
+    client = MockClient.open(mock=True)
+    yield client
+    client.close()
+
+
+def test_get_next_batch_requires_a_started_session(mock_client: MockClient) -> None:
+    mock_client.setup_session(a121.SensorConfig())
+
+    with pytest.raises(a121.ClientError):
+        mock_client.get_next_batch(2)
+
+
+def test_get_next_batch_rejects_non_positive_num_frames(mock_client: MockClient) -> None:
+    mock_client.setup_session(a121.SensorConfig())
+    mock_client.start_session()
+
+    with pytest.raises(ValueError):
+        mock_client.get_next_batch(0)
+
+
+def test_get_next_batch_stacks_results(mock_client: MockClient) -> None:
+    metadata = mock_client.setup_session(a121.SensorConfig(sweeps_per_frame=4))
+    mock_client.start_session()
+
+    assert isinstance(metadata, a121.Metadata)
+
+    stacked_results = mock_client.get_next_batch(3)
+
+    assert isinstance(stacked_results, a121.StackedResults)
+    assert len(stacked_results) == 3
+    assert stacked_results.frame.shape == (3, *metadata.frame_shape)
+
+
+def test_get_next_batch_stacks_extended_results(mock_client: MockClient) -> None:
+    config = a121.SessionConfig(
+        [{1: a121.SensorConfig(), 2: a121.SensorConfig(sweeps_per_frame=2)}]
+    )
+    mock_client.setup_session(config)
+    mock_client.start_session()
+
+    extended_stacked_results = mock_client.get_next_batch(2)
+
+    assert isinstance(extended_stacked_results, list)
+    assert set(extended_stacked_results[0].keys()) == {1, 2}
+    assert extended_stacked_results[0][2].frame.shape[:2] == (2, 2)
@@ -0,0 +1,84 @@
+# Copyright (c) Acconeer AB, 2024
+# All rights reserved
+from __future__ import annotations
+
+from typing import Optional
+
+import numpy as np
+import pytest
+
+from acconeer.exptool import a121
+from acconeer.exptool._core.communication import ClientError
+from acconeer.exptool._core.int_16_complex import INT_16_COMPLEX
+from acconeer.exptool.a121._core.communication.exploration_client import (
+    TickUnwrapper,
+    get_baudrate_to_use,
+)
+from acconeer.exptool.a121._core.entities import ResultContext
+
+
+def _stacked_results(ticks: list[int]) -> a121.StackedResults:
+    num_frames = len(ticks)
+    return a121.StackedResults(
+        data_saturated=np.zeros(num_frames, dtype=bool),
+        frame_delayed=np.zeros(num_frames, dtype=bool),
+        calibration_needed=np.zeros(num_frames, dtype=bool),
+        temperature=np.zeros(num_frames, dtype=int),
+        tick=np.array(ticks, dtype=np.int64),
+        frame=np.zeros((num_frames, 1, 1), dtype=INT_16_COMPLEX),
+        context=ResultContext(metadata=None, ticks_per_second=1),  # type: ignore[arg-type]
+    )
+
+
+def test_tick_unwrapper_unwraps_single_frames() -> None:
+    tick_unwrapper = TickUnwrapper()
+
+    assert tick_unwrapper.unwrap_frame([2**32 - 2]) == [2**32 - 2]
+    assert tick_unwrapper.unwrap_frame([1]) == [2**32 + 1]
+    assert tick_unwrapper.next_minimum_tick == 2**32 + 1
+
+
+def test_tick_unwrapper_continues_between_frames_and_batches() -> None:
+    tick_unwrapper = TickUnwrapper()
+
+    assert tick_unwrapper.unwrap_frame([2**32 - 2]) == [2**32 - 2]
+
+    unwrapped = tick_unwrapper.unwrap(np.array([[2**32 - 1], [0], [1]]))
+
+    assert unwrapped.tolist() == [[2**32 - 1], [2**32], [2**32 + 1]]
+    assert tick_unwrapper.unwrap_frame([2]) == [2**32 + 2]
+
+
+def test_tick_unwrapper_unwraps_stacked_ticks_in_place() -> None:
+    extended_stacked_results = [
+        {1: _stacked_results([2**32 - 1, 0, 1])},
+        {2: _stacked_results([2**32 - 2, 2**32 - 1, 0])},
+    ]
+
+    TickUnwrapper().unwrap_stacked_ticks_in_place(extended_stacked_results)
+
+    assert extended_stacked_results[0][1].tick.tolist() == [2**32 - 1, 2**32, 2**32 + 1]
+    assert extended_stacked_results[1][2].tick.tolist() == [2**32 - 2, 2**32 - 1, 2**32]
+
+
+@pytest.mark.parametrize(
+    ("overridden_baudrate", "max_baudrate", "expected"),
+    [
+        (None, None, None),
+        (None, 115200, None),
+        (None, 2000000, 2000000),
+        (1000000, 2000000, 1000000),
+        (115200, 2000000, None),
+        (1000000, None, None),
+    ],
+)
+def test_get_baudrate_to_use(
+    overridden_baudrate: Optional[int], max_baudrate: Optional[int], expected: Optional[int]
+) -> None:
+    assert get_baudrate_to_use(overridden_baudrate, max_baudrate) == expected
+
+
+@pytest.mark.parametrize("overridden_baudrate", [9600, 3000000])
+def test_get_baudrate_to_use_rejects_invalid_overrides(overridden_baudrate: int) -> None:
+    with pytest.raises(ClientError):
+        get_baudrate_to_use(overridden_baudrate, 2000000)
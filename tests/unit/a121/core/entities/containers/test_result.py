@@ -104,3 +104,41 @@ def test_subframes(good_result: a121.Result) -> None:
 
 def test_tick_time(good_result: a121.Result) -> None:
     assert np.isclose(good_result.tick_time, 1.5)
+
+
+def test_frame_is_converted_once(good_result: a121.Result) -> None:
+    frame = good_result.frame
+
+    assert good_result.frame is frame
+    assert not frame.flags.writeable
+    assert all(np.shares_memory(subframe, frame) for subframe in good_result.subframes)
+
+
+@pytest.mark.parametrize("dtype", [np.complex64, np.complex128])
+def test_get_frame_with_dtype(good_result: a121.Result, dtype: t.Any) -> None:
+    frame = good_result.get_frame(dtype)
+
+    assert frame.dtype == dtype
+    np.testing.assert_array_equal(frame, good_result.frame)
+    assert all(subframe.dtype == dtype for subframe in good_result.get_subframes(dtype))
+
+
+def test_set_frame_dtype(good_result: a121.Result) -> None:
+    assert a121.get_frame_dtype() == np.complex128
+
+    a121.set_frame_dtype(np.complex64)
+    try:
+        assert good_result.frame.dtype == np.complex64
+        assert good_result.subframes[0].dtype == np.complex64
+    finally:
+        a121.set_frame_dtype(np.complex128)
+
+    assert good_result.frame.dtype == np.complex128
+
+
+def test_unsupported_frame_dtype(good_result: a121.Result) -> None:
+    with pytest.raises(ValueError):
+        a121.set_frame_dtype(np.float64)
+
+    with pytest.raises(ValueError):
+        good_result.get_frame(np.complex256)
@@ -248,3 +248,16 @@ class TestStackedResultWithMultipleFrames:
 
     def test_reports_the_number_of_results_in_len(self, stacked_results: StackedResults) -> None:
         assert len(stacked_results) == 2
+
+    def test_frame_is_converted_once(self, stacked_results: StackedResults) -> None:
+        frame = stacked_results.frame
+
+        assert stacked_results.frame is frame
+        assert not frame.flags.writeable
+
+    def test_frame_can_be_converted_to_complex64(self, stacked_results: StackedResults) -> None:
+        frame = stacked_results.get_frame(np.complex64)
+
+        assert frame.dtype == np.complex64
+        np.testing.assert_array_equal(frame, stacked_results.frame)
+        assert all(sf.dtype == np.complex64 for sf in stacked_results.get_subframes(np.complex64))
@@ -0,0 +1,98 @@
+# Copyright (c) Acconeer AB, 2024
+# All rights reserved
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import h5py
+import numpy as np
+import pytest
+
+from acconeer.exptool import a121
+
+
+@pytest.fixture
+def ref_record_file_with_random_data(ref_record_file: Path) -> Path:
+    rng = np.random.default_rng(0)
+
+    with h5py.File(ref_record_file, "r+") as f:
+        for session_group in f["sessions"].values():
+            for group_name, group in session_group.items():
+                if not group_name.startswith("group_"):
+                    continue
+                for entry_group in group.values():
+                    frame_dataset = entry_group["result/frame"]
+                    num_frames = len(frame_dataset)
+                    frame_dataset["real"] = rng.integers(-100, 100, frame_dataset.shape)
+                    frame_dataset["imag"] = rng.integers(-100, 100, frame_dataset.shape)
+                    entry_group["result/temperature"][...] = rng.integers(0, 50, num_frames)
+                    entry_group["result/data_saturated"][...] = rng.integers(0, 2, num_frames)
+
+    return ref_record_file
+
+
+def assert_stacked_results_equal(
+    lazy: a121.H5StackedResults, eager: a121.StackedResults, key: slice
+) -> None:
+    window = lazy[key]
+    assert len(window) == len(eager.tick[key])
+
+    np.testing.assert_array_equal(window.data_saturated, eager.data_saturated[key])
+    np.testing.assert_array_equal(window.frame_delayed, eager.frame_delayed[key])
+    np.testing.assert_array_equal(window.calibration_needed, eager.calibration_needed[key])
+    np.testing.assert_array_equal(window.temperature, eager.temperature[key])
+    np.testing.assert_array_equal(window.tick, eager.tick[key])
+    np.testing.assert_array_equal(window.tick_time, eager.tick_time[key])
+    np.testing.assert_array_equal(window.frame, eager.frame[key])
+
+
+@pytest.mark.parametrize(
+    "key",
+    [
+        slice(None),
+        slice(1, None),
+        slice(None, -1),
+        slice(None, None, 2),
+        slice(None, None, -1),
+        slice(-1, 0, -2),
+        slice(5, 2),
+        slice(100, 200),
+    ],
+)
+def test_slices_read_the_same_data_as_stacked_results(
+    ref_record_file_with_random_data: Path, key: slice
+) -> None:
+    with a121.open_record(ref_record_file_with_random_data) as record:
+        for i in range(record.num_sessions):
+            session = record.session(i)
+            eager = session.extended_stacked_results
+            lazy = session.extended_lazy_stacked_results  # type: ignore[attr-defined]
+
+            for group_id, sensor_id, stacked_results in a121.iterate_extended_structure(eager):
+                assert_stacked_results_equal(lazy[group_id][sensor_id], stacked_results, key)
+
+
+def test_slices_can_be_sliced_and_indexed(ref_record_file_with_random_data: Path) -> None:
+    with h5py.File(ref_record_file_with_random_data, "r") as f:
+        record = a121.H5Record(f)
+        eager = record.session(0).extended_stacked_results
+        lazy = record.extended_lazy_stacked_results
+
+        for group_id, sensor_id, stacked_results in a121.iterate_extended_structure(eager):
+            lazy_stacked_results = lazy[group_id][sensor_id]
+            num_frames = len(stacked_results)
+
+            loaded = lazy_stacked_results[::-1][::-1].load()
+            np.testing.assert_array_equal(loaded.tick, stacked_results.tick)
+            np.testing.assert_array_equal(loaded.frame, stacked_results.frame)
+            np.testing.assert_array_equal(loaded.temperature, stacked_results.temperature)
+
+            for frame_no in range(-num_frames, num_frames):
+                assert lazy_stacked_results[frame_no] == stacked_results[frame_no]
+
+            window = lazy_stacked_results[1:][::-1]
+            np.testing.assert_array_equal(window.frame, stacked_results.frame[1:][::-1])
+
+            with pytest.raises(IndexError):
+                lazy_stacked_results[num_frames]
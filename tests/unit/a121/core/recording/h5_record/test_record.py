@@ -14,8 +14,10 @@ round-trip through:
 """
 from __future__ import annotations
 
+from pathlib import Path
 from typing import Any, Iterator
 
+import h5py
 import numpy as np
 import numpy.typing as npt
 import pytest
@@ -115,3 +117,61 @@ def test_sensor_id(ref_record: a121.Record, ref_structure: Iterator[Iterator[int
         else:
             with pytest.raises(ValueError):
                 _ = ref_record.session(i).sensor_id
+
+
+def test_wrapped_ticks_are_unwrapped(ref_record_file: Path, ref_num_frames: int) -> None:
+    expected_ticks = 2**32 - 2 + np.arange(ref_num_frames)
+
+    with h5py.File(ref_record_file, "r+") as f:
+        for session_group in f["sessions"].values():
+            for group_name, group in session_group.items():
+                if not group_name.startswith("group_"):
+                    continue
+                for entry_group in group.values():
+                    entry_group["result/tick"][...] = expected_ticks % 2**32
+
+    with a121.open_record(ref_record_file) as record:
+        for i in range(record.num_sessions):
+            session = record.session(i)
+            for stacked_results in a121.iterate_extended_structure_values(
+                session.extended_stacked_results
+            ):
+                np.testing.assert_array_equal(stacked_results.tick, expected_ticks)
+
+            for frame_no, extended_result in enumerate(session.extended_results):
+                for result in a121.iterate_extended_structure_values(extended_result):
+                    assert result.tick == expected_ticks[frame_no]
+
+
+@pytest.mark.parametrize("read_chunk_size", [1, 2, 256])
+def test_extended_results_are_read_in_chunks(
+    ref_record_file: Path, ref_num_frames: int, read_chunk_size: int
+) -> None:
+    rng = np.random.default_rng(0)
+
+    with h5py.File(ref_record_file, "r+") as f:
+        for session_group in f["sessions"].values():
+            for group_name, group in session_group.items():
+                if not group_name.startswith("group_"):
+                    continue
+                for entry_group in group.values():
+                    frame_dataset = entry_group["result/frame"]
+                    frame_dataset["real"] = rng.integers(-100, 100, frame_dataset.shape)
+                    entry_group["result/temperature"][...] = np.arange(ref_num_frames)
+
+    with h5py.File(ref_record_file, "r") as f:
+        session = a121.H5Record(f).session(0)
+        session._READ_CHUNK_SIZE = read_chunk_size
+        stacked_results = session.extended_stacked_results
+
+        extended_results = list(session.extended_results)
+        assert len(extended_results) == ref_num_frames
+
+        for frame_no, extended_result in enumerate(extended_results):
+            assert extended_result == session._get_result_for_all_entries(frame_no)
+
+            for group_id, sensor_id, result in a121.iterate_extended_structure(extended_result):
+                stacked = stacked_results[group_id][sensor_id]
+                np.testing.assert_array_equal(result._frame, stacked._frame[frame_no])
+                assert result.temperature == frame_no
+                assert result._context is session._get_result_contexts()[group_id][sensor_id]
@@ -11,6 +11,7 @@ import pytest
 
 import acconeer.exptool
 from acconeer.exptool import a121
+from acconeer.exptool.a121._core import utils
 from acconeer.exptool.utils import get_module_version
 
 
@@ -81,6 +82,28 @@ def test_start_can_only_be_called_once(
         r._start(client_info=ref_client_info, server_info=ref_server_info)
 
 
+def record_whole_record(recorder: a121.H5Recorder, ref_record: a121.Record) -> None:
+    recorder._start(
+        client_info=ref_record.client_info,
+        server_info=ref_record.server_info,
+    )
+
+    assert ref_record.num_sessions > 0
+    for i in range(ref_record.num_sessions):
+        session = ref_record.session(i)
+        recorder._start_session(
+            config=session.session_config,
+            metadata=session.extended_metadata,
+            calibrations=session.calibrations,
+            calibrations_provided=session.calibrations_provided,
+        )
+
+        for extended_results in session.extended_results:
+            recorder._sample(extended_results)
+
+        recorder._stop_session()
+
+
 @pytest.mark.parametrize("chunk_size", [None, 1, 512])
 def test_sample_whole_record(
     tmp_path: Path, ref_record: a121.Record, chunk_size: Optional[int]
@@ -93,28 +116,162 @@ def test_sample_whole_record(
         _uuid=ref_record.uuid,
         _chunk_size=chunk_size,
     ) as recorder:
-        recorder._start(
-            client_info=ref_record.client_info,
-            server_info=ref_record.server_info,
-        )
+        record_whole_record(recorder, ref_record)
 
-        assert ref_record.num_sessions > 0
-        for i in range(ref_record.num_sessions):
-            session = ref_record.session(i)
-            recorder._start_session(
-                config=session.session_config,
-                metadata=session.extended_metadata,
-                calibrations=session.calibrations,
-                calibrations_provided=session.calibrations_provided,
-            )
+    with a121.open_record(filename) as record:
+        assert_record_equals(record, ref_record)
 
-            for extended_results in session.extended_results:
-                recorder._sample(extended_results)
+    record = a121.load_record(filename)
+    assert_record_equals(record, ref_record)
 
-            recorder._stop_session()
+
+@pytest.mark.parametrize(
+    ("flush_frames", "flush_interval_ms"),
+    [(None, None), (1, None), (3, None), (None, 0), (1000, 1)],
+)
+def test_sample_whole_record_with_background_writer(
+    tmp_path: Path,
+    ref_record: a121.Record,
+    flush_frames: Optional[int],
+    flush_interval_ms: Optional[float],
+) -> None:
+    filename = tmp_path / "empty.h5"
+    with a121.H5Recorder(
+        filename,
+        _lib_version=ref_record.lib_version,
+        _timestamp=ref_record.timestamp,
+        _uuid=ref_record.uuid,
+        background_writer=True,
+        flush_frames=flush_frames,
+        flush_interval_ms=flush_interval_ms,
+    ) as recorder:
+        record_whole_record(recorder, ref_record)
 
     with a121.open_record(filename) as record:
         assert_record_equals(record, ref_record)
 
-    record = a121.load_record(filename)
-    assert_record_equals(record, ref_record)
+
+def test_background_writer_is_flushed_on_close(tmp_path: Path, ref_record: a121.Record) -> None:
+    filename = tmp_path / "empty.h5"
+    session = ref_record.session(0)
+
+    with a121.H5Recorder(filename, background_writer=True, flush_interval_ms=60_000) as recorder:
+        recorder._start(client_info=ref_record.client_info, server_info=ref_record.server_info)
+        recorder._start_session(config=session.session_config, metadata=session.extended_metadata)
+
+        for extended_results in session.extended_results:
+            recorder._sample(extended_results)
+
+    with a121.open_record(filename) as record:
+        assert record.num_frames == session.num_frames
+        assert list(record.extended_results) == list(session.extended_results)
+
+
+def test_unstopped_session_is_read_without_unwritten_frames(
+    tmp_path: Path, ref_record: a121.Record
+) -> None:
+    filename = tmp_path / "interrupted.h5"
+    session = ref_record.session(0)
+    extended_results = list(session.extended_results)[:2]
+
+    with h5py.File(filename, "x") as f:
+        recorder = a121.H5Recorder(f, _chunk_size=1)
+        recorder._start(client_info=ref_record.client_info, server_info=ref_record.server_info)
+        recorder._start_session(config=session.session_config, metadata=session.extended_metadata)
+
+        for extended_result in extended_results:
+            recorder._sample(extended_result)
+
+        # The file is closed as if the process was killed, without stopping the session
+        frame_dataset = f["sessions/session_0/group_0/entry_0/result/frame"]
+        assert len(frame_dataset) > len(extended_results)
+
+    with a121.open_record(filename) as record:
+        assert isinstance(record, a121.H5Record)
+        assert record.num_frames == len(extended_results)
+        assert list(record.extended_results) == extended_results
+        for stacked_results in utils.iterate_extended_structure_values(
+            record.extended_stacked_results
+        ):
+            assert len(stacked_results.frame) == len(extended_results)
+        for lazy_stacked_results in utils.iterate_extended_structure_values(
+            record.extended_lazy_stacked_results
+        ):
+            assert len(lazy_stacked_results) == len(extended_results)
+
+
+def test_background_writer_errors_are_raised_on_stop(
+    tmp_path: Path, ref_record: a121.Record
+) -> None:
+    session = ref_record.session(0)
+    recorder = a121.H5Recorder(tmp_path / "empty.h5", background_writer=True, flush_frames=1)
+    recorder._start(client_info=ref_record.client_info, server_info=ref_record.server_info)
+    recorder._start_session(config=session.session_config, metadata=session.extended_metadata)
+
+    recorder._sample(["not a result"])  # type: ignore[list-item]
+
+    with pytest.raises(Exception):
+        recorder._stop_session()
+
+    recorder.close()
+
+
+def test_flush_options_require_background_writer(tmp_path: Path) -> None:
+    with pytest.raises(ValueError):
+        a121.H5Recorder(tmp_path / "a.h5", flush_frames=10)
+
+    with pytest.raises(ValueError):
+        a121.H5Recorder(tmp_path / "b.h5", background_writer=True, _chunk_size=10)
+
+
+@pytest.mark.parametrize(
+    "recording_profile",
+    [
+        a121.H5RecordingProfile(compression=None),
+        a121.H5RecordingProfile(compression="lzf", shuffle=True),
+        a121.H5RecordingProfile(compression="gzip", compression_level=9, chunk_frames=2),
+    ],
+    ids=["none", "lzf", "gzip9"],
+)
+def test_sample_whole_record_with_recording_profile(
+    tmp_path: Path, ref_record: a121.Record, recording_profile: a121.H5RecordingProfile
+) -> None:
+    filename = tmp_path / "empty.h5"
+    with a121.H5Recorder(
+        filename,
+        _lib_version=ref_record.lib_version,
+        _timestamp=ref_record.timestamp,
+        _uuid=ref_record.uuid,
+        recording_profile=recording_profile,
+    ) as recorder:
+        record_whole_record(recorder, ref_record)
+
+    statistics = recorder.write_statistics
+    assert statistics.num_frames == sum(
+        ref_record.session(i).num_frames for i in range(ref_record.num_sessions)
+    )
+    assert statistics.num_bytes > 0
+    assert statistics.file_size == filename.stat().st_size
+
+    with h5py.File(filename, "r") as f:
+        frame_dataset = f["sessions/session_0/group_0/entry_0/result/frame"]
+        assert frame_dataset.compression == recording_profile.compression
+        assert frame_dataset.shuffle == recording_profile.shuffle
+        if recording_profile.compression_level is not None:
+            assert frame_dataset.compression_opts == recording_profile.compression_level
+        if recording_profile.chunk_frames is not None:
+            assert frame_dataset.chunks[0] == recording_profile.chunk_frames
+
+    with a121.open_record(filename) as record:
+        assert_record_equals(record, ref_record)
+
+
+def test_recording_profile_validation() -> None:
+    with pytest.raises(ValueError):
+        a121.H5RecordingProfile(compression="szip")
+
+    with pytest.raises(ValueError):
+        a121.H5RecordingProfile(compression="lzf", compression_level=4)
+
+    with pytest.raises(ValueError):
+        a121.H5RecordingProfile(chunk_frames=0)
@@ -0,0 +1,124 @@
+# Copyright (c) Acconeer AB, 2024
+# All rights reserved
+
+from __future__ import annotations
+
+import json
+import time
+import typing as t
+
+import pytest
+
+from acconeer.exptool import a121
+from acconeer.exptool.a121._core.communication.exploration_protocol import ExplorationProtocol
+from acconeer.exptool.a121._core_ext import _LoopbackServer
+from acconeer.exptool.a121._core_ext._loopback_server import _session_config_from_setup_command
+
+
+@pytest.fixture
+def server() -> t.Iterator[_LoopbackServer]:
+    with _LoopbackServer(frame_rate=None, use_session_rate=False) as server:
+        yield server
+
+
+@pytest.fixture
+def client(server: _LoopbackServer) -> t.Iterator[a121.Client]:
+    with a121.Client.open(ip_address=server.host, tcp_port=server.port) as client:
+        yield client
+
+
+@pytest.mark.parametrize(
+    "session_config",
+    [
+        a121.SessionConfig(
+            a121.SensorConfig(
+                sweeps_per_frame=4,
+                frame_rate=20.0,
+                inter_frame_idle_state=a121.IdleState.SLEEP,
+                subsweeps=[
+                    a121.SubsweepConfig(profile=a121.Profile.PROFILE_1, prf=a121.PRF.PRF_19_5_MHz),
+                    a121.SubsweepConfig(profile=a121.Profile.PROFILE_3, num_points=40),
+                ],
+            )
+        ),
+        a121.SessionConfig(
+            [
+                {1: a121.SensorConfig(), 3: a121.SensorConfig(num_points=7)},
+                {2: a121.SensorConfig()},
+            ],
+            update_rate=5.0,
+            extended=True,
+        ),
+    ],
+)
+def test_session_config_from_setup_command(session_config: a121.SessionConfig) -> None:
+    command = json.loads(ExplorationProtocol.setup_command(session_config))
+
+    actual = _session_config_from_setup_command(command)
+
+    assert actual.groups == session_config.groups
+    assert actual.update_rate == session_config.update_rate
+
+
+def test_frame_rate_must_be_positive() -> None:
+    with pytest.raises(ValueError):
+        _LoopbackServer(frame_rate=0.0)
+
+
+def test_streams_frames_to_exploration_client(
+    server: _LoopbackServer, client: a121.Client
+) -> None:
+    sensor_config = a121.SensorConfig(num_points=40, sweeps_per_frame=8)
+    client.setup_session(sensor_config)
+    client.start_session()
+
+    results = [client.get_next() for _ in range(10)]
+    stacked_results = client.get_next_batch(10)
+
+    client.stop_session()
+
+    assert all(isinstance(result, a121.Result) for result in results)
+    assert all(result.frame.shape == (8, 40) for result in results)  # type: ignore[union-attr]
+    assert isinstance(stacked_results, a121.StackedResults)
+    assert stacked_results.frame.shape == (10, 8, 40)
+
+    statistics = server.statistics
+    assert statistics.num_frames >= 20
+    assert statistics.num_bytes > statistics.num_frames * 8 * 40 * 4
+    assert statistics.frames_per_second > 0
+    assert statistics.bytes_per_second > 0
+
+
+def test_streams_extended_sessions(client: a121.Client) -> None:
+    session_config = a121.SessionConfig(
+        [{1: a121.SensorConfig(num_points=10), 2: a121.SensorConfig(num_points=20)}]
+    )
+    client.setup_session(session_config)
+    client.start_session()
+    extended_result = client.get_next()
+    client.stop_session()
+
+    assert isinstance(extended_result, list)
+    assert extended_result[0][1].frame.shape[1] == 10
+    assert extended_result[0][2].frame.shape[1] == 20
+
+
+def test_frames_are_delayed_when_the_client_does_not_keep_up() -> None:
+    with _LoopbackServer(frame_rate=5000.0) as server, a121.Client.open(
+        ip_address=server.host, tcp_port=server.port
+    ) as client:
+        client.setup_session(a121.SensorConfig(num_points=160, sweeps_per_frame=25))
+        client.start_session()
+        time.sleep(0.5)
+
+        # Frames sent before the OS buffers filled up are not delayed
+        frame_delayed = False
+        for _ in range(10000):
+            frame_delayed = client.get_next().frame_delayed  # type: ignore[union-attr]
+            if frame_delayed:
+                break
+
+        client.stop_session()
+
+        assert server.statistics.num_delayed_frames > 0
+        assert frame_delayed
@@ -0,0 +1,153 @@
+# Copyright (c) Acconeer AB, 2024
+# All rights reserved
+
+from __future__ import annotations
+
+import math
+import typing as t
+
+import numpy as np
+import pytest
+
+from acconeer.exptool import a121
+from acconeer.exptool._core.int_16_complex import INT_16_COMPLEX
+from acconeer.exptool.a121._core.communication import MockClient
+from acconeer.exptool.a121._core.entities import ResultContext
+from acconeer.exptool.a121._core.recording.im_record.im_record import InMemorySessionRecord
+from acconeer.exptool.a121._core_ext._replaying_client import _PrefetchingIterator
+
+
+NUM_FRAMES = 10
+FRAME_PERIOD_S = 0.02
+TICKS_PER_SECOND = 1000000
+
+
+@pytest.fixture
+def record() -> a121.Record:
+    sensor_config = a121.SensorConfig(num_points=4, sweeps_per_frame=2)
+    metadata = MockClient._sensor_config_to_metadata(sensor_config, None)
+    frame = np.zeros((NUM_FRAMES, 2, 4), dtype=INT_16_COMPLEX)
+    frame["real"] = np.arange(NUM_FRAMES)[:, None, None]
+
+    stacked_results = a121.StackedResults(
+        data_saturated=np.zeros(NUM_FRAMES, dtype=bool),
+        frame_delayed=np.zeros(NUM_FRAMES, dtype=bool),
+        calibration_needed=np.zeros(NUM_FRAMES, dtype=bool),
+        temperature=np.zeros(NUM_FRAMES, dtype=int),
+        tick=np.arange(NUM_FRAMES) * int(FRAME_PERIOD_S * TICKS_PER_SECOND),
+        frame=frame,
+        context=ResultContext(metadata=metadata, ticks_per_second=TICKS_PER_SECOND),
+    )
+    session = InMemorySessionRecord(
+        extended_metadata=[{1: metadata}],
+        extended_stacked_results=[{1: stacked_results}],
+        num_frames=NUM_FRAMES,
+        session_config=a121.SessionConfig(sensor_config),
+        calibrations=None,
+        calibrations_provided=None,
+    )
+    return a121.InMemoryRecord(
+        client_info=a121.ClientInfo._from_open(mock=True),
+        lib_version="0.1.2",
+        server_info=a121.ServerInfo(
+            rss_version="0.2.4",
+            sensor_count=1,
+            ticks_per_second=TICKS_PER_SECOND,
+            sensor_infos={},
+            hardware_name="xy123",
+        ),
+        timestamp="2024-03-14T15:00:00",
+        uuid="b0ca48f7-0bcf-4160-965a-9a865a8fc989",
+        sessions=[session],
+    )
+
+
+def replay(client: a121._ReplayingClient) -> list[a121.Result]:
+    client.start_session()
+    results = []
+    while True:
+        try:
+            result = client.get_next()
+        except a121._StopReplay:
+            break
+
+        assert isinstance(result, a121.Result)
+        results.append(result)
+
+    client.stop_session()
+    return results
+
+
+@pytest.mark.parametrize("prefetch_frames", [0, 1, 3, 100])
+def test_replays_all_frames_in_order(record: a121.Record, prefetch_frames: int) -> None:
+    client = a121._ReplayingClient(record, replay_speed=math.inf, prefetch_frames=prefetch_frames)
+
+    results = replay(client)
+
+    assert [result.frame[0, 0].real for result in results] == list(range(NUM_FRAMES))
+
+
+def test_replay_speed_defaults_to_realtime_replay(record: a121.Record) -> None:
+    assert a121._ReplayingClient(record).replay_speed == 1.0
+    assert a121._ReplayingClient(record, realtime_replay=False).replay_speed == math.inf
+    assert (
+        a121._ReplayingClient(record, realtime_replay=False, replay_speed=2.0).replay_speed == 2.0
+    )
+
+
+@pytest.mark.parametrize("replay_speed", [0.0, -1.0, math.nan])
+def test_replay_speed_must_be_positive(record: a121.Record, replay_speed: float) -> None:
+    with pytest.raises(ValueError):
+        a121._ReplayingClient(record, replay_speed=replay_speed)
+
+
+@pytest.mark.parametrize("replay_speed", [1.0, 4.0])
+def test_replay_statistics(record: a121.Record, replay_speed: float) -> None:
+    client = a121._ReplayingClient(record, replay_speed=replay_speed)
+
+    assert math.isnan(client.replay_statistics.time_ratio)
+
+    replay(client)
+    statistics = client.replay_statistics
+
+    assert statistics.num_frames == NUM_FRAMES
+    assert statistics.record_duration_s == pytest.approx((NUM_FRAMES - 1) * FRAME_PERIOD_S)
+    assert statistics.replay_duration_s >= statistics.record_duration_s / replay_speed
+    assert statistics.time_ratio >= 1 / replay_speed
+
+
+def test_fast_replay_is_faster_than_recorded(record: a121.Record) -> None:
+    client = a121._ReplayingClient(record, replay_speed=math.inf)
+
+    replay(client)
+
+    assert client.replay_statistics.time_ratio < 1.0
+
+
+def test_stopping_a_prefetched_session_early(record: a121.Record) -> None:
+    client = a121._ReplayingClient(
+        record, cycled_session_idx=0, replay_speed=math.inf, prefetch_frames=2
+    )
+    client.start_session()
+    client.get_next()
+
+    with pytest.warns(UserWarning):
+        client.stop_session()
+
+    assert len(replay(client)) == NUM_FRAMES
+
+
+def test_prefetching_iterator_raises_errors_after_items() -> None:
+    def items() -> t.Iterator[int]:
+        yield 1
+        yield 2
+        raise RuntimeError
+
+    iterator = _PrefetchingIterator(items(), 1)
+
+    assert next(iterator) == 1
+    assert next(iterator) == 2
+    with pytest.raises(RuntimeError):
+        next(iterator)
+    with pytest.raises(StopIteration):
+        next(iterator)
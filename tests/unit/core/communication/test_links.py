@@ -0,0 +1,143 @@
+# Copyright (c) Acconeer AB, 2024
+# All rights reserved
+
+import socket
+import threading
+
+import pytest
+
+from acconeer.exptool._core.communication.links import LinkError, ReceiveBuffer, SocketLink
+
+
+def _recv_from(data: bytes):
+    remaining = memoryview(data)
+
+    def recv_into(buffer: memoryview) -> int:
+        nonlocal remaining
+        num_bytes = min(len(buffer), len(remaining))
+        buffer[:num_bytes] = remaining[:num_bytes]
+        remaining = remaining[num_bytes:]
+        return num_bytes
+
+    return recv_into
+
+
+def test_receive_buffer_fill_from_is_limited_by_chunk_size():
+    rx = ReceiveBuffer(chunk_size=4)
+
+    assert rx.fill_from(_recv_from(b"abcdefgh")) == 4
+    assert len(rx) == 4
+    assert rx.read(4) == b"abcd"
+
+
+def test_receive_buffer_find_and_read():
+    rx = ReceiveBuffer(chunk_size=4)
+    rx.extend(b'{}\n{"a": 1}\n')
+
+    assert rx.find(b"\n") == 2
+    assert rx.read(3) == b"{}\n"
+    assert rx.find(b"\n") == 8
+    assert rx.find(b"\n", start=9) == -1
+    assert rx.find(b"x") == -1
+
+
+def test_receive_buffer_read_into():
+    rx = ReceiveBuffer(chunk_size=4)
+    rx.extend(b"abc")
+    destination = bytearray(5)
+
+    assert rx.read_into(memoryview(destination)) == 3
+    assert destination == b"abc\x00\x00"
+    assert len(rx) == 0
+
+
+def test_receive_buffer_reads_are_not_overwritten_when_buffer_is_reused():
+    rx = ReceiveBuffer(chunk_size=4, capacity=8)
+
+    rx.extend(b"abcdefgh")
+    first = rx.read(6)
+    rx.extend(b"ijklmn")  # moves "gh" to the front and writes over "abcdef"
+    second = rx.read(8)
+
+    assert first == b"abcdef"
+    assert second == b"ghijklmn"
+    assert rx.capacity == 8
+
+
+def test_receive_buffer_grows_when_needed():
+    rx = ReceiveBuffer(chunk_size=4, capacity=8)
+
+    rx.extend(b"abcdef")
+    rx.extend(b"ghijklmnop")
+
+    assert rx.capacity >= 16
+    assert rx.read(16) == b"abcdefghijklmnop"
+
+
+def test_receive_buffer_raises_on_too_large_read():
+    rx = ReceiveBuffer()
+    rx.extend(b"ab")
+
+    with pytest.raises(ValueError):
+        rx.read(3)
+
+
+@pytest.fixture
+def server_socket():
+    with socket.create_server(("127.0.0.1", 0)) as server:
+        yield server
+
+
+def _serve(server: socket.socket, chunks: list) -> threading.Thread:
+    def target() -> None:
+        conn, _ = server.accept()
+        with conn:
+            for chunk in chunks:
+                conn.sendall(chunk)
+            conn.recv(1)  # wait for the client to disconnect
+
+    thread = threading.Thread(target=target, daemon=True)
+    thread.start()
+    return thread
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 4096])
+def test_socket_link_receives_headers_and_payloads(server_socket, chunk_size):
+    payload = bytes(range(256)) * 40
+    stream = b'{"payload_size": 10240}\n' + payload + b'{"status": "ok"}\n'
+    thread = _serve(server_socket, [stream[i : i + 1000] for i in range(0, len(stream), 1000)])
+
+    link = SocketLink(*server_socket.getsockname(), chunk_size=chunk_size)
+    link.connect()
+
+    try:
+        header = link.recv_until(b"\n")
+        received_payload = link.recv(len(payload))
+        second_header = link.recv_until(b"\n")
+    finally:
+        link.disconnect()
+        thread.join()
+
+    assert header == b'{"payload_size": 10240}\n'
+    assert received_payload == payload
+    assert second_header == b'{"status": "ok"}\n'
+
+
+def test_socket_link_raises_when_connection_is_closed(server_socket):
+    def target() -> None:
+        conn, _ = server_socket.accept()
+        conn.sendall(b"abc")
+        conn.close()
+
+    thread = threading.Thread(target=target, daemon=True)
+    thread.start()
+
+    link = SocketLink(*server_socket.getsockname())
+    link.connect()
+    thread.join()
+
+    try:
+        with pytest.raises(LinkError):
+            link.recv(4)
+    finally:
+        link.disconnect()
@@ -0,0 +1,261 @@
+# Copyright (c) Acconeer AB, 2024
+# All rights reserved
+
+from __future__ import annotations
+
+import json
+import threading
+import typing as t
+
+import attrs
+import pytest
+
+from acconeer.exptool._core.communication import (
+    BufferedLink,
+    CommunicationProtocol,
+    Message,
+    MessageStream,
+    MessageStreamError,
+    MessageStreamOverflowError,
+    OverflowPolicy,
+)
+from acconeer.exptool._core.communication.links import LinkError
+
+
+@attrs.frozen
+class CountMessage(Message):
+    count: int
+    payload: bytes
+
+    @classmethod
+    def parse(cls, header: dict[str, t.Any], payload: bytes) -> CountMessage:
+        return cls(header["count"], bytes(payload))
+
+
+@attrs.frozen
+class DoneMessage(Message):
+    @classmethod
+    def parse(cls, header: dict[str, t.Any], payload: bytes) -> DoneMessage:
+        return cls()
+
+
+@attrs.frozen
+class ErrorMessage(Message):
+    message: str
+
+    @classmethod
+    def parse(cls, header: dict[str, t.Any], payload: bytes) -> ErrorMessage:
+        return cls(header["error"])
+
+
+class CountProtocol(CommunicationProtocol[None]):
+    @classmethod
+    def setup_command(cls, config: None) -> bytes:
+        return b""
+
+    @classmethod
+    def parse_message(cls, header: dict[str, t.Any], payload: bytes) -> Message:
+        if header.get("done"):
+            return DoneMessage.parse(header, payload)
+        if "error" in header:
+            return ErrorMessage.parse(header, payload)
+        return CountMessage.parse(header, payload)
+
+
+class ScriptedLink(BufferedLink):
+    """Serves a fixed sequence of headers and payloads, then raises LinkError
+
+    If ``error_at`` is given, an error message is served before the count message of that count.
+    """
+
+    def __init__(self, num_messages: int, error_at: t.Optional[int] = None) -> None:
+        super().__init__()
+        self._chunks: list[bytes] = []
+        for count in range(num_messages):
+            if count == error_at:
+                self._chunks.append(b'{"error": "Something went wrong"}\n')
+            payload = bytes([count % 256]) * 4
+            self._chunks.append(json.dumps({"count": count, "payload_size": 4}).encode() + b"\n")
+            self._chunks.append(payload)
+        self._chunks.append(b'{"done": true}\n')
+
+    def _update_timeout(self) -> None:
+        pass
+
+    def connect(self) -> None:
+        pass
+
+    def _next_chunk(self) -> bytes:
+        if not self._chunks:
+            raise LinkError("recv timeout")
+        return self._chunks.pop(0)
+
+    def recv(self, num_bytes: int) -> bytes:
+        return self._next_chunk()
+
+    def recv_until(self, bs: bytes) -> bytes:
+        return self._next_chunk()
+
+    def send(self, bytes_: bytes) -> None:
+        pass
+
+    def disconnect(self) -> None:
+        pass
+
+
+class RecordingHandler:
+    def __init__(self) -> None:
+        self.messages: list[Message] = []
+
+    def __call__(self, message: Message) -> None:
+        self.messages.append(message)
+
+
+def reraise(exception: Exception) -> t.NoReturn:
+    raise exception
+
+
+def create_stream(
+    num_messages: int, error_at: t.Optional[int] = None
+) -> tuple[MessageStream, RecordingHandler]:
+    handler = RecordingHandler()
+    stream = MessageStream(
+        ScriptedLink(num_messages, error_at),
+        CountProtocol,
+        message_handler=handler,
+        link_error_callback=reraise,
+    )
+    return stream, handler
+
+
+def wait_for_reader_to_finish(stream: MessageStream) -> None:
+    with stream._queue_condition:
+        stream._queue_condition.wait_for(lambda: not stream.reader_thread_is_running, timeout=5)
+
+
+def counts(messages: list[Message]) -> list[int]:
+    return [m.count for m in messages if isinstance(m, CountMessage)]
+
+
+def test_synchronous_stream_reads_messages_in_order():
+    stream, handler = create_stream(5)
+
+    stream.wait_for_message(DoneMessage)
+
+    assert counts(handler.messages) == [0, 1, 2, 3, 4]
+    assert handler.messages[2] == CountMessage(2, b"\x02" * 4)
+
+
+@pytest.mark.parametrize("max_queue_size", [1, 3, 100])
+def test_blocking_reader_thread_keeps_all_messages(max_queue_size):
+    stream, handler = create_stream(20)
+
+    stream.start_reader_thread(max_queue_size, OverflowPolicy.BLOCK, until=DoneMessage)
+    stream.wait_for_message(DoneMessage)
+    stream.stop_reader_thread()
+
+    assert counts(handler.messages) == list(range(20))
+    assert stream.num_dropped_messages == 0
+    assert 1 <= stream.max_queue_depth <= max_queue_size
+    assert not stream.reader_thread_is_running
+
+
+def test_drop_oldest_reader_thread_drops_and_counts_messages():
+    stream, handler = create_stream(10)
+
+    stream.start_reader_thread(
+        3, OverflowPolicy.DROP_OLDEST, until=DoneMessage, droppable=(CountMessage,)
+    )
+    wait_for_reader_to_finish(stream)
+
+    assert stream.queue_depth == 3
+    assert stream.max_queue_depth == 3
+    assert stream.num_dropped_messages == 8
+
+    stream.wait_for_message(DoneMessage)
+
+    assert counts(handler.messages) == [8, 9]
+    assert stream.queue_depth == 0
+
+
+def test_drop_oldest_reader_thread_keeps_queued_errors():
+    stream, handler = create_stream(10, error_at=2)
+
+    stream.start_reader_thread(
+        3, OverflowPolicy.DROP_OLDEST, until=DoneMessage, droppable=(CountMessage,)
+    )
+    wait_for_reader_to_finish(stream)
+    stream.wait_for_message(DoneMessage)
+
+    assert handler.messages == [ErrorMessage("Something went wrong"), CountMessage(9, b"\x09" * 4)]
+    assert stream.num_dropped_messages == 9
+
+
+def test_drop_oldest_reader_thread_drops_new_droppable_messages_if_none_is_queued():
+    stream, handler = create_stream(5, error_at=0)
+
+    stream.start_reader_thread(
+        1, OverflowPolicy.DROP_OLDEST, until=DoneMessage, droppable=(CountMessage,)
+    )
+    wait_for_reader_to_finish(stream)
+
+    assert stream.queue_depth == 2  # The done message is queued beyond the limit
+    stream.wait_for_message(DoneMessage)
+
+    assert handler.messages == [ErrorMessage("Something went wrong")]
+    assert stream.num_dropped_messages == 5
+
+
+def test_drop_oldest_requires_droppable_messages():
+    stream, _ = create_stream(1)
+
+    with pytest.raises(ValueError):
+        stream.start_reader_thread(3, OverflowPolicy.DROP_OLDEST)
+
+
+def test_raising_reader_thread_raises_in_consumer():
+    stream, handler = create_stream(10)
+
+    stream.start_reader_thread(3, OverflowPolicy.RAISE)
+    wait_for_reader_to_finish(stream)
+
+    with pytest.raises(MessageStreamOverflowError):
+        stream.wait_for_message(DoneMessage)
+
+
+def test_reader_thread_errors_are_raised_after_queued_messages():
+    stream, handler = create_stream(4)
+
+    stream.start_reader_thread(100)
+    wait_for_reader_to_finish(stream)
+
+    stream.wait_for_message(DoneMessage)
+    assert counts(handler.messages) == [0, 1, 2, 3]
+
+    with pytest.raises(LinkError):
+        stream.wait_for_message(DoneMessage)
+
+
+def test_messages_after_until_are_read_synchronously():
+    stream, handler = create_stream(2)
+
+    stream.start_reader_thread(100, until=CountMessage)
+    assert stream.wait_for_message(CountMessage) == CountMessage(0, b"\x00" * 4)
+    stream.stop_reader_thread()
+
+    reader_threads = [t for t in threading.enumerate() if t.name == "MessageStreamReader"]
+    assert reader_threads == []
+
+    stream.wait_for_message(DoneMessage)
+    assert counts(handler.messages) == [1]
+
+
+def test_reader_thread_cannot_be_started_twice():
+    stream, _ = create_stream(1000)
+
+    stream.start_reader_thread(1)
+    try:
+        with pytest.raises(MessageStreamError):
+            stream.start_reader_thread(1)
+    finally:
+        stream.stop_reader_thread()
@@ -1,9 +1,10 @@
 # Copyright (c) Acconeer AB, 2023
 # All rights reserved
 
+import numpy as np
 import pytest
 
-from acconeer.exptool._core.communication.unwrap_ticks import unwrap_ticks
+from acconeer.exptool._core.communication.unwrap_ticks import unwrap_ticks, unwrap_ticks_array
 
 
 @pytest.mark.parametrize(
@@ -35,3 +36,40 @@ def test_unwrap_ticks_special_cases():
 
     with pytest.raises(Exception):
         unwrap_ticks([100], None, limit=100)
+
+
+@pytest.mark.parametrize("minimum_tick", [None, 0, 50, 1234])
+@pytest.mark.parametrize("ticks_per_frame", [1, 3])
+def test_unwrap_ticks_array_matches_unwrap_ticks(minimum_tick, ticks_per_frame):
+    limit = 100
+    rng = np.random.default_rng(1)
+    raw_ticks = np.cumsum(rng.integers(0, 40, size=(50, ticks_per_frame)), axis=0) % limit
+
+    expected_ticks = []
+    expected_minimum_tick = minimum_tick
+    for frame_ticks in raw_ticks.tolist():
+        unwrapped, expected_minimum_tick = unwrap_ticks(
+            frame_ticks, expected_minimum_tick, limit=limit
+        )
+        expected_ticks.append(unwrapped)
+
+    ticks, minimum_tick = unwrap_ticks_array(raw_ticks, minimum_tick, limit=limit)
+
+    assert ticks.tolist() == expected_ticks
+    assert minimum_tick == expected_minimum_tick
+
+
+def test_unwrap_ticks_array_special_cases():
+    ticks, minimum_tick = unwrap_ticks_array(np.empty((0, 2), dtype=np.int64), 123)
+    assert ticks.shape == (0, 2)
+    assert minimum_tick == 123
+
+    ticks, minimum_tick = unwrap_ticks_array(np.array([90, 10]), None, limit=100)
+    assert ticks.tolist() == [90, 110]
+    assert minimum_tick == 110
+
+    with pytest.raises(ValueError):
+        unwrap_ticks_array(np.array([[-1]]), None, limit=100)
+
+    with pytest.raises(ValueError):
+        unwrap_ticks_array(np.array([[100]]), None, limit=100)
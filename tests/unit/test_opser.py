@@ -637,3 +637,96 @@ def test_ragged_numpy_array_persistor_should_not_be_able_to_store_mutlidim_ragge
             name="test",
             type_tree=opser.core.create_type_tree(type(data)),
         ).save(data)
+
+
+@attrs.frozen
+class Columns:
+    array: npt.NDArray[t.Any] = attrs.field(eq=attrs.cmp_using(eq=np.array_equal))
+    optional_array: t.Optional[npt.NDArray[t.Any]] = attrs.field(
+        eq=attrs.cmp_using(eq=np.array_equal)
+    )
+    number: float
+
+
+def test_list_of_attrs_with_equally_shaped_arrays_is_stored_as_stacked_datasets(
+    tmp_h5_file: h5py.File,
+) -> None:
+    data = [
+        Columns(np.random.normal(size=(2, 3)) + 1j, np.arange(4) * i, random()) for i in range(5)
+    ]
+
+    opser.serialize(data, tmp_h5_file, override_type=t.List[Columns])
+
+    for name, shape in [("array", (5, 2, 3)), ("optional_array", (5, 4)), ("number", (5,))]:
+        assert isinstance(tmp_h5_file[name], h5py.Dataset)
+        assert tmp_h5_file[name].shape == shape
+
+    assert tmp_h5_file["array"].attrs["persistor"] == "StackedNumpyArrayPersistor"
+    assert opser.deserialize(tmp_h5_file, t.List[Columns]) == data
+
+
+@pytest.mark.parametrize(
+    "optional_arrays",
+    [
+        [np.zeros(2), np.zeros(3)],
+        [np.zeros(2), np.zeros(2, dtype=np.int_)],
+        [np.zeros((2, 2)), np.zeros((2, 3))],
+        [np.zeros(2), None],
+    ],
+)
+def test_list_of_attrs_with_ragged_arrays_falls_back_to_other_persistors(
+    optional_arrays: t.List[t.Optional[npt.NDArray[t.Any]]], tmp_h5_file: h5py.File
+) -> None:
+    data = [Columns(np.zeros(2), optional_array, 1.0) for optional_array in optional_arrays]
+
+    opser.serialize(data, tmp_h5_file, override_type=t.List[Columns])
+
+    assert tmp_h5_file["array"].attrs["persistor"] == "StackedNumpyArrayPersistor"
+    assert tmp_h5_file["optional_array"].attrs.get("persistor") != "StackedNumpyArrayPersistor"
+    assert opser.deserialize(tmp_h5_file, t.List[Columns]) == data
+
+
+def test_stacked_numpy_array_persistor_does_not_load_ragged_arrays(
+    tmp_h5_file: h5py.File,
+) -> None:
+    data = [np.zeros(2), np.zeros(2)]
+    type_tree = opser.core.create_type_tree(t.List[npt.NDArray[np.float_]])
+    opser.optimizing_persistors.RaggedNumpyArrayPersistor(tmp_h5_file, "test", type_tree).save(
+        data
+    )
+
+    with pytest.raises(opser.core.LoadError):
+        opser.optimizing_persistors.StackedNumpyArrayPersistor(
+            tmp_h5_file, "test", type_tree
+        ).load()
+
+
+def test_type_trees_are_cached() -> None:
+    type_tree = opser.core.get_type_tree(t.List[Parent])
+
+    assert type_tree == opser.core.create_type_tree(t.List[Parent])
+    assert opser.core.get_type_tree(t.List[Parent]) is type_tree
+
+
+def test_applicable_persistors_are_recomputed_when_registry_changes() -> None:
+    @attrs.frozen
+    class JsonPresentable:
+        integer: int
+
+        def to_json(self) -> str:
+            return str(self.integer)
+
+        @classmethod
+        def from_json(cls, json_string: str) -> JsonPresentable:
+            return cls(int(json_string))
+
+    applicable_persistors = RegistryPersistor._get_applicable_persistors(JsonPresentable)
+    assert RegistryPersistor._get_applicable_persistors(JsonPresentable) is applicable_persistors
+
+    registry_version = RegistryPersistor.registry_version()
+    opser.register_json_presentable(JsonPresentable)
+
+    assert RegistryPersistor.registry_version() > registry_version
+    assert len(RegistryPersistor._get_applicable_persistors(JsonPresentable)) == (
+        len(applicable_persistors) + 1
+    )
@@ -127,3 +127,69 @@ def ref_record_file_a121(tmp_path):
 def test_open_record_a121(ref_record_file_a121):
     with pytest.raises(Exception):
         a111.recording.load(ref_record_file_a121)
+
+
+def _record_with_both_recorders(tmp_path, mocker, config, num_frames, **kwargs):
+    session_info = mocker.start_session(config)
+    recorder = a111.recording.Recorder(sensor_config=config, session_info=session_info, **kwargs)
+    filename = Path(tmp_path).joinpath("record.h5")
+
+    with a111.recording.H5Recorder(
+        filename, sensor_config=config, session_info=session_info, chunk_size=4, **kwargs
+    ) as h5_recorder:
+        for i in range(num_frames):
+            data_info, data = mocker.get_next()
+            for sensor_data_info in data_info:
+                sensor_data_info["missed_data"] = i % 3 == 0
+            recorder.sample(data_info, data)
+            h5_recorder.sample(data_info, data)
+
+        assert h5_recorder.num_frames == len(recorder.record.data)
+
+    return recorder.close(), a111.recording.load(filename)
+
+
+@pytest.mark.parametrize("mode", a111.Mode)
+@pytest.mark.parametrize("num_frames", [0, 3, 10])
+def test_h5_recorder(tmp_path, mode, num_frames, mocker):
+    config = a111._configs.MODE_TO_CONFIG_CLASS_MAP[mode]()
+    config.downsampling_factor = 2
+    config.sensor = [1, 2]
+
+    record, loaded_record = _record_with_both_recorders(tmp_path, mocker, config, num_frames)
+
+    assert loaded_record.mode == mode
+    assert loaded_record.sensor_config_dump == config._dumps()
+    assert loaded_record.data_info == record.data_info
+    assert loaded_record.session_info == record.session_info
+    assert len(loaded_record.sample_times) == num_frames
+    np.testing.assert_array_equal(loaded_record.data, record.data)
+
+
+@pytest.mark.parametrize("num_frames", [2, 5, 6, 11, 23])
+def test_h5_recorder_max_len(tmp_path, num_frames, mocker):
+    config = a111.PowerBinServiceConfig()
+
+    record, loaded_record = _record_with_both_recorders(
+        tmp_path, mocker, config, num_frames, max_len=5
+    )
+
+    assert len(loaded_record.data) == min(num_frames, 5)
+    assert loaded_record.data_info == record.data_info
+    assert np.all(np.diff(loaded_record.sample_times) >= 0)
+    np.testing.assert_array_equal(loaded_record.data, record.data)
+
+
+def test_h5_recorder_widens_integer_data(tmp_path, mocker):
+    config = a111.EnvelopeServiceConfig()
+    session_info = mocker.start_session(config)
+    filename = Path(tmp_path).joinpath("record.h5")
+    frames = [np.full((1, 10), 3.0), np.full((1, 10), 2.5)]
+
+    with a111.recording.H5Recorder(
+        filename, sensor_config=config, session_info=session_info, chunk_size=1
+    ) as h5_recorder:
+        for frame in frames:
+            h5_recorder.sample([{"data_saturated": False}], frame)
+
+    np.testing.assert_array_equal(a111.recording.load(filename).data, frames)